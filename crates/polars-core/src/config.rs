@@ -48,6 +48,13 @@ pub fn get_file_prefetch_size() -> usize {
         .unwrap_or_else(|_| std::cmp::max(POOL.current_num_threads() * 2, 16))
 }
 
+/// Maximum estimated size in bytes of the files that scans of cloud storage read ahead.
+pub fn get_file_prefetch_memory_budget() -> usize {
+    std::env::var("POLARS_PREFETCH_MEMORY_BUDGET")
+        .map(|s| s.parse::<usize>().expect("integer"))
+        .unwrap_or(1 << 30)
+}
+
 pub fn get_rg_prefetch_size() -> usize {
     std::env::var("POLARS_ROW_GROUP_PREFETCH_SIZE")
         .map(|s| s.parse::<usize>().expect("integer"))
@@ -55,6 +62,21 @@ pub fn get_rg_prefetch_size() -> usize {
         .unwrap_or_else(|_| std::cmp::max(get_file_prefetch_size(), 128))
 }
 
+/// Maximum memory usage of the process-wide parquet metadata cache in bytes, 0 disables it.
+pub fn get_parquet_metadata_cache_size() -> usize {
+    std::env::var("POLARS_PARQUET_METADATA_CACHE_SIZE")
+        .map(|s| s.parse::<usize>().expect("integer"))
+        .unwrap_or(256 << 20)
+}
+
+/// Maximum memory usage of the process-wide cache of persisted query results in bytes, 0
+/// disables it.
+pub fn get_query_cache_size() -> usize {
+    std::env::var("POLARS_QUERY_CACHE_SIZE")
+        .map(|s| s.parse::<usize>().expect("integer"))
+        .unwrap_or(1 << 30)
+}
+
 pub fn force_async() -> bool {
     std::env::var("POLARS_FORCE_ASYNC")
         .map(|value| value == "1")
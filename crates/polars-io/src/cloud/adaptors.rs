@@ -3,16 +3,26 @@
 //!
 //! [parquet2]: https://crates.io/crates/parquet2
 
+use std::collections::VecDeque;
+use std::io::{Read, Seek, SeekFrom};
 use std::sync::Arc;
 
+use bytes::Bytes;
 use object_store::path::Path;
 use object_store::{MultipartId, ObjectStore};
 use polars_error::{to_compute_err, PolarsResult};
 use tokio::io::{AsyncWrite, AsyncWriteExt};
+use tokio::task::JoinHandle;
 
-use super::CloudOptions;
+use super::{build_object_store, CloudOptions, PolarsObjectStore};
+use crate::mmap::MmapBytesReader;
 use crate::pl_async::get_runtime;
 
+/// Size of the ranges that are requested by the [`CloudReader`].
+const CLOUD_READ_BLOCK_SIZE: usize = 8 * 1024 * 1024;
+/// Number of ranges that the [`CloudReader`] requests ahead of the position that is read.
+const CLOUD_READ_PREFETCH: usize = 4;
+
 /// Adaptor which wraps the asynchronous interface of [ObjectStore::put_multipart](https://docs.rs/object_store/latest/object_store/trait.ObjectStore.html#tymethod.put_multipart)
 /// exposing a synchronous interface which implements `std::io::Write`.
 ///
@@ -102,6 +112,137 @@ impl Drop for CloudWriter {
     }
 }
 
+/// Adaptor which reads an object with ranged requests, exposing a synchronous interface which
+/// implements `std::io::Read` and `std::io::Seek`.
+///
+/// While a range is consumed, the next ranges are already requested concurrently, so that
+/// sequential readers, such as the streaming CSV reader, rarely wait for the object store.
+pub struct CloudReader {
+    store: PolarsObjectStore,
+    path: Path,
+    size: usize,
+    /// The position of the next byte that is read.
+    pos: usize,
+    /// The last fetched range and its offset in the object.
+    block: Bytes,
+    block_offset: usize,
+    /// The ranges that are requested ahead, in order of their offsets.
+    pending: VecDeque<(usize, JoinHandle<PolarsResult<Bytes>>)>,
+    /// The offset of the next range that is requested.
+    next_request: usize,
+}
+
+impl CloudReader {
+    pub async fn new(uri: &str, cloud_options: Option<&CloudOptions>) -> PolarsResult<Self> {
+        let (location, store) = build_object_store(uri, cloud_options).await?;
+        let store = PolarsObjectStore::new(store).with_file_cache(&location, cloud_options);
+        let path: Path = location.prefix.into();
+        let size = store.head(&path).await?.size;
+        Ok(Self {
+            store,
+            path,
+            size,
+            pos: 0,
+            block: Bytes::new(),
+            block_offset: 0,
+            pending: VecDeque::new(),
+            next_request: 0,
+        })
+    }
+
+    /// Blocking version of [`CloudReader::new`].
+    pub fn from_uri(uri: &str, cloud_options: Option<&CloudOptions>) -> PolarsResult<Self> {
+        get_runtime().block_on_potential_spawn(Self::new(uri, cloud_options))
+    }
+
+    /// The size of the object in bytes.
+    pub fn size(&self) -> usize {
+        self.size
+    }
+
+    fn request_ahead(&mut self) {
+        while self.pending.len() < CLOUD_READ_PREFETCH && self.next_request < self.size {
+            let range = self.next_request
+                ..std::cmp::min(self.next_request + CLOUD_READ_BLOCK_SIZE, self.size);
+            let store = self.store.clone();
+            let path = self.path.clone();
+            self.next_request = range.end;
+            let offset = range.start;
+            let handle = get_runtime().spawn(async move { store.get_range(&path, range).await });
+            self.pending.push_back((offset, handle));
+        }
+    }
+
+    fn cancel_requests(&mut self) {
+        for (_, handle) in self.pending.drain(..) {
+            handle.abort();
+        }
+    }
+}
+
+impl Read for CloudReader {
+    fn read(&mut self, buf: &mut [u8]) -> std::io::Result<usize> {
+        if self.pos >= self.size || buf.is_empty() {
+            return Ok(0);
+        }
+        if self.pos >= self.block_offset + self.block.len() {
+            self.request_ahead();
+            let (offset, handle) = self.pending.pop_front().unwrap();
+            debug_assert_eq!(offset, self.pos);
+            let block = get_runtime()
+                .block_on_potential_spawn(handle)
+                .map_err(std::io::Error::other)?
+                .map_err(std::io::Error::other)?;
+            if block.is_empty() {
+                return Err(std::io::ErrorKind::UnexpectedEof.into());
+            }
+            self.block = block;
+            self.block_offset = offset;
+            // Keep the object store busy while this range is consumed.
+            self.request_ahead();
+        }
+        let start = self.pos - self.block_offset;
+        let n = std::cmp::min(buf.len(), self.block.len() - start);
+        buf[..n].copy_from_slice(&self.block[start..start + n]);
+        self.pos += n;
+        Ok(n)
+    }
+}
+
+impl Seek for CloudReader {
+    fn seek(&mut self, pos: SeekFrom) -> std::io::Result<u64> {
+        let pos = match pos {
+            SeekFrom::Start(pos) => pos as i64,
+            SeekFrom::End(delta) => self.size as i64 + delta,
+            SeekFrom::Current(delta) => self.pos as i64 + delta,
+        };
+        if pos < 0 {
+            return Err(std::io::Error::new(
+                std::io::ErrorKind::InvalidInput,
+                "seek to a negative position",
+            ));
+        }
+        let pos = pos as usize;
+        // The prefetched ranges are only kept if the reader does not leave the current range.
+        if pos < self.block_offset || pos > self.block_offset + self.block.len() {
+            self.cancel_requests();
+            self.block = Bytes::new();
+            self.block_offset = pos;
+            self.next_request = pos;
+        }
+        self.pos = pos;
+        Ok(pos as u64)
+    }
+}
+
+impl MmapBytesReader for CloudReader {}
+
+impl Drop for CloudReader {
+    fn drop(&mut self) {
+        self.cancel_requests()
+    }
+}
+
 #[cfg(feature = "csv")]
 #[cfg(test)]
 mod tests {
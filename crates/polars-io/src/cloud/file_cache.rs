@@ -0,0 +1,300 @@
+//! Size bounded local disk cache of object store reads.
+//!
+//! Every cached object (range) is stored in its own file named by the hash of its key. The file
+//! starts with the key itself, so that hash collisions and files written by other versions are
+//! detected on read. Failing to read or write the cache is never an error, the data is then
+//! fetched from the object store instead.
+use std::fs::File;
+use std::io::{Read, Write};
+use std::path::PathBuf;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{Arc, Mutex};
+use std::time::SystemTime;
+
+use ahash::RandomState;
+use bytes::Bytes;
+use once_cell::sync::Lazy;
+use polars_utils::aliases::PlHashMap;
+
+use crate::cloud::FileCacheOptions;
+
+/// The caches that are opened in this process, keyed by their directory.
+static FILE_CACHES: Lazy<Mutex<PlHashMap<PathBuf, Arc<FileCache>>>> = Lazy::new(Default::default);
+
+/// Makes the names of temporary files unique within the process.
+static TMP_FILE_COUNTER: AtomicU64 = AtomicU64::new(0);
+
+/// Hit/miss statistics of the file caches.
+#[derive(Clone, Copy, Debug, Default, PartialEq, Eq)]
+pub struct FileCacheStats {
+    /// Number of reads that were served from the cache.
+    pub hits: u64,
+    /// Number of reads that were fetched from the object store.
+    pub misses: u64,
+    /// Bytes that were served from the cache.
+    pub hit_bytes: u64,
+    /// Bytes that were fetched from the object store.
+    pub miss_bytes: u64,
+    /// Number of cached objects.
+    pub entries: u64,
+    /// Total size of the cached objects in bytes.
+    pub size: u64,
+}
+
+struct Entry {
+    size: u64,
+    last_used: u64,
+}
+
+#[derive(Default)]
+struct Index {
+    entries: PlHashMap<u64, Entry>,
+    total_size: u64,
+    clock: u64,
+}
+
+impl Index {
+    fn touch(&mut self, hash: u64, size: u64) {
+        self.clock += 1;
+        let entry = Entry {
+            size,
+            last_used: self.clock,
+        };
+        if let Some(old) = self.entries.insert(hash, entry) {
+            self.total_size -= old.size;
+        }
+        self.total_size += size;
+    }
+}
+
+pub struct FileCache {
+    dir: PathBuf,
+    max_size: AtomicU64,
+    index: Mutex<Index>,
+    hits: AtomicU64,
+    misses: AtomicU64,
+    hit_bytes: AtomicU64,
+    miss_bytes: AtomicU64,
+}
+
+impl std::fmt::Debug for FileCache {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.debug_struct("FileCache").field("dir", &self.dir).finish()
+    }
+}
+
+impl FileCache {
+    /// Get the cache in the directory of `options`, opening it on first use.
+    ///
+    /// Returns `None` if the directory can not be used.
+    pub fn get_or_init(options: &FileCacheOptions) -> Option<Arc<Self>> {
+        let mut caches = FILE_CACHES.lock().unwrap();
+        if let Some(cache) = caches.get(&options.dir) {
+            cache.max_size.store(options.max_size, Ordering::Relaxed);
+            return Some(cache.clone());
+        }
+        let cache = Arc::new(Self::open(options).ok()?);
+        caches.insert(options.dir.clone(), cache.clone());
+        Some(cache)
+    }
+
+    /// Open the cache and index the files that were written by earlier processes. Their
+    /// modification time determines the initial LRU order.
+    fn open(options: &FileCacheOptions) -> std::io::Result<Self> {
+        std::fs::create_dir_all(&options.dir)?;
+        let mut files = vec![];
+        for entry in std::fs::read_dir(&options.dir)? {
+            let entry = entry?;
+            let name = entry.file_name();
+            let Some(name) = name.to_str() else {
+                continue;
+            };
+            if name.ends_with(".tmp") {
+                // Left behind by an interrupted write.
+                let _ = std::fs::remove_file(entry.path());
+                continue;
+            }
+            let Ok(hash) = u64::from_str_radix(name, 16) else {
+                continue;
+            };
+            let metadata = entry.metadata()?;
+            let modified = metadata.modified().unwrap_or(SystemTime::UNIX_EPOCH);
+            files.push((modified, hash, metadata.len()));
+        }
+        files.sort_unstable();
+
+        let mut index = Index::default();
+        for (_, hash, size) in files {
+            index.touch(hash, size);
+        }
+        let cache = Self {
+            dir: options.dir.clone(),
+            max_size: AtomicU64::new(options.max_size),
+            index: Mutex::new(index),
+            hits: Default::default(),
+            misses: Default::default(),
+            hit_bytes: Default::default(),
+            miss_bytes: Default::default(),
+        };
+        cache.evict(&mut cache.index.lock().unwrap());
+        Ok(cache)
+    }
+
+    fn hash(key: &str) -> u64 {
+        // Fixed seeds, the hash must be stable across processes.
+        RandomState::with_seeds(0, 0, 0, 0).hash_one(key)
+    }
+
+    fn path(&self, hash: u64) -> PathBuf {
+        self.dir.join(format!("{hash:016x}"))
+    }
+
+    /// Read the cached data of `key`.
+    pub fn get(&self, key: &str) -> Option<Bytes> {
+        let hash = Self::hash(key);
+        match self.read(hash, key) {
+            Some((data, file_size)) => {
+                self.hits.fetch_add(1, Ordering::Relaxed);
+                self.hit_bytes
+                    .fetch_add(data.len() as u64, Ordering::Relaxed);
+                self.index.lock().unwrap().touch(hash, file_size);
+                Some(data)
+            },
+            None => {
+                self.misses.fetch_add(1, Ordering::Relaxed);
+                None
+            },
+        }
+    }
+
+    fn read(&self, hash: u64, key: &str) -> Option<(Bytes, u64)> {
+        let mut buf = vec![];
+        File::open(self.path(hash))
+            .ok()?
+            .read_to_end(&mut buf)
+            .ok()?;
+        let key_len = u32::from_le_bytes(buf.get(..4)?.try_into().ok()?) as usize;
+        if buf.get(4..4 + key_len)? != key.as_bytes() {
+            return None;
+        }
+        let file_size = buf.len() as u64;
+        Some((Bytes::from(buf).slice(4 + key_len..), file_size))
+    }
+
+    /// Store the data of `key` that was fetched from the object store.
+    pub fn insert(&self, key: &str, data: &[u8]) {
+        self.miss_bytes
+            .fetch_add(data.len() as u64, Ordering::Relaxed);
+        let hash = Self::hash(key);
+        let file_size = (4 + key.len() + data.len()) as u64;
+        if file_size > self.max_size.load(Ordering::Relaxed) || self.write(hash, key, data).is_err()
+        {
+            return;
+        }
+        let mut index = self.index.lock().unwrap();
+        index.touch(hash, file_size);
+        self.evict(&mut index);
+    }
+
+    fn write(&self, hash: u64, key: &str, data: &[u8]) -> std::io::Result<()> {
+        // Write to a temporary file first, so that readers never see a partial file.
+        let tmp_path = self.dir.join(format!(
+            "{hash:016x}.{}-{}.tmp",
+            std::process::id(),
+            TMP_FILE_COUNTER.fetch_add(1, Ordering::Relaxed)
+        ));
+        let result = (|| {
+            let mut file = File::create(&tmp_path)?;
+            file.write_all(&(key.len() as u32).to_le_bytes())?;
+            file.write_all(key.as_bytes())?;
+            file.write_all(data)?;
+            std::fs::rename(&tmp_path, self.path(hash))
+        })();
+        if result.is_err() {
+            let _ = std::fs::remove_file(&tmp_path);
+        }
+        result
+    }
+
+    /// Remove the least recently used files until the cache is below 90% of its maximum size,
+    /// so that not every insert of a full cache has to evict.
+    fn evict(&self, index: &mut Index) {
+        let max_size = self.max_size.load(Ordering::Relaxed);
+        if index.total_size <= max_size {
+            return;
+        }
+        let target_size = max_size / 10 * 9;
+        let mut lru = index
+            .entries
+            .iter()
+            .map(|(hash, entry)| (entry.last_used, *hash))
+            .collect::<Vec<_>>();
+        lru.sort_unstable();
+        for (_, hash) in lru {
+            if index.total_size <= target_size {
+                break;
+            }
+            let entry = index.entries.remove(&hash).unwrap();
+            index.total_size -= entry.size;
+            let _ = std::fs::remove_file(self.path(hash));
+        }
+    }
+
+    pub fn stats(&self) -> FileCacheStats {
+        let index = self.index.lock().unwrap();
+        FileCacheStats {
+            hits: self.hits.load(Ordering::Relaxed),
+            misses: self.misses.load(Ordering::Relaxed),
+            hit_bytes: self.hit_bytes.load(Ordering::Relaxed),
+            miss_bytes: self.miss_bytes.load(Ordering::Relaxed),
+            entries: index.entries.len() as u64,
+            size: index.total_size,
+        }
+    }
+}
+
+/// The statistics of all file caches that are opened in this process.
+pub fn file_cache_stats() -> FileCacheStats {
+    FILE_CACHES
+        .lock()
+        .unwrap()
+        .values()
+        .map(|cache| cache.stats())
+        .fold(FileCacheStats::default(), |acc, stats| FileCacheStats {
+            hits: acc.hits + stats.hits,
+            misses: acc.misses + stats.misses,
+            hit_bytes: acc.hit_bytes + stats.hit_bytes,
+            miss_bytes: acc.miss_bytes + stats.miss_bytes,
+            entries: acc.entries + stats.entries,
+            size: acc.size + stats.size,
+        })
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_file_cache() {
+        let dir = tempfile::tempdir().unwrap();
+        let options = FileCacheOptions::new(dir.path()).with_max_size(100);
+        let cache = FileCache::open(&options).unwrap();
+
+        assert!(cache.get("a").is_none());
+        cache.insert("a", &[1; 40]);
+        assert_eq!(cache.get("a").unwrap().as_ref(), &[1; 40]);
+        cache.insert("b", &[2; 40]);
+        // Evicts "a", the least recently used object.
+        cache.insert("c", &[3; 40]);
+        assert!(cache.get("a").is_none());
+        assert_eq!(cache.get("c").unwrap().as_ref(), &[3; 40]);
+
+        let stats = cache.stats();
+        assert_eq!((stats.hits, stats.misses), (2, 2));
+        assert_eq!(stats.hit_bytes, 80);
+
+        // The files are found again by a new process.
+        let cache = FileCache::open(&options).unwrap();
+        assert_eq!(cache.get("c").unwrap().as_ref(), &[3; 40]);
+    }
+}
@@ -3,6 +3,8 @@
 #[cfg(feature = "cloud")]
 mod adaptors;
 #[cfg(feature = "cloud")]
+mod file_cache;
+#[cfg(feature = "cloud")]
 mod glob;
 #[cfg(feature = "cloud")]
 mod object_store_setup;
@@ -13,6 +15,8 @@ mod polars_object_store;
 #[cfg(feature = "cloud")]
 pub use adaptors::*;
 #[cfg(feature = "cloud")]
+pub use file_cache::*;
+#[cfg(feature = "cloud")]
 pub use glob::*;
 #[cfg(feature = "cloud")]
 pub use object_store_setup::*;
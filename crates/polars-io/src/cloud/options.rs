@@ -2,6 +2,7 @@
 use std::io::Read;
 #[cfg(feature = "aws")]
 use std::path::Path;
+use std::path::PathBuf;
 use std::str::FromStr;
 
 #[cfg(feature = "aws")]
@@ -63,6 +64,8 @@ pub struct CloudOptions {
     #[cfg(feature = "gcp")]
     gcp: Option<Configs<GoogleConfigKey>>,
     pub max_retries: usize,
+    /// Cache the fetched objects on the local disk.
+    pub file_cache: Option<FileCacheOptions>,
 }
 
 impl Default for CloudOptions {
@@ -75,10 +78,50 @@ impl Default for CloudOptions {
             azure: Default::default(),
             #[cfg(feature = "gcp")]
             gcp: Default::default(),
+            file_cache: None,
         }
     }
 }
 
+#[derive(Clone, Debug, PartialEq, Hash, Eq)]
+#[cfg_attr(feature = "serde", derive(Serialize, Deserialize))]
+/// Options of the local disk cache of object store reads.
+pub struct FileCacheOptions {
+    /// Directory in which the cached objects are stored.
+    pub dir: PathBuf,
+    /// Maximum total size of the cached objects in bytes. The least recently used objects are
+    /// evicted once the cache grows larger.
+    pub max_size: u64,
+}
+
+impl FileCacheOptions {
+    pub const DEFAULT_MAX_SIZE: u64 = 10 << 30;
+
+    pub fn new(dir: impl Into<PathBuf>) -> Self {
+        Self {
+            dir: dir.into(),
+            max_size: Self::DEFAULT_MAX_SIZE,
+        }
+    }
+
+    pub fn with_max_size(mut self, max_size: u64) -> Self {
+        self.max_size = max_size;
+        self
+    }
+
+    /// Read the options from the `POLARS_OBJECT_STORE_CACHE_DIR` and
+    /// `POLARS_OBJECT_STORE_CACHE_MAX_SIZE` environment variables. Returns `None` if no cache
+    /// directory is set.
+    pub fn from_env() -> Option<Self> {
+        let dir = std::env::var("POLARS_OBJECT_STORE_CACHE_DIR").ok()?;
+        let max_size = std::env::var("POLARS_OBJECT_STORE_CACHE_MAX_SIZE")
+            .ok()
+            .and_then(|max_size| max_size.parse().ok())
+            .unwrap_or(Self::DEFAULT_MAX_SIZE);
+        Some(Self::new(dir).with_max_size(max_size))
+    }
+}
+
 #[allow(dead_code)]
 /// Parse an untype configuration hashmap to a typed configuration for the given configuration key type.
 fn parsed_untyped_config<T, I: IntoIterator<Item = (impl AsRef<str>, impl Into<String>)>>(
@@ -386,7 +429,36 @@ impl CloudOptions {
         url: &str,
         config: I,
     ) -> PolarsResult<Self> {
-        match CloudType::from_str(url)? {
+        // The file cache keys are shared by all cloud providers.
+        let mut file_cache_dir: Option<String> = None;
+        let mut file_cache_max_size = None;
+        let mut provider_config: Vec<(String, String)> = vec![];
+        for (key, val) in config {
+            match key.as_ref() {
+                "file_cache_dir" => file_cache_dir = Some(val.into()),
+                "file_cache_max_size" => {
+                    let val: String = val.into();
+                    file_cache_max_size = Some(val.parse::<u64>().map_err(
+                        |_| polars_err!(ComputeError: "invalid 'file_cache_max_size': {}", val),
+                    )?)
+                },
+                key => provider_config.push((key.to_string(), val.into())),
+            }
+        }
+        let file_cache = match (file_cache_dir, file_cache_max_size) {
+            (Some(dir), max_size) => Some(
+                FileCacheOptions::new(dir)
+                    .with_max_size(max_size.unwrap_or(FileCacheOptions::DEFAULT_MAX_SIZE)),
+            ),
+            (None, Some(_)) => {
+                polars_bail!(ComputeError: "'file_cache_max_size' requires 'file_cache_dir'")
+            },
+            (None, None) => None,
+        };
+        #[allow(unused_variables)]
+        let config = provider_config;
+
+        let mut out = match CloudType::from_str(url)? {
             CloudType::Aws => {
                 #[cfg(feature = "aws")]
                 {
@@ -422,7 +494,9 @@ impl CloudOptions {
                     polars_bail!(ComputeError: "'gcp' feature is not enabled");
                 }
             },
-        }
+        }?;
+        out.file_cache = file_cache;
+        Ok(out)
     }
 }
 
@@ -1,28 +1,87 @@
 use std::ops::Range;
-use std::sync::Arc;
+use std::sync::{Arc, Mutex};
 
 use bytes::Bytes;
 use object_store::path::Path;
 use object_store::{ObjectMeta, ObjectStore};
 use polars_error::{to_compute_err, PolarsResult};
+use polars_utils::aliases::PlHashMap;
 
+use crate::cloud::{CloudLocation, CloudOptions, FileCache, FileCacheOptions};
 use crate::pl_async::{
     tune_with_concurrency_budget, with_concurrency_budget, MAX_BUDGET_PER_REQUEST,
 };
 
 /// Polars specific wrapper for `Arc<dyn ObjectStore>` that limits the number of
 /// concurrent requests for the entire application.
+///
+/// Optionally the fetched data is cached on the local disk, see [`FileCacheOptions`].
 #[derive(Debug, Clone)]
-pub struct PolarsObjectStore(Arc<dyn ObjectStore>);
+pub struct PolarsObjectStore {
+    store: Arc<dyn ObjectStore>,
+    /// The disk cache and the `scheme://bucket` prefix of the cache keys.
+    file_cache: Option<(Arc<FileCache>, Arc<str>)>,
+    /// The object metadata that was fetched by this store.
+    heads: Arc<Mutex<PlHashMap<Path, ObjectMeta>>>,
+}
 
 impl PolarsObjectStore {
     pub fn new(store: Arc<dyn ObjectStore>) -> Self {
-        Self(store)
+        Self {
+            store,
+            file_cache: None,
+            heads: Default::default(),
+        }
     }
 
-    pub async fn get(&self, path: &Path) -> PolarsResult<Bytes> {
+    /// Cache the fetched data on the local disk if this is configured in the `options`, or else
+    /// in the `POLARS_OBJECT_STORE_CACHE_DIR` environment variable.
+    pub fn with_file_cache(
+        mut self,
+        location: &CloudLocation,
+        options: Option<&CloudOptions>,
+    ) -> Self {
+        let cache_options = options
+            .and_then(|options| options.file_cache.clone())
+            .or_else(FileCacheOptions::from_env);
+        self.file_cache = cache_options
+            .and_then(|options| FileCache::get_or_init(&options))
+            .map(|cache| {
+                let prefix = format!("{}://{}", location.scheme, location.bucket);
+                (cache, Arc::from(prefix))
+            });
+        self
+    }
+
+    /// The key of an object (range) in the file cache. It contains the version of the object, so
+    /// that modified objects are never served from the cache.
+    async fn cache_key(&self, prefix: &str, path: &Path, range: &str) -> PolarsResult<String> {
+        let meta = self.head(path).await?;
+        let version = match &meta.e_tag {
+            Some(e_tag) => e_tag.clone(),
+            None => format!("{}-{}", meta.size, meta.last_modified.timestamp_millis()),
+        };
+        Ok(format!("{prefix}/{path}\n{version}\n{range}"))
+    }
+
+    async fn cache_get(cache: &Arc<FileCache>, key: &str) -> Option<Bytes> {
+        let cache = cache.clone();
+        let key = key.to_string();
+        tokio::task::spawn_blocking(move || cache.get(&key))
+            .await
+            .ok()
+            .flatten()
+    }
+
+    /// Write to the cache in the background, the query does not wait for it.
+    fn cache_insert(cache: &Arc<FileCache>, key: String, data: Bytes) {
+        let cache = cache.clone();
+        tokio::task::spawn_blocking(move || cache.insert(&key, &data));
+    }
+
+    async fn fetch(&self, path: &Path) -> PolarsResult<Bytes> {
         tune_with_concurrency_budget(1, || async {
-            self.0
+            self.store
                 .get(path)
                 .await
                 .map_err(to_compute_err)?
@@ -33,29 +92,97 @@ impl PolarsObjectStore {
         .await
     }
 
-    pub async fn get_range(&self, path: &Path, range: Range<usize>) -> PolarsResult<Bytes> {
-        tune_with_concurrency_budget(1, || self.0.get_range(path, range))
+    pub async fn get(&self, path: &Path) -> PolarsResult<Bytes> {
+        let Some((cache, prefix)) = &self.file_cache else {
+            return self.fetch(path).await;
+        };
+        let key = self.cache_key(prefix, path, "full").await?;
+        if let Some(bytes) = Self::cache_get(cache, &key).await {
+            return Ok(bytes);
+        }
+        let bytes = self.fetch(path).await?;
+        Self::cache_insert(cache, key, bytes.clone());
+        Ok(bytes)
+    }
+
+    async fn fetch_range(&self, path: &Path, range: Range<usize>) -> PolarsResult<Bytes> {
+        tune_with_concurrency_budget(1, || self.store.get_range(path, range))
             .await
             .map_err(to_compute_err)
     }
 
-    pub async fn get_ranges(
-        &self,
-        path: &Path,
-        ranges: &[Range<usize>],
-    ) -> PolarsResult<Vec<Bytes>> {
+    pub async fn get_range(&self, path: &Path, range: Range<usize>) -> PolarsResult<Bytes> {
+        let Some((cache, prefix)) = &self.file_cache else {
+            return self.fetch_range(path, range).await;
+        };
+        let key = self
+            .cache_key(prefix, path, &format!("{}-{}", range.start, range.end))
+            .await?;
+        if let Some(bytes) = Self::cache_get(cache, &key).await {
+            return Ok(bytes);
+        }
+        let bytes = self.fetch_range(path, range).await?;
+        Self::cache_insert(cache, key, bytes.clone());
+        Ok(bytes)
+    }
+
+    async fn fetch_ranges(&self, path: &Path, ranges: &[Range<usize>]) -> PolarsResult<Vec<Bytes>> {
         tune_with_concurrency_budget(
             (ranges.len() as u32).clamp(0, MAX_BUDGET_PER_REQUEST as u32),
-            || self.0.get_ranges(path, ranges),
+            || self.store.get_ranges(path, ranges),
         )
         .await
         .map_err(to_compute_err)
     }
 
-    /// Fetch the metadata of the parquet file, do not memoize it.
+    pub async fn get_ranges(
+        &self,
+        path: &Path,
+        ranges: &[Range<usize>],
+    ) -> PolarsResult<Vec<Bytes>> {
+        let Some((cache, prefix)) = &self.file_cache else {
+            return self.fetch_ranges(path, ranges).await;
+        };
+
+        // Only fetch the ranges that are not cached.
+        let mut out = Vec::with_capacity(ranges.len());
+        let mut missing_keys = vec![];
+        let mut missing_ranges = vec![];
+        for (i, range) in ranges.iter().enumerate() {
+            let key = self
+                .cache_key(prefix, path, &format!("{}-{}", range.start, range.end))
+                .await?;
+            let bytes = Self::cache_get(cache, &key).await;
+            if bytes.is_none() {
+                missing_keys.push((i, key));
+                missing_ranges.push(range.clone());
+            }
+            out.push(bytes);
+        }
+        if !missing_ranges.is_empty() {
+            let fetched = self.fetch_ranges(path, &missing_ranges).await?;
+            for ((i, key), bytes) in missing_keys.into_iter().zip(fetched) {
+                Self::cache_insert(cache, key, bytes.clone());
+                out[i] = Some(bytes);
+            }
+        }
+        Ok(out.into_iter().map(Option::unwrap).collect())
+    }
+
+    /// Fetch the metadata of the object. It is memoized for the lifetime of this store, i.e. of
+    /// the reader that created it, but never across queries.
     pub async fn head(&self, path: &Path) -> PolarsResult<ObjectMeta> {
-        with_concurrency_budget(1, || self.0.head(path))
+        let memoized = self.heads.lock().unwrap().get(path).cloned();
+        if let Some(meta) = memoized {
+            return Ok(meta);
+        }
+        let meta = with_concurrency_budget(1, || self.store.head(path))
             .await
-            .map_err(to_compute_err)
+            .map_err(to_compute_err)?;
+        self.heads
+            .lock()
+            .unwrap()
+            .insert(path.clone(), meta.clone());
+        Ok(meta)
     }
 }
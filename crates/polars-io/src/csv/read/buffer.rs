@@ -11,6 +11,7 @@ use polars_utils::vec::PushUnchecked;
 
 use super::options::CsvEncoding;
 use super::parser::{is_whitespace, skip_whitespace};
+use super::transcode::decode_single_byte;
 use super::utils::escape_field;
 
 pub(crate) trait PrimitiveParser: PolarsNumericType {
@@ -150,6 +151,7 @@ pub(crate) struct Utf8Field {
     name: String,
     mutable: MutableBinaryViewArray<str>,
     scratch: Vec<u8>,
+    decoded: String,
     quote_char: u8,
     encoding: CsvEncoding,
 }
@@ -160,6 +162,7 @@ impl Utf8Field {
             name: name.to_string(),
             mutable: MutableBinaryViewArray::with_capacity(capacity),
             scratch: vec![],
+            decoded: String::new(),
             quote_char: quote_char.unwrap_or(b'"'),
             encoding,
         }
@@ -208,6 +211,21 @@ impl ParsedBuffer for Utf8Field {
             bytes
         };
 
+        if matches!(
+            self.encoding,
+            CsvEncoding::Latin1 | CsvEncoding::Windows1252
+        ) {
+            if escaped_bytes.is_ascii() {
+                // SAFETY: ASCII is valid utf8.
+                let value = unsafe { std::str::from_utf8_unchecked(escaped_bytes) };
+                self.mutable.push_value(value)
+            } else {
+                decode_single_byte(escaped_bytes, self.encoding, &mut self.decoded);
+                self.mutable.push_value(self.decoded.as_str())
+            }
+            return Ok(());
+        }
+
         // It is important that this happens after escaping, as invalid escaped string can produce
         // invalid utf8.
         let parse_result = validate_utf8(escaped_bytes);
@@ -247,7 +265,9 @@ pub(crate) struct CategoricalField {
 #[cfg(feature = "dtype-categorical")]
 pub(crate) struct CategoricalField {
     escape_scratch: Vec<u8>,
+    decoded: String,
     quote_char: u8,
+    encoding: CsvEncoding,
     builder: CategoricalChunkedBuilder,
 }
 
@@ -258,12 +278,15 @@ impl CategoricalField {
         capacity: usize,
         quote_char: Option<u8>,
         ordering: CategoricalOrdering,
+        encoding: CsvEncoding,
     ) -> Self {
         let builder = CategoricalChunkedBuilder::new(name, capacity, ordering);
 
         Self {
             escape_scratch: vec![],
+            decoded: String::new(),
             quote_char: quote_char.unwrap_or(b'"'),
+            encoding,
             builder,
         }
     }
@@ -282,6 +305,33 @@ impl CategoricalField {
             return Ok(());
         }
 
+        if matches!(
+            self.encoding,
+            CsvEncoding::Latin1 | CsvEncoding::Windows1252
+        ) && !bytes.is_ascii()
+        {
+            let bytes = if needs_escaping {
+                self.escape_scratch.clear();
+                self.escape_scratch.reserve(bytes.len());
+                // SAFETY:
+                // we just allocated enough capacity and data_len is correct.
+                unsafe {
+                    let n_written = escape_field(
+                        bytes,
+                        self.quote_char,
+                        self.escape_scratch.spare_capacity_mut(),
+                    );
+                    self.escape_scratch.set_len(n_written);
+                }
+                self.escape_scratch.as_slice()
+            } else {
+                bytes
+            };
+            decode_single_byte(bytes, self.encoding, &mut self.decoded);
+            self.builder.append_value(&self.decoded);
+            return Ok(());
+        }
+
         if validate_utf8(bytes) {
             if needs_escaping {
                 polars_ensure!(bytes.len() > 1, ComputeError: "invalid csv file\n\nField `{}` is not properly escaped.", std::str::from_utf8(bytes).map_err(to_compute_err)?);
@@ -539,7 +589,7 @@ pub(crate) fn init_buffers(
                 &DataType::Date => Buffer::Date(DatetimeField::new(name, capacity)),
                 #[cfg(feature = "dtype-categorical")]
                 DataType::Categorical(_, ordering) => Buffer::Categorical(CategoricalField::new(
-                    name, capacity, quote_char, *ordering,
+                    name, capacity, quote_char, *ordering, encoding,
                 )),
                 // TODO (ENUM) support writing to Enum
                 dt => polars_bail!(
@@ -24,11 +24,13 @@ mod parser;
 mod read_impl;
 mod reader;
 mod splitfields;
+mod transcode;
 mod utils;
 
 pub use options::{CommentPrefix, CsvEncoding, CsvParserOptions, NullValues};
 pub use parser::count_rows;
 pub use read_impl::batched_mmap::{BatchedCsvReaderMmap, OwnedBatchedCsvReaderMmap};
 pub use read_impl::batched_read::{BatchedCsvReaderRead, OwnedBatchedCsvReader};
+pub use read_impl::batched_stream::BatchedCsvReaderStream;
 pub use reader::CsvReader;
-pub use utils::{infer_file_schema, is_compressed};
+pub use utils::{decompressed_reader, infer_file_schema, is_compressed};
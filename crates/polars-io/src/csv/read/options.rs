@@ -61,6 +61,24 @@ pub enum CsvEncoding {
     Utf8,
     /// Utf8 encoding and unknown bytes are replaced with �.
     LossyUtf8,
+    /// ISO-8859-1 (Latin-1) encoding.
+    Latin1,
+    /// Windows-1252 (CP1252) encoding.
+    Windows1252,
+    /// Little-endian UTF-16 encoding. A byte order mark takes precedence.
+    Utf16Le,
+    /// Big-endian UTF-16 encoding. A byte order mark takes precedence.
+    Utf16Be,
+}
+
+impl CsvEncoding {
+    /// Whether the ASCII characters are encoded as single ASCII bytes.
+    ///
+    /// Such files are parsed in place and only the string fields are decoded. Other files are
+    /// transcoded to UTF-8 before they are parsed.
+    pub fn is_ascii_compatible(&self) -> bool {
+        !matches!(self, Self::Utf16Le | Self::Utf16Be)
+    }
 }
 
 #[derive(Clone, Debug, Eq, PartialEq, Hash)]
@@ -1,5 +1,6 @@
 pub(super) mod batched_mmap;
 pub(super) mod batched_read;
+pub(super) mod batched_stream;
 
 use std::fmt;
 
@@ -18,6 +19,7 @@ use super::parser::{
     get_line_stats, is_comment_line, next_line_position, next_line_position_naive, parse_lines,
     skip_bom, skip_line_ending, skip_this_line, skip_whitespace_exclude,
 };
+use super::transcode::transcode_utf16;
 #[cfg(any(feature = "decompress", feature = "decompress-fast"))]
 use super::utils::decompress;
 #[cfg(not(any(feature = "decompress", feature = "decompress-fast")))]
@@ -166,8 +168,8 @@ impl<'a> CoreReader<'a> {
         decimal_comma: bool,
     ) -> PolarsResult<CoreReader<'a>> {
         check_decimal_comma(decimal_comma, separator.unwrap_or(b','))?;
-        #[cfg(any(feature = "decompress", feature = "decompress-fast"))]
         let mut reader_bytes = reader_bytes;
+        let mut encoding = encoding;
 
         #[cfg(not(any(feature = "decompress", feature = "decompress-fast")))]
         if is_compressed(&reader_bytes) {
@@ -185,8 +187,10 @@ impl<'a> CoreReader<'a> {
         // again after decompression.
         #[cfg(any(feature = "decompress", feature = "decompress-fast"))]
         {
-            let total_n_rows =
-                n_rows.map(|n| skip_rows + (has_header as usize) + skip_rows_after_header + n);
+            // The end of the rows can only be found in ASCII compatible files.
+            let total_n_rows = n_rows
+                .filter(|_| encoding.is_ascii_compatible())
+                .map(|n| skip_rows + (has_header as usize) + skip_rows_after_header + n);
             if let Some(b) =
                 decompress(&reader_bytes, total_n_rows, separator, quote_char, eol_char)
             {
@@ -194,6 +198,11 @@ impl<'a> CoreReader<'a> {
             }
         }
 
+        if !encoding.is_ascii_compatible() {
+            reader_bytes = ReaderBytes::Owned(transcode_utf16(&reader_bytes, encoding)?);
+            encoding = CsvEncoding::Utf8;
+        }
+
         let mut schema = match schema {
             Some(schema) => schema,
             None => {
@@ -213,6 +222,7 @@ impl<'a> CoreReader<'a> {
                     raise_if_empty,
                     &mut n_threads,
                     decimal_comma,
+                    encoding,
                 )?;
                 Arc::new(inferred_schema)
             },
@@ -6,7 +6,7 @@ use polars_core::datatypes::Field;
 use polars_core::frame::DataFrame;
 use polars_core::schema::SchemaRef;
 use polars_core::POOL;
-use polars_error::PolarsResult;
+use polars_error::{polars_bail, PolarsResult};
 use polars_utils::IdxSize;
 use rayon::iter::{IntoParallelRefIterator, ParallelIterator};
 
@@ -204,7 +204,10 @@ impl<'a> CoreReader<'a> {
         let reader_bytes = self.reader_bytes.take().unwrap();
 
         let ReaderBytes::Mapped(bytes, mut file) = &reader_bytes else {
-            unreachable!()
+            polars_bail!(
+                ComputeError: "low memory batched reading requires an uncompressed, \
+                ASCII compatible file; use the memory mapped batched reader instead"
+            )
         };
         let (_, starting_point_offset) =
             self.find_starting_point(bytes, self.quote_char, self.eol_char)?;
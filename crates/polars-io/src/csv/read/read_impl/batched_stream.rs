@@ -0,0 +1,184 @@
+use std::io::{Cursor, Read};
+
+use polars_core::prelude::*;
+
+use super::super::CsvReader;
+use crate::predicates::{apply_predicate, PhysicalIoExpr};
+use crate::RowIndex;
+
+/// Size of the first block, of which the schema is inferred.
+const FIRST_BLOCK_SIZE: usize = 1 << 22;
+const MIN_BLOCK_SIZE: usize = 1 << 20;
+const MAX_BLOCK_SIZE: usize = 1 << 26;
+
+/// The position after the last line ending in `bytes` that is not in a quoted field, i.e. the
+/// end of the last complete row.
+fn last_row_end(bytes: &[u8], quote_char: Option<u8>, eol_char: u8) -> Option<usize> {
+    let Some(quote_char) = quote_char else {
+        return memchr::memrchr(eol_char, bytes).map(|i| i + 1);
+    };
+    let mut in_field = false;
+    let mut end = None;
+    for (i, &c) in bytes.iter().enumerate() {
+        if c == quote_char {
+            in_field = !in_field;
+        } else if c == eol_char && !in_field {
+            end = Some(i + 1);
+        }
+    }
+    end
+}
+
+/// Reads a CSV file in batches while it is read from a stream, e.g. while it is decompressed or
+/// downloaded, instead of reading the whole file in memory first.
+///
+/// The stream is read in blocks of complete rows that are parsed in parallel. The size of the
+/// blocks follows the number of rows that is requested.
+pub struct BatchedCsvReaderStream<'a> {
+    source: Box<dyn Read + Send + 'a>,
+    /// The options of the reader of every block.
+    template: CsvReader<'a, Cursor<Vec<u8>>>,
+    /// The first block, if it was read to infer the schema.
+    first_block: Option<Vec<u8>>,
+    /// The bytes after the last complete row that was read.
+    remainder: Vec<u8>,
+    n_rows: Option<usize>,
+    row_index: Option<RowIndex>,
+    predicate: Option<Arc<dyn PhysicalIoExpr>>,
+    quote_char: Option<u8>,
+    eol_char: u8,
+    chunk_size: usize,
+    schema: Option<SchemaRef>,
+    rows_read: usize,
+    bytes_read: usize,
+    blocks_read: usize,
+    finished: bool,
+}
+
+impl<'a> BatchedCsvReaderStream<'a> {
+    #[allow(clippy::too_many_arguments)]
+    pub(crate) fn new(
+        source: Box<dyn Read + Send + 'a>,
+        template: CsvReader<'a, Cursor<Vec<u8>>>,
+        n_rows: Option<usize>,
+        row_index: Option<RowIndex>,
+        predicate: Option<Arc<dyn PhysicalIoExpr>>,
+        quote_char: Option<u8>,
+        eol_char: u8,
+        chunk_size: usize,
+    ) -> Self {
+        Self {
+            source,
+            template,
+            first_block: None,
+            remainder: vec![],
+            n_rows,
+            row_index,
+            predicate,
+            quote_char,
+            eol_char,
+            chunk_size,
+            schema: None,
+            rows_read: 0,
+            bytes_read: 0,
+            blocks_read: 0,
+            finished: false,
+        }
+    }
+
+    /// Read the next block of complete rows of at least `size` bytes, unless the stream ends.
+    fn read_block(&mut self, size: usize) -> PolarsResult<Option<Vec<u8>>> {
+        let mut block = std::mem::take(&mut self.remainder);
+        loop {
+            let want = size.saturating_sub(block.len()).max(MIN_BLOCK_SIZE / 4);
+            let read = (&mut self.source)
+                .take(want as u64)
+                .read_to_end(&mut block)?;
+            if read < want {
+                self.finished = true;
+                return Ok((!block.is_empty()).then_some(block));
+            }
+            if block.len() >= size {
+                if let Some(end) = last_row_end(&block, self.quote_char, self.eol_char) {
+                    self.remainder = block.split_off(end);
+                    return Ok(Some(block));
+                }
+            }
+        }
+    }
+
+    /// The schema of the file, which is inferred from the first block if it is not given.
+    pub fn schema(&mut self) -> PolarsResult<SchemaRef> {
+        if let Some(schema) = &self.schema {
+            return Ok(schema.clone());
+        }
+        let block = self.read_block(FIRST_BLOCK_SIZE)?.unwrap_or_default();
+        let schema = self.template.infer_schema_of(&block)?;
+        self.first_block = Some(block);
+        self.schema = Some(schema.clone());
+        Ok(schema)
+    }
+
+    pub fn next_batches(&mut self, n: usize) -> PolarsResult<Option<Vec<DataFrame>>> {
+        self.schema()?;
+        let remaining = self.n_rows.map(|n| n.saturating_sub(self.rows_read));
+        if remaining == Some(0) {
+            return Ok(None);
+        }
+        let first = self.blocks_read == 0;
+        let block = match self.first_block.take() {
+            Some(block) => block,
+            None if self.finished => return Ok(None),
+            None => {
+                // Size the block so that it holds about `n` chunks of rows.
+                let bytes_per_row = self.bytes_read / std::cmp::max(self.rows_read, 1);
+                let size = (bytes_per_row * self.chunk_size)
+                    .saturating_mul(n)
+                    .clamp(MIN_BLOCK_SIZE, MAX_BLOCK_SIZE);
+                match self.read_block(size)? {
+                    Some(block) => block,
+                    None => return Ok(None),
+                }
+            },
+        };
+        self.blocks_read += 1;
+        self.bytes_read += block.len();
+
+        let row_index = self.row_index.clone().map(|mut ri| {
+            ri.offset += self.rows_read as IdxSize;
+            ri
+        });
+        let mut df = self
+            .template
+            .block_reader(block, first)
+            .with_n_rows(remaining)
+            .with_row_index(row_index)
+            .finish()?;
+        if let Some(remaining) = remaining {
+            if df.height() > remaining {
+                df = df.slice(0, remaining);
+            }
+        }
+        self.rows_read += df.height();
+        apply_predicate(&mut df, self.predicate.as_deref(), true)?;
+
+        if df.n_chunks() > 1 {
+            Ok(Some(df.split_chunks().collect()))
+        } else {
+            Ok(Some(vec![df]))
+        }
+    }
+}
+
+#[cfg(test)]
+mod test {
+    use super::*;
+
+    #[test]
+    fn test_last_row_end() {
+        assert_eq!(last_row_end(b"a,b\n1,2\n3,", Some(b'"'), b'\n'), Some(8));
+        assert_eq!(last_row_end(b"a,b\n\"1\n2\",", Some(b'"'), b'\n'), Some(4));
+        assert_eq!(last_row_end(b"a,b\n\"1\n2\",", None, b'\n'), Some(7));
+        assert_eq!(last_row_end(b"a,b", Some(b'"'), b'\n'), None);
+    }
+}
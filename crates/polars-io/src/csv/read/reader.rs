@@ -1,4 +1,5 @@
 use std::fs::File;
+use std::io::Cursor;
 use std::path::PathBuf;
 
 use polars_core::prelude::*;
@@ -15,8 +16,10 @@ use super::read_impl::batched_mmap::{
 use super::read_impl::batched_read::{
     to_batched_owned_read, BatchedCsvReaderRead, OwnedBatchedCsvReader,
 };
+use super::read_impl::batched_stream::BatchedCsvReaderStream;
 use super::read_impl::CoreReader;
-use crate::mmap::MmapBytesReader;
+use super::utils::decompressed_reader;
+use crate::mmap::{MmapBytesReader, ReaderBytes};
 use crate::predicates::PhysicalIoExpr;
 use crate::shared::SerReader;
 use crate::utils::{get_reader_bytes, resolve_homedir};
@@ -38,6 +41,7 @@ use crate::RowIndex;
 /// }
 /// ```
 #[must_use]
+#[derive(Clone)]
 pub struct CsvReader<'a, R>
 where
     R: MmapBytesReader,
@@ -426,6 +430,136 @@ impl<'a, R: MmapBytesReader + 'a> CsvReader<'a, R> {
             csv_reader.batched_read(false)
         }
     }
+
+    /// Read the file in batches while it is read from `R`, instead of reading it in memory at
+    /// once. Compressed files are decompressed while they are read.
+    pub fn batched_stream(self) -> PolarsResult<BatchedCsvReaderStream<'a>> {
+        polars_ensure!(
+            self.encoding.is_ascii_compatible(),
+            ComputeError: "cannot read a UTF-16 encoded CSV file in a stream"
+        );
+        let CsvReader {
+            reader,
+            n_rows,
+            max_records,
+            skip_rows_before_header,
+            projection,
+            columns,
+            separator,
+            schema,
+            encoding,
+            n_threads,
+            path,
+            schema_overwrite,
+            dtype_overwrite,
+            sample_size,
+            chunk_size,
+            comment_prefix,
+            null_values,
+            predicate,
+            quote_char,
+            skip_rows_after_header,
+            try_parse_dates,
+            row_index,
+            rechunk: _,
+            raise_if_empty,
+            truncate_ragged_lines,
+            missing_is_null,
+            low_memory,
+            has_header,
+            ignore_errors,
+            eol_char,
+            decimal_comma,
+        } = self;
+        // The rows limit, row index and predicate apply to the whole file, not per block.
+        let template = CsvReader {
+            reader: Cursor::new(vec![]),
+            n_rows: None,
+            max_records,
+            skip_rows_before_header,
+            projection,
+            columns,
+            separator,
+            schema,
+            encoding,
+            n_threads,
+            path,
+            schema_overwrite,
+            dtype_overwrite,
+            sample_size,
+            chunk_size,
+            comment_prefix,
+            null_values,
+            predicate: None,
+            quote_char,
+            skip_rows_after_header,
+            try_parse_dates,
+            row_index: None,
+            rechunk: false,
+            raise_if_empty,
+            truncate_ragged_lines,
+            missing_is_null,
+            low_memory,
+            has_header,
+            ignore_errors,
+            eol_char,
+            decimal_comma,
+        };
+        Ok(BatchedCsvReaderStream::new(
+            decompressed_reader(reader)?,
+            template,
+            n_rows,
+            row_index,
+            predicate,
+            quote_char,
+            eol_char,
+            chunk_size,
+        ))
+    }
+}
+
+impl<'a> CsvReader<'a, Cursor<Vec<u8>>> {
+    /// Infer the schema of a streamed file from its first block, unless it is given.
+    pub(super) fn infer_schema_of(&mut self, bytes: &[u8]) -> PolarsResult<SchemaRef> {
+        if let Some(schema) = &self.schema {
+            return Ok(schema.clone());
+        }
+        let (inferred_schema, _, _) = infer_file_schema(
+            &ReaderBytes::Borrowed(bytes),
+            self.separator.unwrap_or(b','),
+            self.max_records,
+            self.has_header,
+            self.schema_overwrite.as_deref(),
+            &mut self.skip_rows_before_header,
+            self.skip_rows_after_header,
+            self.comment_prefix.as_ref(),
+            self.quote_char,
+            self.eol_char,
+            self.null_values.as_ref(),
+            self.try_parse_dates,
+            self.raise_if_empty,
+            &mut self.n_threads,
+            self.decimal_comma,
+            self.encoding,
+        )?;
+        let schema = Arc::new(inferred_schema);
+        self.schema = Some(schema.clone());
+        Ok(schema)
+    }
+
+    /// The reader of a block of complete rows of a streamed file. Only the first block contains
+    /// the header and the rows that are skipped.
+    pub(super) fn block_reader(&self, block: Vec<u8>, first: bool) -> Self {
+        let mut reader = self.clone();
+        reader.reader = Cursor::new(block);
+        if !first {
+            reader.has_header = false;
+            reader.skip_rows_before_header = 0;
+            reader.skip_rows_after_header = 0;
+            reader.raise_if_empty = false;
+        }
+        reader
+    }
 }
 
 impl<'a> CsvReader<'a, Box<dyn MmapBytesReader>> {
@@ -454,6 +588,7 @@ impl<'a> CsvReader<'a, Box<dyn MmapBytesReader>> {
                     self.raise_if_empty,
                     &mut self.n_threads,
                     self.decimal_comma,
+                    self.encoding,
                 )?;
                 let schema = Arc::new(inferred_schema);
                 Ok(to_batched_owned_mmap(self, schema))
@@ -485,6 +620,7 @@ impl<'a> CsvReader<'a, Box<dyn MmapBytesReader>> {
                     self.raise_if_empty,
                     &mut self.n_threads,
                     self.decimal_comma,
+                    self.encoding,
                 )?;
                 let schema = Arc::new(inferred_schema);
                 Ok(to_batched_owned_read(self, schema))
@@ -0,0 +1,156 @@
+//! Decoding of CSV files that are not encoded in UTF-8.
+//!
+//! Single byte encodings encode the ASCII characters as ASCII bytes, so such files are parsed in
+//! place and only the string fields that contain other bytes are decoded. UTF-16 files are
+//! transcoded to UTF-8 before they are parsed.
+use polars_core::POOL;
+use polars_error::{polars_ensure, polars_err, PolarsResult};
+use rayon::prelude::*;
+
+use super::options::CsvEncoding;
+
+/// The characters of the bytes `0x80..0xA0` in Windows-1252. The five bytes that are not assigned
+/// are mapped to the C1 control characters, as in ISO-8859-1.
+const WINDOWS_1252_HIGH: [char; 32] = [
+    '\u{20AC}', '\u{0081}', '\u{201A}', '\u{0192}', '\u{201E}', '\u{2026}', '\u{2020}', '\u{2021}',
+    '\u{02C6}', '\u{2030}', '\u{0160}', '\u{2039}', '\u{0152}', '\u{008D}', '\u{017D}', '\u{008F}',
+    '\u{0090}', '\u{2018}', '\u{2019}', '\u{201C}', '\u{201D}', '\u{2022}', '\u{2013}', '\u{2014}',
+    '\u{02DC}', '\u{2122}', '\u{0161}', '\u{203A}', '\u{0153}', '\u{009D}', '\u{017E}', '\u{0178}',
+];
+
+/// Minimal number of UTF-16 code units that are transcoded by a single task.
+const MIN_UTF16_CHUNK: usize = 1 << 16;
+
+#[inline]
+fn decode_byte(byte: u8, encoding: CsvEncoding) -> char {
+    match (encoding, byte) {
+        (CsvEncoding::Windows1252, 0x80..=0x9F) => WINDOWS_1252_HIGH[(byte - 0x80) as usize],
+        _ => byte as char,
+    }
+}
+
+/// Decode the bytes of a field in a single byte `encoding` into `out`.
+pub(super) fn decode_single_byte(bytes: &[u8], encoding: CsvEncoding, out: &mut String) {
+    debug_assert!(matches!(
+        encoding,
+        CsvEncoding::Latin1 | CsvEncoding::Windows1252
+    ));
+    out.clear();
+    // Every byte above 0x7F is decoded to two or three bytes.
+    out.reserve(bytes.len() * 2);
+    out.extend(bytes.iter().map(|&b| decode_byte(b, encoding)));
+}
+
+#[inline]
+fn code_unit(bytes: &[u8], i: usize, big_endian: bool) -> u16 {
+    let pair = [bytes[2 * i], bytes[2 * i + 1]];
+    if big_endian {
+        u16::from_be_bytes(pair)
+    } else {
+        u16::from_le_bytes(pair)
+    }
+}
+
+/// Transcode a UTF-16 encoded file to UTF-8.
+///
+/// The file is split in chunks that are transcoded in parallel. The first pass computes the
+/// length of every transcoded chunk, so that the second pass can write them directly into a
+/// single output buffer.
+pub(super) fn transcode_utf16(bytes: &[u8], encoding: CsvEncoding) -> PolarsResult<Vec<u8>> {
+    let (bytes, big_endian) = match bytes {
+        [0xFF, 0xFE, rest @ ..] => (rest, false),
+        [0xFE, 0xFF, rest @ ..] => (rest, true),
+        _ => (bytes, matches!(encoding, CsvEncoding::Utf16Be)),
+    };
+    polars_ensure!(
+        bytes.len() % 2 == 0,
+        ComputeError: "invalid utf-16 sequence: the file has an odd number of bytes"
+    );
+    let n_units = bytes.len() / 2;
+
+    // Split on code units, but never between the two units of a surrogate pair.
+    let chunk_size = std::cmp::max(n_units / POOL.current_num_threads(), MIN_UTF16_CHUNK);
+    let mut offsets = vec![0];
+    let mut offset = chunk_size;
+    while offset < n_units {
+        if (0xDC00..0xE000).contains(&code_unit(bytes, offset, big_endian)) {
+            offset += 1;
+        }
+        offsets.push(offset);
+        offset += chunk_size;
+    }
+    offsets.push(n_units);
+    offsets.dedup();
+
+    let decode = |start: usize, end: usize| {
+        char::decode_utf16((start..end).map(move |i| code_unit(bytes, i, big_endian)))
+    };
+
+    let lengths = POOL.install(|| {
+        offsets
+            .par_windows(2)
+            .map(|w| {
+                decode(w[0], w[1])
+                    .map(|c| c.map(char::len_utf8))
+                    .sum::<Result<usize, _>>()
+                    .map_err(|_| polars_err!(ComputeError: "invalid utf-16 sequence"))
+            })
+            .collect::<PolarsResult<Vec<_>>>()
+    })?;
+
+    let mut out = vec![0u8; lengths.iter().sum()];
+    let mut remaining = out.as_mut_slice();
+    let mut chunks = Vec::with_capacity(lengths.len());
+    for len in lengths {
+        let (chunk, rest) = remaining.split_at_mut(len);
+        chunks.push(chunk);
+        remaining = rest;
+    }
+
+    POOL.install(|| {
+        chunks
+            .into_par_iter()
+            .zip(offsets.par_windows(2))
+            .for_each(|(chunk, w)| {
+                let mut pos = 0;
+                // The chunks are validated by the first pass.
+                for c in decode(w[0], w[1]).flatten() {
+                    pos += c.encode_utf8(&mut chunk[pos..]).len();
+                }
+            })
+    });
+    Ok(out)
+}
+
+#[cfg(test)]
+mod test {
+    use super::*;
+
+    #[test]
+    fn test_decode_single_byte() {
+        let mut out = String::new();
+        decode_single_byte(b"caf\xe9 \x80", CsvEncoding::Latin1, &mut out);
+        assert_eq!(out, "café \u{80}");
+        decode_single_byte(b"caf\xe9 \x80", CsvEncoding::Windows1252, &mut out);
+        assert_eq!(out, "café €");
+    }
+
+    #[test]
+    fn test_transcode_utf16() {
+        let text = "a,b\n\u{1F600},é\n";
+        let le = text
+            .encode_utf16()
+            .flat_map(u16::to_le_bytes)
+            .collect::<Vec<_>>();
+        let be = [0xFE, 0xFF]
+            .into_iter()
+            .chain(text.encode_utf16().flat_map(u16::to_be_bytes))
+            .collect::<Vec<_>>();
+        let out = transcode_utf16(&le, CsvEncoding::Utf16Le).unwrap();
+        assert_eq!(out, text.as_bytes());
+        // The byte order mark takes precedence.
+        let out = transcode_utf16(&be, CsvEncoding::Utf16Le).unwrap();
+        assert_eq!(out, text.as_bytes());
+        assert!(transcode_utf16(&[0x00, 0xD8], CsvEncoding::Utf16Le).is_err());
+    }
+}
@@ -16,6 +16,7 @@ use super::options::{CommentPrefix, CsvEncoding, NullValues};
 use super::parser::next_line_position_naive;
 use super::parser::{is_comment_line, next_line_position, skip_bom, skip_line_ending, SplitLines};
 use super::splitfields::SplitFields;
+use super::transcode::{decode_single_byte, transcode_utf16};
 use crate::mmap::ReaderBytes;
 use crate::utils::{BOOLEAN_RE, FLOAT_RE, FLOAT_RE_DECIMAL, INTEGER_RE};
 
@@ -129,7 +130,20 @@ pub(crate) fn parse_bytes_with_encoding(
         CsvEncoding::Utf8 => simdutf8::basic::from_utf8(bytes)
             .map_err(|_| polars_err!(ComputeError: "invalid utf-8 sequence"))?
             .into(),
-        CsvEncoding::LossyUtf8 => String::from_utf8_lossy(bytes),
+        // UTF-16 files are transcoded to UTF-8 before they are parsed.
+        CsvEncoding::LossyUtf8 | CsvEncoding::Utf16Le | CsvEncoding::Utf16Be => {
+            String::from_utf8_lossy(bytes)
+        },
+        CsvEncoding::Latin1 | CsvEncoding::Windows1252 => {
+            if bytes.is_ascii() {
+                // SAFETY: ASCII is valid utf8.
+                unsafe { std::str::from_utf8_unchecked(bytes) }.into()
+            } else {
+                let mut decoded = String::new();
+                decode_single_byte(bytes, encoding, &mut decoded);
+                decoded.into()
+            }
+        },
     })
 }
 
@@ -153,13 +167,17 @@ pub fn infer_file_schema_inner(
     raise_if_empty: bool,
     n_threads: &mut Option<usize>,
     decimal_comma: bool,
+    encoding: CsvEncoding,
 ) -> PolarsResult<(Schema, usize, usize)> {
     // keep track so that we can determine the amount of bytes read
     let start_ptr = reader_bytes.as_ptr() as usize;
 
     // We use lossy utf8 here because we don't want the schema inference to fail on utf8.
     // It may later.
-    let encoding = CsvEncoding::LossyUtf8;
+    let encoding = match encoding {
+        CsvEncoding::Utf8 => CsvEncoding::LossyUtf8,
+        encoding => encoding,
+    };
 
     let bytes = skip_line_ending(skip_bom(reader_bytes), eol_char);
     if raise_if_empty {
@@ -254,6 +272,7 @@ pub fn infer_file_schema_inner(
             raise_if_empty,
             n_threads,
             decimal_comma,
+            encoding,
         );
     } else if !raise_if_empty {
         return Ok((Schema::new(), 0, 0));
@@ -458,6 +477,7 @@ pub fn infer_file_schema_inner(
             raise_if_empty,
             n_threads,
             decimal_comma,
+            encoding,
         );
     }
 
@@ -499,8 +519,31 @@ pub fn infer_file_schema(
     raise_if_empty: bool,
     n_threads: &mut Option<usize>,
     decimal_comma: bool,
+    encoding: CsvEncoding,
 ) -> PolarsResult<(Schema, usize, usize)> {
     check_decimal_comma(decimal_comma, separator)?;
+    if !encoding.is_ascii_compatible() {
+        let reader_bytes = ReaderBytes::Owned(transcode_utf16(reader_bytes, encoding)?);
+        return infer_file_schema_inner(
+            &reader_bytes,
+            separator,
+            max_read_rows,
+            has_header,
+            schema_overwrite,
+            skip_rows,
+            skip_rows_after_header,
+            comment_prefix,
+            quote_char,
+            eol_char,
+            null_values,
+            try_parse_dates,
+            0,
+            raise_if_empty,
+            n_threads,
+            decimal_comma,
+            CsvEncoding::Utf8,
+        );
+    }
     infer_file_schema_inner(
         reader_bytes,
         separator,
@@ -518,6 +561,7 @@ pub fn infer_file_schema(
         raise_if_empty,
         n_threads,
         decimal_comma,
+        encoding,
     )
 }
 
@@ -632,6 +676,35 @@ pub(crate) fn decompress(
     }
 }
 
+/// Wrap `reader` in a decoder if its content is compressed, so that it can be decompressed while
+/// it is read.
+pub fn decompressed_reader<'a, R: Read + Send + 'a>(
+    reader: R,
+) -> PolarsResult<Box<dyn Read + Send + 'a>> {
+    let mut reader = std::io::BufReader::new(reader);
+    let magic = std::io::BufRead::fill_buf(&mut reader)?;
+    if !is_compressed(magic) {
+        return Ok(Box::new(reader));
+    }
+    #[cfg(any(feature = "decompress", feature = "decompress-fast"))]
+    {
+        if magic.starts_with(&GZIP) {
+            Ok(Box::new(flate2::read::MultiGzDecoder::new(reader)))
+        } else if magic.starts_with(&ZSTD) {
+            Ok(Box::new(zstd::Decoder::with_buffer(reader)?))
+        } else {
+            Ok(Box::new(flate2::read::ZlibDecoder::new(reader)))
+        }
+    }
+    #[cfg(not(any(feature = "decompress", feature = "decompress-fast")))]
+    {
+        polars_bail!(
+            ComputeError: "cannot read compressed CSV file; \
+            compile with feature 'decompress' or 'decompress-fast'"
+        );
+    }
+}
+
 /// replace double quotes by single ones
 ///
 /// This function assumes that bytes is wrapped in the quoting character.
@@ -62,12 +62,11 @@ impl IpcReaderAsync {
         uri: &str,
         cloud_options: Option<&CloudOptions>,
     ) -> PolarsResult<IpcReaderAsync> {
-        let (
-            CloudLocation {
-                prefix, expansion, ..
-            },
-            store,
-        ) = build_object_store(uri, cloud_options).await?;
+        let (location, store) = build_object_store(uri, cloud_options).await?;
+        let store = PolarsObjectStore::new(store).with_file_cache(&location, cloud_options);
+        let CloudLocation {
+            prefix, expansion, ..
+        } = location;
 
         let path = {
             // Any wildcards should already have been resolved here. Without this assertion they would
@@ -76,10 +75,7 @@ impl IpcReaderAsync {
             Path::from_url_path(prefix).map_err(to_compute_err)?
         };
 
-        Ok(Self {
-            store: PolarsObjectStore::new(store),
-            path,
-        })
+        Ok(Self { store, path })
     }
 
     async fn object_metadata(&self) -> PolarsResult<ObjectMeta> {
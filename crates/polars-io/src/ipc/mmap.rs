@@ -2,7 +2,6 @@ use arrow::io::ipc::read;
 use arrow::io::ipc::read::{Dictionaries, FileMetadata};
 use arrow::mmap::{mmap_dictionaries_unchecked, mmap_unchecked};
 use arrow::record_batch::RecordBatch;
-use memmap::Mmap;
 use polars_core::frame::ArrowChunk;
 use polars_core::prelude::*;
 
@@ -34,7 +33,7 @@ impl<R: MmapBytesReader> IpcReader<R> {
                     metadata.schema.clone()
                 };
 
-                let reader = MMapChunkIter::new(mmap, metadata, &self.projection)?;
+                let reader = MMapChunkIter::new(Arc::new(mmap), metadata, &self.projection)?;
 
                 finish_reader(
                     reader,
@@ -51,23 +50,36 @@ impl<R: MmapBytesReader> IpcReader<R> {
     }
 }
 
-struct MMapChunkIter<'a> {
+/// Reads an in-memory IPC file without copying its buffers.
+///
+/// The arrays of the returned [`DataFrame`] point into `data`, which is kept alive for as long
+/// as they are. This errors if the file is compressed or its buffers are not aligned.
+///
+/// # Safety
+/// `data` must be a valid IPC file, e.g. written by an [`IpcWriter`](super::IpcWriter). The
+/// offsets and the UTF-8 of the buffers are not validated.
+pub unsafe fn read_ipc_file_zero_copy<T: AsRef<[u8]>>(data: Arc<T>) -> PolarsResult<DataFrame> {
+    let metadata = read::read_file_metadata(&mut std::io::Cursor::new(data.as_ref().as_ref()))?;
+    let schema = metadata.schema.clone();
+    let reader = MMapChunkIter::new(data, metadata, &None)?;
+    finish_reader(reader, false, None, None, &schema, None)
+}
+
+struct MMapChunkIter<'a, T> {
     dictionaries: Dictionaries,
     metadata: FileMetadata,
-    mmap: Arc<Mmap>,
+    mmap: Arc<T>,
     idx: usize,
     end: usize,
     projection: &'a Option<Vec<usize>>,
 }
 
-impl<'a> MMapChunkIter<'a> {
+impl<'a, T: AsRef<[u8]>> MMapChunkIter<'a, T> {
     fn new(
-        mmap: Mmap,
+        mmap: Arc<T>,
         metadata: FileMetadata,
         projection: &'a Option<Vec<usize>>,
     ) -> PolarsResult<Self> {
-        let mmap = Arc::new(mmap);
-
         let end = metadata.blocks.len();
         // mmap the dictionaries
         let dictionaries = unsafe { mmap_dictionaries_unchecked(&metadata, mmap.clone())? };
@@ -83,7 +95,7 @@ impl<'a> MMapChunkIter<'a> {
     }
 }
 
-impl ArrowReader for MMapChunkIter<'_> {
+impl<T: AsRef<[u8]>> ArrowReader for MMapChunkIter<'_, T> {
     fn next_record_batch(&mut self) -> PolarsResult<Option<ArrowChunk>> {
         if self.idx < self.end {
             let chunk = unsafe {
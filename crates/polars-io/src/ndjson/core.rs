@@ -100,6 +100,130 @@ impl<'a> JsonLineReader<'a, File> {
         let f = polars_utils::open_file(&path)?;
         Ok(Self::new(f).with_path(Some(path)))
     }
+
+    /// Read the file in batches of `chunk_size` rows per thread instead of all at once.
+    ///
+    /// Only the columns in the schema are parsed, so it doubles as the projection. The schema
+    /// is inferred from the start of the file if it is not set.
+    pub fn batched(self) -> PolarsResult<BatchedJsonLineReader> {
+        let mmap = unsafe { memmap::Mmap::map(&self.reader)? };
+        let mut schema = match self.schema {
+            Some(schema) => schema,
+            None => {
+                let mut cursor = Cursor::new(mmap.as_ref());
+                Arc::new(crate::ndjson::infer_schema(
+                    &mut cursor,
+                    self.infer_schema_len,
+                )?)
+            },
+        };
+        if let Some(overwriting_schema) = self.schema_overwrite {
+            let schema = Arc::make_mut(&mut schema);
+            overwrite_schema(schema, overwriting_schema)?;
+        }
+        Ok(BatchedJsonLineReader {
+            mmap,
+            offset: 0,
+            schema,
+            chunk_size: self.chunk_size.get(),
+            bytes_per_row: None,
+            n_rows: self.n_rows,
+            rows_read: 0,
+            ignore_errors: self.ignore_errors,
+        })
+    }
+}
+
+/// Reads an NDJSON file in batches, so that it can be processed in bounded memory.
+///
+/// Every call of [`BatchedJsonLineReader::next_batches`] splits the next part of the file at line
+/// boundaries and parses the parts in parallel.
+pub struct BatchedJsonLineReader {
+    mmap: memmap::Mmap,
+    offset: usize,
+    schema: SchemaRef,
+    chunk_size: usize,
+    /// Estimated from the lines at the start of the file on the first read.
+    bytes_per_row: Option<usize>,
+    n_rows: Option<usize>,
+    rows_read: usize,
+    ignore_errors: bool,
+}
+
+impl BatchedJsonLineReader {
+    /// The schema of the batches.
+    pub fn schema(&self) -> &SchemaRef {
+        &self.schema
+    }
+
+    /// Parse the next `n` batches of about `chunk_size` rows, or return `None` if the file is
+    /// exhausted.
+    pub fn next_batches(&mut self, n: usize) -> PolarsResult<Option<Vec<DataFrame>>> {
+        let bytes: &[u8] = &self.mmap;
+        if self.offset >= bytes.len() || self.n_rows.is_some_and(|n| self.rows_read >= n) {
+            return Ok(None);
+        }
+        let bytes_per_row = *self.bytes_per_row.get_or_insert_with(|| {
+            get_line_stats_json(&bytes[self.offset..], 1024)
+                .map_or(256, |(mean, std)| (mean + std).ceil() as usize)
+                .max(1)
+        });
+        let chunk_bytes = self.chunk_size.saturating_mul(bytes_per_row);
+
+        let mut chunks = Vec::with_capacity(n);
+        for _ in 0..n {
+            if self.offset >= bytes.len() {
+                break;
+            }
+            let end = next_chunk_end(bytes, self.offset + chunk_bytes);
+            chunks.push((self.offset, end));
+            self.offset = end;
+        }
+
+        let capacity = self.chunk_size;
+        let mut dfs = POOL.install(|| {
+            chunks
+                .into_par_iter()
+                .map(|(start, end)| {
+                    let mut buffers = init_buffers(&self.schema, capacity, self.ignore_errors)?;
+                    parse_lines(&bytes[start..end], &mut buffers)?;
+                    DataFrame::new(
+                        buffers
+                            .into_values()
+                            .map(|buf| buf.into_series())
+                            .collect::<_>(),
+                    )
+                })
+                .collect::<PolarsResult<Vec<_>>>()
+        })?;
+
+        if let Some(n_rows) = self.n_rows {
+            for df in dfs.iter_mut() {
+                let remaining = n_rows.saturating_sub(self.rows_read);
+                if df.height() > remaining {
+                    *df = df.slice(0, remaining);
+                }
+                self.rows_read += df.height();
+            }
+            dfs.retain(|df| df.height() > 0);
+            if dfs.is_empty() {
+                return Ok(None);
+            }
+        }
+        Ok(Some(dfs))
+    }
+}
+
+/// The end of the line at or after `pos`, or the end of `bytes`.
+fn next_chunk_end(bytes: &[u8], pos: usize) -> usize {
+    if pos >= bytes.len() {
+        return bytes.len();
+    }
+    // A JSON line can not contain a raw newline, so any newline ends a line. Prefer one after a
+    // closing bracket, like the in-memory reader.
+    next_line_position_naive_json(&bytes[pos..])
+        .or_else(|| memchr::memchr(NEWLINE, &bytes[pos..]).map(|p| p + 1))
+        .map_or(bytes.len(), |p| pos + p)
 }
 impl<'a, R> SerReader<R> for JsonLineReader<'a, R>
 where
@@ -1,9 +1,38 @@
+use std::num::NonZeroUsize;
+
 use arrow::array::StructArray;
 use polars_core::prelude::*;
+#[cfg(feature = "serde")]
+use serde::{Deserialize, Serialize};
 
 pub(crate) mod buffer;
 pub mod core;
 
+/// Options for reading (scanning) NDJSON files.
+#[derive(Clone, Debug, PartialEq, Eq, Hash)]
+#[cfg_attr(feature = "serde", derive(Serialize, Deserialize))]
+pub struct NDJsonReadOptions {
+    pub n_threads: Option<usize>,
+    pub infer_schema_length: Option<usize>,
+    pub chunk_size: Option<NonZeroUsize>,
+    pub low_memory: bool,
+    pub ignore_errors: bool,
+    pub schema: Option<SchemaRef>,
+}
+
+impl Default for NDJsonReadOptions {
+    fn default() -> Self {
+        Self {
+            n_threads: None,
+            infer_schema_length: Some(100),
+            chunk_size: None,
+            low_memory: false,
+            ignore_errors: false,
+            schema: None,
+        }
+    }
+}
+
 pub fn infer_schema<R: std::io::BufRead>(
     reader: &mut R,
     infer_schema_len: Option<usize>,
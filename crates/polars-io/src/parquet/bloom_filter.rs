@@ -0,0 +1,125 @@
+//! Hashing of values for parquet bloom filters.
+//!
+//! Values are hashed as their parquet physical type, so that the bloom filters of files
+//! written by other writers can be probed as well.
+use polars_core::prelude::*;
+use polars_parquet::parquet::bloom_filter::{hash_byte, hash_native, insert, optimal_num_of_bytes};
+use polars_parquet::parquet::schema::types::PhysicalType;
+use polars_utils::total_ord::{canonical_f32, canonical_f64};
+
+/// The false positive probability of the bloom filters we write.
+const FPP: f64 = 0.01;
+
+/// Returns the parquet physical type the values of `dtype` are hashed as, or `None` if
+/// values of this type cannot be hashed.
+pub(crate) fn hashed_physical_type(dtype: &DataType) -> Option<PhysicalType> {
+    use DataType::*;
+    match dtype {
+        Int8 | Int16 | Int32 | UInt8 | UInt16 | UInt32 => Some(PhysicalType::Int32),
+        #[cfg(feature = "dtype-date")]
+        Date => Some(PhysicalType::Int32),
+        Int64 | UInt64 => Some(PhysicalType::Int64),
+        #[cfg(feature = "dtype-datetime")]
+        Datetime(_, _) => Some(PhysicalType::Int64),
+        #[cfg(feature = "dtype-time")]
+        Time => Some(PhysicalType::Int64),
+        Float32 => Some(PhysicalType::Float),
+        Float64 => Some(PhysicalType::Double),
+        String | Binary => Some(PhysicalType::ByteArray),
+        _ => None,
+    }
+}
+
+/// Hashes a single value, returns `None` if the value cannot be hashed.
+///
+/// Zeros and NaNs are not hashed: Polars considers `-0.0 == 0.0` and all NaNs equal, but
+/// other writers hash them by their bit pattern, so a single probe could miss a match.
+pub(crate) fn hash_any_value(value: &AnyValue) -> Option<u64> {
+    let hash = match value {
+        AnyValue::Int8(v) => hash_native(*v as i32),
+        AnyValue::Int16(v) => hash_native(*v as i32),
+        AnyValue::Int32(v) => hash_native(*v),
+        AnyValue::Int64(v) => hash_native(*v),
+        AnyValue::UInt8(v) => hash_native(*v as i32),
+        AnyValue::UInt16(v) => hash_native(*v as i32),
+        AnyValue::UInt32(v) => hash_native(*v as i32),
+        AnyValue::UInt64(v) => hash_native(*v as i64),
+        AnyValue::Float32(v) if *v != 0.0 && !v.is_nan() => hash_native(*v),
+        AnyValue::Float64(v) if *v != 0.0 && !v.is_nan() => hash_native(*v),
+        #[cfg(feature = "dtype-date")]
+        AnyValue::Date(v) => hash_native(*v),
+        #[cfg(feature = "dtype-datetime")]
+        AnyValue::Datetime(v, _, _) => hash_native(*v),
+        #[cfg(feature = "dtype-time")]
+        AnyValue::Time(v) => hash_native(*v),
+        AnyValue::String(v) => hash_byte(v),
+        AnyValue::StringOwned(v) => hash_byte(v.as_str()),
+        AnyValue::Binary(v) => hash_byte(v),
+        AnyValue::BinaryOwned(v) => hash_byte(v),
+        _ => return None,
+    };
+    Some(hash)
+}
+
+/// Hashes the non-null values of `s`, returns `None` if the values cannot be hashed.
+fn hash_values(s: &Series) -> Option<PlHashSet<u64>> {
+    hashed_physical_type(s.dtype())?;
+    let s = s.to_physical_repr();
+    let hashes = match s.dtype() {
+        DataType::Int8 | DataType::Int16 | DataType::Int32 | DataType::UInt8 | DataType::UInt16 => {
+            let s = s.cast(&DataType::Int32).ok()?;
+            s.i32().unwrap().iter().flatten().map(hash_native).collect()
+        },
+        DataType::UInt32 => s
+            .u32()
+            .unwrap()
+            .iter()
+            .flatten()
+            .map(|v| hash_native(v as i32))
+            .collect(),
+        DataType::Int64 => s.i64().unwrap().iter().flatten().map(hash_native).collect(),
+        DataType::UInt64 => s
+            .u64()
+            .unwrap()
+            .iter()
+            .flatten()
+            .map(|v| hash_native(v as i64))
+            .collect(),
+        // Hash zeros and NaNs in their canonical form, like Polars compares them.
+        DataType::Float32 => s
+            .f32()
+            .unwrap()
+            .iter()
+            .flatten()
+            .map(|v| hash_native(canonical_f32(v)))
+            .collect(),
+        DataType::Float64 => s
+            .f64()
+            .unwrap()
+            .iter()
+            .flatten()
+            .map(|v| hash_native(canonical_f64(v)))
+            .collect(),
+        DataType::String => s.str().unwrap().iter().flatten().map(hash_byte).collect(),
+        DataType::Binary => s
+            .binary()
+            .unwrap()
+            .iter()
+            .flatten()
+            .map(hash_byte)
+            .collect(),
+        _ => return None,
+    };
+    Some(hashes)
+}
+
+/// Builds the split block bitset of the values of `s`, sized to the number of distinct
+/// values. Returns `None` if the values cannot be hashed.
+pub(crate) fn build_bitset(s: &Series) -> Option<Vec<u8>> {
+    let hashes = hash_values(s)?;
+    let mut bitset = vec![0; optimal_num_of_bytes(hashes.len(), FPP)];
+    for hash in hashes {
+        insert(&mut bitset, hash);
+    }
+    Some(bitset)
+}
@@ -1,8 +1,147 @@
 //! Apache Parquet file metadata.
 
-use std::sync::Arc;
+use std::fs::File;
+use std::path::Path;
+use std::sync::{Arc, Mutex};
+use std::time::UNIX_EPOCH;
 
+use once_cell::sync::Lazy;
+use polars_core::config::get_parquet_metadata_cache_size;
+use polars_core::error::PolarsResult;
 pub use polars_parquet::parquet::metadata::FileMetaData;
 pub use polars_parquet::read::statistics::{deserialize, Statistics as ParquetStatistics};
+use polars_utils::aliases::PlHashMap;
 
 pub type FileMetaDataRef = Arc<FileMetaData>;
+
+static METADATA_CACHE: Lazy<Mutex<MetadataCache>> = Lazy::new(Default::default);
+
+struct CacheEntry {
+    metadata: FileMetaDataRef,
+    size: usize,
+    last_used: u64,
+}
+
+/// Process-wide cache of parquet metadata, shared by the query planning and the execution of all
+/// queries.
+///
+/// The keys contain the version of the file (modification time and size, or the ETag of cloud
+/// objects), so that modified files are never served from the cache. The memory usage of the
+/// cache is bounded by `POLARS_PARQUET_METADATA_CACHE_SIZE` (in bytes); the least recently used
+/// metadata is evicted first.
+#[derive(Default)]
+struct MetadataCache {
+    entries: PlHashMap<String, CacheEntry>,
+    total_size: usize,
+    clock: u64,
+}
+
+impl MetadataCache {
+    fn get(&mut self, key: &str) -> Option<FileMetaDataRef> {
+        self.clock += 1;
+        let entry = self.entries.get_mut(key)?;
+        entry.last_used = self.clock;
+        Some(entry.metadata.clone())
+    }
+
+    fn insert(&mut self, key: String, metadata: FileMetaDataRef, max_size: usize) {
+        let size = estimated_size(&metadata);
+        if size > max_size {
+            return;
+        }
+        self.clock += 1;
+        let entry = CacheEntry {
+            metadata,
+            size,
+            last_used: self.clock,
+        };
+        if let Some(old) = self.entries.insert(key, entry) {
+            self.total_size -= old.size;
+        }
+        self.total_size += size;
+
+        if self.total_size > max_size {
+            // Evict down to 90% of the maximum size, so that not every insert has to evict.
+            let target_size = max_size / 10 * 9;
+            let mut lru = self
+                .entries
+                .iter()
+                .map(|(key, entry)| (entry.last_used, key.clone()))
+                .collect::<Vec<_>>();
+            lru.sort_unstable();
+            for (_, key) in lru {
+                if self.total_size <= target_size {
+                    break;
+                }
+                let entry = self.entries.remove(&key).unwrap();
+                self.total_size -= entry.size;
+            }
+        }
+    }
+}
+
+/// A rough estimate of the heap size of the deserialized metadata.
+fn estimated_size(metadata: &FileMetaData) -> usize {
+    let n_column_chunks = metadata
+        .row_groups
+        .iter()
+        .map(|rg| rg.columns().len())
+        .sum::<usize>();
+    1024 + metadata.schema_descr.columns().len() * 256 + n_column_chunks * 512
+}
+
+/// Get the metadata of `key` from the metadata cache.
+pub fn get_cached_metadata(key: &str) -> Option<FileMetaDataRef> {
+    if get_parquet_metadata_cache_size() == 0 {
+        return None;
+    }
+    METADATA_CACHE.lock().unwrap().get(key)
+}
+
+/// Add the metadata of `key` to the metadata cache.
+pub fn cache_metadata(key: String, metadata: FileMetaDataRef) {
+    let max_size = get_parquet_metadata_cache_size();
+    if max_size > 0 {
+        METADATA_CACHE
+            .lock()
+            .unwrap()
+            .insert(key, metadata, max_size);
+    }
+}
+
+/// Get the metadata of `key` from the metadata cache, or read it with `read` and cache it.
+pub fn get_or_read_metadata(
+    key: String,
+    read: impl FnOnce() -> PolarsResult<FileMetaData>,
+) -> PolarsResult<FileMetaDataRef> {
+    if let Some(metadata) = get_cached_metadata(&key) {
+        return Ok(metadata);
+    }
+    // The lock is not held while reading, so that other files can be read concurrently.
+    let metadata = Arc::new(read()?);
+    cache_metadata(key, metadata.clone());
+    Ok(metadata)
+}
+
+/// The key of a local file in the metadata cache.
+pub fn local_file_key(path: &Path, file: &File) -> PolarsResult<String> {
+    let file_metadata = file.metadata()?;
+    let modified = file_metadata
+        .modified()
+        .ok()
+        .and_then(|modified| modified.duration_since(UNIX_EPOCH).ok())
+        .map_or(0, |modified| modified.as_nanos());
+    Ok(format!(
+        "{}\n{}-{}",
+        path.display(),
+        file_metadata.len(),
+        modified
+    ))
+}
+
+/// Remove all metadata from the metadata cache.
+pub fn clear_metadata_cache() {
+    let mut cache = METADATA_CACHE.lock().unwrap();
+    cache.entries.clear();
+    cache.total_size = 0;
+}
@@ -1,5 +1,6 @@
 //! Functionality for reading and writing Apache Parquet files.
 
+pub(crate) mod bloom_filter;
 pub mod metadata;
 pub mod read;
 pub mod write;
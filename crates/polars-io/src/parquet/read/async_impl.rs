@@ -17,7 +17,7 @@ use super::mmap::ColumnStore;
 use super::predicates::read_this_row_group;
 use super::read_impl::compute_row_group_range;
 use crate::cloud::{build_object_store, CloudLocation, CloudOptions, PolarsObjectStore};
-use crate::parquet::metadata::FileMetaDataRef;
+use crate::parquet::metadata::{cache_metadata, get_cached_metadata, FileMetaDataRef};
 use crate::pl_async::get_runtime;
 use crate::predicates::PhysicalIoExpr;
 
@@ -27,6 +27,7 @@ type QueueSend = Arc<Sender<PolarsResult<QueuePayload>>>;
 
 pub struct ParquetObjectStore {
     store: PolarsObjectStore,
+    uri: String,
     path: ObjectPath,
     length: Option<usize>,
     metadata: Option<FileMetaDataRef>,
@@ -38,12 +39,11 @@ impl ParquetObjectStore {
         options: Option<&CloudOptions>,
         metadata: Option<FileMetaDataRef>,
     ) -> PolarsResult<Self> {
-        let (
-            CloudLocation {
-                prefix, expansion, ..
-            },
-            store,
-        ) = build_object_store(uri, options).await?;
+        let (location, store) = build_object_store(uri, options).await?;
+        let store = PolarsObjectStore::new(store).with_file_cache(&location, options);
+        let CloudLocation {
+            prefix, expansion, ..
+        } = location;
 
         // Any wildcards should already have been resolved here. Without this assertion they would
         // be ignored.
@@ -51,7 +51,8 @@ impl ParquetObjectStore {
         let path = ObjectPath::from_url_path(prefix).map_err(to_compute_err)?;
 
         Ok(ParquetObjectStore {
-            store: PolarsObjectStore::new(store),
+            store,
+            uri: uri.to_string(),
             path,
             length: None,
             metadata,
@@ -88,10 +89,25 @@ impl ParquetObjectStore {
         fetch_metadata(&self.store, &self.path, length).await
     }
 
-    /// Fetch and memoize the metadata of the parquet file.
+    /// Fetch and memoize the metadata of the parquet file. It is shared with other readers of the
+    /// same version of the object through the process-wide metadata cache.
     pub async fn get_metadata(&mut self) -> PolarsResult<&FileMetaDataRef> {
         if self.metadata.is_none() {
-            self.metadata = Some(Arc::new(self.fetch_metadata().await?));
+            let meta = self.store.head(&self.path).await?;
+            let version = match &meta.e_tag {
+                Some(e_tag) => e_tag.clone(),
+                None => format!("{}-{}", meta.size, meta.last_modified.timestamp_millis()),
+            };
+            let key = format!("{}\n{}", self.uri, version);
+            let metadata = match get_cached_metadata(&key) {
+                Some(metadata) => metadata,
+                None => {
+                    let metadata = Arc::new(self.fetch_metadata().await?);
+                    cache_metadata(key, metadata.clone());
+                    metadata
+                },
+            };
+            self.metadata = Some(metadata);
         }
         Ok(self.metadata.as_ref().unwrap())
     }
@@ -291,7 +307,7 @@ impl FetchRowGroupsFromObjectStore {
                 .enumerate()
                 .filter(|(i, rg)| {
                     let should_be_read =
-                        matches!(read_this_row_group(Some(pred), rg, &schema), Ok(true));
+                        matches!(read_this_row_group(Some(pred), rg, &schema, None), Ok(true));
 
                     // Already add the row groups that will be skipped to the prefetched data.
                     if !should_be_read {
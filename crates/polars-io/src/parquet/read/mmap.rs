@@ -26,6 +26,17 @@ pub enum ColumnStore<'a> {
     Fetched(PlHashMap<u64, Bytes>),
 }
 
+impl<'a> ColumnStore<'a> {
+    /// Returns the bytes of the whole file if it is available locally.
+    pub(super) fn local_bytes(&self) -> Option<&'a [u8]> {
+        match self {
+            ColumnStore::Local(file) => Some(file),
+            #[cfg(feature = "async")]
+            ColumnStore::Fetched(_) => None,
+        }
+    }
+}
+
 /// For local files memory maps all columns that are part of the parquet field `field_name`.
 /// For cloud files the relevant memory regions should have been prefetched.
 pub(super) fn mmap_columns<'a>(
@@ -18,6 +18,7 @@
 mod async_impl;
 mod mmap;
 mod options;
+mod page_index;
 mod predicates;
 mod read_impl;
 mod reader;
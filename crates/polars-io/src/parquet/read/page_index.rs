@@ -0,0 +1,282 @@
+//! Page level predicate pushdown using the parquet page index.
+//!
+//! The page index consists of a `ColumnIndex` with the min/max/null_count statistics of every
+//! page and an `OffsetIndex` with the location and first row of every page. The column index
+//! is used to determine the rows of a row group that may satisfy a predicate, the offset index
+//! to only read and decode the pages that contain those rows.
+use std::io::Cursor;
+
+use arrow::array::Array;
+use polars_core::config::verbose;
+use polars_core::prelude::*;
+use polars_parquet::parquet::indexes::select_pages;
+use polars_parquet::parquet::read::IndexedPageReader;
+use polars_parquet::read::indexes::{
+    compute_page_row_intervals, read_columns_indexes, FieldPageStatistics, Interval,
+};
+use polars_parquet::read::{
+    column_iter_to_arrays, get_field_columns, read_pages_locations, BasicDecompressor,
+    ColumnChunkMetaData, RowGroupMetaData,
+};
+
+use super::mmap::{mmap_columns, to_deserializer, ColumnStore};
+use super::read_impl::array_iter_to_series;
+use crate::predicates::{BatchStats, ColumnStats, PhysicalIoExpr};
+
+/// The page statistics of a single column in the predicate.
+struct PageStats {
+    schema_idx: usize,
+    intervals: Vec<Interval>,
+    min: Series,
+    max: Series,
+    null_count: Series,
+}
+
+/// Returns the single leaf column of a field if the field is not nested.
+fn flat_column<'a>(md: &'a RowGroupMetaData, name: &str) -> Option<&'a ColumnChunkMetaData> {
+    match get_field_columns(md.columns(), name)[..] {
+        [column] if column.descriptor().descriptor.max_rep_level == 0 => Some(column),
+        _ => None,
+    }
+}
+
+fn has_page_index(column: &ColumnChunkMetaData) -> bool {
+    let chunk = column.column_chunk();
+    chunk.column_index_offset.is_some() && chunk.offset_index_offset.is_some()
+}
+
+fn read_page_stats(
+    file: &[u8],
+    md: &RowGroupMetaData,
+    schema_idx: usize,
+    field: &ArrowField,
+) -> PolarsResult<Option<PageStats>> {
+    let Some(column) = flat_column(md, &field.name).filter(|c| has_page_index(c)) else {
+        return Ok(None);
+    };
+    let columns = std::slice::from_ref(column);
+    let mut reader = Cursor::new(file);
+
+    let Some(locations) = read_pages_locations(&mut reader, columns)?.pop() else {
+        return Ok(None);
+    };
+    let intervals = compute_page_row_intervals(&locations, md.num_rows())?;
+    let Some(FieldPageStatistics::Single(stats)) =
+        read_columns_indexes(&mut reader, columns, std::slice::from_ref(field))?.pop()
+    else {
+        return Ok(None);
+    };
+    if stats.min.len() != intervals.len() {
+        return Ok(None);
+    }
+
+    Ok(Some(PageStats {
+        schema_idx,
+        intervals,
+        min: Series::try_from(("", stats.min))?,
+        max: Series::try_from(("", stats.max))?,
+        null_count: Series::try_from(("", stats.null_count.boxed()))?,
+    }))
+}
+
+/// Determine the rows of a row group that may satisfy the predicate using the page index.
+///
+/// The row group is split at the page boundaries of every column in the predicate. Each
+/// segment is evaluated with the statistics of the pages it falls in.
+///
+/// Returns `None` if all rows must be read.
+pub(super) fn select_row_intervals(
+    predicate: &dyn PhysicalIoExpr,
+    md: &RowGroupMetaData,
+    schema: &ArrowSchema,
+    file: &[u8],
+) -> PolarsResult<Option<Vec<Interval>>> {
+    let (Some(evaluator), Some(live_columns)) =
+        (predicate.as_stats_evaluator(), predicate.live_variables())
+    else {
+        return Ok(None);
+    };
+
+    let mut page_stats = vec![];
+    for name in live_columns.iter() {
+        let Some((schema_idx, field)) = schema
+            .fields
+            .iter()
+            .enumerate()
+            .find(|(_, field)| field.name.as_str() == name.as_ref())
+        else {
+            continue;
+        };
+        if let Some(stats) = read_page_stats(file, md, schema_idx, field)? {
+            page_stats.push(stats)
+        }
+    }
+    if page_stats.is_empty() {
+        return Ok(None);
+    }
+
+    let num_rows = md.num_rows();
+    let mut boundaries = page_stats
+        .iter()
+        .flat_map(|stats| stats.intervals.iter().map(|interval| interval.start))
+        .chain(std::iter::once(num_rows))
+        .collect::<Vec<_>>();
+    boundaries.sort_unstable();
+    boundaries.dedup();
+
+    let polars_schema: SchemaRef = Arc::new(schema.into());
+    let mut page_idx = vec![0usize; page_stats.len()];
+    let mut selected: Vec<Interval> = vec![];
+    for segment in boundaries.windows(2) {
+        let (start, end) = (segment[0], segment[1]);
+
+        let mut column_stats = schema
+            .fields
+            .iter()
+            .map(|field| ColumnStats::from_field(field.into()))
+            .collect::<Vec<_>>();
+        for (stats, page_idx) in page_stats.iter().zip(page_idx.iter_mut()) {
+            while stats.intervals[*page_idx].start + stats.intervals[*page_idx].length <= start {
+                *page_idx += 1;
+            }
+            let i = *page_idx as i64;
+            column_stats[stats.schema_idx] = ColumnStats::new(
+                (&schema.fields[stats.schema_idx]).into(),
+                Some(stats.null_count.slice(i, 1)),
+                Some(stats.min.slice(i, 1)),
+                Some(stats.max.slice(i, 1)),
+            );
+        }
+        let batch_stats = BatchStats::new(polars_schema.clone(), column_stats, None);
+
+        let read = match evaluator.should_read(&batch_stats) {
+            Ok(read) => read,
+            Err(PolarsError::ColumnNotFound(_)) => true,
+            Err(e) => return Err(e),
+        };
+        if read {
+            match selected.last_mut() {
+                Some(last) if last.start + last.length == start => last.length += end - start,
+                _ => selected.push(Interval::new(start, end - start)),
+            }
+        }
+    }
+
+    if selected.len() == 1 && selected[0].length == num_rows {
+        Ok(None)
+    } else {
+        if verbose() {
+            let selected_rows = selected.iter().map(|i| i.length).sum::<usize>();
+            eprintln!(
+                "parquet page index: skipping pages, reading {selected_rows} of {num_rows} rows \
+                 of the row group"
+            );
+        }
+        Ok(Some(selected))
+    }
+}
+
+/// Take the selected `rows` from a column that contains the rows in `decoded`.
+///
+/// Every selected row must fall into one of the `decoded` intervals.
+fn take_rows(s: &Series, decoded: &[Interval], rows: &[Interval]) -> Series {
+    let mut out = s.clear();
+    let mut decoded_iter = decoded.iter();
+    let mut current = decoded_iter.next();
+    // The position of the start of `current` in `s`.
+    let mut offset = 0;
+    for row in rows {
+        while let Some(interval) = current {
+            if row.start < interval.start + interval.length {
+                break;
+            }
+            offset += interval.length;
+            current = decoded_iter.next();
+        }
+        let interval = current.unwrap();
+        let start = offset + row.start - interval.start;
+        out.append(&s.slice(start as i64, row.length)).unwrap();
+    }
+    out
+}
+
+/// Deserializes the selected `rows` of a column.
+///
+/// Of flat columns in a local file with an offset index, only the pages that contain the
+/// selected rows are read and decompressed.
+pub(super) fn column_to_series_with_row_selection(
+    field: &ArrowField,
+    md: &RowGroupMetaData,
+    store: &ColumnStore,
+    rows: &[Interval],
+) -> PolarsResult<Series> {
+    let num_rows = md.num_rows();
+    let all_rows = [Interval::new(0, num_rows)];
+
+    let selected_pages = store
+        .local_bytes()
+        .and_then(|file| Some((file, flat_column(md, &field.name)?)))
+        .filter(|(_, column)| column.column_chunk().offset_index_offset.is_some())
+        .map(|(file, column)| {
+            let columns = std::slice::from_ref(column);
+            let locations = read_pages_locations(&mut Cursor::new(file), columns)?
+                .pop()
+                .unwrap_or_default();
+            let pages = select_pages(rows, &locations, num_rows)?;
+            let decoded = compute_page_row_intervals(&locations, num_rows)?
+                .into_iter()
+                .zip(pages.iter())
+                .filter_map(|(interval, page)| (!page.selected_rows.is_empty()).then_some(interval))
+                .collect::<Vec<_>>();
+            PolarsResult::Ok((file, column, pages, decoded))
+        })
+        .transpose()?
+        .filter(|(_, _, pages, _)| !pages.is_empty());
+
+    let (iter, decoded) = match selected_pages {
+        Some((file, column, pages, decoded)) => {
+            let decoded_rows = decoded.iter().map(|interval| interval.length).sum();
+            let pages = IndexedPageReader::new(Cursor::new(file), column, pages, vec![], vec![]);
+            let iter = column_iter_to_arrays(
+                vec![BasicDecompressor::new(pages, vec![])],
+                vec![&column.descriptor().descriptor.primitive_type],
+                field.clone(),
+                Some(decoded_rows),
+                decoded_rows,
+            )?;
+            (iter, decoded)
+        },
+        // Decode the whole column chunk.
+        None => {
+            let columns = mmap_columns(store, md.columns(), &field.name);
+            let iter = to_deserializer(columns, field.clone(), num_rows, Some(num_rows))?;
+            (iter, all_rows.to_vec())
+        },
+    };
+    let s = array_iter_to_series(iter, field, None)?;
+    Ok(take_rows(&s, &decoded, rows))
+}
+
+/// Determine the rows of a row group to read, or `None` if the whole row group must be read.
+///
+/// The page index is only used for local files and if all rows of the row group are
+/// requested without a row index, as the row index is computed from the position in the
+/// row group.
+pub(super) fn row_group_row_selection(
+    predicate: Option<&dyn PhysicalIoExpr>,
+    md: &RowGroupMetaData,
+    schema: &ArrowSchema,
+    store: &ColumnStore,
+    projection_height: usize,
+    use_statistics: bool,
+    has_row_index: bool,
+) -> PolarsResult<Option<Vec<Interval>>> {
+    match (predicate, store.local_bytes()) {
+        (Some(predicate), Some(file))
+            if use_statistics && !has_row_index && projection_height == md.num_rows() =>
+        {
+            select_row_intervals(predicate, md, schema, file)
+        },
+        _ => Ok(None),
+    }
+}
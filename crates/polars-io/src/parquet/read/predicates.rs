@@ -1,9 +1,11 @@
 use arrow::datatypes::ArrowSchemaRef;
 use polars_core::prelude::*;
+use polars_parquet::parquet::bloom_filter::read as read_bloom_filter;
 use polars_parquet::read::statistics::{deserialize, Statistics};
-use polars_parquet::read::RowGroupMetaData;
+use polars_parquet::read::{get_field_columns, RowGroupMetaData};
 
-use crate::predicates::{BatchStats, ColumnStats, PhysicalIoExpr};
+use crate::parquet::bloom_filter::hashed_physical_type;
+use crate::predicates::{BatchStats, BloomFilter, ColumnStats, PhysicalIoExpr, StatsEvaluator};
 
 impl ColumnStats {
     fn from_arrow_stats(stats: Statistics, field: &ArrowField) -> Self {
@@ -39,20 +41,74 @@ pub(crate) fn collect_statistics(
     })
 }
 
+/// Attach the bloom filters of the column chunks in a row group to their statistics.
+///
+/// Only the filters of the `live_columns` of the predicate are read, or of all columns if
+/// they are unknown. Returns `false` if none of these columns has a bloom filter.
+fn collect_bloom_filters(
+    stats: &mut BatchStats,
+    md: &RowGroupMetaData,
+    schema: &ArrowSchema,
+    file: &[u8],
+    live_columns: Option<&[Arc<str>]>,
+) -> PolarsResult<bool> {
+    let mut found = false;
+    let mut bitset = vec![];
+    for (field, column_stats) in schema.fields.iter().zip(stats.column_stats_mut()) {
+        if live_columns.is_some_and(|live| !live.iter().any(|name| **name == *field.name)) {
+            continue;
+        }
+        // Nested fields consist of multiple column chunks, we only probe leaf columns.
+        let [column] = get_field_columns(md.columns(), &field.name)[..] else {
+            continue;
+        };
+        // The values must have been hashed as the physical type we expect.
+        if column.metadata().bloom_filter_offset.is_none()
+            || hashed_physical_type(column_stats.dtype()) != Some(column.physical_type())
+        {
+            continue;
+        }
+        read_bloom_filter(column, &mut std::io::Cursor::new(file), &mut bitset)?;
+        if !bitset.is_empty() {
+            column_stats.set_bloom_filter(Some(BloomFilter::new(std::mem::take(&mut bitset))));
+            found = true;
+        }
+    }
+    Ok(found)
+}
+
+fn should_read(pred: &dyn StatsEvaluator, stats: &BatchStats) -> PolarsResult<bool> {
+    let should_read = pred.should_read(stats);
+    // a parquet file may not have statistics of all columns
+    if matches!(should_read, Ok(false)) {
+        return Ok(false);
+    } else if !matches!(should_read, Err(PolarsError::ColumnNotFound(_))) {
+        let _ = should_read?;
+    }
+    Ok(true)
+}
+
+/// Determine from the statistics whether a row group must be read.
+///
+/// If the min/max statistics are not sufficient and the bytes of the file are
+/// available, the bloom filters of the row group are consulted as well.
 pub(super) fn read_this_row_group(
     predicate: Option<&dyn PhysicalIoExpr>,
     md: &RowGroupMetaData,
     schema: &ArrowSchemaRef,
+    file: Option<&[u8]>,
 ) -> PolarsResult<bool> {
-    if let Some(pred) = predicate {
-        if let Some(pred) = pred.as_stats_evaluator() {
-            if let Some(stats) = collect_statistics(md, schema)? {
-                let should_read = pred.should_read(&stats);
-                // a parquet file may not have statistics of all columns
-                if matches!(should_read, Ok(false)) {
+    if let Some(predicate) = predicate {
+        if let Some(pred) = predicate.as_stats_evaluator() {
+            if let Some(mut stats) = collect_statistics(md, schema)? {
+                if !should_read(pred, &stats)? {
                     return Ok(false);
-                } else if !matches!(should_read, Err(PolarsError::ColumnNotFound(_))) {
-                    let _ = should_read?;
+                }
+                if let Some(file) = file {
+                    let live = predicate.live_variables();
+                    if collect_bloom_filters(&mut stats, md, schema, file, live.as_deref())? {
+                        return should_read(pred, &stats);
+                    }
                 }
             }
         }
@@ -14,13 +14,14 @@ use rayon::prelude::*;
 #[cfg(feature = "cloud")]
 use super::async_impl::FetchRowGroupsFromObjectStore;
 use super::mmap::{mmap_columns, ColumnStore};
+use super::page_index::{column_to_series_with_row_selection, row_group_row_selection};
 use super::predicates::read_this_row_group;
 use super::utils::materialize_empty_df;
 use super::{mmap, ParallelStrategy};
 use crate::mmap::{MmapBytesReader, ReaderBytes};
 use crate::parquet::metadata::FileMetaDataRef;
 use crate::predicates::{apply_predicate, PhysicalIoExpr};
-use crate::utils::get_reader_bytes;
+use crate::utils::{get_reader_bytes, materialize_hive_partitions};
 use crate::RowIndex;
 
 #[cfg(debug_assertions)]
@@ -106,25 +107,6 @@ pub(super) fn array_iter_to_series(
     }
 }
 
-/// Materializes hive partitions.
-/// We have a special num_rows arg, as df can be empty when a projection contains
-/// only hive partition columns.
-///
-/// # Safety
-///
-/// num_rows equals the height of the df when the df height is non-zero.
-pub(crate) fn materialize_hive_partitions(
-    df: &mut DataFrame,
-    hive_partition_columns: Option<&[Series]>,
-    num_rows: usize,
-) {
-    if let Some(hive_columns) = hive_partition_columns {
-        for s in hive_columns {
-            unsafe { df.with_column_unchecked(s.new_from_index(0, num_rows)) };
-        }
-    }
-}
-
 #[allow(clippy::too_many_arguments)]
 fn rg_to_dfs(
     store: &mmap::ColumnStore,
@@ -199,50 +181,63 @@ fn rg_to_dfs_optionally_par_over_columns(
         let current_row_count = md.num_rows() as IdxSize;
 
         if use_statistics
-            && !read_this_row_group(predicate, &file_metadata.row_groups[rg_idx], schema)?
+            && !read_this_row_group(
+                predicate,
+                &file_metadata.row_groups[rg_idx],
+                schema,
+                store.local_bytes(),
+            )?
         {
             *previous_row_count += current_row_count;
             continue;
         }
+
+        let projection_height = (*remaining_rows).min(md.num_rows());
+        let row_selection = row_group_row_selection(
+            predicate,
+            md,
+            schema,
+            store,
+            projection_height,
+            use_statistics,
+            row_index.is_some(),
+        )?;
+        if row_selection.as_ref().is_some_and(|rows| rows.is_empty()) {
+            // The page index proved that no row matches the predicate.
+            *previous_row_count += current_row_count;
+            continue;
+        }
         // test we don't read the parquet file if this env var is set
         #[cfg(debug_assertions)]
         {
             assert!(std::env::var("POLARS_PANIC_IF_PARQUET_PARSED").is_err())
         }
 
-        let projection_height = (*remaining_rows).min(md.num_rows());
         let chunk_size = md.num_rows();
+        let read_column = |column_i: &usize| match &row_selection {
+            Some(rows) => {
+                column_to_series_with_row_selection(&schema.fields[*column_i], md, store, rows)
+            },
+            None => {
+                column_idx_to_series(*column_i, md, projection_height, schema, store, chunk_size)
+            },
+        };
         let columns = if let ParallelStrategy::Columns = parallel {
             POOL.install(|| {
                 projection
                     .par_iter()
-                    .map(|column_i| {
-                        column_idx_to_series(
-                            *column_i,
-                            md,
-                            projection_height,
-                            schema,
-                            store,
-                            chunk_size,
-                        )
-                    })
+                    .map(read_column)
                     .collect::<PolarsResult<Vec<_>>>()
             })?
         } else {
             projection
                 .iter()
-                .map(|column_i| {
-                    column_idx_to_series(
-                        *column_i,
-                        md,
-                        projection_height,
-                        schema,
-                        store,
-                        chunk_size,
-                    )
-                })
+                .map(read_column)
                 .collect::<PolarsResult<Vec<_>>>()?
         };
+        let height = row_selection.map_or(projection_height, |rows| {
+            rows.iter().map(|interval| interval.length).sum()
+        });
 
         *remaining_rows -= projection_height;
 
@@ -251,7 +246,7 @@ fn rg_to_dfs_optionally_par_over_columns(
             df.with_row_index_mut(&rc.name, Some(*previous_row_count + rc.offset));
         }
 
-        materialize_hive_partitions(&mut df, hive_partition_columns, projection_height);
+        materialize_hive_partitions(&mut df, hive_partition_columns, height);
         apply_predicate(&mut df, predicate, true)?;
 
         *previous_row_count += current_row_count;
@@ -308,10 +303,23 @@ fn rg_to_dfs_par_over_rg(
                             predicate,
                             &file_metadata.row_groups[rg_idx],
                             schema,
+                            store.local_bytes(),
                         )?
                 {
                     return Ok(None);
                 }
+                let row_selection = row_group_row_selection(
+                    predicate,
+                    md,
+                    schema,
+                    store,
+                    projection_height,
+                    use_statistics,
+                    row_index.is_some(),
+                )?;
+                if row_selection.as_ref().is_some_and(|rows| rows.is_empty()) {
+                    return Ok(None);
+                }
                 // test we don't read the parquet file if this env var is set
                 #[cfg(debug_assertions)]
                 {
@@ -321,17 +329,26 @@ fn rg_to_dfs_par_over_rg(
                 let chunk_size = md.num_rows();
                 let columns = projection
                     .iter()
-                    .map(|column_i| {
-                        column_idx_to_series(
+                    .map(|column_i| match &row_selection {
+                        Some(rows) => column_to_series_with_row_selection(
+                            &schema.fields[*column_i],
+                            md,
+                            store,
+                            rows,
+                        ),
+                        None => column_idx_to_series(
                             *column_i,
                             md,
                             projection_height,
                             schema,
                             store,
                             chunk_size,
-                        )
+                        ),
                     })
                     .collect::<PolarsResult<Vec<_>>>()?;
+                let height = row_selection.map_or(projection_height, |rows| {
+                    rows.iter().map(|interval| interval.length).sum()
+                });
 
                 let mut df = unsafe { DataFrame::new_no_checks(columns) };
 
@@ -339,7 +356,7 @@ fn rg_to_dfs_par_over_rg(
                     df.with_row_index_mut(&rc.name, Some(row_count_start as IdxSize + rc.offset));
                 }
 
-                materialize_hive_partitions(&mut df, hive_partition_columns, projection_height);
+                materialize_hive_partitions(&mut df, hive_partition_columns, height);
                 apply_predicate(&mut df, predicate, false)?;
 
                 Ok(Some(df))
@@ -602,6 +619,16 @@ impl BatchedParquetReader {
         self.row_group_offset >= self.n_row_groups
     }
 
+    /// Estimated size in bytes of the projected columns of the row groups that are not yet read.
+    pub fn estimated_remaining_size(&self) -> usize {
+        let offset = std::cmp::min(self.row_group_offset, self.n_row_groups);
+        let size = self.metadata.row_groups[offset..]
+            .iter()
+            .map(|rg| rg.compressed_size())
+            .sum::<usize>();
+        size / std::cmp::max(self.schema.len(), 1) * self.projection.len()
+    }
+
     pub fn finishes_this_batch(&self, n: usize) -> bool {
         self.row_group_offset + n > self.n_row_groups
     }
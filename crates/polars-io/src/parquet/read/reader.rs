@@ -1,4 +1,6 @@
+use std::fs::File;
 use std::io::{Read, Seek};
+use std::path::Path;
 use std::sync::Arc;
 
 use arrow::datatypes::ArrowSchemaRef;
@@ -18,7 +20,7 @@ use super::utils::materialize_empty_df;
 #[cfg(feature = "cloud")]
 use crate::cloud::CloudOptions;
 use crate::mmap::MmapBytesReader;
-use crate::parquet::metadata::FileMetaDataRef;
+use crate::parquet::metadata::{get_or_read_metadata, local_file_key, FileMetaDataRef};
 use crate::predicates::PhysicalIoExpr;
 use crate::prelude::*;
 use crate::RowIndex;
@@ -130,6 +132,21 @@ impl<R: MmapBytesReader> ParquetReader<R> {
     }
 }
 
+impl ParquetReader<File> {
+    /// Get the metadata from the process-wide metadata cache, keyed by `path` and the size and
+    /// modification time of the file. On a miss the metadata is read and added to the cache.
+    pub fn with_cached_metadata(mut self, path: &Path) -> PolarsResult<Self> {
+        if self.metadata.is_none() {
+            let key = local_file_key(path, &self.reader)?;
+            let reader = &mut self.reader;
+            self.metadata = Some(get_or_read_metadata(key, || {
+                Ok(read::read_metadata(reader)?)
+            })?);
+        }
+        Ok(self)
+    }
+}
+
 impl<R: MmapBytesReader + 'static> ParquetReader<R> {
     pub fn batched(mut self, chunk_size: usize) -> PolarsResult<BatchedParquetReader> {
         let metadata = self.get_metadata()?.clone();
@@ -14,6 +14,11 @@ use polars_parquet::write::{
 };
 use rayon::prelude::*;
 
+use crate::parquet::bloom_filter::build_bitset;
+
+/// The bloom filters of a row group as `(leaf column index, bitset)`.
+pub type RowGroupBloomFilters = Vec<(usize, Vec<u8>)>;
+
 pub struct BatchedWriter<W: Write> {
     // A mutex so that streaming engine can get concurrent read access to
     // compress pages.
@@ -22,22 +27,30 @@ pub struct BatchedWriter<W: Write> {
     pub(super) encodings: Vec<Vec<Encoding>>,
     pub(super) options: WriteOptions,
     pub(super) parallel: bool,
+    /// The columns to write bloom filters for, as `(column index, leaf column index)`.
+    pub(super) bloom_filter_columns: Vec<(usize, usize)>,
 }
 
 impl<W: Write> BatchedWriter<W> {
     pub fn encode_and_compress<'a>(
         &'a self,
         df: &'a DataFrame,
-    ) -> impl Iterator<Item = PolarsResult<RowGroupIter<'static, PolarsError>>> + 'a {
+    ) -> impl Iterator<Item = PolarsResult<(RowGroupIter<'static, PolarsError>, RowGroupBloomFilters)>>
+           + 'a {
         let rb_iter = df.iter_chunks(true);
         rb_iter.filter_map(move |batch| match batch.len() {
             0 => None,
             _ => {
-                let row_group = create_eager_serializer(
-                    batch,
-                    self.parquet_schema.fields(),
-                    self.encodings.as_ref(),
-                    self.options,
+                let row_group = build_bloom_filters(&batch, &self.bloom_filter_columns).and_then(
+                    |bloom_filters| {
+                        let row_group = create_eager_serializer(
+                            batch,
+                            self.parquet_schema.fields(),
+                            self.encodings.as_ref(),
+                            self.options,
+                        )?;
+                        Ok((row_group, bloom_filters))
+                    },
                 );
 
                 Some(row_group)
@@ -56,11 +69,13 @@ impl<W: Write> BatchedWriter<W> {
             &self.encodings,
             self.options,
             self.parallel,
+            &self.bloom_filter_columns,
         );
         // Lock before looping so that order is maintained under contention.
         let mut writer = self.writer.lock().unwrap();
         for group in row_group_iter {
-            writer.write(group?)?;
+            let (group, bloom_filters) = group?;
+            write_row_group(&mut writer, group, bloom_filters)?;
         }
         Ok(())
     }
@@ -71,12 +86,12 @@ impl<W: Write> BatchedWriter<W> {
 
     pub fn write_row_groups(
         &self,
-        rgs: Vec<RowGroupIter<'static, PolarsError>>,
+        rgs: Vec<(RowGroupIter<'static, PolarsError>, RowGroupBloomFilters)>,
     ) -> PolarsResult<()> {
         // Lock before looping so that order is maintained.
         let mut writer = self.writer.lock().unwrap();
-        for group in rgs {
-            writer.write(group)?;
+        for (group, bloom_filters) in rgs {
+            write_row_group(&mut writer, group, bloom_filters)?;
         }
         Ok(())
     }
@@ -89,6 +104,18 @@ impl<W: Write> BatchedWriter<W> {
     }
 }
 
+fn write_row_group<W: Write>(
+    writer: &mut FileWriter<W>,
+    row_group: RowGroupIter<'static, PolarsError>,
+    bloom_filters: RowGroupBloomFilters,
+) -> PolarsResult<()> {
+    writer.write(row_group)?;
+    for (column, bitset) in bloom_filters {
+        writer.write_bloom_filter(column, &bitset)?;
+    }
+    Ok(())
+}
+
 // Note that the df should be rechunked
 fn prepare_rg_iter<'a>(
     df: &'a DataFrame,
@@ -96,19 +123,44 @@ fn prepare_rg_iter<'a>(
     encodings: &'a [Vec<Encoding>],
     options: WriteOptions,
     parallel: bool,
-) -> impl Iterator<Item = PolarsResult<RowGroupIter<'static, PolarsError>>> + 'a {
+    bloom_filter_columns: &'a [(usize, usize)],
+) -> impl Iterator<Item = PolarsResult<(RowGroupIter<'static, PolarsError>, RowGroupBloomFilters)>> + 'a
+{
     let rb_iter = df.iter_chunks(true);
     rb_iter.filter_map(move |batch| match batch.len() {
         0 => None,
         _ => {
             let row_group =
-                create_serializer(batch, parquet_schema.fields(), encodings, options, parallel);
+                build_bloom_filters(&batch, bloom_filter_columns).and_then(|bloom_filters| {
+                    let row_group = create_serializer(
+                        batch,
+                        parquet_schema.fields(),
+                        encodings,
+                        options,
+                        parallel,
+                    )?;
+                    Ok((row_group, bloom_filters))
+                });
 
             Some(row_group)
         },
     })
 }
 
+fn build_bloom_filters(
+    batch: &RecordBatch<Box<dyn Array>>,
+    bloom_filter_columns: &[(usize, usize)],
+) -> PolarsResult<RowGroupBloomFilters> {
+    let mut bloom_filters = Vec::with_capacity(bloom_filter_columns.len());
+    for &(column, leaf_column) in bloom_filter_columns {
+        let s = Series::try_from(("", batch.columns()[column].clone()))?;
+        if let Some(bitset) = build_bitset(&s) {
+            bloom_filters.push((leaf_column, bitset));
+        }
+    }
+    Ok(bloom_filters)
+}
+
 fn create_serializer(
     batch: RecordBatch<Box<dyn Array>>,
     fields: &[ParquetType],
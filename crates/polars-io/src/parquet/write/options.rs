@@ -6,7 +6,7 @@ use polars_parquet::write::{
 #[cfg(feature = "serde")]
 use serde::{Deserialize, Serialize};
 
-#[derive(Copy, Clone, Debug, PartialEq, Eq, Default, Hash)]
+#[derive(Clone, Debug, PartialEq, Eq, Default, Hash)]
 #[cfg_attr(feature = "serde", derive(Serialize, Deserialize))]
 pub struct ParquetWriteOptions {
     /// Data page compression
@@ -19,6 +19,8 @@ pub struct ParquetWriteOptions {
     pub data_pagesize_limit: Option<usize>,
     /// maintain the order the data was processed
     pub maintain_order: bool,
+    /// Write a bloom filter for these columns
+    pub bloom_filter_columns: Vec<String>,
 }
 
 /// The compression strategy to use for writing Parquet files.
@@ -9,6 +9,7 @@ use polars_parquet::write::{
 
 use super::batched_writer::BatchedWriter;
 use super::options::ParquetCompression;
+use crate::parquet::bloom_filter::hashed_physical_type;
 use crate::prelude::chunk_df_for_writing;
 
 /// Write a DataFrame to Parquet format.
@@ -25,6 +26,8 @@ pub struct ParquetWriter<W> {
     data_page_size: Option<usize>,
     /// Serialize columns in parallel
     parallel: bool,
+    /// Write a bloom filter for these columns
+    bloom_filter_columns: Vec<String>,
 }
 
 impl<W> ParquetWriter<W>
@@ -43,6 +46,7 @@ where
             row_group_size: None,
             data_page_size: None,
             parallel: true,
+            bloom_filter_columns: vec![],
         }
     }
 
@@ -56,6 +60,8 @@ where
     }
 
     /// Compute and write statistic
+    ///
+    /// Statistics are written for every row group and every page (in the column index).
     pub fn with_statistics(mut self, statistics: bool) -> Self {
         self.statistics = statistics;
         self
@@ -80,14 +86,39 @@ where
         self
     }
 
+    /// Write a bloom filter for the given columns in every row group. This allows readers to
+    /// skip row groups that do not contain a value, e.g. on point lookups of ids.
+    pub fn with_bloom_filter_columns(mut self, columns: Vec<String>) -> Self {
+        self.bloom_filter_columns = columns;
+        self
+    }
+
     pub fn batched(self, schema: &Schema) -> PolarsResult<BatchedWriter<W>> {
         let fields = schema.to_arrow(true).fields;
-        let schema = ArrowSchema::from(fields);
-
-        let parquet_schema = to_parquet_schema(&schema)?;
-        let encodings = get_encodings(&schema);
+        let arrow_schema = ArrowSchema::from(fields);
+
+        let parquet_schema = to_parquet_schema(&arrow_schema)?;
+        let bloom_filter_columns = self
+            .bloom_filter_columns
+            .iter()
+            .map(|name| {
+                let (idx, _, dtype) = schema.try_get_full(name)?;
+                polars_ensure!(
+                    hashed_physical_type(dtype).is_some(),
+                    InvalidOperation: "cannot write a bloom filter for column '{}' of dtype {}", name, dtype
+                );
+                // Types that support bloom filters are not nested, so they map to a single leaf.
+                let leaf_idx = parquet_schema
+                    .columns()
+                    .iter()
+                    .position(|column| column.path_in_schema == [name.as_str()])
+                    .unwrap();
+                Ok((idx, leaf_idx))
+            })
+            .collect::<PolarsResult<Vec<_>>>()?;
+        let encodings = get_encodings(&arrow_schema);
         let options = self.materialize_options();
-        let writer = Mutex::new(FileWriter::try_new(self.writer, schema, options)?);
+        let writer = Mutex::new(FileWriter::try_new(self.writer, arrow_schema, options)?);
 
         Ok(BatchedWriter {
             writer,
@@ -95,6 +126,7 @@ where
             encodings,
             options,
             parallel: self.parallel,
+            bloom_filter_columns,
         })
     }
 
@@ -4,6 +4,7 @@ use std::fs::File;
 use std::io::BufWriter;
 use std::path::{Path, PathBuf};
 
+use percent_encoding::{utf8_percent_encode, AsciiSet, CONTROLS};
 use polars_core::prelude::*;
 use polars_core::series::IsSorted;
 use polars_core::POOL;
@@ -112,8 +113,32 @@ where
     }
 }
 
+/// The characters that are percent-encoded in the values of Hive partitions.
+const HIVE_VALUE_ENCODE_SET: &AsciiSet = &CONTROLS.add(b'/').add(b'=').add(b'%').add(b'\\');
+
+/// The directory name of a null value in Hive partitioning.
+pub const HIVE_DEFAULT_PARTITION: &str = "__HIVE_DEFAULT_PARTITION__";
+
+/// Formats a partition value the way Hive partitioned scans parse it back.
+///
+/// Strings are percent-encoded and written without quotes, nulls are written as
+/// `__HIVE_DEFAULT_PARTITION__`.
+fn hive_partition_value(value: &AnyValue) -> String {
+    match value {
+        AnyValue::Null => HIVE_DEFAULT_PARTITION.to_string(),
+        AnyValue::String(v) => utf8_percent_encode(v, HIVE_VALUE_ENCODE_SET).to_string(),
+        AnyValue::StringOwned(v) => {
+            utf8_percent_encode(v.as_str(), HIVE_VALUE_ENCODE_SET).to_string()
+        },
+        value => utf8_percent_encode(&value.to_string(), HIVE_VALUE_ENCODE_SET).to_string(),
+    }
+}
+
+/// Resolves the Hive partition directory `rootdir/key=value/...` of the first row of
+/// `partition_df`.
+///
 /// `partition_df` must be created in the same way as `partition_by`.
-fn resolve_partition_dir<I, S>(rootdir: &Path, by: I, partition_df: &DataFrame) -> PathBuf
+pub fn resolve_partition_dir<I, S>(rootdir: &Path, by: I, partition_df: &DataFrame) -> PathBuf
 where
     I: IntoIterator<Item = S>,
     S: AsRef<str>,
@@ -122,8 +147,8 @@ where
     path.push(resolve_homedir(rootdir));
 
     for key in by.into_iter() {
-        let value = partition_df[key.as_ref()].get(0).unwrap().to_string();
-        path.push(format!("{}={}", key.as_ref(), value))
+        let value = partition_df[key.as_ref()].get(0).unwrap();
+        path.push(format!("{}={}", key.as_ref(), hive_partition_value(&value)))
     }
     path
 }
@@ -7,6 +7,13 @@ pub trait PhysicalIoExpr: Send + Sync {
     /// as a predicate mask
     fn evaluate_io(&self, df: &DataFrame) -> PolarsResult<Series>;
 
+    /// Get the names of the columns that are used in the expression.
+    ///
+    /// Returns `None` if they are unknown.
+    fn live_variables(&self) -> Option<Vec<Arc<str>>> {
+        None
+    }
+
     /// Can take &dyn Statistics and determine of a file should be
     /// read -> `true`
     /// or not -> `false`
@@ -44,6 +51,7 @@ pub fn apply_predicate(
 /// - Null count
 /// - Minimum value
 /// - Maximum value
+/// - Bloom filter, if the file provides one
 #[derive(Debug)]
 #[cfg_attr(feature = "serde", derive(Serialize, Deserialize))]
 pub struct ColumnStats {
@@ -52,6 +60,8 @@ pub struct ColumnStats {
     null_count: Option<Series>,
     min_value: Option<Series>,
     max_value: Option<Series>,
+    #[cfg_attr(feature = "serde", serde(skip))]
+    bloom_filter: Option<BloomFilter>,
 }
 
 impl ColumnStats {
@@ -67,6 +77,7 @@ impl ColumnStats {
             null_count,
             min_value,
             max_value,
+            bloom_filter: None,
         }
     }
 
@@ -77,6 +88,7 @@ impl ColumnStats {
             null_count: None,
             min_value: None,
             max_value: None,
+            bloom_filter: None,
         }
     }
 
@@ -88,6 +100,32 @@ impl ColumnStats {
             null_count: None,
             min_value: Some(s.clone()),
             max_value: Some(s),
+            bloom_filter: None,
+        }
+    }
+
+    /// Sets the [`BloomFilter`] of the column.
+    pub fn set_bloom_filter(&mut self, bloom_filter: Option<BloomFilter>) {
+        self.bloom_filter = bloom_filter;
+    }
+
+    /// Returns the [`BloomFilter`] of the column, if any.
+    pub fn bloom_filter(&self) -> Option<&BloomFilter> {
+        self.bloom_filter.as_ref()
+    }
+
+    /// Returns whether any of the `values` may occur in the column.
+    ///
+    /// Only returns `false` if the bloom filter of the column proves that none
+    /// of the values occur.
+    pub fn may_contain_any(&self, values: &Series) -> bool {
+        let Some(bloom_filter) = &self.bloom_filter else {
+            return true;
+        };
+        // The values must be hashed as the physical type of the column.
+        match values.cast(self.dtype()) {
+            Ok(values) => values.iter().any(|av| bloom_filter.may_contain(&av)),
+            Err(_) => true,
         }
     }
 
@@ -184,6 +222,40 @@ impl ColumnStats {
     }
 }
 
+/// A split block bloom filter over the values of a column.
+///
+/// A bloom filter can prove that a value is absent, but never that it is present.
+#[derive(Debug, Clone)]
+pub struct BloomFilter {
+    bitset: Vec<u8>,
+}
+
+impl BloomFilter {
+    /// Constructs a new [`BloomFilter`] from a parquet split block bitset.
+    pub fn new(bitset: Vec<u8>) -> Self {
+        Self { bitset }
+    }
+
+    /// Returns whether `value` may be in the set.
+    ///
+    /// Returns `true` if the hash of the value cannot be determined.
+    pub fn may_contain(&self, value: &AnyValue) -> bool {
+        #[cfg(feature = "parquet")]
+        {
+            use polars_parquet::parquet::bloom_filter::is_in_set;
+            match crate::parquet::bloom_filter::hash_any_value(value) {
+                Some(hash) => is_in_set(&self.bitset, hash),
+                None => true,
+            }
+        }
+        #[cfg(not(feature = "parquet"))]
+        {
+            let _ = value;
+            true
+        }
+    }
+}
+
 /// Returns whether the [`DataType`] supports minimum/maximum operations.
 fn use_min_max(dtype: &DataType) -> bool {
     dtype.is_numeric()
@@ -225,6 +297,11 @@ impl BatchStats {
         self.stats.as_ref()
     }
 
+    /// Returns the [`ColumnStats`] of all columns in the batch, mutably.
+    pub(crate) fn column_stats_mut(&mut self) -> &mut [ColumnStats] {
+        self.stats.as_mut()
+    }
+
     /// Returns the [`ColumnStats`] of a single column in the batch.
     ///
     /// Returns an `Err` if no statistics are available for the given column.
@@ -217,6 +217,25 @@ pub fn materialize_projection(
     }
 }
 
+/// Materializes hive partitions.
+/// We have a special num_rows arg, as df can be empty when a projection contains
+/// only hive partition columns.
+///
+/// # Safety
+///
+/// num_rows equals the height of the df when the df height is non-zero.
+pub fn materialize_hive_partitions(
+    df: &mut DataFrame,
+    hive_partition_columns: Option<&[Series]>,
+    num_rows: usize,
+) {
+    if let Some(hive_columns) = hive_partition_columns {
+        for s in hive_columns {
+            unsafe { df.with_column_unchecked(s.new_from_index(0, num_rows)) };
+        }
+    }
+}
+
 pub fn check_projected_schema_impl(
     a: &Schema,
     b: &Schema,
@@ -309,6 +328,27 @@ pub fn is_cloud_url<P: AsRef<Path>>(p: P) -> bool {
     }
 }
 
+/// Open a local file or an object in cloud storage for reading. Objects in cloud storage are
+/// read with ranged requests.
+#[allow(unused_variables)]
+pub fn open_reader(
+    path: &Path,
+    cloud_options: Option<&crate::cloud::CloudOptions>,
+) -> PolarsResult<Box<dyn MmapBytesReader>> {
+    if is_cloud_url(path) {
+        #[cfg(feature = "cloud")]
+        {
+            let reader =
+                crate::cloud::CloudReader::from_uri(&path.to_string_lossy(), cloud_options)?;
+            return Ok(Box::new(reader));
+        }
+        #[cfg(not(feature = "cloud"))]
+        panic!("One or more of the cloud storage features ('aws', 'gcp', ...) must be enabled.");
+    }
+    let path = resolve_homedir(path);
+    Ok(Box::new(polars_utils::open_file(&path)?))
+}
+
 #[cfg(test)]
 mod tests {
     use std::path::PathBuf;
@@ -465,7 +465,20 @@ impl LazyFrame {
     /// This should be used to prevent computations running multiple times.
     pub fn cache(self) -> Self {
         let opt_state = self.get_opt_state();
-        let lp = self.get_plan_builder().cache().build();
+        let lp = self.get_plan_builder().cache(false).build();
+        Self::from_logical_plan(lp, opt_state)
+    }
+
+    /// Caches the result into a new LazyFrame and keeps it in the process-wide query cache, so
+    /// that later queries with the same plan reuse it.
+    ///
+    /// The cached result is identified by the plan and the version (size and modification time)
+    /// of the local files it reads, so it is invalidated when a source file changes. Plans that
+    /// contain user defined functions or read from cloud storage are not persisted. The memory
+    /// budget of the query cache is set with `POLARS_QUERY_CACHE_SIZE` (in bytes).
+    pub fn cache_persistent(self) -> Self {
+        let opt_state = self.get_opt_state();
+        let lp = self.get_plan_builder().cache(true).build();
         Self::from_logical_plan(lp, opt_state)
     }
 
@@ -649,6 +662,25 @@ impl LazyFrame {
         Ok((out, timer_df))
     }
 
+    /// Profile a LazyFrame on the streaming engine.
+    ///
+    /// This will run the query in a streaming fashion and return a tuple containing the
+    /// materialized DataFrame and a DataFrame that contains the metrics of every source, operator
+    /// and sink of the streaming pipelines: the rows that went in and out, the estimated bytes
+    /// that went out, the time spent in the node summed over all threads (`busy`), the time the
+    /// threads waited on a source (`wait`), the bytes that were spilled to disk and when the node
+    /// was first and last active.
+    ///
+    /// The units of the timings are microseconds.
+    #[cfg(feature = "streaming")]
+    pub fn profile_streaming(self) -> PolarsResult<(DataFrame, DataFrame)> {
+        let (mut state, mut physical_plan, _) = self.with_streaming(true).prepare_collect(false)?;
+        state.time_nodes();
+        let out = physical_plan.execute(&mut state)?;
+        let metrics = state.finish_streaming_metrics()?;
+        Ok((out, metrics))
+    }
+
     /// Stream a query result into a parquet file. This is useful if the final result doesn't fit
     /// into memory. This methods will return an error if the query cannot be completely done in a
     /// streaming fashion.
@@ -757,6 +789,45 @@ impl LazyFrame {
         )
     }
 
+    /// Stream a query result into a Hive partitioned dataset in the directory `path`.
+    ///
+    /// Every partition is written to `path/key=value/.../data-{i}.{ext}`; the partition
+    /// columns are not written to the files. This method will return an error if the query
+    /// cannot be completely done in a streaming fashion.
+    #[cfg(any(
+        feature = "ipc",
+        feature = "parquet",
+        feature = "csv",
+        feature = "json"
+    ))]
+    pub fn sink_partitioned(
+        self,
+        path: PathBuf,
+        file_type: FileType,
+        options: PartitionedSinkOptions,
+    ) -> PolarsResult<()> {
+        polars_ensure!(
+            !options.by.is_empty(),
+            InvalidOperation: "partitioned sink requires at least one partition column"
+        );
+        polars_ensure!(
+            options.max_open_files > 0,
+            InvalidOperation: "`max_open_files` must be positive"
+        );
+        polars_ensure!(
+            options.max_rows_per_file != Some(0),
+            InvalidOperation: "`max_rows_per_file` must be positive"
+        );
+        self.sink(
+            SinkType::Partitioned {
+                path: Arc::new(path),
+                file_type,
+                options,
+            },
+            "collect()",
+        )
+    }
+
     #[cfg(any(
         feature = "ipc",
         feature = "parquet",
@@ -1,11 +1,37 @@
 use std::sync::atomic::Ordering;
 
+#[cfg(feature = "cse")]
+use polars_plan::logical_plan::PlanFingerprint;
+
 use super::*;
+#[cfg(feature = "cse")]
+use crate::physical_plan::query_cache;
 
 pub struct CacheExec {
     pub input: Box<dyn Executor>,
     pub id: usize,
     pub count: u32,
+    /// Set if the result is kept in the query cache and reused by later queries.
+    #[cfg(feature = "cse")]
+    pub fingerprint: Option<PlanFingerprint>,
+}
+
+impl CacheExec {
+    fn execute_input(&mut self, state: &mut ExecutionState) -> PolarsResult<DataFrame> {
+        #[cfg(feature = "cse")]
+        if let Some(fingerprint) = &self.fingerprint {
+            if let Some(df) = query_cache::get(fingerprint.key) {
+                if state.verbose() {
+                    eprintln!("QUERY CACHE HIT: cache id: {:x}", self.id);
+                }
+                return Ok(df);
+            }
+            let df = self.input.execute(state)?;
+            query_cache::insert(fingerprint, df.clone());
+            return Ok(df);
+        }
+        self.input.execute(state)
+    }
 }
 
 impl Executor for CacheExec {
@@ -17,7 +43,7 @@ impl Executor for CacheExec {
 
         let df = cache.1.get_or_try_init(|| {
             cache_hit = false;
-            self.input.execute(state)
+            self.execute_input(state)
         })?;
 
         // Decrement count on cache hits.
@@ -1,16 +1,62 @@
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
+
+use polars_core::utils::accumulate_dataframes_vertical;
+use polars_io::cloud::CloudOptions;
+use polars_io::predicates::apply_predicate;
+use polars_io::utils::{materialize_hive_partitions, open_reader};
+use polars_io::RowIndex;
 
 use super::*;
 
 pub struct CsvExec {
-    pub path: PathBuf,
-    pub schema: SchemaRef,
+    pub paths: Arc<[PathBuf]>,
+    pub file_info: FileInfo,
     pub options: CsvParserOptions,
+    pub cloud_options: Option<CloudOptions>,
     pub file_options: FileScanOptions,
     pub predicate: Option<Arc<dyn PhysicalExpr>>,
 }
 
 impl CsvExec {
+    fn read_file(
+        &self,
+        path: &Path,
+        schema: SchemaRef,
+        with_columns: Option<Vec<String>>,
+        n_rows: Option<usize>,
+        row_index: Option<RowIndex>,
+        predicate: Option<Arc<dyn PhysicalIoExpr>>,
+    ) -> PolarsResult<DataFrame> {
+        let options = self.options.clone();
+        // Objects in cloud storage are downloaded with concurrent ranged requests.
+        let reader = open_reader(path, self.cloud_options.as_ref())?;
+        CsvReader::new(reader)
+            .with_path(Some(path))
+            .has_header(options.has_header)
+            .with_dtypes(Some(schema))
+            .with_separator(options.separator)
+            .with_ignore_errors(options.ignore_errors)
+            .with_skip_rows(options.skip_rows)
+            .with_n_rows(n_rows)
+            .with_columns(with_columns)
+            .low_memory(options.low_memory)
+            .with_null_values(options.null_values)
+            .with_predicate(predicate)
+            .with_encoding(CsvEncoding::LossyUtf8)
+            ._with_comment_prefix(options.comment_prefix)
+            .with_quote_char(options.quote_char)
+            .with_end_of_line_char(options.eol_char)
+            .with_encoding(options.encoding)
+            .with_rechunk(self.file_options.rechunk)
+            .with_row_index(row_index)
+            .with_try_parse_dates(options.try_parse_dates)
+            .with_n_threads(options.n_threads)
+            .truncate_ragged_lines(options.truncate_ragged_lines)
+            .with_decimal_comma(options.decimal_comma)
+            .raise_if_empty(options.raise_if_empty)
+            .finish()
+    }
+
     fn read(&mut self) -> PolarsResult<DataFrame> {
         let with_columns = self
             .file_options
@@ -22,39 +68,134 @@ impl CsvExec {
 
         let n_rows = _set_n_rows_for_scan(self.file_options.n_rows);
         let predicate = self.predicate.clone().map(phys_expr_to_io_expr);
+        let row_index = std::mem::take(&mut self.file_options.row_index);
 
-        CsvReader::from_path(&self.path)
-            .unwrap()
-            .has_header(self.options.has_header)
-            .with_dtypes(Some(self.schema.clone()))
-            .with_separator(self.options.separator)
-            .with_ignore_errors(self.options.ignore_errors)
-            .with_skip_rows(self.options.skip_rows)
-            .with_n_rows(n_rows)
-            .with_columns(with_columns)
-            .low_memory(self.options.low_memory)
-            .with_null_values(std::mem::take(&mut self.options.null_values))
-            .with_predicate(predicate)
-            .with_encoding(CsvEncoding::LossyUtf8)
-            ._with_comment_prefix(std::mem::take(&mut self.options.comment_prefix))
-            .with_quote_char(self.options.quote_char)
-            .with_end_of_line_char(self.options.eol_char)
-            .with_encoding(self.options.encoding)
-            .with_rechunk(self.file_options.rechunk)
-            .with_row_index(std::mem::take(&mut self.file_options.row_index))
-            .with_try_parse_dates(self.options.try_parse_dates)
-            .with_n_threads(self.options.n_threads)
-            .truncate_ragged_lines(self.options.truncate_ragged_lines)
-            .with_decimal_comma(self.options.decimal_comma)
-            .raise_if_empty(self.options.raise_if_empty)
-            .finish()
+        let Some(hive_schema) = self
+            .file_info
+            .hive_parts
+            .as_ref()
+            .map(|hive| hive.get_statistics().schema().clone())
+        else {
+            return self.read_files(
+                self.file_info.schema.clone(),
+                with_columns,
+                n_rows,
+                row_index,
+                predicate,
+            );
+        };
+
+        // The partition columns are not in the files.
+        let schema = Arc::new(
+            self.file_info
+                .schema
+                .iter()
+                .filter(|(name, _)| !hive_schema.contains(name))
+                .map(|(name, dtype)| Field::new(name, dtype.clone()))
+                .collect::<Schema>(),
+        );
+        let mut file_columns = with_columns.as_ref().map(|columns| {
+            columns
+                .iter()
+                .filter(|name| !hive_schema.contains(name))
+                .cloned()
+                .collect::<Vec<_>>()
+        });
+        // If only partition columns are projected, we still need the number of rows.
+        let only_hive_columns = file_columns.as_ref().is_some_and(|cols| cols.is_empty());
+        if only_hive_columns {
+            file_columns = schema
+                .iter_names()
+                .find(|name| {
+                    row_index
+                        .as_ref()
+                        .map_or(true, |ri| ri.name != name.as_str())
+                })
+                .map(|name| vec![name.to_string()]);
+        }
+
+        let mut df = self.read_files(schema, file_columns, n_rows, row_index.clone(), None)?;
+        if only_hive_columns {
+            df = df.select(
+                row_index
+                    .iter()
+                    .map(|ri| ri.name.as_str())
+                    .chain(hive_schema.iter_names().map(|name| name.as_str())),
+            )?;
+        }
+        // The predicate may refer to the partition columns, so it is only applied
+        // after they are materialized.
+        apply_predicate(&mut df, predicate.as_deref(), true)?;
+        Ok(df)
+    }
+
+    /// Reads all files and materializes the Hive partition columns of every file.
+    fn read_files(
+        &mut self,
+        schema: SchemaRef,
+        with_columns: Option<Vec<String>>,
+        n_rows: Option<usize>,
+        row_index: Option<RowIndex>,
+        predicate: Option<Arc<dyn PhysicalIoExpr>>,
+    ) -> PolarsResult<DataFrame> {
+        let paths = self.paths.clone();
+        if let [path] = paths.as_ref() {
+            let mut df =
+                self.read_file(path, schema, with_columns, n_rows, row_index, predicate)?;
+            self.add_hive_columns(path, &mut df)?;
+            return Ok(df);
+        }
+
+        let mut n_rows_read = 0;
+        let mut dfs = Vec::with_capacity(paths.len());
+        for path in paths.iter() {
+            let remaining = n_rows.map(|n| n.saturating_sub(n_rows_read));
+            if remaining == Some(0) && !dfs.is_empty() {
+                break;
+            }
+
+            let mut df = self.read_file(
+                path,
+                schema.clone(),
+                with_columns.clone(),
+                remaining,
+                row_index.clone().map(|mut ri| {
+                    ri.offset += n_rows_read as IdxSize;
+                    ri
+                }),
+                // The rows must be counted before they are filtered.
+                None,
+            )?;
+            n_rows_read += df.height();
+            self.add_hive_columns(path, &mut df)?;
+            apply_predicate(&mut df, predicate.as_deref(), true)?;
+            dfs.push(df);
+        }
+
+        let mut df = accumulate_dataframes_vertical(dfs)?;
+        if self.file_options.rechunk {
+            df.as_single_chunk_par();
+        }
+        Ok(df)
+    }
+
+    fn add_hive_columns(&mut self, path: &Path, df: &mut DataFrame) -> PolarsResult<()> {
+        self.file_info.update_hive_partitions(path)?;
+        let hive_columns = self
+            .file_info
+            .hive_parts
+            .as_ref()
+            .map(|hive| hive.materialize_partition_columns());
+        let height = df.height();
+        materialize_hive_partitions(df, hive_columns.as_deref(), height);
+        Ok(())
     }
 }
 
 impl Executor for CsvExec {
     fn execute(&mut self, state: &mut ExecutionState) -> PolarsResult<DataFrame> {
         let profile_name = if state.has_node_timer() {
-            let mut ids = vec![self.path.to_string_lossy().into()];
+            let mut ids = vec![self.paths[0].to_string_lossy().into()];
             if self.predicate.is_some() {
                 ids.push("predicate".into())
             }
@@ -6,7 +6,7 @@ use polars_core::config;
 use polars_core::utils::accumulate_dataframes_vertical;
 use polars_io::cloud::CloudOptions;
 use polars_io::predicates::apply_predicate;
-use polars_io::utils::is_cloud_url;
+use polars_io::utils::{is_cloud_url, materialize_hive_partitions};
 use polars_io::RowIndex;
 use rayon::prelude::*;
 
@@ -14,7 +14,7 @@ use super::*;
 
 pub struct IpcExec {
     pub(crate) paths: Arc<[PathBuf]>,
-    pub(crate) schema: SchemaRef,
+    pub(crate) file_info: FileInfo,
     pub(crate) predicate: Option<Arc<dyn PhysicalExpr>>,
     pub(crate) options: IpcScanOptions,
     pub(crate) file_options: FileScanOptions,
@@ -22,8 +22,81 @@ pub struct IpcExec {
     pub(crate) metadata: Option<arrow::io::ipc::read::FileMetadata>,
 }
 
+/// The Hive partition columns of every file and the file column that is only read to
+/// determine the number of rows, if no other file columns are projected.
+struct HiveColumns {
+    per_file: Vec<Option<Vec<Series>>>,
+    placeholder: Option<String>,
+}
+
+impl HiveColumns {
+    fn first(&self) -> Option<&[Series]> {
+        self.per_file.first().and_then(|columns| columns.as_deref())
+    }
+
+    fn add_to(&self, index: usize, df: &mut DataFrame) -> PolarsResult<()> {
+        if let Some(name) = &self.placeholder {
+            df.drop_in_place(name)?;
+        }
+        let height = df.height();
+        materialize_hive_partitions(df, self.per_file[index].as_deref(), height);
+        Ok(())
+    }
+}
+
 impl IpcExec {
+    fn hive_columns(&mut self) -> PolarsResult<HiveColumns> {
+        if self.file_info.hive_parts.is_none() {
+            return Ok(HiveColumns {
+                per_file: vec![None; self.paths.len()],
+                placeholder: None,
+            });
+        }
+
+        let paths = self.paths.clone();
+        let per_file = paths
+            .iter()
+            .map(|path| {
+                self.file_info.update_hive_partitions(path)?;
+                Ok(self
+                    .file_info
+                    .hive_parts
+                    .as_ref()
+                    .map(|hive| hive.materialize_partition_columns()))
+            })
+            .collect::<PolarsResult<Vec<_>>>()?;
+
+        // If only partition columns are projected, we still need the number of rows of
+        // every file, so we read the first column of the file.
+        let placeholder = self
+            .file_options
+            .with_columns
+            .as_ref()
+            .filter(|columns| {
+                let hive_columns = per_file[0].as_deref().unwrap_or_default();
+                columns
+                    .iter()
+                    .all(|name| hive_columns.iter().any(|s| s.name() == name.as_str()))
+            })
+            .and_then(|_| {
+                let row_index = self.file_options.row_index.is_some() as usize;
+                self.file_info
+                    .schema
+                    .get_at_index(row_index)
+                    .map(|(name, _)| name.to_string())
+            });
+        if let Some(name) = &placeholder {
+            self.file_options.with_columns = Some(Arc::new(vec![name.clone()]));
+        }
+
+        Ok(HiveColumns {
+            per_file,
+            placeholder,
+        })
+    }
+
     fn read(&mut self, verbose: bool) -> PolarsResult<DataFrame> {
+        let hive_columns = self.hive_columns()?;
         let is_cloud = self.paths.iter().any(is_cloud_url);
         let mut out = if is_cloud || config::force_async() {
             #[cfg(not(feature = "cloud"))]
@@ -38,10 +111,10 @@ impl IpcExec {
                 }
 
                 polars_io::pl_async::get_runtime()
-                    .block_on_potential_spawn(self.read_async(verbose))?
+                    .block_on_potential_spawn(self.read_async(&hive_columns, verbose))?
             }
         } else {
-            self.read_sync()?
+            self.read_sync(&hive_columns)?
         };
 
         if self.file_options.rechunk {
@@ -51,7 +124,7 @@ impl IpcExec {
         Ok(out)
     }
 
-    fn read_sync(&mut self) -> PolarsResult<DataFrame> {
+    fn read_sync(&mut self, hive_columns: &HiveColumns) -> PolarsResult<DataFrame> {
         if config::verbose() {
             eprintln!("executing ipc read sync with row_index = {:?}, n_rows = {:?}, predicate = {:?} for paths {:?}",
                 self.file_options.row_index.as_ref(),
@@ -66,8 +139,8 @@ impl IpcExec {
                 .with_columns
                 .as_deref()
                 .map(|cols| cols.deref()),
-            &self.schema,
-            None,
+            &self.file_info.schema,
+            hive_columns.first(),
             self.file_options.row_index.is_some(),
         );
 
@@ -95,7 +168,7 @@ impl IpcExec {
 
                 let file = std::fs::File::open(path)?;
 
-                let df = IpcReader::new(file)
+                let mut df = IpcReader::new(file)
                     .with_n_rows(
                         // NOTE: If there is any file that by itself exceeds the
                         // row limit, passing the total row limit to each
@@ -115,6 +188,7 @@ impl IpcExec {
                     .write()
                     .unwrap()
                     .write(index, df.height().try_into().unwrap());
+                hive_columns.add_to(index, &mut df)?;
 
                 Ok((index, df))
             })
@@ -130,7 +204,11 @@ impl IpcExec {
     }
 
     #[cfg(feature = "cloud")]
-    async fn read_async(&mut self, verbose: bool) -> PolarsResult<DataFrame> {
+    async fn read_async(
+        &mut self,
+        hive_columns: &HiveColumns,
+        verbose: bool,
+    ) -> PolarsResult<DataFrame> {
         use futures::stream::{self, StreamExt};
         use futures::TryStreamExt;
 
@@ -155,11 +233,22 @@ impl IpcExec {
 
         let row_counter = RwLock::new(ConsecutiveCountState::new(self.paths.len()));
 
+        // The partition columns are not in the files.
+        let projection = self.file_options.with_columns.as_deref().map(|columns| {
+            let hive_columns = hive_columns.first().unwrap_or_default();
+            columns
+                .iter()
+                .filter(|name| !hive_columns.iter().any(|s| s.name() == name.as_str()))
+                .cloned()
+                .collect::<Vec<_>>()
+        });
+
         let index_and_dfs = stream::iter(&*self.paths)
             .enumerate()
             .map(|(index, path)| {
                 let this = &*self;
                 let row_counter = &row_counter;
+                let projection = &projection;
                 async move {
                     let already_read_in_sequence = row_counter.read().unwrap().sum();
                     if already_read_in_sequence >= row_limit {
@@ -171,7 +260,7 @@ impl IpcExec {
                         this.cloud_options.as_ref(),
                     )
                     .await?;
-                    let df = reader
+                    let mut df = reader
                         .data(
                             this.metadata.as_ref(),
                             IpcReadOptions::default()
@@ -187,9 +276,7 @@ impl IpcExec {
                                     }),
                                 )
                                 .with_row_index(this.file_options.row_index.clone())
-                                .with_projection(
-                                    this.file_options.with_columns.as_deref().cloned(),
-                                ),
+                                .with_projection(projection.clone()),
                             verbose,
                         )
                         .await?;
@@ -198,6 +285,7 @@ impl IpcExec {
                         .write()
                         .unwrap()
                         .write(index, df.height().try_into().unwrap());
+                    hive_columns.add_to(index, &mut df)?;
 
                     PolarsResult::Ok((index, df))
                 }
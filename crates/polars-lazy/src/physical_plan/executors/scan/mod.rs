@@ -17,18 +17,36 @@ use std::ops::Deref;
 pub(crate) use csv::CsvExec;
 #[cfg(feature = "ipc")]
 pub(crate) use ipc::IpcExec;
+#[cfg(feature = "json")]
+pub(crate) use ndjson::JsonExec;
 #[cfg(feature = "parquet")]
 pub(crate) use parquet::ParquetExec;
-#[cfg(any(feature = "ipc", feature = "parquet"))]
+#[cfg(any(
+    feature = "ipc",
+    feature = "parquet",
+    feature = "csv",
+    feature = "json"
+))]
 use polars_io::predicates::PhysicalIoExpr;
-#[cfg(any(feature = "parquet", feature = "csv", feature = "ipc", feature = "cse"))]
+#[cfg(any(
+    feature = "parquet",
+    feature = "csv",
+    feature = "ipc",
+    feature = "json",
+    feature = "cse"
+))]
 use polars_io::prelude::*;
 use polars_plan::global::_set_n_rows_for_scan;
 #[cfg(feature = "ipc")]
 pub(crate) use support::ConsecutiveCountState;
 
 use super::*;
-#[cfg(any(feature = "ipc", feature = "parquet"))]
+#[cfg(any(
+    feature = "ipc",
+    feature = "parquet",
+    feature = "csv",
+    feature = "json"
+))]
 use crate::physical_plan::expressions::phys_expr_to_io_expr;
 use crate::prelude::*;
 
@@ -1,41 +1,124 @@
+use std::path::PathBuf;
+
+use polars_core::utils::accumulate_dataframes_vertical;
+use polars_io::ndjson::NDJsonReadOptions;
+use polars_io::predicates::apply_predicate;
+use polars_io::utils::materialize_hive_partitions;
+
 use super::*;
 
-impl AnonymousScan for LazyJsonLineReader {
-    fn as_any(&self) -> &dyn std::any::Any {
-        self
-    }
-    fn scan(&self, scan_opts: AnonymousScanArgs) -> PolarsResult<DataFrame> {
-        let schema = scan_opts.output_schema.unwrap_or(scan_opts.schema);
-        JsonLineReader::from_path(&self.path)?
-            .with_schema(schema)
-            .with_rechunk(self.rechunk)
-            .with_chunk_size(self.batch_size)
-            .low_memory(self.low_memory)
-            .with_n_rows(scan_opts.n_rows)
-            .with_ignore_errors(self.ignore_errors)
-            .finish()
-    }
+pub struct JsonExec {
+    pub paths: Arc<[PathBuf]>,
+    pub file_info: FileInfo,
+    pub options: NDJsonReadOptions,
+    pub file_options: FileScanOptions,
+    pub predicate: Option<Arc<dyn PhysicalExpr>>,
+}
+
+impl JsonExec {
+    /// The schema of the columns that are read from the files.
+    ///
+    /// This excludes the row index and the Hive partition columns. If only those are
+    /// projected, the first column of the files is read to determine the number of rows.
+    fn file_schema(&self) -> SchemaRef {
+        // The schema is inferred when the plan is converted.
+        let schema = self.options.schema.clone().unwrap();
+        let Some(with_columns) = &self.file_options.with_columns else {
+            return schema;
+        };
 
-    fn schema(&self, infer_schema_length: Option<usize>) -> PolarsResult<SchemaRef> {
-        // Short-circuit schema inference if the schema has been explicitly provided,
-        // or already inferred
-        if let Some(schema) = &(*self.schema.read().unwrap()) {
-            return Ok(schema.clone());
+        let projected = schema
+            .iter()
+            .filter(|(name, _)| with_columns.iter().any(|c| c == name.as_str()))
+            .map(|(name, dtype)| Field::new(name, dtype.clone()))
+            .collect::<Schema>();
+        if projected.is_empty() {
+            if let Some((name, dtype)) = schema.get_at_index(0) {
+                return Arc::new(Schema::from_iter([Field::new(name, dtype.clone())]));
+            }
         }
+        Arc::new(projected)
+    }
+
+    fn read(&mut self) -> PolarsResult<DataFrame> {
+        let schema = self.file_schema();
+        let projected_names = self.file_options.with_columns.clone();
+        let n_rows = _set_n_rows_for_scan(self.file_options.n_rows);
+        let predicate = self.predicate.clone().map(phys_expr_to_io_expr);
 
-        let f = polars_utils::open_file(&self.path)?;
-        let mut reader = std::io::BufReader::new(f);
+        let paths = self.paths.clone();
+        let mut n_rows_read = 0;
+        let mut dfs = Vec::with_capacity(paths.len());
+        for path in paths.iter() {
+            let remaining = n_rows.map(|n| n.saturating_sub(n_rows_read));
+            if remaining == Some(0) && !dfs.is_empty() {
+                break;
+            }
 
-        let schema = Arc::new(polars_io::ndjson::infer_schema(
-            &mut reader,
-            infer_schema_length,
-        )?);
-        let mut guard = self.schema.write().unwrap();
-        *guard = Some(schema.clone());
+            let mut df = JsonLineReader::from_path(path)?
+                .with_schema(schema.clone())
+                .with_rechunk(false)
+                .with_n_rows(remaining)
+                .with_n_threads(self.options.n_threads)
+                .with_chunk_size(self.options.chunk_size)
+                .low_memory(self.options.low_memory)
+                .with_ignore_errors(self.options.ignore_errors)
+                .finish()?;
+            let height = df.height();
 
-        Ok(schema)
+            if let Some(projected_names) = &projected_names {
+                // Drop the column that was only read to determine the number of rows.
+                let columns = df
+                    .get_column_names()
+                    .into_iter()
+                    .filter(|name| projected_names.iter().any(|c| c == name))
+                    .map(|name| name.to_string())
+                    .collect::<Vec<_>>();
+                df = df.select(columns)?;
+            }
+            if let Some(row_index) = &self.file_options.row_index {
+                df = df.with_row_index(
+                    &row_index.name,
+                    Some(row_index.offset + n_rows_read as IdxSize),
+                )?;
+            }
+            if self.file_info.hive_parts.is_some() {
+                self.file_info.update_hive_partitions(path)?;
+                let hive_columns = self
+                    .file_info
+                    .hive_parts
+                    .as_ref()
+                    .map(|hive| hive.materialize_partition_columns());
+                materialize_hive_partitions(&mut df, hive_columns.as_deref(), height);
+            }
+            n_rows_read += height;
+
+            // The rows must be counted before they are filtered.
+            apply_predicate(&mut df, predicate.as_deref(), true)?;
+            dfs.push(df);
+        }
+
+        let mut df = accumulate_dataframes_vertical(dfs)?;
+        if self.file_options.rechunk {
+            df.as_single_chunk_par();
+        }
+        Ok(df)
     }
-    fn allows_projection_pushdown(&self) -> bool {
-        true
+}
+
+impl Executor for JsonExec {
+    fn execute(&mut self, state: &mut ExecutionState) -> PolarsResult<DataFrame> {
+        let profile_name = if state.has_node_timer() {
+            let mut ids = vec![self.paths[0].to_string_lossy().into()];
+            if self.predicate.is_some() {
+                ids.push("predicate".into())
+            }
+            let name = comma_delimited("ndjson".to_string(), &ids);
+            Cow::Owned(name)
+        } else {
+            Cow::Borrowed("")
+        };
+
+        state.record(|| self.read(), profile_name)
     }
 }
@@ -91,6 +91,7 @@ impl ParquetExec {
                     );
 
                     let mut reader = ParquetReader::new(file)
+                        .with_cached_metadata(path)?
                         .with_schema(self.file_info.reader_schema.clone())
                         .read_parallel(parallel)
                         .set_low_memory(self.options.low_memory)
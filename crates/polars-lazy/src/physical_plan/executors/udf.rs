@@ -1,4 +1,6 @@
 use super::*;
+#[cfg(feature = "streaming")]
+use crate::physical_plan::streaming::with_node_timer;
 
 pub(crate) struct UdfExec {
     pub(crate) input: Box<dyn Executor>,
@@ -21,6 +23,15 @@ impl Executor for UdfExec {
         } else {
             Cow::Borrowed("")
         };
+        // The streaming engine executes its pipelines with a new state, which must time them
+        // as well.
+        #[cfg(feature = "streaming")]
+        if let FunctionNode::Pipeline { .. } = self.function {
+            return state.record(
+                || with_node_timer(state, || self.function.evaluate(df)),
+                profile_name,
+            );
+        }
         state.record(|| self.function.evaluate(df), profile_name)
     }
 }
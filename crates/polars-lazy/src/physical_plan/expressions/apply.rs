@@ -535,6 +535,9 @@ impl ApplyExpr {
                     #[allow(clippy::explicit_auto_deref)]
                     let input: &Series = &**input;
                     let st = stats.get_stats(&root).ok()?;
+                    if !st.may_contain_any(input) {
+                        return Some(false);
+                    }
                     let min = st.to_min()?;
                     let max = st.to_max()?;
 
@@ -258,7 +258,7 @@ impl PhysicalExpr for BinaryExpr {
 
 #[cfg(feature = "parquet")]
 mod stats {
-    use polars_io::predicates::{BatchStats, StatsEvaluator};
+    use polars_io::predicates::{BatchStats, ColumnStats, StatsEvaluator};
 
     use super::*;
 
@@ -360,6 +360,14 @@ mod stats {
         }
     }
 
+    // A bloom filter can only prove that a literal does not occur in the column.
+    fn apply_operator_bloom_filter(stats: &ColumnStats, literal: &Series, op: Operator) -> bool {
+        match op {
+            Operator::Eq => stats.may_contain_any(literal),
+            _ => true,
+        }
+    }
+
     impl BinaryExpr {
         fn impl_should_read(&self, stats: &BatchStats) -> PolarsResult<bool> {
             // See: #5864 for the rationale behind this.
@@ -400,27 +408,29 @@ mod stats {
             let out = match (self.left.is_literal(), self.right.is_literal()) {
                 (false, true) => {
                     let l = stats.get_stats(fld_l.name())?;
-                    match l.to_min_max() {
-                        None => Ok(true),
+                    let lit_s = self.right.evaluate(&dummy, &state).unwrap();
+                    let read = match l.to_min_max() {
+                        None => true,
                         Some(min_max_s) => {
                             // will be incorrect if not
                             debug_assert_eq!(min_max_s.null_count(), 0);
-                            let lit_s = self.right.evaluate(&dummy, &state).unwrap();
-                            Ok(apply_operator_stats_rhs_lit(&min_max_s, &lit_s, self.op))
+                            apply_operator_stats_rhs_lit(&min_max_s, &lit_s, self.op)
                         },
-                    }
+                    };
+                    Ok(read && apply_operator_bloom_filter(l, &lit_s, self.op))
                 },
                 (true, false) => {
                     let r = stats.get_stats(fld_r.name())?;
-                    match r.to_min_max() {
-                        None => Ok(true),
+                    let lit_s = self.left.evaluate(&dummy, &state).unwrap();
+                    let read = match r.to_min_max() {
+                        None => true,
                         Some(min_max_s) => {
                             // will be incorrect if not
                             debug_assert_eq!(min_max_s.null_count(), 0);
-                            let lit_s = self.left.evaluate(&dummy, &state).unwrap();
-                            Ok(apply_operator_stats_lhs_lit(&lit_s, &min_max_s, self.op))
+                            apply_operator_stats_lhs_lit(&lit_s, &min_max_s, self.op)
                         },
-                    }
+                    };
+                    Ok(read && apply_operator_bloom_filter(r, &lit_s, self.op))
                 },
                 // Default: read the file
                 _ => Ok(true),
@@ -4,6 +4,8 @@ pub(crate) mod exotic;
 pub mod expressions;
 mod node_timer;
 pub mod planner;
+#[cfg(feature = "cse")]
+pub mod query_cache;
 pub(crate) mod state;
 #[cfg(feature = "streaming")]
 pub(crate) mod streaming;
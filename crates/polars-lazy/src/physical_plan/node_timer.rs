@@ -3,6 +3,8 @@ use std::time::Instant;
 
 use polars_core::prelude::*;
 use polars_core::utils::NoNull;
+#[cfg(feature = "streaming")]
+use polars_pipe::pipeline::StreamingProfiler;
 
 type StartInstant = Instant;
 type EndInstant = Instant;
@@ -14,13 +16,19 @@ type Ticks = Vec<(StartInstant, EndInstant)>;
 pub(super) struct NodeTimer {
     query_start: Instant,
     data: Arc<Mutex<(Nodes, Ticks)>>,
+    /// Collects the metrics of the streaming pipelines of the query.
+    #[cfg(feature = "streaming")]
+    pub(super) streaming: Arc<StreamingProfiler>,
 }
 
 impl NodeTimer {
     pub(super) fn new() -> Self {
+        let query_start = Instant::now();
         Self {
-            query_start: Instant::now(),
+            query_start,
             data: Arc::new(Mutex::new((Vec::with_capacity(16), Vec::with_capacity(16)))),
+            #[cfg(feature = "streaming")]
+            streaming: Arc::new(StreamingProfiler::new(query_start)),
         }
     }
 
@@ -150,6 +150,9 @@ pub fn create_physical_plan(
             SinkType::Cloud { .. } => {
                 polars_bail!(InvalidOperation: "cloud sink not supported in standard engine.")
             },
+            SinkType::Partitioned { .. } => {
+                polars_bail!(InvalidOperation: "partitioned sink not supported in standard engine.")
+            },
         },
         Union { inputs, options } => {
             let inputs = inputs
@@ -234,17 +237,15 @@ pub fn create_physical_plan(
                 #[cfg(feature = "csv")]
                 FileScan::Csv {
                     options: csv_options,
-                } => {
-                    assert_eq!(paths.len(), 1);
-                    let path = paths[0].clone();
-                    Ok(Box::new(executors::CsvExec {
-                        path,
-                        schema: file_info.schema,
-                        options: csv_options,
-                        predicate,
-                        file_options,
-                    }))
-                },
+                    cloud_options,
+                } => Ok(Box::new(executors::CsvExec {
+                    paths,
+                    file_info,
+                    options: csv_options,
+                    cloud_options,
+                    predicate,
+                    file_options,
+                })),
                 #[cfg(feature = "ipc")]
                 FileScan::Ipc {
                     options,
@@ -252,7 +253,7 @@ pub fn create_physical_plan(
                     metadata,
                 } => Ok(Box::new(executors::IpcExec {
                     paths,
-                    schema: file_info.schema,
+                    file_info,
                     predicate,
                     options,
                     file_options,
@@ -273,6 +274,14 @@ pub fn create_physical_plan(
                     file_options,
                     metadata,
                 ))),
+                #[cfg(feature = "json")]
+                FileScan::NDJson { options } => Ok(Box::new(executors::JsonExec {
+                    paths,
+                    file_info,
+                    options,
+                    file_options,
+                    predicate,
+                })),
                 FileScan::Anonymous { function, .. } => {
                     Ok(Box::new(executors::AnonymousScanExec {
                         function,
@@ -379,12 +388,29 @@ pub fn create_physical_plan(
             input,
             id,
             cache_hits,
+            persist,
         } => {
+            #[cfg(feature = "cse")]
+            let fingerprint = if persist {
+                let fingerprint = plan_fingerprint(input, lp_arena, expr_arena);
+                if fingerprint.is_none() && polars_core::config::verbose() {
+                    eprintln!(
+                        "cache id {id:x} cannot be persisted: its result cannot be identified"
+                    );
+                }
+                fingerprint
+            } else {
+                None
+            };
+            #[cfg(not(feature = "cse"))]
+            let _ = persist;
             let input = create_physical_plan(input, lp_arena, expr_arena)?;
             Ok(Box::new(executors::CacheExec {
                 id,
                 input,
                 count: cache_hits,
+                #[cfg(feature = "cse")]
+                fingerprint,
             }))
         },
         Distinct { input, options } => {
@@ -0,0 +1,198 @@
+//! Process-wide cache of the results of persisted caches, see [`LazyFrame::cache_persistent`].
+//!
+//! Results are keyed by the fingerprint of their plan. The memory usage is bounded by
+//! `POLARS_QUERY_CACHE_SIZE` (in bytes); the least recently used results are evicted first. If
+//! `POLARS_QUERY_CACHE_SPILL_DIR` is set, evicted results are written to IPC files in that
+//! directory and read back on their next use instead of being dropped.
+#[cfg(feature = "ipc")]
+use std::path::PathBuf;
+use std::sync::Mutex;
+
+use once_cell::sync::Lazy;
+use polars_core::config::{get_query_cache_size, verbose};
+use polars_core::prelude::*;
+#[cfg(feature = "ipc")]
+use polars_io::ipc::{IpcReader, IpcWriter};
+#[cfg(feature = "ipc")]
+use polars_io::{SerReader, SerWriter};
+use polars_plan::logical_plan::PlanFingerprint;
+
+static QUERY_CACHE: Lazy<Mutex<QueryCache>> = Lazy::new(Default::default);
+
+enum Stored {
+    Memory(DataFrame),
+    #[cfg(feature = "ipc")]
+    Disk(PathBuf),
+}
+
+struct Entry {
+    stored: Stored,
+    size: usize,
+    last_used: u64,
+    /// Keeps the in-memory sources of the plan alive, as the fingerprint contains their
+    /// addresses.
+    _sources: Vec<Arc<DataFrame>>,
+}
+
+#[derive(Default)]
+struct QueryCache {
+    entries: PlHashMap<u128, Entry>,
+    /// Size of the results that are held in memory.
+    total_size: usize,
+    clock: u64,
+}
+
+impl QueryCache {
+    /// Evict the least recently used results from memory until the cache is below 90% of its
+    /// maximum size, so that not every insert has to evict. Returns the evicted entries.
+    fn evict(&mut self, max_size: usize) -> Vec<(u128, Entry)> {
+        if self.total_size <= max_size {
+            return vec![];
+        }
+        let target_size = max_size / 10 * 9;
+        let mut lru = self
+            .entries
+            .iter()
+            .filter(|(_, entry)| matches!(entry.stored, Stored::Memory(_)))
+            .map(|(key, entry)| (entry.last_used, *key))
+            .collect::<Vec<_>>();
+        lru.sort_unstable();
+
+        let mut evicted = vec![];
+        for (_, key) in lru {
+            if self.total_size <= target_size {
+                break;
+            }
+            let entry = self.entries.remove(&key).unwrap();
+            self.total_size -= entry.size;
+            evicted.push((key, entry));
+        }
+        evicted
+    }
+}
+
+#[cfg(feature = "ipc")]
+fn spill_dir() -> Option<PathBuf> {
+    std::env::var_os("POLARS_QUERY_CACHE_SPILL_DIR").map(PathBuf::from)
+}
+
+#[cfg(feature = "ipc")]
+fn spill_path(dir: &std::path::Path, key: u128) -> PathBuf {
+    dir.join(format!("{key:032x}.ipc"))
+}
+
+/// Write the evicted results to the spill directory, if one is configured. The cache is not
+/// locked while writing, a result that is computed again in the meantime wins.
+fn spill(evicted: Vec<(u128, Entry)>) {
+    #[cfg(feature = "ipc")]
+    if let Some(dir) = spill_dir() {
+        if std::fs::create_dir_all(&dir).is_err() {
+            return;
+        }
+        for (key, entry) in evicted {
+            let Stored::Memory(mut df) = entry.stored else {
+                continue;
+            };
+            let path = spill_path(&dir, key);
+            let written = std::fs::File::create(&path)
+                .map_err(PolarsError::from)
+                .and_then(|file| IpcWriter::new(file).finish(&mut df));
+            if written.is_err() {
+                let _ = std::fs::remove_file(&path);
+                continue;
+            }
+            if verbose() {
+                eprintln!("QUERY CACHE SPILL: {key:x}");
+            }
+            let mut cache = QUERY_CACHE.lock().unwrap();
+            cache.clock += 1;
+            let last_used = cache.clock;
+            cache.entries.entry(key).or_insert(Entry {
+                stored: Stored::Disk(path),
+                size: 0,
+                last_used,
+                _sources: entry._sources,
+            });
+        }
+    }
+    #[cfg(not(feature = "ipc"))]
+    drop(evicted);
+}
+
+/// Get the cached result of the plan with the fingerprint `key`.
+pub(crate) fn get(key: u128) -> Option<DataFrame> {
+    let max_size = get_query_cache_size();
+    if max_size == 0 {
+        return None;
+    }
+    let mut guard = QUERY_CACHE.lock().unwrap();
+    let cache = &mut *guard;
+    cache.clock += 1;
+    let entry = cache.entries.get_mut(&key)?;
+    entry.last_used = cache.clock;
+    match &entry.stored {
+        Stored::Memory(df) => Some(df.clone()),
+        #[cfg(feature = "ipc")]
+        Stored::Disk(path) => {
+            let df = std::fs::File::open(path)
+                .map_err(PolarsError::from)
+                .and_then(|file| IpcReader::new(file).memory_mapped(false).finish());
+            let _ = std::fs::remove_file(path);
+            let Ok(df) = df else {
+                cache.entries.remove(&key);
+                return None;
+            };
+            // Move the result back into memory.
+            let size = df.estimated_size();
+            entry.stored = Stored::Memory(df.clone());
+            entry.size = size;
+            cache.total_size += size;
+            let evicted = cache.evict(max_size);
+            drop(guard);
+            spill(evicted);
+            Some(df)
+        },
+    }
+}
+
+/// Add the result `df` of the plan with the fingerprint `fingerprint` to the cache.
+pub(crate) fn insert(fingerprint: &PlanFingerprint, df: DataFrame) {
+    let max_size = get_query_cache_size();
+    let size = df.estimated_size();
+    if max_size == 0 || size > max_size {
+        return;
+    }
+    let mut cache = QUERY_CACHE.lock().unwrap();
+    cache.clock += 1;
+    let entry = Entry {
+        stored: Stored::Memory(df),
+        size,
+        last_used: cache.clock,
+        _sources: fingerprint.sources.clone(),
+    };
+    if let Some(old) = cache.entries.insert(fingerprint.key, entry) {
+        cache.total_size -= old.size;
+        #[cfg(feature = "ipc")]
+        if let Stored::Disk(path) = old.stored {
+            let _ = std::fs::remove_file(path);
+        }
+    }
+    cache.total_size += size;
+    let evicted = cache.evict(max_size);
+    drop(cache);
+    spill(evicted);
+}
+
+/// Remove all results from the query cache, including the spilled ones.
+pub fn clear_query_cache() {
+    let mut cache = QUERY_CACHE.lock().unwrap();
+    for (_, entry) in cache.entries.drain() {
+        #[cfg(feature = "ipc")]
+        if let Stored::Disk(path) = entry.stored {
+            let _ = std::fs::remove_file(path);
+        }
+        #[cfg(not(feature = "ipc"))]
+        drop(entry);
+    }
+    cache.total_size = 0;
+}
@@ -105,6 +105,22 @@ impl ExecutionState {
         self.node_timer.unwrap().finish()
     }
 
+    #[cfg(feature = "streaming")]
+    pub(super) fn node_timer(&self) -> Option<&NodeTimer> {
+        self.node_timer.as_ref()
+    }
+
+    #[cfg(feature = "streaming")]
+    pub(super) fn set_node_timer(&mut self, node_timer: Option<NodeTimer>) {
+        self.node_timer = node_timer
+    }
+
+    /// The metrics of the streaming pipelines that were executed while the nodes were timed.
+    #[cfg(feature = "streaming")]
+    pub(crate) fn finish_streaming_metrics(&self) -> PolarsResult<DataFrame> {
+        self.node_timer.as_ref().unwrap().streaming.finish()
+    }
+
     // This is wrong when the U64 overflows which will never happen.
     pub(super) fn should_stop(&self) -> PolarsResult<()> {
         polars_ensure!(!self.stop.load(Ordering::Relaxed), ComputeError: "query interrupted");
@@ -24,11 +24,27 @@ pub(super) fn all_column(exprs: &[ExprIR], expr_arena: &Arena<AExpr>) -> bool {
         .all(|e| matches!(expr_arena.get(e.node()), AExpr::Column(_)))
 }
 
-pub(super) fn streamable_join(args: &JoinArgs) -> bool {
-    let supported = match args.how {
+#[allow(unused_variables)]
+pub(super) fn streamable_join(
+    args: &JoinArgs,
+    left_on: &[ExprIR],
+    right_on: &[ExprIR],
+    expr_arena: &Arena<AExpr>,
+) -> bool {
+    let supported = match &args.how {
         #[cfg(feature = "cross_join")]
         JoinType::Cross => true,
         JoinType::Inner | JoinType::Left | JoinType::Outer { .. } => true,
+        #[cfg(feature = "semi_anti_join")]
+        JoinType::Semi | JoinType::Anti => true,
+        // The streaming as-of join looks up the keys by column name and cannot
+        // resolve a tolerance string, as that depends on the key dtype.
+        #[cfg(feature = "asof_join")]
+        JoinType::AsOf(options) => {
+            options.tolerance_str.is_none()
+                && all_column(left_on, expr_arena)
+                && all_column(right_on, expr_arena)
+        },
         _ => false,
     };
     supported && !args.validation.needs_checks()
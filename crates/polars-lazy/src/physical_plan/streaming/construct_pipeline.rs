@@ -9,10 +9,12 @@ use polars_pipe::expressions::PhysicalPipedExpr;
 use polars_pipe::operators::chunks::DataChunk;
 use polars_pipe::pipeline::{
     create_pipeline, execute_pipeline, get_dummy_operator, get_operator, CallBacks, PipeLine,
+    StreamingProfiler,
 };
 use polars_pipe::SExecutionContext;
 use polars_plan::prelude::expr_ir::ExprIR;
 
+use crate::physical_plan::node_timer::NodeTimer;
 use crate::physical_plan::planner::{create_physical_expr, ExpressionConversionState};
 use crate::physical_plan::state::ExecutionState;
 use crate::physical_plan::streaming::tree::{PipelineNode, Tree};
@@ -240,6 +242,19 @@ pub(super) fn construct(
     Ok(Some(final_sink))
 }
 
+thread_local! {
+    /// The node timer of the query of which a streaming pipeline is executed on this thread.
+    static NODE_TIMER: RefCell<Option<NodeTimer>> = const { RefCell::new(None) };
+}
+
+/// Run `func`, in which the streaming pipelines are timed with the node timer of `state`.
+pub(crate) fn with_node_timer<T>(state: &ExecutionState, func: impl FnOnce() -> T) -> T {
+    let prev = NODE_TIMER.with(|timer| timer.replace(state.node_timer().cloned()));
+    let out = func();
+    NODE_TIMER.with(|timer| *timer.borrow_mut() = prev);
+    out
+}
+
 impl SExecutionContext for ExecutionState {
     fn as_any(&self) -> &dyn Any {
         self
@@ -248,6 +263,10 @@ impl SExecutionContext for ExecutionState {
     fn should_stop(&self) -> PolarsResult<()> {
         ExecutionState::should_stop(self)
     }
+
+    fn profiler(&self) -> Option<Arc<StreamingProfiler>> {
+        self.node_timer().map(|timer| timer.streaming.clone())
+    }
 }
 
 fn get_pipeline_node(
@@ -270,6 +289,7 @@ fn get_pipeline_node(
         function: FunctionNode::Pipeline {
             function: Arc::new(move |_df: DataFrame| {
                 let mut state = ExecutionState::new();
+                state.set_node_timer(NODE_TIMER.with(|timer| timer.borrow().clone()));
                 if state.verbose() {
                     eprintln!("RUN STREAMING PIPELINE");
                     eprintln!("{:?}", &pipelines)
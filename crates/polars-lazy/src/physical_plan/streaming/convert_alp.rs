@@ -262,6 +262,13 @@ pub(crate) fn insert_streaming_nodes(
                     pipeline_trees[current_idx].push(state)
                 }
             },
+            #[cfg(feature = "python")]
+            PythonScan { .. } => {
+                if state.streamable {
+                    state.sources.push(root);
+                    pipeline_trees[current_idx].push(state)
+                }
+            },
             DataFrameScan { .. } => {
                 if state.streamable {
                     state.sources.push(root);
@@ -271,9 +278,11 @@ pub(crate) fn insert_streaming_nodes(
             Join {
                 input_left,
                 input_right,
+                left_on,
+                right_on,
                 options,
                 ..
-            } if streamable_join(&options.args) => {
+            } if streamable_join(&options.args, left_on, right_on, expr_arena) => {
                 let input_left = *input_left;
                 let input_right = *input_right;
                 state.streamable = true;
@@ -3,4 +3,5 @@ mod construct_pipeline;
 mod convert_alp;
 mod tree;
 
+pub(crate) use construct_pipeline::with_node_timer;
 pub(crate) use convert_alp::insert_streaming_nodes;
@@ -14,6 +14,7 @@ pub use polars_plan::logical_plan::{
     NULL,
 };
 pub(crate) use polars_plan::prelude::*;
+pub use polars_plan::prelude::{FileType, PartitionedSinkOptions};
 #[cfg(feature = "rolling_window")]
 pub use polars_time::{prelude::RollingOptions, Duration};
 #[cfg(feature = "dynamic_group_by")]
@@ -1,10 +1,15 @@
+use std::io::{Read, Seek};
 use std::path::{Path, PathBuf};
 
 use polars_core::prelude::*;
-use polars_io::csv::read::{infer_file_schema, CommentPrefix, CsvEncoding, NullValues};
-use polars_io::utils::get_reader_bytes;
-use polars_io::RowIndex;
-
+use polars_io::cloud::CloudOptions;
+use polars_io::csv::read::{
+    infer_file_schema, is_compressed, CommentPrefix, CsvEncoding, CsvReader, NullValues,
+};
+use polars_io::utils::{get_reader_bytes, is_cloud_url, open_reader};
+use polars_io::{HiveOptions, RowIndex, SerReader};
+
+use super::file_list_reader::scan_and_concat;
 use crate::prelude::*;
 
 #[derive(Clone)]
@@ -36,6 +41,8 @@ pub struct LazyCsvReader {
     raise_if_empty: bool,
     n_threads: Option<usize>,
     decimal_comma: bool,
+    hive_options: HiveOptions,
+    cloud_options: Option<CloudOptions>,
 }
 
 #[cfg(feature = "csv")]
@@ -72,6 +79,11 @@ impl LazyCsvReader {
             truncate_ragged_lines: false,
             n_threads: None,
             decimal_comma: false,
+            hive_options: HiveOptions {
+                enabled: false,
+                ..Default::default()
+            },
+            cloud_options: None,
         }
     }
 
@@ -238,6 +250,22 @@ impl LazyCsvReader {
         self
     }
 
+    /// Set the Hive partitioning options.
+    ///
+    /// If enabled, all files are scanned with the schema of the first file.
+    #[must_use]
+    pub fn with_hive_options(mut self, hive_options: HiveOptions) -> Self {
+        self.hive_options = hive_options;
+        self
+    }
+
+    /// Set the options to read the files from cloud storage.
+    #[must_use]
+    pub fn with_cloud_options(mut self, cloud_options: Option<CloudOptions>) -> Self {
+        self.cloud_options = cloud_options;
+        self
+    }
+
     /// Modify a schema before we run the lazy scanning.
     ///
     /// Important! Run this function latest in the builder!
@@ -245,36 +273,62 @@ impl LazyCsvReader {
     where
         F: Fn(Schema) -> PolarsResult<Schema>,
     {
-        let mut file = if let Some(mut paths) = self.iter_paths()? {
-            let path = match paths.next() {
+        let path = if let Some(mut paths) = self.iter_paths()? {
+            match paths.next() {
                 Some(globresult) => globresult?,
                 None => polars_bail!(ComputeError: "globbing pattern did not match any files"),
-            };
-            polars_utils::open_file(path)
+            }
         } else {
-            polars_utils::open_file(&self.path)
-        }?;
-        let reader_bytes = get_reader_bytes(&mut file).expect("could not mmap file");
-        let mut skip_rows = self.skip_rows;
-
-        let (schema, _, _) = infer_file_schema(
-            &reader_bytes,
-            self.separator,
-            self.infer_schema_length,
-            self.has_header,
-            // we set it to None and modify them after the schema is updated
-            None,
-            &mut skip_rows,
-            self.skip_rows_after_header,
-            self.comment_prefix.as_ref(),
-            self.quote_char,
-            self.eol_char,
-            None,
-            self.try_parse_dates,
-            self.raise_if_empty,
-            &mut self.n_threads,
-            self.decimal_comma,
-        )?;
+            self.path.clone()
+        };
+        let mut file = open_reader(&path, self.cloud_options.as_ref())?;
+        let mut magic_nr = [0u8; 4];
+        let res_len = file.read(&mut magic_nr)?;
+        file.rewind()?;
+
+        let schema = if is_cloud_url(&path) || (res_len >= 2 && is_compressed(&magic_nr)) {
+            // Cloud and compressed files are streamed until enough rows are read.
+            let schema = CsvReader::new(file)
+                .with_separator(self.separator)
+                .infer_schema(self.infer_schema_length)
+                .has_header(self.has_header)
+                .with_skip_rows(self.skip_rows)
+                .with_skip_rows_after_header(self.skip_rows_after_header)
+                ._with_comment_prefix(self.comment_prefix.clone())
+                .with_quote_char(self.quote_char)
+                .with_end_of_line_char(self.eol_char)
+                .with_try_parse_dates(self.try_parse_dates)
+                .raise_if_empty(self.raise_if_empty)
+                .with_decimal_comma(self.decimal_comma)
+                .with_encoding(self.encoding)
+                .batched_stream()?
+                .schema()?;
+            Arc::unwrap_or_clone(schema)
+        } else {
+            let reader_bytes = get_reader_bytes(&mut file).expect("could not mmap file");
+            let mut skip_rows = self.skip_rows;
+
+            let (schema, _, _) = infer_file_schema(
+                &reader_bytes,
+                self.separator,
+                self.infer_schema_length,
+                self.has_header,
+                // we set it to None and modify them after the schema is updated
+                None,
+                &mut skip_rows,
+                self.skip_rows_after_header,
+                self.comment_prefix.as_ref(),
+                self.quote_char,
+                self.eol_char,
+                None,
+                self.try_parse_dates,
+                self.raise_if_empty,
+                &mut self.n_threads,
+                self.decimal_comma,
+                self.encoding,
+            )?;
+            schema
+        };
         let mut schema = f(schema)?;
 
         // the dtypes set may be for the new names, so update again
@@ -289,9 +343,37 @@ impl LazyCsvReader {
 }
 
 impl LazyFileListReader for LazyCsvReader {
+    fn finish(mut self) -> PolarsResult<LazyFrame> {
+        let Some(paths) = self.iter_paths()? else {
+            return self.finish_no_glob();
+        };
+        if !self.hive_options.enabled {
+            return scan_and_concat(&self, paths);
+        }
+
+        // With Hive partitioning all files are scanned at once, so that files can be
+        // pruned based on their partition values.
+        let paths = paths.collect::<PolarsResult<Arc<[PathBuf]>>>()?;
+        polars_ensure!(
+            !paths.is_empty(),
+            ComputeError: "no matching files found in {}", self.path.display()
+        );
+        self.path = PathBuf::new();
+        self.paths = paths;
+        self.finish_no_glob()
+    }
+
     fn finish_no_glob(self) -> PolarsResult<LazyFrame> {
+        // The paths are only scanned at once with Hive partitioning, otherwise every
+        // file is scanned separately with its own `path`.
+        let paths = if self.path.as_os_str().is_empty() {
+            self.paths
+        } else {
+            Arc::new([self.path]) as Arc<[PathBuf]>
+        };
+
         let mut lf: LazyFrame = DslBuilder::scan_csv(
-            self.path,
+            paths,
             self.separator,
             self.has_header,
             self.ignore_errors,
@@ -315,6 +397,8 @@ impl LazyFileListReader for LazyCsvReader {
             self.truncate_ragged_lines,
             self.n_threads,
             self.decimal_comma,
+            self.hive_options,
+            self.cloud_options,
         )?
         .build()
         .into();
@@ -372,6 +456,10 @@ impl LazyFileListReader for LazyCsvReader {
         self.row_index.as_ref()
     }
 
+    fn cloud_options(&self) -> Option<&CloudOptions> {
+        self.cloud_options.as_ref()
+    }
+
     fn concat_impl(&self, lfs: Vec<LazyFrame>) -> PolarsResult<LazyFrame> {
         // set to false, as the csv parser has full thread utilization
         concat_impl(&lfs, self.rechunk(), false, true, false)
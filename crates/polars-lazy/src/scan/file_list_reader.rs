@@ -29,6 +29,47 @@ fn polars_glob(pattern: &str, cloud_options: Option<&CloudOptions>) -> PolarsRes
     }
 }
 
+/// Scans every file separately and concatenates the resulting [LazyFrame]s.
+pub(super) fn scan_and_concat<R: LazyFileListReader>(
+    reader: &R,
+    paths: PathIterator,
+) -> PolarsResult<LazyFrame> {
+    let lfs = paths
+        .map(|r| {
+            let path = r?;
+            reader
+                .clone()
+                // Each individual reader should not apply a row limit.
+                .with_n_rows(None)
+                // Each individual reader should not apply a row index.
+                .with_row_index(None)
+                .with_path(path.clone())
+                .with_rechunk(false)
+                .finish_no_glob()
+                .map_err(|e| {
+                    polars_err!(
+                        ComputeError: "error while reading {}: {}", path.display(), e
+                    )
+                })
+        })
+        .collect::<PolarsResult<Vec<_>>>()?;
+
+    polars_ensure!(
+        !lfs.is_empty(),
+        ComputeError: "no matching files found in {}", reader.path().display()
+    );
+
+    let mut lf = reader.concat_impl(lfs)?;
+    if let Some(n_rows) = reader.n_rows() {
+        lf = lf.slice(0, n_rows as IdxSize)
+    };
+    if let Some(rc) = reader.row_index() {
+        lf = lf.with_row_index(&rc.name, Some(rc.offset))
+    };
+
+    Ok(lf)
+}
+
 /// Reads [LazyFrame] from a filesystem or a cloud storage.
 /// Supports glob patterns.
 ///
@@ -37,39 +78,7 @@ pub trait LazyFileListReader: Clone {
     /// Get the final [LazyFrame].
     fn finish(self) -> PolarsResult<LazyFrame> {
         if let Some(paths) = self.iter_paths()? {
-            let lfs = paths
-                .map(|r| {
-                    let path = r?;
-                    self.clone()
-                        // Each individual reader should not apply a row limit.
-                        .with_n_rows(None)
-                        // Each individual reader should not apply a row index.
-                        .with_row_index(None)
-                        .with_path(path.clone())
-                        .with_rechunk(false)
-                        .finish_no_glob()
-                        .map_err(|e| {
-                            polars_err!(
-                                ComputeError: "error while reading {}: {}", path.display(), e
-                            )
-                        })
-                })
-                .collect::<PolarsResult<Vec<_>>>()?;
-
-            polars_ensure!(
-                !lfs.is_empty(),
-                ComputeError: "no matching files found in {}", self.path().display()
-            );
-
-            let mut lf = self.concat_impl(lfs)?;
-            if let Some(n_rows) = self.n_rows() {
-                lf = lf.slice(0, n_rows as IdxSize)
-            };
-            if let Some(rc) = self.row_index() {
-                lf = lf.with_row_index(&rc.name, Some(rc.offset))
-            };
-
-            Ok(lf)
+            scan_and_concat(&self, paths)
         } else {
             self.finish_no_glob()
         }
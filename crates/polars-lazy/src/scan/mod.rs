@@ -8,6 +8,3 @@ pub(super) mod ipc;
 pub(super) mod ndjson;
 #[cfg(feature = "parquet")]
 pub(super) mod parquet;
-
-#[cfg(feature = "json")]
-use file_list_reader::*;
@@ -3,10 +3,10 @@ use std::path::{Path, PathBuf};
 use std::sync::RwLock;
 
 use polars_core::prelude::*;
-use polars_io::RowIndex;
+use polars_io::ndjson::NDJsonReadOptions;
+use polars_io::{HiveOptions, RowIndex};
 
-use super::*;
-use crate::prelude::{LazyFrame, ScanArgsAnonymous};
+use crate::prelude::*;
 
 #[derive(Clone)]
 pub struct LazyJsonLineReader {
@@ -20,6 +20,7 @@ pub struct LazyJsonLineReader {
     pub(crate) infer_schema_length: Option<usize>,
     pub(crate) n_rows: Option<usize>,
     pub(crate) ignore_errors: bool,
+    pub(crate) hive_options: HiveOptions,
 }
 
 impl LazyJsonLineReader {
@@ -39,6 +40,10 @@ impl LazyJsonLineReader {
             infer_schema_length: Some(100),
             ignore_errors: false,
             n_rows: None,
+            hive_options: HiveOptions {
+                enabled: false,
+                ..Default::default()
+            },
         }
     }
     /// Add a row index column.
@@ -89,20 +94,56 @@ impl LazyJsonLineReader {
         self.batch_size = batch_size;
         self
     }
+
+    /// Set the Hive partitioning options.
+    #[must_use]
+    pub fn with_hive_options(mut self, hive_options: HiveOptions) -> Self {
+        self.hive_options = hive_options;
+        self
+    }
 }
 
 impl LazyFileListReader for LazyJsonLineReader {
+    fn finish(mut self) -> PolarsResult<LazyFrame> {
+        if let Some(paths) = self.iter_paths()? {
+            let paths = paths
+                .into_iter()
+                .collect::<PolarsResult<Arc<[PathBuf]>>>()?;
+            polars_ensure!(
+                !paths.is_empty(),
+                ComputeError: "no matching files found in {}", self.path.display()
+            );
+            self.paths = paths;
+        }
+        self.finish_no_glob()
+    }
+
     fn finish_no_glob(self) -> PolarsResult<LazyFrame> {
-        let options = ScanArgsAnonymous {
-            name: "JSON SCAN",
+        let paths = if self.paths.is_empty() {
+            Arc::new([self.path]) as Arc<[PathBuf]>
+        } else {
+            self.paths
+        };
+
+        let options = NDJsonReadOptions {
+            n_threads: None,
             infer_schema_length: self.infer_schema_length,
-            n_rows: self.n_rows,
-            row_index: self.row_index.clone(),
+            chunk_size: self.batch_size,
+            low_memory: self.low_memory,
+            ignore_errors: self.ignore_errors,
             schema: self.schema.read().unwrap().clone(),
-            ..ScanArgsAnonymous::default()
         };
 
-        LazyFrame::anonymous_scan(std::sync::Arc::new(self), options)
+        Ok(DslBuilder::scan_ndjson(
+            paths,
+            options,
+            self.n_rows,
+            self.row_index,
+            self.rechunk,
+            self.hive_options,
+        )?
+        .build()
+        .into())
     }
 
     fn path(&self) -> &Path {
@@ -417,6 +417,7 @@ fn test_ipc_globbing() -> PolarsResult<()> {
             row_index: None,
             memory_map: true,
             cloud_options: None,
+            ..Default::default()
         },
     )?
     .collect()?;
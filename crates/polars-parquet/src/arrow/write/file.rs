@@ -75,6 +75,13 @@ impl<W: Write> FileWriter<W> {
         Ok(self.writer.write(row_group)?)
     }
 
+    /// Writes the bloom filter `bitset` of the `column`-th leaf column of the last
+    /// written row group.
+    #[cfg(feature = "bloom_filter")]
+    pub fn write_bloom_filter(&mut self, column: usize, bitset: &[u8]) -> PolarsResult<()> {
+        Ok(self.writer.write_bloom_filter(column, bitset)?)
+    }
+
     /// Writes the footer of the parquet file. Returns the total size of the file.
     pub fn end(&mut self, key_value_metadata: Option<Vec<KeyValue>>) -> PolarsResult<u64> {
         let key_value_metadata = add_arrow_schema(&self.schema, key_value_metadata);
@@ -1,11 +1,13 @@
-//! API to read and use bloom filters
+//! API to read, write and use bloom filters
 mod hash;
 mod read;
 mod split_block;
+mod write;
 
 pub use hash::{hash_byte, hash_native};
 pub use read::read;
 pub use split_block::{insert, is_in_set};
+pub use write::{optimal_num_of_bytes, write};
 
 #[cfg(test)]
 mod tests {
@@ -68,4 +70,27 @@ mod tests {
         ];
         assert_eq!(bitset, expected);
     }
+
+    #[test]
+    fn roundtrip() {
+        let mut bitset = vec![0; optimal_num_of_bytes(100, 0.01)];
+        for a in 0..100i64 {
+            insert(&mut bitset, hash_native(a));
+        }
+
+        let mut file = vec![];
+        let len = write(&mut file, &bitset).unwrap();
+        assert_eq!(len as usize, file.len());
+
+        // the header is followed by the bitset
+        assert!(file.ends_with(&bitset));
+        assert!((0..100i64).all(|a| is_in_set(&bitset, hash_native(a))));
+    }
+
+    #[test]
+    fn num_of_bytes() {
+        assert_eq!(optimal_num_of_bytes(0, 0.01), 32);
+        assert_eq!(optimal_num_of_bytes(1_000, 0.01), 2048);
+        assert!(optimal_num_of_bytes(usize::MAX, 0.01) <= 128 * 1024 * 1024);
+    }
 }
@@ -0,0 +1,42 @@
+use std::io::Write;
+
+use parquet_format_safe::thrift::protocol::TCompactOutputProtocol;
+use parquet_format_safe::{
+    BloomFilterAlgorithm, BloomFilterCompression, BloomFilterHash, BloomFilterHeader,
+    SplitBlockAlgorithm, Uncompressed, XxHash,
+};
+
+use crate::parquet::error::Result;
+
+/// The minimum size of a bitset, a single block.
+const MIN_NUM_BYTES: usize = 32;
+/// The maximum size of a bitset, as used by parquet-mr.
+const MAX_NUM_BYTES: usize = 128 * 1024 * 1024;
+
+/// Returns the number of bytes of a bitset that holds `ndv` distinct values
+/// with a false positive probability of at most `fpp`.
+///
+/// The result is a power of two between 32 bytes and 128 MiB.
+pub fn optimal_num_of_bytes(ndv: usize, fpp: f64) -> usize {
+    // see https://github.com/apache/parquet-format/blob/master/BloomFilter.md
+    let num_bits = -8.0 * ndv as f64 / (1.0 - fpp.powf(1.0 / 8.0)).ln();
+    let num_bytes = (num_bits / 8.0).ceil() as usize;
+    num_bytes
+        .clamp(MIN_NUM_BYTES, MAX_NUM_BYTES)
+        .next_power_of_two()
+}
+
+/// Writes the header and `bitset` of a split block bloom filter to `writer`.
+/// Returns the number of bytes written.
+pub fn write<W: Write>(mut writer: &mut W, bitset: &[u8]) -> Result<u64> {
+    let header = BloomFilterHeader {
+        num_bytes: bitset.len().try_into()?,
+        algorithm: BloomFilterAlgorithm::BLOCK(SplitBlockAlgorithm {}),
+        hash: BloomFilterHash::XXHASH(XxHash {}),
+        compression: BloomFilterCompression::UNCOMPRESSED(Uncompressed {}),
+    };
+    let mut protocol = TCompactOutputProtocol::new(&mut writer);
+    let header_len = header.write_to_out_protocol(&mut protocol)? as u64;
+    writer.write_all(bitset)?;
+    Ok(header_len + bitset.len() as u64)
+}
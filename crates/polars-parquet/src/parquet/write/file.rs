@@ -168,6 +168,28 @@ impl<W: Write> FileWriter<W> {
         Ok(())
     }
 
+    /// Writes the bloom filter `bitset` of the `column`-th column chunk of the last
+    /// written row group.
+    ///
+    /// # Errors
+    /// Returns an error if no row group has been written or the column does not exist.
+    #[cfg(feature = "bloom_filter")]
+    pub fn write_bloom_filter(&mut self, column: usize, bitset: &[u8]) -> Result<()> {
+        let metadata = self
+            .row_groups
+            .last_mut()
+            .and_then(|group| group.columns.get_mut(column))
+            .and_then(|column| column.meta_data.as_mut())
+            .ok_or_else(|| {
+                Error::InvalidParameter(format!(
+                    "A bloom filter can only be written for an existing column chunk, got column {column}"
+                ))
+            })?;
+        metadata.bloom_filter_offset = Some(self.offset as i64);
+        self.offset += crate::parquet::bloom_filter::write(&mut self.writer, bitset)?;
+        Ok(())
+    }
+
     /// Writes the footer of the parquet file. Returns the total size of the file and the
     /// underlying writer.
     pub fn end(&mut self, key_value_metadata: Option<Vec<KeyValue>>) -> Result<u64> {
@@ -2,5 +2,5 @@ pub(crate) mod operators;
 pub(crate) mod sinks;
 pub(crate) mod sources;
 
-#[cfg(feature = "csv")]
+#[cfg(any(feature = "csv", feature = "json"))]
 use crate::operators::*;
@@ -62,7 +62,9 @@ impl Operator for FunctionOperator {
             // ideal chunk size we want to have
             // we cannot rely on input chunk size as that can increase due to multiple explode calls
             // for instance.
-            let chunk_size_ambition = determine_chunk_size(chunk.data.width(), self.n_threads)?;
+            // The size of a row is observed, as the function can change the data types.
+            let row_size = chunk.data.estimated_size() / std::cmp::max(input_height, 1);
+            let chunk_size_ambition = determine_chunk_size(row_size, self.n_threads)?;
 
             if self.offsets.is_empty() {
                 let n = input_height / self.chunk_size;
@@ -11,7 +11,7 @@ use polars_core::utils::arrow::temporal_conversions::SECONDS_IN_DAY;
 use polars_io::prelude::*;
 
 use crate::executors::sinks::get_base_temp_dir;
-use crate::pipeline::morsels_per_sink;
+use crate::pipeline::{morsels_per_sink, SPILLED_BYTES};
 
 pub(in crate::executors::sinks) type DfIter =
     Box<dyn ExactSizeIterator<Item = DataFrame> + Sync + Send>;
@@ -170,6 +170,7 @@ impl IOThread {
                 if let Some(partitions) = partitions {
                     for (part, mut df) in partitions.into_no_null_iter().zip(iter) {
                         df.shrink_to_fit();
+                        SPILLED_BYTES.fetch_add(df.estimated_size(), Ordering::Relaxed);
                         let mut path = dir2.clone();
                         path.push(format!("{part}"));
 
@@ -193,6 +194,7 @@ impl IOThread {
 
                     for mut df in iter {
                         df.shrink_to_fit();
+                        SPILLED_BYTES.fetch_add(df.estimated_size(), Ordering::Relaxed);
                         writer.write_batch(&df).unwrap();
                     }
                     writer.finish().unwrap();
@@ -220,6 +222,7 @@ impl IOThread {
         // we write locally on this thread
         if self.payload_tx.is_full() {
             df.shrink_to_fit();
+            SPILLED_BYTES.fetch_add(df.estimated_size(), Ordering::Relaxed);
             let mut path = self.dir.clone();
             let count = self.thread_local_count.fetch_add(1, Ordering::Relaxed);
             // thread local name we start with an underscore to ensure we don't get
@@ -251,6 +254,7 @@ impl IOThread {
         mut df: DataFrame,
     ) {
         df.shrink_to_fit();
+        SPILLED_BYTES.fetch_add(df.estimated_size(), Ordering::Relaxed);
         let count = self.thread_local_count.fetch_add(1, Ordering::Relaxed);
         let mut path = self.dir.clone();
         path.push(format!("{partition_no}"));
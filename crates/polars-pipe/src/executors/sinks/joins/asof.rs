@@ -0,0 +1,199 @@
+use std::any::Any;
+use std::sync::Arc;
+
+use polars_core::prelude::*;
+use polars_ops::prelude::*;
+use polars_utils::arena::Node;
+
+use crate::executors::operators::PlaceHolder;
+use crate::expressions::PhysicalPipedExpr;
+use crate::operators::{
+    chunks_to_df_unchecked, DataChunk, FinalizedSink, Operator, OperatorResult, PExecutionContext,
+    Sink, SinkResult,
+};
+
+/// Build side of an as-of join.
+///
+/// The right table is collected in order, so that it stays sorted on the join key.
+/// The left table is streamed through the [`AsOfJoinProbe`].
+pub struct AsOfJoinBuild {
+    chunks: Vec<DataChunk>,
+    args: JoinArgs,
+    join_column_left: Arc<dyn PhysicalPipedExpr>,
+    join_column_right: Arc<dyn PhysicalPipedExpr>,
+    node: Node,
+    placeholder: PlaceHolder,
+}
+
+impl AsOfJoinBuild {
+    pub(crate) fn new(
+        args: JoinArgs,
+        join_column_left: Arc<dyn PhysicalPipedExpr>,
+        join_column_right: Arc<dyn PhysicalPipedExpr>,
+        node: Node,
+        placeholder: PlaceHolder,
+    ) -> Self {
+        AsOfJoinBuild {
+            chunks: vec![],
+            args,
+            join_column_left,
+            join_column_right,
+            node,
+            placeholder,
+        }
+    }
+}
+
+impl Sink for AsOfJoinBuild {
+    fn node(&self) -> Node {
+        self.node
+    }
+    fn is_join_build(&self) -> bool {
+        true
+    }
+
+    fn sink(&mut self, _context: &PExecutionContext, chunk: DataChunk) -> PolarsResult<SinkResult> {
+        self.chunks.push(chunk);
+        Ok(SinkResult::CanHaveMoreInput)
+    }
+
+    fn combine(&mut self, other: &mut dyn Sink) {
+        let other = other.as_any().downcast_mut::<Self>().unwrap();
+        let other_chunks = std::mem::take(&mut other.chunks);
+        self.chunks.extend(other_chunks);
+    }
+
+    fn split(&self, _thread_no: usize) -> Box<dyn Sink> {
+        Box::new(Self::new(
+            self.args.clone(),
+            self.join_column_left.clone(),
+            self.join_column_right.clone(),
+            self.node,
+            self.placeholder.clone(),
+        ))
+    }
+
+    fn finalize(&mut self, context: &PExecutionContext) -> PolarsResult<FinalizedSink> {
+        // The threads may have received the chunks out of order,
+        // restore the order so that the join key is sorted.
+        let mut chunks = std::mem::take(&mut self.chunks);
+        chunks.sort_unstable_by_key(|chunk| chunk.chunk_index);
+        let mut right_df = chunks_to_df_unchecked(chunks);
+        right_df.as_single_chunk_par();
+
+        let tmp = DataChunk {
+            data: right_df.clone(),
+            chunk_index: 0,
+        };
+        let right_key = self
+            .join_column_right
+            .evaluate(&tmp, context.execution_state.as_any())?;
+
+        let op = Box::new(AsOfJoinProbe {
+            right_df: Arc::new(right_df),
+            right_key,
+            args: self.args.clone(),
+            join_column_left: self.join_column_left.clone(),
+        });
+        self.placeholder.replace(op);
+
+        Ok(FinalizedSink::Operator)
+    }
+
+    fn as_any(&mut self) -> &mut dyn Any {
+        self
+    }
+
+    fn fmt(&self) -> &str {
+        "asof_join_build"
+    }
+}
+
+#[derive(Clone)]
+pub struct AsOfJoinProbe {
+    right_df: Arc<DataFrame>,
+    right_key: Series,
+    args: JoinArgs,
+    join_column_left: Arc<dyn PhysicalPipedExpr>,
+}
+
+impl AsOfJoinProbe {
+    /// Determine the offset in the right table from where a sorted merge can start for
+    /// the given (sorted) left keys. All rows before this offset can never be a match.
+    fn right_offset(&self, left_key: &Series) -> PolarsResult<usize> {
+        let JoinType::AsOf(options) = &self.args.how else {
+            unreachable!()
+        };
+        // With `by` groups the matches are searched per group, so every
+        // right row might be needed.
+        if options.left_by.is_some() || self.right_key.null_count() > 0 {
+            return Ok(0);
+        }
+        let first = left_key.drop_nulls().slice(0, 1);
+        if first.is_empty() {
+            return Ok(0);
+        }
+        let first = first.cast(self.right_key.dtype())?;
+
+        let offset = match options.strategy {
+            // The last right value that is <= the first left value.
+            AsofStrategy::Backward => {
+                let idx = search_sorted(&self.right_key, &first, SearchSortedSide::Right, false)?;
+                idx.get(0).unwrap().saturating_sub(1)
+            },
+            // The first right value that is >= the first left value.
+            AsofStrategy::Forward => {
+                search_sorted(&self.right_key, &first, SearchSortedSide::Left, false)?
+                    .get(0)
+                    .unwrap()
+            },
+            // The last right value that is < the first left value
+            // may still be nearer than the first value that is >=.
+            AsofStrategy::Nearest => {
+                let idx = search_sorted(&self.right_key, &first, SearchSortedSide::Left, false)?;
+                idx.get(0).unwrap().saturating_sub(1)
+            },
+        };
+        Ok(offset as usize)
+    }
+}
+
+impl Operator for AsOfJoinProbe {
+    fn execute(
+        &mut self,
+        context: &PExecutionContext,
+        chunk: &DataChunk,
+    ) -> PolarsResult<OperatorResult> {
+        let left_key = self
+            .join_column_left
+            .evaluate(chunk, context.execution_state.as_any())?;
+
+        let offset = self.right_offset(&left_key)?;
+        let (right_df, right_key) = if offset > 0 {
+            (
+                self.right_df.slice(offset as i64, usize::MAX),
+                self.right_key.slice(offset as i64, usize::MAX),
+            )
+        } else {
+            (self.right_df.as_ref().clone(), self.right_key.clone())
+        };
+
+        let out = chunk.data._join_impl(
+            &right_df,
+            vec![left_key],
+            vec![right_key],
+            self.args.clone(),
+            false,
+            false,
+        )?;
+        Ok(OperatorResult::Finished(chunk.with_data(out)))
+    }
+
+    fn split(&self, _thread_no: usize) -> Box<dyn Operator> {
+        Box::new(self.clone())
+    }
+
+    fn fmt(&self) -> &str {
+        "asof_join_probe"
+    }
+}
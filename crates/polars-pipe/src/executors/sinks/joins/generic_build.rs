@@ -1,7 +1,9 @@
 use std::any::Any;
+use std::sync::RwLock;
 
 use arrow::array::BinaryArray;
 use hashbrown::hash_map::RawEntryMut;
+use polars_core::config::verbose;
 use polars_core::export::ahash::RandomState;
 use polars_core::prelude::*;
 use polars_core::utils::{_set_partition_size, accumulate_dataframes_vertical_unchecked};
@@ -14,10 +16,13 @@ use super::*;
 use crate::executors::operators::PlaceHolder;
 use crate::executors::sinks::joins::generic_probe_inner_left::GenericJoinProbe;
 use crate::executors::sinks::joins::generic_probe_outer::GenericOuterJoinProbe;
+use crate::executors::sinks::joins::ooc::{GraceJoinProbe, KeyColumn, Spill, SpilledJoin};
+use crate::executors::sinks::memory::MemTracker;
 use crate::executors::sinks::utils::{hash_rows, load_vec};
 use crate::executors::sinks::HASHMAP_INIT_SIZE;
 use crate::expressions::PhysicalPipedExpr;
-use crate::operators::{DataChunk, FinalizedSink, PExecutionContext, Sink, SinkResult};
+use crate::operators::{DataChunk, FinalizedSink, Operator, PExecutionContext, Sink, SinkResult};
+use crate::pipeline::{morsels_per_sink, FORCE_OOC};
 
 pub(super) type ChunkIdx = IdxSize;
 pub(super) type DfIdx = IdxSize;
@@ -53,6 +58,22 @@ pub struct GenericBuild<K: ExtraPayload> {
     key_names_left: Arc<[SmartString]>,
     key_names_right: Arc<[SmartString]>,
     placeholder: PlaceHolder,
+    // Stores available memory in the system at the start of this sink
+    // and the memory used by this sink.
+    mem_track: MemTracker,
+    // The join keys looked up by name, if the join is on columns only. Only then the build
+    // side can be spilled, as the keys of the spilled partitions are evaluated again when
+    // they are joined.
+    key_columns: Option<(
+        Arc<Vec<Arc<dyn PhysicalPipedExpr>>>,
+        Arc<Vec<Arc<dyn PhysicalPipedExpr>>>,
+    )>,
+    // build in-memory or out-of-core
+    ooc: bool,
+    // when ooc, the build side is spilled in partitions
+    spill: Arc<RwLock<Option<Spill>>>,
+    // An empty frame with the schema of the build side.
+    empty: Option<DataFrame>,
 }
 
 impl<K: ExtraPayload> GenericBuild<K> {
@@ -70,10 +91,10 @@ impl<K: ExtraPayload> GenericBuild<K> {
         placeholder: PlaceHolder,
     ) -> Self {
         let hb: RandomState = Default::default();
-        let partitions = _set_partition_size();
-        let hash_tables = PartitionedHashMap::new(load_vec(partitions, || {
-            PlIdHashMap::with_capacity(HASHMAP_INIT_SIZE)
-        }));
+        let key_columns = KeyColumn::try_from_exprs(&join_columns_left)
+            .zip(KeyColumn::try_from_exprs(&join_columns_right));
+        // for testing purposes
+        let ooc = key_columns.is_some() && std::env::var(FORCE_OOC).is_ok();
         GenericBuild {
             chunks: vec![],
             join_type,
@@ -84,15 +105,33 @@ impl<K: ExtraPayload> GenericBuild<K> {
             join_columns_right,
             join_columns: vec![],
             materialized_join_cols: vec![],
-            hash_tables,
+            hash_tables: new_hash_tables(),
             hashes: vec![],
             join_nulls,
             node,
             key_names_left,
             key_names_right,
             placeholder,
+            mem_track: MemTracker::new(morsels_per_sink()),
+            key_columns,
+            ooc,
+            spill: Default::default(),
+            empty: None,
         }
     }
+
+    /// Never spill this build to disk.
+    pub(super) fn disable_spill(&mut self) {
+        self.key_columns = None;
+        self.ooc = false;
+    }
+}
+
+fn new_hash_tables<K: ExtraPayload>() -> PartitionedMap<K> {
+    let partitions = _set_partition_size();
+    PartitionedHashMap::new(load_vec(partitions, || {
+        PlIdHashMap::with_capacity(HASHMAP_INIT_SIZE)
+    }))
 }
 
 #[inline]
@@ -151,6 +190,153 @@ impl<K: ExtraPayload> GenericBuild<K> {
             .get_unchecked_release(chunk_idx as usize)
             .value_unchecked(df_idx as usize)
     }
+
+    fn init_ooc(&mut self, schema: SchemaRef) -> PolarsResult<()> {
+        if verbose() {
+            eprintln!("OOC join started");
+        }
+        self.ooc = true;
+
+        let mut spill = self.spill.write().unwrap();
+        if spill.is_none() {
+            *spill = Some(Spill::try_new(schema, &self.mem_track)?)
+        }
+        Ok(())
+    }
+
+    /// Spill the chunks that are held in memory and clear the hash tables.
+    fn spill_in_memory(&mut self) -> PolarsResult<()> {
+        if self.is_empty() {
+            return Ok(());
+        }
+        self.init_ooc(self.chunks[0].data.schema().into())?;
+
+        let chunks = std::mem::take(&mut self.chunks);
+        let materialized_join_cols = std::mem::take(&mut self.materialized_join_cols);
+        self.hash_tables = new_hash_tables();
+
+        let spill = self.spill.read().unwrap();
+        let spill = spill.as_ref().unwrap();
+        for (chunk, rows) in chunks.into_iter().zip(materialized_join_cols) {
+            hash_rows(&rows, &mut self.hashes, &self.hb);
+            spill.push(chunk.data, &self.hashes)?;
+            self.hashes.clear();
+        }
+        Ok(())
+    }
+
+    fn sink_ooc(&mut self, context: &PExecutionContext, chunk: DataChunk) -> PolarsResult<()> {
+        let rows = self.set_join_series(context, &chunk)?.clone();
+        self.materialized_join_cols.pop();
+        self.join_columns.clear();
+        hash_rows(&rows, &mut self.hashes, &self.hb);
+
+        self.init_ooc(chunk.data.schema().into())?;
+        let spill = self.spill.read().unwrap();
+        spill.as_ref().unwrap().push(chunk.data, &self.hashes)?;
+        self.hashes.clear();
+        Ok(())
+    }
+
+    /// The operator that probes the hash tables of this build.
+    pub(super) fn probe_operator(&mut self, context: &PExecutionContext) -> Box<dyn Operator> {
+        let chunks_len = self.chunks.len();
+        let left_df = accumulate_dataframes_vertical_unchecked(
+            std::mem::take(&mut self.chunks)
+                .into_iter()
+                .map(|chunk| chunk.data),
+        );
+        if left_df.height() > 0 {
+            assert_eq!(left_df.n_chunks(), chunks_len);
+        }
+        // Reallocate to Arc<[]> to get rid of double indirection as this is accessed on every
+        // hashtable cmp.
+        let materialized_join_cols = Arc::from(std::mem::take(&mut self.materialized_join_cols));
+        let suffix = self.suffix.clone();
+        let hb = self.hb.clone();
+        let hash_tables = Arc::new(PartitionedHashMap::new(std::mem::take(
+            self.hash_tables.inner_mut(),
+        )));
+        let join_columns_left = self.join_columns_left.clone();
+        let join_columns_right = self.join_columns_right.clone();
+
+        // take the buffers, this saves one allocation
+        let mut hashes = std::mem::take(&mut self.hashes);
+        hashes.clear();
+
+        match self.join_type {
+            JoinType::Outer { coalesce } => {
+                let probe_operator = GenericOuterJoinProbe::new(
+                    left_df,
+                    materialized_join_cols,
+                    suffix,
+                    hb,
+                    hash_tables,
+                    join_columns_left,
+                    self.swapped,
+                    hashes,
+                    self.join_nulls,
+                    coalesce,
+                    self.key_names_left.clone(),
+                    self.key_names_right.clone(),
+                );
+                Box::new(probe_operator)
+            },
+            // Inner, left, semi and anti joins.
+            _ => {
+                let probe_operator = GenericJoinProbe::new(
+                    left_df,
+                    materialized_join_cols,
+                    suffix,
+                    hb,
+                    hash_tables,
+                    join_columns_left,
+                    join_columns_right,
+                    self.swapped,
+                    hashes,
+                    context,
+                    self.join_type.clone(),
+                    self.join_nulls,
+                );
+                Box::new(probe_operator)
+            },
+        }
+    }
+
+    /// The operator that spills the probe side and joins the spilled partitions.
+    fn spilled_probe_operator(
+        &mut self,
+        context: &PExecutionContext,
+    ) -> PolarsResult<Box<dyn Operator>> {
+        self.spill_in_memory()?;
+        let build = self.spill.write().unwrap().take().unwrap();
+        let (key_columns_left, key_columns_right) = self.key_columns.clone().unwrap();
+        let join = SpilledJoin {
+            build,
+            probe: Default::default(),
+            build_empty: self.empty.take().unwrap(),
+            probe_empty: Default::default(),
+            output_empty: Default::default(),
+            suffix: self.suffix.clone(),
+            join_type: self.join_type.clone(),
+            swapped: self.swapped,
+            join_nulls: self.join_nulls,
+            node: self.node,
+            key_columns_left,
+            key_columns_right,
+            key_names_left: self.key_names_left.clone(),
+            key_names_right: self.key_names_right.clone(),
+            hb: self.hb.clone(),
+            mem_track: self.mem_track.clone(),
+            verbose: context.verbose,
+        };
+        // The probe side is partitioned by the keys that the in-memory probes evaluate.
+        let probe_columns = match self.join_type {
+            JoinType::Outer { .. } => self.join_columns_left.clone(),
+            _ => self.join_columns_right.clone(),
+        };
+        Ok(Box::new(GraceJoinProbe::<K>::new(join, probe_columns)))
+    }
 }
 
 impl<K: ExtraPayload> Sink for GenericBuild<K> {
@@ -162,6 +348,14 @@ impl<K: ExtraPayload> Sink for GenericBuild<K> {
     }
 
     fn sink(&mut self, context: &PExecutionContext, chunk: DataChunk) -> PolarsResult<SinkResult> {
+        if self.empty.is_none() {
+            self.empty = Some(chunk.data.clear());
+        }
+        if self.ooc && !chunk.is_empty() {
+            self.sink_ooc(context, chunk)?;
+            return Ok(SinkResult::CanHaveMoreInput);
+        }
+
         // we do some juggling here so that we don't
         // end up with empty chunks
         // But we always want one empty chunk if all is empty as we need
@@ -207,19 +401,40 @@ impl<K: ExtraPayload> Sink for GenericBuild<K> {
         self.hashes.clear();
         self.join_columns.clear();
 
+        let chunk_bytes = chunk.data.estimated_size();
         self.chunks.push(chunk);
+
+        if self.key_columns.is_some() {
+            let used = self.mem_track.fetch_add(chunk_bytes);
+            let free = self.mem_track.get_available();
+
+            // we need free memory to probe the hash tables
+            // so we keep 3x the build data size before we go out of core
+            if used * 3 > free {
+                self.spill_in_memory()?;
+            }
+        }
         Ok(SinkResult::CanHaveMoreInput)
     }
 
     fn combine(&mut self, other: &mut dyn Sink) {
+        let other = other.as_any().downcast_mut::<Self>().unwrap();
+        if self.empty.is_none() {
+            self.empty = other.empty.take();
+        }
+        if self.ooc || other.ooc {
+            // The spilled partitions are shared, so we only have to spill what is left.
+            self.spill_in_memory().unwrap();
+            other.spill_in_memory().unwrap();
+            self.ooc = true;
+            return;
+        }
         if self.is_empty() {
-            let other = other.as_any().downcast_mut::<Self>().unwrap();
             if !other.is_empty() {
                 std::mem::swap(self, other);
             }
             return;
         }
-        let other = other.as_any().downcast_ref::<Self>().unwrap();
         if other.is_empty() {
             return;
         }
@@ -289,74 +504,21 @@ impl<K: ExtraPayload> Sink for GenericBuild<K> {
             self.placeholder.clone(),
         );
         new.hb = self.hb.clone();
+        new.mem_track = self.mem_track.clone();
+        new.key_columns = self.key_columns.clone();
+        new.ooc = self.ooc;
+        new.spill = self.spill.clone();
         Box::new(new)
     }
 
     fn finalize(&mut self, context: &PExecutionContext) -> PolarsResult<FinalizedSink> {
-        let chunks_len = self.chunks.len();
-        let left_df = accumulate_dataframes_vertical_unchecked(
-            std::mem::take(&mut self.chunks)
-                .into_iter()
-                .map(|chunk| chunk.data),
-        );
-        if left_df.height() > 0 {
-            assert_eq!(left_df.n_chunks(), chunks_len);
-        }
-        // Reallocate to Arc<[]> to get rid of double indirection as this is accessed on every
-        // hashtable cmp.
-        let materialized_join_cols = Arc::from(std::mem::take(&mut self.materialized_join_cols));
-        let suffix = self.suffix.clone();
-        let hb = self.hb.clone();
-        let hash_tables = Arc::new(PartitionedHashMap::new(std::mem::take(
-            self.hash_tables.inner_mut(),
-        )));
-        let join_columns_left = self.join_columns_left.clone();
-        let join_columns_right = self.join_columns_right.clone();
-
-        // take the buffers, this saves one allocation
-        let mut hashes = std::mem::take(&mut self.hashes);
-        hashes.clear();
-
-        match self.join_type {
-            JoinType::Inner | JoinType::Left => {
-                let probe_operator = GenericJoinProbe::new(
-                    left_df,
-                    materialized_join_cols,
-                    suffix,
-                    hb,
-                    hash_tables,
-                    join_columns_left,
-                    join_columns_right,
-                    self.swapped,
-                    hashes,
-                    context,
-                    self.join_type.clone(),
-                    self.join_nulls,
-                );
-                self.placeholder.replace(Box::new(probe_operator));
-                Ok(FinalizedSink::Operator)
-            },
-            JoinType::Outer { coalesce } => {
-                let probe_operator = GenericOuterJoinProbe::new(
-                    left_df,
-                    materialized_join_cols,
-                    suffix,
-                    hb,
-                    hash_tables,
-                    join_columns_left,
-                    self.swapped,
-                    hashes,
-                    self.join_nulls,
-                    coalesce,
-                    self.key_names_left.clone(),
-                    self.key_names_right.clone(),
-                );
-                self.placeholder.replace(Box::new(probe_operator));
-                Ok(FinalizedSink::Operator)
-            },
-
-            _ => unimplemented!(),
-        }
+        let probe_operator = if self.ooc && self.spill.read().unwrap().is_some() {
+            self.spilled_probe_operator(context)?
+        } else {
+            self.probe_operator(context)
+        };
+        self.placeholder.replace(probe_operator);
+        Ok(FinalizedSink::Operator)
     }
 
     fn as_any(&mut self) -> &mut dyn Any {
@@ -301,6 +301,70 @@ impl<K: ExtraPayload> GenericJoinProbe<K> {
 
         Ok(OperatorResult::Finished(chunk.with_data(out)))
     }
+
+    #[cfg(feature = "semi_anti_join")]
+    fn match_semi_anti<'b, I, T>(&mut self, iter: I, anti: bool)
+    where
+        I: Iterator<Item = (usize, (&'b u64, T))> + 'b,
+        T: IsNull
+            // Temporary trait to get concrete &[u8]
+            // Input is either &[u8] or Option<&[u8]>
+            + ToRow,
+    {
+        for (i, (h, row)) in iter {
+            // We only have to check for existence of the key in the build table.
+            let found = !row.is_null() && {
+                let row = row.get_row();
+                self.hash_tables
+                    .raw_entry(*h)
+                    .from_hash(*h, |key| {
+                        compare_fn(key, *h, &self.materialized_join_cols, row)
+                    })
+                    .is_some()
+            };
+            if found != anti {
+                self.join_tuples_b.push(i as IdxSize);
+            }
+        }
+    }
+
+    #[cfg(feature = "semi_anti_join")]
+    fn execute_semi_anti(
+        &mut self,
+        context: &PExecutionContext,
+        chunk: &DataChunk,
+        anti: bool,
+    ) -> PolarsResult<OperatorResult> {
+        // Like the left join, the right table is the build table
+        // and the left table is filtered while streaming through.
+        self.join_tuples_b.clear();
+        let mut hashes = std::mem::take(&mut self.hashes);
+        let rows = self
+            .row_values
+            .get_values(context, chunk, self.join_nulls)?;
+        hash_rows(&rows, &mut hashes, &self.hb);
+
+        if self.join_nulls || rows.null_count() == 0 {
+            let iter = hashes.iter().zip(rows.values_iter()).enumerate();
+            self.match_semi_anti(iter, anti);
+        } else {
+            let iter = hashes.iter().zip(rows.iter()).enumerate();
+            self.match_semi_anti(iter, anti);
+        }
+        self.hashes = hashes;
+
+        let out = unsafe {
+            chunk
+                .data
+                ._take_unchecked_slice_sorted(&self.join_tuples_b, false, IsSorted::Ascending)
+        };
+
+        // Clear memory.
+        self.row_values.clear();
+        self.hashes.clear();
+
+        Ok(OperatorResult::Finished(chunk.with_data(out)))
+    }
 }
 
 impl<K: ExtraPayload> Operator for GenericJoinProbe<K> {
@@ -312,6 +376,10 @@ impl<K: ExtraPayload> Operator for GenericJoinProbe<K> {
         match self.how {
             JoinType::Inner => self.execute_inner(context, chunk),
             JoinType::Left => self.execute_left(context, chunk),
+            #[cfg(feature = "semi_anti_join")]
+            JoinType::Semi => self.execute_semi_anti(context, chunk, false),
+            #[cfg(feature = "semi_anti_join")]
+            JoinType::Anti => self.execute_semi_anti(context, chunk, true),
             _ => unreachable!(),
         }
     }
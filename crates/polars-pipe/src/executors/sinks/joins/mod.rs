@@ -1,13 +1,18 @@
+#[cfg(feature = "asof_join")]
+mod asof;
 #[cfg(feature = "cross_join")]
 mod cross;
 mod generic_build;
 mod generic_probe_inner_left;
 mod generic_probe_outer;
+mod ooc;
 mod row_values;
 
 use std::hash::{BuildHasherDefault, Hash, Hasher};
 use std::sync::atomic::AtomicBool;
 
+#[cfg(feature = "asof_join")]
+pub(crate) use asof::*;
 #[cfg(feature = "cross_join")]
 pub(crate) use cross::*;
 pub(crate) use generic_build::GenericBuild;
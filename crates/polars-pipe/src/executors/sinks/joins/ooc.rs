@@ -0,0 +1,415 @@
+//! Out-of-core hash join.
+//!
+//! If the build side of a join does not fit in memory, the build sink spills it to disk in
+//! `PARTITION_SIZE` partitions by the hash of the join keys. The probe side is then
+//! partitioned in the same way and the matching partitions are joined in memory, one
+//! partition at a time (a grace hash join).
+use std::any::Any;
+use std::collections::VecDeque;
+use std::marker::PhantomData;
+use std::sync::{OnceLock, RwLock};
+
+use polars_core::export::ahash::RandomState;
+use polars_core::prelude::*;
+use polars_core::utils::_set_partition_size;
+use polars_io::predicates::PhysicalIoExpr;
+use polars_plan::dsl::Expr;
+use polars_utils::arena::Node;
+use polars_utils::hashing::hash_to_partition;
+use smartstring::alias::String as SmartString;
+
+use super::*;
+use crate::executors::operators::PlaceHolder;
+use crate::executors::sinks::io::IOThread;
+use crate::executors::sinks::joins::row_values::RowValues;
+use crate::executors::sinks::memory::MemTracker;
+use crate::executors::sinks::sort::ooc::{partition_df, read_df, PartitionSpiller};
+use crate::executors::sinks::utils::hash_rows;
+use crate::expressions::PhysicalPipedExpr;
+use crate::operators::{
+    DataChunk, Operator, OperatorResult, PExecutionContext, SExecutionContext, Sink,
+};
+use crate::pipeline::{morsels_per_sink, PARTITION_SIZE};
+
+/// Looks up a join key column by name.
+///
+/// The spilled partitions are joined with these instead of the expressions of the query,
+/// which need its execution state.
+pub(super) struct KeyColumn(Arc<str>);
+
+impl KeyColumn {
+    /// The key columns of the join, if all `join_columns` are plain columns.
+    pub(super) fn try_from_exprs(
+        join_columns: &[Arc<dyn PhysicalPipedExpr>],
+    ) -> Option<Arc<Vec<Arc<dyn PhysicalPipedExpr>>>> {
+        join_columns
+            .iter()
+            .map(|e| match e.expression() {
+                Expr::Column(name) => Some(Arc::new(KeyColumn(name)) as Arc<dyn PhysicalPipedExpr>),
+                _ => None,
+            })
+            .collect::<Option<Vec<_>>>()
+            .map(Arc::new)
+    }
+}
+
+impl PhysicalIoExpr for KeyColumn {
+    fn evaluate_io(&self, df: &DataFrame) -> PolarsResult<Series> {
+        df.column(&self.0).cloned()
+    }
+}
+
+impl PhysicalPipedExpr for KeyColumn {
+    fn evaluate(&self, chunk: &DataChunk, _lazy_state: &dyn Any) -> PolarsResult<Series> {
+        chunk.data.column(&self.0).cloned()
+    }
+
+    fn field(&self, input_schema: &Schema) -> PolarsResult<Field> {
+        input_schema.try_get_field(&self.0)
+    }
+
+    fn expression(&self) -> Expr {
+        Expr::Column(self.0.clone())
+    }
+}
+
+/// The execution state of the joins of the spilled partitions; their keys are looked up
+/// by [`KeyColumn`] and don't need a state.
+struct PartitionState;
+
+impl SExecutionContext for PartitionState {
+    fn as_any(&self) -> &dyn Any {
+        self
+    }
+
+    fn should_stop(&self) -> PolarsResult<()> {
+        Ok(())
+    }
+}
+
+/// One side of a join that is spilled to disk in partitions.
+pub(super) struct Spill {
+    io_thread: IOThread,
+    // Buffers small partitions, so that we don't write many small files.
+    buffers: PartitionSpiller,
+}
+
+impl Spill {
+    pub(super) fn try_new(schema: SchemaRef, mem_track: &MemTracker) -> PolarsResult<Self> {
+        // Like the out-of-core sort, we keep at most a third of the free memory in the
+        // buffers.
+        let spill_limit = std::cmp::min(
+            mem_track.get_available_latest() / (PARTITION_SIZE * 3),
+            1 << 26,
+        );
+        Ok(Self {
+            io_thread: IOThread::try_new(schema, "join")?,
+            buffers: PartitionSpiller::new(PARTITION_SIZE, spill_limit as u64),
+        })
+    }
+
+    /// Partition `df` by the `hashes` of its join keys and spill the partitions.
+    pub(super) fn push(&self, df: DataFrame, hashes: &[u64]) -> PolarsResult<()> {
+        let partitions = hashes
+            .iter()
+            .map(|h| hash_to_partition(*h, PARTITION_SIZE) as IdxSize)
+            .collect::<Vec<_>>();
+        let partitions = IdxCa::from_vec("", partitions);
+        let (iter, partitions) = partition_df(df, &partitions, false)?;
+        for (part, df) in partitions.into_no_null_iter().zip(iter) {
+            if let Some(df) = self.buffers.push(part as usize, df) {
+                self.io_thread.dump_partition_local(part, df)
+            }
+        }
+        Ok(())
+    }
+
+    /// Load a partition and remove its files.
+    fn load(&self, partition: usize) -> PolarsResult<Vec<DataFrame>> {
+        let mut out = vec![];
+        let dir = self.io_thread.dir.join(format!("{partition}"));
+        if dir.exists() {
+            for entry in std::fs::read_dir(&dir)? {
+                out.push(read_df(&entry?.path())?);
+            }
+            self.io_thread.clean(dir);
+        }
+        out.extend(self.buffers.get(partition));
+        Ok(out)
+    }
+}
+
+/// The state that is shared by the probe operators of all threads.
+pub(super) struct SpilledJoin {
+    pub(super) build: Spill,
+    // Created when the first probe chunk is spilled.
+    pub(super) probe: RwLock<Option<Spill>>,
+    // Empty frames with the schema of the build side, the probe side and the output.
+    pub(super) build_empty: DataFrame,
+    pub(super) probe_empty: OnceLock<DataFrame>,
+    pub(super) output_empty: OnceLock<DataFrame>,
+    // The arguments of the in-memory joins of the partitions.
+    pub(super) suffix: Arc<str>,
+    pub(super) join_type: JoinType,
+    pub(super) swapped: bool,
+    pub(super) join_nulls: bool,
+    pub(super) node: Node,
+    pub(super) key_columns_left: Arc<Vec<Arc<dyn PhysicalPipedExpr>>>,
+    pub(super) key_columns_right: Arc<Vec<Arc<dyn PhysicalPipedExpr>>>,
+    pub(super) key_names_left: Arc<[SmartString]>,
+    pub(super) key_names_right: Arc<[SmartString]>,
+    // Hashes the keys of both sides to assign the partitions.
+    pub(super) hb: RandomState,
+    pub(super) mem_track: MemTracker,
+    pub(super) verbose: bool,
+}
+
+impl SpilledJoin {
+    fn context(&self) -> PExecutionContext {
+        PExecutionContext::new(Box::new(PartitionState), self.verbose)
+    }
+
+    /// Build the hash table of a partition and return the operator that probes it.
+    fn build_partition<K: ExtraPayload>(
+        &self,
+        context: &PExecutionContext,
+        build: Vec<DataFrame>,
+    ) -> PolarsResult<Box<dyn Operator>> {
+        let mut sink = GenericBuild::<K>::new(
+            self.suffix.clone(),
+            self.join_type.clone(),
+            self.swapped,
+            self.key_columns_left.clone(),
+            self.key_columns_right.clone(),
+            self.join_nulls,
+            self.node,
+            self.key_names_left.clone(),
+            self.key_names_right.clone(),
+            PlaceHolder::new(),
+        );
+        sink.disable_spill();
+        // This ensures an empty partition still has the schema of the build side.
+        sink.sink(context, DataChunk::new(0, self.build_empty.clone()))?;
+        for mut df in build {
+            // The probe operators expect a single chunk per build chunk.
+            df.as_single_chunk();
+            sink.sink(context, DataChunk::new(0, df))?;
+        }
+        Ok(sink.probe_operator(context))
+    }
+
+    /// Join an empty probe chunk to determine the schema of the output.
+    fn output_empty<K: ExtraPayload>(&self, probe_empty: &DataFrame) -> PolarsResult<&DataFrame> {
+        if let Some(df) = self.output_empty.get() {
+            return Ok(df);
+        }
+        let context = self.context();
+        let mut op = self.build_partition::<K>(&context, vec![])?;
+        let out = match op.execute(&context, &DataChunk::new(0, probe_empty.clone()))? {
+            OperatorResult::Finished(chunk) | OperatorResult::HaveMoreOutPut(chunk) => chunk.data,
+            OperatorResult::NeedsNewData => unreachable!(),
+        };
+        Ok(self.output_empty.get_or_init(|| out))
+    }
+}
+
+/// The in-memory join of a spilled partition.
+struct PartitionJoin {
+    context: PExecutionContext,
+    op: Box<dyn Operator>,
+    probe: Vec<DataFrame>,
+    // The output that is not yet returned.
+    out: VecDeque<DataFrame>,
+    flushed: bool,
+}
+
+/// Spills the probe side of a join and joins the spilled partitions when it is flushed.
+pub(super) struct GraceJoinProbe<K: ExtraPayload> {
+    join: Arc<SpilledJoin>,
+    row_values: RowValues,
+    hashes: Vec<u64>,
+    thread_no: usize,
+    // The partitions that this thread still has to join.
+    partitions: Option<VecDeque<usize>>,
+    current: Option<PartitionJoin>,
+    phantom: PhantomData<K>,
+}
+
+impl<K: ExtraPayload> GraceJoinProbe<K> {
+    pub(super) fn new(
+        join: SpilledJoin,
+        probe_columns: Arc<Vec<Arc<dyn PhysicalPipedExpr>>>,
+    ) -> Self {
+        if join.verbose {
+            eprintln!("OOC join: the probe side is spilled to disk");
+        }
+        GraceJoinProbe {
+            join: Arc::new(join),
+            row_values: RowValues::new(probe_columns, false),
+            hashes: vec![],
+            thread_no: 0,
+            partitions: None,
+            current: None,
+            phantom: PhantomData,
+        }
+    }
+
+    fn spill(&mut self, context: &PExecutionContext, chunk: &DataChunk) -> PolarsResult<()> {
+        // Null keys are hashed as well; the partitions are joined with the `join_nulls`
+        // setting of the query.
+        let rows = self.row_values.get_values(context, chunk, true)?;
+        hash_rows(&rows, &mut self.hashes, &self.join.hb);
+        self.row_values.clear();
+
+        if self.join.probe.read().unwrap().is_none() {
+            let mut probe = self.join.probe.write().unwrap();
+            if probe.is_none() {
+                *probe = Some(Spill::try_new(
+                    chunk.data.schema().into(),
+                    &self.join.mem_track,
+                )?);
+            }
+        }
+        let probe = self.join.probe.read().unwrap();
+        probe
+            .as_ref()
+            .unwrap()
+            .push(chunk.data.clone(), &self.hashes)?;
+        self.hashes.clear();
+        Ok(())
+    }
+
+    fn next_partition(&mut self) -> PolarsResult<Option<PartitionJoin>> {
+        let Some(partition) = self.partitions.as_mut().unwrap().pop_front() else {
+            return Ok(None);
+        };
+        if self.join.verbose {
+            eprintln!("OOC join: joining partition {partition}");
+        }
+        let build = self.join.build.load(partition)?;
+        let probe = match self.join.probe.read().unwrap().as_ref() {
+            Some(probe) => probe.load(partition)?,
+            None => vec![],
+        };
+        let context = self.join.context();
+        let mut op = self.join.build_partition::<K>(&context, build)?;
+        let outer = matches!(self.join.join_type, JoinType::Outer { .. });
+        if outer {
+            // The outer join needs to see the probe schema before it is flushed.
+            let probe_empty = self.join.probe_empty.get().unwrap().clone();
+            op.execute(&context, &DataChunk::new(0, probe_empty))?;
+        }
+        Ok(Some(PartitionJoin {
+            context,
+            op,
+            probe,
+            out: VecDeque::new(),
+            // Only the outer join has to be flushed.
+            flushed: !outer,
+        }))
+    }
+}
+
+impl PartitionJoin {
+    /// The next output of the join, or `None` if the partition is completely joined.
+    fn next(&mut self) -> PolarsResult<Option<DataFrame>> {
+        loop {
+            if let Some(df) = self.out.pop_front() {
+                return Ok(Some(df));
+            }
+            if let Some(mut df) = self.probe.pop() {
+                df.as_single_chunk();
+                let chunk = DataChunk::new(0, df);
+                loop {
+                    match self.op.execute(&self.context, &chunk)? {
+                        OperatorResult::Finished(out) => {
+                            self.push_output(out.data);
+                            break;
+                        },
+                        OperatorResult::HaveMoreOutPut(out) => self.push_output(out.data),
+                        OperatorResult::NeedsNewData => break,
+                    }
+                }
+            } else if !self.flushed {
+                self.flushed = true;
+                // Get the unmatched rows of the build side from all hash tables.
+                for thread_no in 0.._set_partition_size() {
+                    if let OperatorResult::Finished(out) = self.op.split(thread_no).flush()? {
+                        self.push_output(out.data)
+                    }
+                }
+            } else {
+                return Ok(None);
+            }
+        }
+    }
+
+    fn push_output(&mut self, df: DataFrame) {
+        if df.height() > 0 {
+            self.out.push_back(df)
+        }
+    }
+}
+
+impl<K: ExtraPayload> Operator for GraceJoinProbe<K> {
+    fn execute(
+        &mut self,
+        context: &PExecutionContext,
+        chunk: &DataChunk,
+    ) -> PolarsResult<OperatorResult> {
+        let out = {
+            let probe_empty = self.join.probe_empty.get_or_init(|| chunk.data.clear());
+            self.join.output_empty::<K>(probe_empty)?.clone()
+        };
+        if chunk.data.height() > 0 {
+            self.spill(context, chunk)?;
+        }
+        // The partitions are joined when the operator is flushed.
+        Ok(OperatorResult::Finished(chunk.with_data(out)))
+    }
+
+    fn flush(&mut self) -> PolarsResult<OperatorResult> {
+        if self.partitions.is_none() {
+            // Every thread joins a part of the partitions.
+            let n_threads = morsels_per_sink();
+            self.partitions = Some(
+                (0..PARTITION_SIZE)
+                    .filter(|partition| partition % n_threads == self.thread_no)
+                    .collect(),
+            );
+        }
+        loop {
+            if self.current.is_none() {
+                self.current = self.next_partition()?;
+                if self.current.is_none() {
+                    let out = self.join.output_empty.get().unwrap().clone();
+                    return Ok(OperatorResult::Finished(DataChunk::new(0, out)));
+                }
+            }
+            match self.current.as_mut().unwrap().next()? {
+                Some(out) => return Ok(OperatorResult::HaveMoreOutPut(DataChunk::new(0, out))),
+                None => self.current = None,
+            }
+        }
+    }
+
+    fn must_flush(&self) -> bool {
+        true
+    }
+
+    fn split(&self, thread_no: usize) -> Box<dyn Operator> {
+        Box::new(Self {
+            join: self.join.clone(),
+            row_values: self.row_values.clone(),
+            hashes: vec![],
+            thread_no,
+            partitions: None,
+            current: None,
+            phantom: PhantomData,
+        })
+    }
+
+    fn fmt(&self) -> &str {
+        "grace_join_probe"
+    }
+}
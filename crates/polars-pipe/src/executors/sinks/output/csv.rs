@@ -2,32 +2,41 @@ use std::path::Path;
 
 use crossbeam_channel::bounded;
 use polars_core::prelude::*;
-use polars_io::csv::write::{CsvWriter, CsvWriterOptions};
+use polars_io::csv::write::{BatchedWriter, CsvWriter, CsvWriterOptions};
 use polars_io::SerWriter;
 
 use crate::executors::sinks::output::file_sink::{init_writer_thread, FilesSink, SinkWriter};
 use crate::pipeline::morsels_per_sink;
 
+pub(super) fn csv_batched_writer(
+    file: std::fs::File,
+    options: CsvWriterOptions,
+    schema: &Schema,
+) -> PolarsResult<BatchedWriter<std::fs::File>> {
+    CsvWriter::new(file)
+        .include_bom(options.include_bom)
+        .include_header(options.include_header)
+        .with_separator(options.serialize_options.separator)
+        .with_line_terminator(options.serialize_options.line_terminator)
+        .with_quote_char(options.serialize_options.quote_char)
+        .with_batch_size(options.batch_size)
+        .with_datetime_format(options.serialize_options.datetime_format)
+        .with_date_format(options.serialize_options.date_format)
+        .with_time_format(options.serialize_options.time_format)
+        .with_float_precision(options.serialize_options.float_precision)
+        .with_null_value(options.serialize_options.null)
+        .with_quote_style(options.serialize_options.quote_style)
+        .n_threads(1)
+        .batched(schema)
+}
+
 pub struct CsvSink {}
 impl CsvSink {
     #[allow(clippy::new_ret_no_self)]
     pub fn new(path: &Path, options: CsvWriterOptions, schema: &Schema) -> PolarsResult<FilesSink> {
         let file = std::fs::File::create(path)?;
-        let writer = CsvWriter::new(file)
-            .include_bom(options.include_bom)
-            .include_header(options.include_header)
-            .with_separator(options.serialize_options.separator)
-            .with_line_terminator(options.serialize_options.line_terminator)
-            .with_quote_char(options.serialize_options.quote_char)
-            .with_batch_size(options.batch_size)
-            .with_datetime_format(options.serialize_options.datetime_format)
-            .with_date_format(options.serialize_options.date_format)
-            .with_time_format(options.serialize_options.time_format)
-            .with_float_precision(options.serialize_options.float_precision)
-            .with_null_value(options.serialize_options.null)
-            .with_quote_style(options.serialize_options.quote_style)
-            .n_threads(1)
-            .batched(schema)?;
+        let maintain_order = options.maintain_order;
+        let writer = csv_batched_writer(file, options, schema)?;
 
         let writer = Box::new(writer) as Box<dyn SinkWriter + Send + Sync>;
 
@@ -38,7 +47,7 @@ impl CsvSink {
         let io_thread_handle = Arc::new(Some(init_writer_thread(
             receiver,
             writer,
-            options.maintain_order,
+            maintain_order,
             morsels_per_sink,
         )));
 
@@ -49,7 +58,7 @@ impl CsvSink {
     }
 }
 
-impl SinkWriter for polars_io::csv::write::BatchedWriter<std::fs::File> {
+impl SinkWriter for BatchedWriter<std::fs::File> {
     fn _write_batch(&mut self, df: &DataFrame) -> PolarsResult<()> {
         self.write_batch(df)
     }
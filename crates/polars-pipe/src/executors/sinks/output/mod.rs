@@ -13,6 +13,8 @@ mod ipc;
 mod json;
 #[cfg(feature = "parquet")]
 mod parquet;
+#[cfg(any(feature = "parquet", feature = "ipc", feature = "csv"))]
+mod partitioned;
 
 #[cfg(feature = "csv")]
 pub use csv::*;
@@ -22,3 +24,5 @@ pub use ipc::*;
 pub use json::*;
 #[cfg(feature = "parquet")]
 pub use parquet::*;
+#[cfg(any(feature = "parquet", feature = "ipc", feature = "csv"))]
+pub use partitioned::*;
@@ -4,13 +4,15 @@ use std::thread::JoinHandle;
 
 use crossbeam_channel::{bounded, Receiver, Sender};
 use polars_core::prelude::*;
-use polars_io::parquet::write::{BatchedWriter, ParquetWriteOptions, ParquetWriter, RowGroupIter};
+use polars_io::parquet::write::{
+    BatchedWriter, ParquetWriteOptions, ParquetWriter, RowGroupBloomFilters, RowGroupIter,
+};
 
 use crate::executors::sinks::output::file_sink::{init_writer_thread, FilesSink, SinkWriter};
 use crate::operators::{DataChunk, FinalizedSink, PExecutionContext, Sink, SinkResult};
 use crate::pipeline::morsels_per_sink;
 
-type RowGroups = Vec<RowGroupIter<'static, PolarsError>>;
+type RowGroups = Vec<(RowGroupIter<'static, PolarsError>, RowGroupBloomFilters)>;
 
 pub(super) fn init_row_group_writer_thread(
     receiver: Receiver<Option<(IdxSize, RowGroups)>>,
@@ -49,6 +51,23 @@ pub(super) fn init_row_group_writer_thread(
     })
 }
 
+pub(super) fn parquet_batched_writer<W: std::io::Write>(
+    writer: W,
+    options: ParquetWriteOptions,
+    schema: &Schema,
+) -> PolarsResult<BatchedWriter<W>> {
+    ParquetWriter::new(writer)
+        .with_compression(options.compression)
+        .with_data_page_size(options.data_pagesize_limit)
+        .with_statistics(options.statistics)
+        .with_row_group_size(options.row_group_size)
+        .with_bloom_filter_columns(options.bloom_filter_columns)
+        // This is important! Otherwise we will deadlock
+        // See: #7074
+        .set_parallel(false)
+        .batched(schema)
+}
+
 #[derive(Clone)]
 pub struct ParquetSink {
     writer: Arc<BatchedWriter<std::fs::File>>,
@@ -59,15 +78,7 @@ impl ParquetSink {
     #[allow(clippy::new_ret_no_self)]
     pub fn new(path: &Path, options: ParquetWriteOptions, schema: &Schema) -> PolarsResult<Self> {
         let file = std::fs::File::create(path)?;
-        let writer = ParquetWriter::new(file)
-            .with_compression(options.compression)
-            .with_data_page_size(options.data_pagesize_limit)
-            .with_statistics(options.statistics)
-            .with_row_group_size(options.row_group_size)
-            // This is important! Otherwise we will deadlock
-            // See: #7074
-            .set_parallel(false)
-            .batched(schema)?;
+        let writer = parquet_batched_writer(file, options, schema)?;
 
         let writer = Arc::new(writer);
         let morsels_per_sink = morsels_per_sink();
@@ -150,15 +161,7 @@ impl ParquetCloudSink {
         schema: &Schema,
     ) -> PolarsResult<FilesSink> {
         let cloud_writer = polars_io::cloud::CloudWriter::new(uri, cloud_options).await?;
-        let writer = ParquetWriter::new(cloud_writer)
-            .with_compression(parquet_options.compression)
-            .with_data_page_size(parquet_options.data_pagesize_limit)
-            .with_statistics(parquet_options.statistics)
-            .with_row_group_size(parquet_options.row_group_size)
-            // This is important! Otherwise we will deadlock
-            // See: #7074
-            .set_parallel(false)
-            .batched(schema)?;
+        let writer = parquet_batched_writer(cloud_writer, parquet_options, schema)?;
 
         let writer = Box::new(writer) as Box<dyn SinkWriter + Send>;
 
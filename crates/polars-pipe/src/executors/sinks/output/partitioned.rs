@@ -0,0 +1,368 @@
+//! Streaming sink that writes a Hive partitioned dataset.
+//!
+//! The morsels are split by the partition columns on the worker threads. A single IO thread
+//! keeps a batched writer open per partition and writes the parts of the morsels to them.
+use std::any::Any;
+use std::path::{Path, PathBuf};
+use std::thread::JoinHandle;
+
+use crossbeam_channel::{bounded, Receiver, Sender};
+use polars_core::prelude::*;
+#[cfg(feature = "ipc")]
+use polars_io::ipc::IpcWriter;
+use polars_io::partition::resolve_partition_dir;
+#[cfg(feature = "ipc")]
+use polars_io::SerWriter;
+use polars_plan::prelude::{FileType, PartitionedSinkOptions};
+
+use crate::executors::sinks::output::file_sink::SinkWriter;
+use crate::operators::{
+    DataChunk, FinalizedSink, PExecutionContext, Sink, SinkResult, StreamingVstacker,
+};
+use crate::pipeline::morsels_per_sink;
+
+/// The parts of a morsel, keyed by the directory of their partition.
+type Partitions = Vec<(PathBuf, DataFrame)>;
+
+/// A file of a partition that is currently being written.
+struct OpenFile {
+    writer: Box<dyn SinkWriter + Send>,
+    vstacker: StreamingVstacker,
+    rows_written: usize,
+    last_used: usize,
+}
+
+impl OpenFile {
+    fn write(&mut self, df: DataFrame) -> PolarsResult<()> {
+        self.rows_written += df.height();
+        for mut df in self.vstacker.add(df) {
+            if df.n_chunks() > 1 {
+                df.as_single_chunk();
+            }
+            self.writer._write_batch(&df)?;
+        }
+        Ok(())
+    }
+
+    fn finish(mut self) -> PolarsResult<()> {
+        if let Some(mut df) = self.vstacker.finish() {
+            if df.n_chunks() > 1 {
+                df.as_single_chunk();
+            }
+            self.writer._write_batch(&df)?;
+        }
+        self.writer._finish()
+    }
+}
+
+fn file_extension(file_type: &FileType) -> &'static str {
+    match file_type {
+        #[cfg(feature = "parquet")]
+        FileType::Parquet(_) => "parquet",
+        #[cfg(feature = "ipc")]
+        FileType::Ipc(_) => "ipc",
+        #[cfg(feature = "csv")]
+        FileType::Csv(_) => "csv",
+        #[cfg(feature = "json")]
+        FileType::Json(_) => "json",
+        #[allow(unreachable_patterns)]
+        _ => unreachable!(),
+    }
+}
+
+fn create_writer(
+    path: &Path,
+    file_type: &FileType,
+    schema: &Schema,
+) -> PolarsResult<Box<dyn SinkWriter + Send>> {
+    let file = std::fs::File::create(path)?;
+    let writer = match file_type {
+        #[cfg(feature = "parquet")]
+        FileType::Parquet(options) => Box::new(super::parquet::parquet_batched_writer(
+            file,
+            options.clone(),
+            schema,
+        )?) as Box<dyn SinkWriter + Send>,
+        #[cfg(feature = "ipc")]
+        FileType::Ipc(options) => Box::new(
+            IpcWriter::new(file)
+                .with_compression(options.compression)
+                .batched(schema)?,
+        ) as Box<dyn SinkWriter + Send>,
+        #[cfg(feature = "csv")]
+        FileType::Csv(options) => Box::new(super::csv::csv_batched_writer(
+            file,
+            options.clone(),
+            schema,
+        )?) as Box<dyn SinkWriter + Send>,
+        #[cfg(feature = "json")]
+        FileType::Json(_) => {
+            Box::new(polars_io::json::BatchedWriter::new(file)) as Box<dyn SinkWriter + Send>
+        },
+        #[allow(unreachable_patterns)]
+        _ => unreachable!(),
+    };
+    Ok(writer)
+}
+
+/// The open files of all partitions.
+///
+/// At most `max_open_files` files are open at the same time; if another partition must be
+/// written, the least recently used file is finished. Later rows of that partition are
+/// written to a new file in the same directory.
+struct PartitionWriters {
+    file_type: FileType,
+    /// The schema of the files, i.e. without the partition columns.
+    schema: Schema,
+    max_open_files: usize,
+    max_rows_per_file: Option<usize>,
+    open_files: PlHashMap<PathBuf, OpenFile>,
+    /// The number of files that are created in every partition directory.
+    n_files: PlHashMap<PathBuf, usize>,
+    clock: usize,
+}
+
+impl PartitionWriters {
+    fn open_file(&mut self, dir: &Path) -> PolarsResult<&mut OpenFile> {
+        self.clock += 1;
+        if !self.open_files.contains_key(dir) {
+            if self.open_files.len() >= self.max_open_files {
+                let lru = self
+                    .open_files
+                    .iter()
+                    .min_by_key(|(_, file)| file.last_used)
+                    .map(|(dir, _)| dir.clone())
+                    .unwrap();
+                self.close_file(&lru)?;
+            }
+
+            let n_files = self.n_files.entry(dir.to_path_buf()).or_insert(0);
+            if *n_files == 0 {
+                std::fs::create_dir_all(dir)?;
+            }
+            let path = dir.join(format!(
+                "data-{:04}.{}",
+                *n_files,
+                file_extension(&self.file_type)
+            ));
+            *n_files += 1;
+
+            let file = OpenFile {
+                writer: create_writer(&path, &self.file_type, &self.schema)?,
+                vstacker: StreamingVstacker::default(),
+                rows_written: 0,
+                last_used: 0,
+            };
+            self.open_files.insert(dir.to_path_buf(), file);
+        }
+        let file = self.open_files.get_mut(dir).unwrap();
+        file.last_used = self.clock;
+        Ok(file)
+    }
+
+    fn close_file(&mut self, dir: &Path) -> PolarsResult<()> {
+        match self.open_files.remove(dir) {
+            Some(file) => file.finish(),
+            None => Ok(()),
+        }
+    }
+
+    fn write(&mut self, dir: &Path, mut df: DataFrame) -> PolarsResult<()> {
+        let Some(max_rows) = self.max_rows_per_file else {
+            return self.open_file(dir)?.write(df);
+        };
+
+        // Fill up the current file and roll over to a new file once it is full.
+        while df.height() > 0 {
+            let file = self.open_file(dir)?;
+            let capacity = max_rows - file.rows_written;
+            let (head, tail) = if df.height() > capacity {
+                (
+                    df.slice(0, capacity),
+                    df.slice(capacity as i64, df.height() - capacity),
+                )
+            } else {
+                (df, DataFrame::empty())
+            };
+            file.write(head)?;
+            if file.rows_written == max_rows {
+                self.close_file(dir)?;
+            }
+            df = tail;
+        }
+        Ok(())
+    }
+
+    fn finish(&mut self) -> PolarsResult<()> {
+        for (_, file) in self.open_files.drain() {
+            file.finish()?;
+        }
+        Ok(())
+    }
+}
+
+fn init_partition_writer_thread(
+    receiver: Receiver<Option<(IdxSize, Partitions)>>,
+    mut writers: PartitionWriters,
+    maintain_order: bool,
+    // this is used to determine when a batch of chunks should be written to disk
+    // all chunks per push should be collected to determine in which order they should
+    // be written
+    morsels_per_sink: usize,
+) -> JoinHandle<()> {
+    std::thread::spawn(move || {
+        let mut batched = Vec::with_capacity(morsels_per_sink);
+        while let Ok(partitions) = receiver.recv() {
+            // `last_write` indicates if all chunks are processed, e.g. this is the last write.
+            let last_write = if let Some(partitions) = partitions {
+                batched.push(partitions);
+                false
+            } else {
+                true
+            };
+
+            if batched.len() == morsels_per_sink || last_write {
+                if maintain_order {
+                    batched.sort_by_key(|chunk| chunk.0);
+                }
+
+                for (_, partitions) in batched.drain(0..) {
+                    for (dir, df) in partitions {
+                        writers.write(&dir, df).unwrap();
+                    }
+                }
+            }
+            if last_write {
+                writers.finish().unwrap();
+                return;
+            }
+        }
+    })
+}
+
+/// Writes a Hive partitioned dataset to `rootdir/key=value/.../data-{i}.{ext}`.
+#[derive(Clone)]
+pub struct PartitionedSink {
+    rootdir: Arc<PathBuf>,
+    by: Arc<Vec<String>>,
+    sender: Sender<Option<(IdxSize, Partitions)>>,
+    io_thread_handle: Arc<Option<JoinHandle<()>>>,
+}
+
+impl PartitionedSink {
+    pub fn new(
+        rootdir: Arc<PathBuf>,
+        file_type: FileType,
+        options: PartitionedSinkOptions,
+        schema: &Schema,
+    ) -> PolarsResult<Self> {
+        for name in &options.by {
+            schema.try_get(name)?;
+        }
+        // The partition columns are encoded in the directories and not written to the files.
+        let file_schema = schema
+            .iter()
+            .filter(|(name, _)| !options.by.iter().any(|by| by == name.as_str()))
+            .map(|(name, dtype)| Field::new(name, dtype.clone()))
+            .collect::<Schema>();
+
+        let maintain_order = match &file_type {
+            #[cfg(feature = "parquet")]
+            FileType::Parquet(options) => options.maintain_order,
+            #[cfg(feature = "ipc")]
+            FileType::Ipc(options) => options.maintain_order,
+            #[cfg(feature = "csv")]
+            FileType::Csv(options) => options.maintain_order,
+            #[cfg(feature = "json")]
+            FileType::Json(options) => options.maintain_order,
+            #[allow(unreachable_patterns)]
+            _ => true,
+        };
+        let writers = PartitionWriters {
+            file_type,
+            schema: file_schema,
+            max_open_files: options.max_open_files,
+            max_rows_per_file: options.max_rows_per_file,
+            open_files: Default::default(),
+            n_files: Default::default(),
+            clock: 0,
+        };
+
+        let morsels_per_sink = morsels_per_sink();
+        let backpressure = morsels_per_sink * 2;
+        let (sender, receiver) = bounded(backpressure);
+
+        let io_thread_handle = Arc::new(Some(init_partition_writer_thread(
+            receiver,
+            writers,
+            maintain_order,
+            morsels_per_sink,
+        )));
+
+        Ok(Self {
+            rootdir,
+            by: Arc::new(options.by),
+            sender,
+            io_thread_handle,
+        })
+    }
+}
+
+impl Sink for PartitionedSink {
+    fn sink(&mut self, _context: &PExecutionContext, chunk: DataChunk) -> PolarsResult<SinkResult> {
+        // don't add empty dataframes
+        if chunk.data.height() == 0 {
+            return Ok(SinkResult::CanHaveMoreInput);
+        }
+        // Split the morsel on every thread, so that the IO thread only has to write.
+        let partitions = chunk
+            .data
+            .partition_by_stable(self.by.iter(), true)?
+            .into_iter()
+            .map(|mut df| {
+                let dir = resolve_partition_dir(&self.rootdir, self.by.iter(), &df);
+                for name in self.by.iter() {
+                    df.drop_in_place(name)?;
+                }
+                Ok((dir, df))
+            })
+            .collect::<PolarsResult<Vec<_>>>()?;
+        self.sender
+            .send(Some((chunk.chunk_index, partitions)))
+            .unwrap();
+        Ok(SinkResult::CanHaveMoreInput)
+    }
+
+    fn combine(&mut self, _other: &mut dyn Sink) {
+        // already synchronized
+    }
+
+    fn split(&self, _thread_no: usize) -> Box<dyn Sink> {
+        Box::new(self.clone())
+    }
+
+    fn finalize(&mut self, _context: &PExecutionContext) -> PolarsResult<FinalizedSink> {
+        // `None` indicates that we can flush all remaining chunks.
+        self.sender.send(None).unwrap();
+
+        // wait until all files written
+        // some unwrap/mut kung-fu to get a hold of `self`
+        Arc::get_mut(&mut self.io_thread_handle)
+            .unwrap()
+            .take()
+            .unwrap()
+            .join()
+            .unwrap();
+
+        // return a dummy dataframe;
+        Ok(FinalizedSink::Finished(Default::default()))
+    }
+
+    fn as_any(&mut self) -> &mut dyn Any {
+        self
+    }
+
+    fn fmt(&self) -> &str {
+        "partitioned_sink"
+    }
+}
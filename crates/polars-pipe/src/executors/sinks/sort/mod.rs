@@ -1,4 +1,4 @@
-mod ooc;
+pub(super) mod ooc;
 mod sink;
 mod sink_multiple;
 mod source;
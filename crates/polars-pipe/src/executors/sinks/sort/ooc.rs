@@ -19,7 +19,7 @@ use crate::executors::sinks::memory::MemTracker;
 use crate::executors::sinks::sort::source::SortSource;
 use crate::operators::FinalizedSink;
 
-pub(super) fn read_df(path: &Path) -> PolarsResult<DataFrame> {
+pub(in crate::executors::sinks) fn read_df(path: &Path) -> PolarsResult<DataFrame> {
     let file = polars_utils::open_file(path)?;
     IpcReader::new(file).set_rechunk(false).finish()
 }
@@ -80,7 +80,7 @@ pub(crate) struct PartitionSpiller {
 }
 
 impl PartitionSpiller {
-    fn new(n_parts: usize, spill_limit: u64) -> Self {
+    pub(crate) fn new(n_parts: usize, spill_limit: u64) -> Self {
         let mut partitions = vec![];
         partitions.resize_with(n_parts + 1, PartitionSpillBuf::default);
         Self {
@@ -89,7 +89,7 @@ impl PartitionSpiller {
         }
     }
 
-    fn push(&self, partition: usize, df: DataFrame) -> Option<DataFrame> {
+    pub(crate) fn push(&self, partition: usize, df: DataFrame) -> Option<DataFrame> {
         self.partitions[partition].push(df, self.spill_limit)
     }
 
@@ -232,7 +232,7 @@ fn det_partitions(s: &Series, partitions: &Series, descending: bool) -> IdxCa {
     search_sorted(partitions, &s, SearchSortedSide::Any, descending).unwrap()
 }
 
-fn partition_df(
+pub(in crate::executors::sinks) fn partition_df(
     df: DataFrame,
     partitions: &IdxCa,
     multithreaded: bool,
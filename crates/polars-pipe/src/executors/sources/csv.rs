@@ -1,29 +1,44 @@
-use std::fs::File;
+use std::io::{Read, Seek};
 use std::path::PathBuf;
 
 use polars_core::export::arrow::Either;
 use polars_core::POOL;
+use polars_io::cloud::CloudOptions;
 use polars_io::csv::read::{
-    BatchedCsvReaderMmap, BatchedCsvReaderRead, CsvEncoding, CsvParserOptions, CsvReader,
+    is_compressed, BatchedCsvReaderMmap, BatchedCsvReaderRead, BatchedCsvReaderStream, CsvEncoding,
+    CsvParserOptions, CsvReader,
 };
+use polars_io::mmap::MmapBytesReader;
+use polars_io::utils::{is_cloud_url, materialize_hive_partitions, open_reader};
 use polars_plan::global::_set_n_rows_for_scan;
+use polars_plan::logical_plan::FileInfo;
 use polars_plan::prelude::FileScanOptions;
 use polars_utils::iter::EnumerateIdxTrait;
 
 use super::*;
-use crate::pipeline::determine_chunk_size;
+use crate::pipeline::{determine_chunk_size, estimated_row_size};
 
 pub(crate) struct CsvSource {
-    #[allow(dead_code)]
-    // this exist because we need to keep ownership
     schema: SchemaRef,
-    reader: Option<*mut CsvReader<'static, File>>,
+    reader: Option<*mut CsvReader<'static, Box<dyn MmapBytesReader>>>,
     batched_reader:
         Option<Either<*mut BatchedCsvReaderMmap<'static>, *mut BatchedCsvReaderRead<'static>>>,
+    /// Reads cloud and compressed files, which can not be memory mapped.
+    stream_reader: Option<BatchedCsvReaderStream<'static>>,
     n_threads: usize,
-    path: Option<PathBuf>,
-    options: Option<CsvParserOptions>,
-    file_options: Option<FileScanOptions>,
+    paths: Arc<[PathBuf]>,
+    path_index: usize,
+    file_info: FileInfo,
+    options: CsvParserOptions,
+    cloud_options: Option<CloudOptions>,
+    file_options: FileScanOptions,
+    with_columns: Option<Vec<String>>,
+    // The file column that is only read to determine the number of rows, if only
+    // Hive partition columns are projected.
+    placeholder: Option<String>,
+    hive_columns: Option<Vec<Series>>,
+    chunk_size: usize,
+    rows_read: usize,
     verbose: bool,
 }
 
@@ -32,43 +47,41 @@ impl CsvSource {
     // otherwise all files would be opened during construction of the pipeline
     // leading to Too many Open files error
     fn init_reader(&mut self) -> PolarsResult<()> {
-        let options = self.options.take().unwrap();
-        let file_options = self.file_options.take().unwrap();
-        let path = self.path.take().unwrap();
-        let mut with_columns = file_options.with_columns;
-        let mut projected_len = 0;
-        with_columns.as_ref().map(|columns| {
-            projected_len = columns.len();
-            columns
+        let path = self.paths[self.path_index].clone();
+        self.path_index += 1;
+
+        let n_rows = _set_n_rows_for_scan(self.file_options.n_rows)
+            .map(|n_rows| n_rows.saturating_sub(self.rows_read));
+        let row_index = self.file_options.row_index.clone().map(|mut row_index| {
+            row_index.offset += self.rows_read as IdxSize;
+            row_index
         });
 
-        if projected_len == 0 {
-            with_columns = None;
+        if self.file_info.hive_parts.is_some() {
+            self.file_info.update_hive_partitions(&path)?;
+            self.hive_columns = self
+                .file_info
+                .hive_parts
+                .as_ref()
+                .map(|hive| hive.materialize_partition_columns());
         }
 
-        let n_cols = if projected_len > 0 {
-            projected_len
-        } else {
-            self.schema.len()
-        };
-        let n_rows = _set_n_rows_for_scan(file_options.n_rows);
-        // inversely scale the chunk size by the number of threads so that we reduce memory pressure
-        // in streaming
-        let chunk_size = determine_chunk_size(n_cols, POOL.current_num_threads())?;
-
-        if self.verbose {
-            eprintln!("STREAMING CHUNK SIZE: {chunk_size} rows")
-        }
+        let mut file = open_reader(&path, self.cloud_options.as_ref())?;
+        let mut magic_nr = [0u8; 4];
+        let res_len = file.read(&mut magic_nr)?;
+        file.rewind()?;
+        let stream = is_cloud_url(&path) || (res_len >= 2 && is_compressed(&magic_nr));
 
-        let reader = CsvReader::from_path(&path)
-            .unwrap()
+        let options = self.options.clone();
+        let reader = CsvReader::new(file)
+            .with_path(Some(path))
             .has_header(options.has_header)
             .with_dtypes(Some(self.schema.clone()))
             .with_separator(options.separator)
             .with_ignore_errors(options.ignore_errors)
             .with_skip_rows(options.skip_rows)
             .with_n_rows(n_rows)
-            .with_columns(with_columns.map(|mut cols| std::mem::take(Arc::make_mut(&mut cols))))
+            .with_columns(self.with_columns.clone())
             .low_memory(options.low_memory)
             .with_null_values(options.null_values)
             .with_encoding(CsvEncoding::LossyUtf8)
@@ -78,18 +91,25 @@ impl CsvSource {
             .with_encoding(options.encoding)
             // never rechunk in streaming
             .with_rechunk(false)
-            .with_chunk_size(chunk_size)
-            .with_row_index(file_options.row_index)
+            .with_chunk_size(self.chunk_size)
+            .with_row_index(row_index)
             .with_n_threads(options.n_threads)
             .with_try_parse_dates(options.try_parse_dates)
             .truncate_ragged_lines(options.truncate_ragged_lines)
             .with_decimal_comma(options.decimal_comma)
             .raise_if_empty(options.raise_if_empty);
 
+        if stream {
+            // Parse the file while it is downloaded or decompressed.
+            self.stream_reader = Some(reader.batched_stream()?);
+            return Ok(());
+        }
+
         let reader = Box::new(reader);
-        let reader = Box::leak(reader) as *mut CsvReader<'static, File>;
+        let reader = Box::leak(reader) as *mut CsvReader<'static, Box<dyn MmapBytesReader>>;
 
-        let batched_reader = if options.low_memory {
+        // Files that are transcoded before parsing are held in memory anyway.
+        let batched_reader = if options.low_memory && options.encoding.is_ascii_compatible() {
             let batched_reader = unsafe { Box::new((*reader).batched_borrowed_read()?) };
             let batched_reader = Box::leak(batched_reader) as *mut BatchedCsvReaderRead;
             Either::Right(batched_reader)
@@ -103,21 +123,113 @@ impl CsvSource {
         Ok(())
     }
 
+    /// Drop the reader of the current file.
+    fn drop_reader(&mut self) {
+        self.stream_reader = None;
+        unsafe {
+            match self.batched_reader.take() {
+                Some(Either::Left(ptr)) => {
+                    let _to_drop = Box::from_raw(ptr);
+                },
+                Some(Either::Right(ptr)) => {
+                    let _to_drop = Box::from_raw(ptr);
+                },
+                // nothing initialized, nothing to drop
+                _ => {},
+            }
+            if let Some(ptr) = self.reader.take() {
+                let _to_drop = Box::from_raw(ptr);
+            }
+        };
+    }
+
     pub(crate) fn new(
-        path: PathBuf,
-        schema: SchemaRef,
+        paths: Arc<[PathBuf]>,
+        file_info: FileInfo,
         options: CsvParserOptions,
+        cloud_options: Option<CloudOptions>,
         file_options: FileScanOptions,
         verbose: bool,
     ) -> PolarsResult<Self> {
+        let hive_schema = file_info
+            .hive_parts
+            .as_ref()
+            .map(|hive| hive.get_statistics().schema().clone());
+
+        // The partition columns are not in the files.
+        let schema = match &hive_schema {
+            Some(hive_schema) => Arc::new(
+                file_info
+                    .schema
+                    .iter()
+                    .filter(|(name, _)| !hive_schema.contains(name))
+                    .map(|(name, dtype)| Field::new(name, dtype.clone()))
+                    .collect::<Schema>(),
+            ),
+            None => file_info.schema.clone(),
+        };
+        let mut with_columns = file_options
+            .with_columns
+            .as_ref()
+            .map(|columns| {
+                columns
+                    .iter()
+                    .filter(|name| hive_schema.as_ref().map_or(true, |s| !s.contains(name)))
+                    .cloned()
+                    .collect::<Vec<_>>()
+            })
+            .filter(|columns| !columns.is_empty());
+
+        // If only partition columns are projected, we still need the number of rows.
+        let mut placeholder = None;
+        let only_hive_columns = hive_schema.is_some()
+            && with_columns.is_none()
+            && file_options
+                .with_columns
+                .as_ref()
+                .is_some_and(|columns| !columns.is_empty());
+        if only_hive_columns {
+            placeholder = schema
+                .iter_names()
+                .find(|name| {
+                    file_options
+                        .row_index
+                        .as_ref()
+                        .map_or(true, |ri| ri.name != name.as_str())
+                })
+                .map(|name| name.to_string());
+            with_columns = placeholder.clone().map(|name| vec![name]);
+        }
+
+        let row_size = match &with_columns {
+            Some(columns) => estimated_row_size(columns.iter().filter_map(|name| schema.get(name))),
+            None => estimated_row_size(schema.iter_dtypes()),
+        };
+        // inversely scale the chunk size by the number of threads so that we reduce memory pressure
+        // in streaming
+        let chunk_size = determine_chunk_size(row_size, POOL.current_num_threads())?;
+
+        if verbose {
+            eprintln!("STREAMING CHUNK SIZE: {chunk_size} rows")
+        }
+
         Ok(CsvSource {
             schema,
             reader: None,
             batched_reader: None,
+            stream_reader: None,
             n_threads: POOL.current_num_threads(),
-            path: Some(path),
-            options: Some(options),
-            file_options: Some(file_options),
+            paths,
+            path_index: 0,
+            file_info,
+            options,
+            cloud_options,
+            file_options,
+            with_columns,
+            placeholder,
+            hive_columns: None,
+            chunk_size,
+            rows_read: 0,
             verbose,
         })
     }
@@ -125,21 +237,7 @@ impl CsvSource {
 
 impl Drop for CsvSource {
     fn drop(&mut self) {
-        unsafe {
-            match self.batched_reader {
-                Some(Either::Left(ptr)) => {
-                    let _to_drop = Box::from_raw(ptr);
-                },
-                Some(Either::Right(ptr)) => {
-                    let _to_drop = Box::from_raw(ptr);
-                },
-                // nothing initialized, nothing to drop
-                _ => {},
-            }
-            if let Some(ptr) = self.reader {
-                let _to_drop = Box::from_raw(ptr);
-            }
-        };
+        self.drop_reader()
     }
 }
 
@@ -148,38 +246,63 @@ unsafe impl Sync for CsvSource {}
 
 impl Source for CsvSource {
     fn get_batches(&mut self, _context: &PExecutionContext) -> PolarsResult<SourceResult> {
-        if self.reader.is_none() {
-            self.init_reader()?
-        }
-
-        let batches = match self.batched_reader.unwrap() {
-            Either::Left(batched_reader) => {
-                let reader = unsafe { &mut *batched_reader };
+        let batches = loop {
+            if self.reader.is_none() && self.stream_reader.is_none() {
+                let n_rows = _set_n_rows_for_scan(self.file_options.n_rows);
+                if self.path_index == self.paths.len() || n_rows == Some(self.rows_read) {
+                    return Ok(SourceResult::Finished);
+                }
+                if self.verbose && self.paths.len() > 1 {
+                    eprintln!("csv source: reading {:?}", self.paths[self.path_index])
+                }
+                self.init_reader()?
+            }
 
+            let batches = if let Some(reader) = self.stream_reader.as_mut() {
                 reader.next_batches(self.n_threads)?
-            },
-            Either::Right(batched_reader) => {
-                let reader = unsafe { &mut *batched_reader };
+            } else {
+                match self.batched_reader.unwrap() {
+                    Either::Left(batched_reader) => {
+                        let reader = unsafe { &mut *batched_reader };
 
-                reader.next_batches(self.n_threads)?
-            },
+                        reader.next_batches(self.n_threads)?
+                    },
+                    Either::Right(batched_reader) => {
+                        let reader = unsafe { &mut *batched_reader };
+
+                        reader.next_batches(self.n_threads)?
+                    },
+                }
+            };
+            match batches {
+                Some(batches) => break batches,
+                // Continue with the next file.
+                None => self.drop_reader(),
+            }
         };
-        Ok(match batches {
-            None => SourceResult::Finished,
-            Some(batches) => {
-                let index = get_source_index(0);
-                let out = batches
-                    .into_iter()
-                    .enumerate_u32()
-                    .map(|(i, data)| DataChunk {
-                        chunk_index: (index + i) as IdxSize,
-                        data,
-                    })
-                    .collect::<Vec<_>>();
-                get_source_index(out.len() as u32);
-                SourceResult::GotMoreData(out)
-            },
-        })
+
+        let index = get_source_index(0);
+        let out = batches
+            .into_iter()
+            .map(|mut data| {
+                let height = data.height();
+                self.rows_read += height;
+                if let Some(name) = &self.placeholder {
+                    data.drop_in_place(name)?;
+                }
+                materialize_hive_partitions(&mut data, self.hive_columns.as_deref(), height);
+                Ok(data)
+            })
+            .enumerate_u32()
+            .map(|(i, data)| {
+                Ok(DataChunk {
+                    chunk_index: (index + i) as IdxSize,
+                    data: data?,
+                })
+            })
+            .collect::<PolarsResult<Vec<_>>>()?;
+        get_source_index(out.len() as u32);
+        Ok(SourceResult::GotMoreData(out))
     }
     fn fmt(&self) -> &str {
         "csv"
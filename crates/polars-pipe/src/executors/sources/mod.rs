@@ -2,8 +2,12 @@
 mod csv;
 mod frame;
 mod ipc_one_shot;
+#[cfg(feature = "json")]
+mod ndjson;
 #[cfg(feature = "parquet")]
 mod parquet;
+#[cfg(feature = "python")]
+mod python;
 mod reproject;
 mod union;
 
@@ -13,12 +17,16 @@ use std::sync::atomic::{AtomicU32, Ordering};
 pub(crate) use csv::CsvSource;
 pub(crate) use frame::*;
 pub(crate) use ipc_one_shot::*;
+#[cfg(feature = "json")]
+pub(crate) use ndjson::NDJsonSource;
 #[cfg(feature = "parquet")]
 pub(crate) use parquet::*;
+#[cfg(feature = "python")]
+pub(crate) use python::*;
 pub(crate) use reproject::*;
 pub(crate) use union::*;
 
-#[cfg(feature = "csv")]
+#[cfg(any(feature = "csv", feature = "json"))]
 use super::*;
 
 static CHUNK_INDEX: AtomicU32 = AtomicU32::new(0);
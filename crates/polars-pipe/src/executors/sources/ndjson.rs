@@ -0,0 +1,196 @@
+use std::num::NonZeroUsize;
+use std::path::PathBuf;
+
+use polars_core::POOL;
+use polars_io::ndjson::core::{BatchedJsonLineReader, JsonLineReader};
+use polars_io::ndjson::NDJsonReadOptions;
+use polars_io::utils::materialize_hive_partitions;
+use polars_plan::global::_set_n_rows_for_scan;
+use polars_plan::logical_plan::FileInfo;
+use polars_plan::prelude::FileScanOptions;
+use polars_utils::iter::EnumerateIdxTrait;
+
+use super::*;
+use crate::pipeline::{determine_chunk_size, estimated_row_size};
+
+pub(crate) struct NDJsonSource {
+    /// The schema of the columns that are read from the files.
+    schema: SchemaRef,
+    reader: Option<BatchedJsonLineReader>,
+    n_threads: usize,
+    paths: Arc<[PathBuf]>,
+    path_index: usize,
+    file_info: FileInfo,
+    options: NDJsonReadOptions,
+    file_options: FileScanOptions,
+    // The file column that is only read to determine the number of rows, if only
+    // Hive partition columns or the row index are projected.
+    placeholder: Option<String>,
+    hive_columns: Option<Vec<Series>>,
+    chunk_size: usize,
+    rows_read: usize,
+    verbose: bool,
+}
+
+impl NDJsonSource {
+    // Delay initializing the reader
+    // otherwise all files would be opened during construction of the pipeline
+    // leading to Too many Open files error
+    fn init_reader(&mut self) -> PolarsResult<()> {
+        let path = self.paths[self.path_index].clone();
+        self.path_index += 1;
+
+        let n_rows = _set_n_rows_for_scan(self.file_options.n_rows)
+            .map(|n_rows| n_rows.saturating_sub(self.rows_read));
+
+        if self.file_info.hive_parts.is_some() {
+            self.file_info.update_hive_partitions(&path)?;
+            self.hive_columns = self
+                .file_info
+                .hive_parts
+                .as_ref()
+                .map(|hive| hive.materialize_partition_columns());
+        }
+
+        let reader = JsonLineReader::from_path(&path)?
+            .with_schema(self.schema.clone())
+            .with_n_rows(n_rows)
+            .with_chunk_size(NonZeroUsize::new(self.chunk_size))
+            .with_ignore_errors(self.options.ignore_errors)
+            .batched()?;
+        self.reader = Some(reader);
+        Ok(())
+    }
+
+    pub(crate) fn new(
+        paths: Arc<[PathBuf]>,
+        file_info: FileInfo,
+        options: NDJsonReadOptions,
+        file_options: FileScanOptions,
+        verbose: bool,
+    ) -> PolarsResult<Self> {
+        // The schema is inferred when the plan is converted, it is enforced on every file.
+        let full_schema = options.schema.clone().unwrap();
+        let hive_schema = file_info
+            .hive_parts
+            .as_ref()
+            .map(|hive| hive.get_statistics().schema().clone());
+        let is_file_column = |name: &str| {
+            hive_schema.as_ref().map_or(true, |s| !s.contains(name))
+                && file_options
+                    .row_index
+                    .as_ref()
+                    .map_or(true, |ri| ri.name != name)
+        };
+
+        let mut schema = match &file_options.with_columns {
+            Some(with_columns) => Arc::new(
+                full_schema
+                    .iter()
+                    .filter(|(name, _)| {
+                        is_file_column(name) && with_columns.iter().any(|c| c == name.as_str())
+                    })
+                    .map(|(name, dtype)| Field::new(name, dtype.clone()))
+                    .collect::<Schema>(),
+            ),
+            None => Arc::new(
+                full_schema
+                    .iter()
+                    .filter(|(name, _)| is_file_column(name))
+                    .map(|(name, dtype)| Field::new(name, dtype.clone()))
+                    .collect::<Schema>(),
+            ),
+        };
+
+        // If no column of the files is projected, we still need the number of rows.
+        let mut placeholder = None;
+        if schema.is_empty() {
+            if let Some((name, dtype)) = full_schema.get_at_index(0) {
+                placeholder = Some(name.to_string());
+                schema = Arc::new(Schema::from_iter([Field::new(name, dtype.clone())]));
+            }
+        }
+
+        // inversely scale the chunk size by the number of threads so that we reduce memory pressure
+        // in streaming
+        let n_threads = options
+            .n_threads
+            .unwrap_or_else(|| POOL.current_num_threads());
+        let chunk_size = determine_chunk_size(estimated_row_size(schema.iter_dtypes()), n_threads)?;
+
+        if verbose {
+            eprintln!("STREAMING CHUNK SIZE: {chunk_size} rows")
+        }
+
+        Ok(NDJsonSource {
+            schema,
+            reader: None,
+            n_threads,
+            paths,
+            path_index: 0,
+            file_info,
+            options,
+            file_options,
+            placeholder,
+            hive_columns: None,
+            chunk_size,
+            rows_read: 0,
+            verbose,
+        })
+    }
+}
+
+impl Source for NDJsonSource {
+    fn get_batches(&mut self, _context: &PExecutionContext) -> PolarsResult<SourceResult> {
+        let batches = loop {
+            if self.reader.is_none() {
+                let n_rows = _set_n_rows_for_scan(self.file_options.n_rows);
+                if self.path_index == self.paths.len() || n_rows == Some(self.rows_read) {
+                    return Ok(SourceResult::Finished);
+                }
+                if self.verbose && self.paths.len() > 1 {
+                    eprintln!("ndjson source: reading {:?}", self.paths[self.path_index])
+                }
+                self.init_reader()?
+            }
+
+            match self.reader.as_mut().unwrap().next_batches(self.n_threads)? {
+                Some(batches) => break batches,
+                // Continue with the next file.
+                None => self.reader = None,
+            }
+        };
+
+        let index = get_source_index(0);
+        let out = batches
+            .into_iter()
+            .map(|mut data| {
+                let height = data.height();
+                if let Some(row_index) = &self.file_options.row_index {
+                    data.with_row_index_mut(
+                        &row_index.name,
+                        Some(row_index.offset + self.rows_read as IdxSize),
+                    );
+                }
+                self.rows_read += height;
+                if let Some(name) = &self.placeholder {
+                    data.drop_in_place(name)?;
+                }
+                materialize_hive_partitions(&mut data, self.hive_columns.as_deref(), height);
+                Ok(data)
+            })
+            .enumerate_u32()
+            .map(|(i, data)| {
+                Ok(DataChunk {
+                    chunk_index: (index + i) as IdxSize,
+                    data: data?,
+                })
+            })
+            .collect::<PolarsResult<Vec<_>>>()?;
+        get_source_index(out.len() as u32);
+        Ok(SourceResult::GotMoreData(out))
+    }
+    fn fmt(&self) -> &str {
+        "ndjson"
+    }
+}
@@ -1,10 +1,13 @@
 use std::collections::VecDeque;
+#[cfg(feature = "async")]
+use std::future::Future;
 use std::ops::{Deref, Range};
 use std::path::PathBuf;
+use std::sync::atomic::{AtomicUsize, Ordering};
 use std::sync::Arc;
 
 use arrow::datatypes::ArrowSchemaRef;
-use polars_core::config::{self, get_file_prefetch_size};
+use polars_core::config::{self, get_file_prefetch_memory_budget, get_file_prefetch_size};
 use polars_core::error::*;
 use polars_core::prelude::Series;
 use polars_core::POOL;
@@ -25,10 +28,41 @@ use polars_utils::IdxSize;
 
 use crate::executors::sources::get_source_index;
 use crate::operators::{DataChunk, PExecutionContext, Source, SourceResult};
-use crate::pipeline::determine_chunk_size;
+use crate::pipeline::{determine_chunk_size, estimated_row_size};
+
+/// Estimated size in bytes of the files that are read ahead by all parquet sources, which is
+/// bounded by the prefetch memory budget.
+static PREFETCHED_BYTES: AtomicUsize = AtomicUsize::new(0);
+
+/// A reader that holds its estimated size of the prefetch memory budget until it is dropped.
+struct PrefetchedReader {
+    reader: BatchedParquetReader,
+    reserved: usize,
+}
+
+impl PrefetchedReader {
+    fn new(reader: BatchedParquetReader, reserve: bool) -> Self {
+        let reserved = if reserve {
+            reader.estimated_remaining_size()
+        } else {
+            0
+        };
+        PREFETCHED_BYTES.fetch_add(reserved, Ordering::Relaxed);
+        Self { reader, reserved }
+    }
+}
+
+impl Drop for PrefetchedReader {
+    fn drop(&mut self) {
+        PREFETCHED_BYTES.fetch_sub(self.reserved, Ordering::Relaxed);
+    }
+}
 
 pub struct ParquetSource {
-    batched_readers: VecDeque<BatchedParquetReader>,
+    batched_readers: VecDeque<PrefetchedReader>,
+    /// Readers that are being initialized on the async runtime, in the order of the paths.
+    #[cfg(feature = "async")]
+    pending_readers: VecDeque<tokio::task::JoinHandle<PolarsResult<BatchedParquetReader>>>,
     n_threads: usize,
     processed_paths: usize,
     iter: Range<usize>,
@@ -42,6 +76,12 @@ pub struct ParquetSource {
     verbose: bool,
     run_async: bool,
     prefetch_size: usize,
+    #[cfg_attr(not(feature = "async"), allow(dead_code))]
+    memory_budget: usize,
+    /// Estimated size in bytes of a file that is not yet initialized, or 0 if no file was
+    /// initialized yet.
+    #[cfg_attr(not(feature = "async"), allow(dead_code))]
+    file_size_estimate: usize,
     predicate: Option<Arc<dyn PhysicalIoExpr>>,
 }
 
@@ -65,7 +105,7 @@ impl ParquetSource {
         &self,
         index: usize,
     ) -> PolarsResult<(
-        &PathBuf,
+        PathBuf,
         ParquetOptions,
         FileScanOptions,
         Option<Vec<usize>>,
@@ -73,13 +113,13 @@ impl ParquetSource {
         Option<ArrowSchemaRef>,
         Option<Vec<Series>>,
     )> {
-        let path = &self.paths[index];
+        let path = self.paths[index].clone();
         let options = self.options;
         let file_options = self.file_options.clone();
         let schema = self.file_info.schema.clone();
 
         let mut file_info = self.file_info.clone();
-        file_info.update_hive_partitions(path)?;
+        file_info.update_hive_partitions(&path)?;
         let hive_partitions = file_info
             .hive_parts
             .as_ref()
@@ -95,14 +135,21 @@ impl ParquetSource {
             false,
         );
 
-        let n_cols = projection.as_ref().map(|v| v.len()).unwrap_or(schema.len());
-        let chunk_size = determine_chunk_size(n_cols, self.n_threads)?;
+        let row_size = match &projection {
+            Some(projection) => estimated_row_size(
+                projection
+                    .iter()
+                    .filter_map(|i| schema.get_at_index(*i).map(|(_, dtype)| dtype)),
+            ),
+            None => estimated_row_size(schema.iter_dtypes()),
+        };
+        let chunk_size = determine_chunk_size(row_size, self.n_threads)?;
 
         if self.verbose {
             eprintln!("STREAMING CHUNK SIZE: {chunk_size} rows")
         }
 
-        let reader_schema = if self.processed_paths == 0 {
+        let reader_schema = if index == 0 {
             self.file_info.reader_schema.clone()
         } else {
             None
@@ -127,8 +174,9 @@ impl ParquetSource {
             self.prepare_init_reader(index)?;
 
         let batched_reader = {
-            let file = std::fs::File::open(path).unwrap();
+            let file = std::fs::File::open(&path).unwrap();
             ParquetReader::new(file)
+                .with_cached_metadata(&path)?
                 .with_schema(reader_schema)
                 .with_n_rows(file_options.n_rows)
                 .with_row_index(file_options.row_index)
@@ -156,33 +204,67 @@ impl ParquetSource {
                 "schema of all files in a single scan_parquet must be equal",
             )?;
         }
-        self.batched_readers.push_back(batched_reader);
+        let reader = PrefetchedReader::new(batched_reader, self.run_async);
+        if self.run_async {
+            self.file_size_estimate = reader.reserved.max(1);
+        }
+        self.batched_readers.push_back(reader);
         self.processed_paths += 1;
         Ok(())
     }
 
     #[cfg(feature = "async")]
-    async fn init_reader_async(&self, index: usize) -> PolarsResult<BatchedParquetReader> {
+    fn init_reader_async(
+        &self,
+        index: usize,
+    ) -> PolarsResult<impl Future<Output = PolarsResult<BatchedParquetReader>> + Send + 'static>
+    {
         let metadata = self.metadata.clone();
         let predicate = self.predicate.clone();
         let cloud_options = self.cloud_options.clone();
         let (path, options, file_options, projection, chunk_size, reader_schema, hive_partitions) =
             self.prepare_init_reader(index)?;
 
-        let batched_reader = {
+        Ok(async move {
             let uri = path.to_string_lossy();
             ParquetAsyncReader::from_uri(&uri, cloud_options.as_ref(), reader_schema, metadata)
                 .await?
                 .with_n_rows(file_options.n_rows)
                 .with_row_index(file_options.row_index)
                 .with_projection(projection)
-                .with_predicate(predicate.clone())
+                .with_predicate(predicate)
                 .use_statistics(options.use_statistics)
                 .with_hive_partition_columns(hive_partitions)
                 .batched(chunk_size)
-                .await?
-        };
-        Ok(batched_reader)
+                .await
+        })
+    }
+
+    /// Spawn the initialization of the next files on the async runtime, so that they are
+    /// downloaded while the compute threads process the current file. At most `max_in_flight`
+    /// files are read ahead, as long as their estimated size fits in the memory budget. Until the
+    /// first file is initialized its size is unknown, so only a single file is read ahead. If
+    /// `must_progress` is set, a single file is always allowed, otherwise the scan could not
+    /// make progress.
+    #[cfg(feature = "async")]
+    fn spawn_prefetches(&mut self, max_in_flight: usize, must_progress: bool) -> PolarsResult<()> {
+        loop {
+            let in_flight = self.batched_readers.len() + self.pending_readers.len();
+            if in_flight >= max_in_flight || (self.file_size_estimate == 0 && in_flight > 0) {
+                break;
+            }
+            let reserved = PREFETCHED_BYTES.load(Ordering::Relaxed)
+                + (self.pending_readers.len() + 1) * self.file_size_estimate;
+            if !(must_progress && in_flight == 0) && reserved > self.memory_budget {
+                break;
+            }
+            let Some(index) = self.iter.next() else {
+                break;
+            };
+            let fut = self.init_reader_async(index)?;
+            self.pending_readers.push_back(get_runtime().spawn(fut));
+        }
+        Ok(())
     }
 
     #[allow(unused_variables)]
@@ -202,13 +284,17 @@ impl ParquetSource {
         let iter = 0..paths.len();
 
         let prefetch_size = get_file_prefetch_size();
+        let memory_budget = get_file_prefetch_memory_budget();
         if verbose {
-            eprintln!("POLARS PREFETCH_SIZE: {}", prefetch_size)
+            eprintln!("POLARS PREFETCH_SIZE: {}", prefetch_size);
+            eprintln!("POLARS PREFETCH_MEMORY_BUDGET: {}", memory_budget)
         }
         let run_async = paths.first().map(is_cloud_url).unwrap_or(false) || config::force_async();
 
         let mut source = ParquetSource {
             batched_readers: VecDeque::new(),
+            #[cfg(feature = "async")]
+            pending_readers: VecDeque::new(),
             n_threads,
             processed_paths: 0,
             options,
@@ -221,67 +307,76 @@ impl ParquetSource {
             verbose,
             run_async,
             prefetch_size,
+            memory_budget,
+            file_size_estimate: 0,
             predicate,
         };
+        source.metadata = None;
         // Already start downloading when we deal with cloud urls.
-        if run_async {
-            source.init_next_reader()?;
-            source.metadata = None;
-        }
+        source.prefetch()?;
         Ok(source)
     }
 
     fn prefetch_files(&mut self) -> PolarsResult<()> {
-        // We already start downloading the next file, we can only do that if we don't have a limit.
-        // In the case of a limit we first must update the row count with the batch results.
-        //
-        // It is important we do this for a reasonable batch size, that's why we start this when we
-        // have just 2 readers left.
-        if self.batched_readers.len() <= 2 && self.file_options.n_rows.is_none()
-            || self.batched_readers.is_empty()
-        {
-            let range = 0..self.prefetch_size - self.batched_readers.len();
-
-            if self.run_async {
-                #[cfg(not(feature = "async"))]
-                panic!("activate 'async' feature");
-
-                #[cfg(feature = "async")]
-                {
-                    let range = range
-                        .zip(&mut self.iter)
-                        .map(|(_, index)| index)
-                        .collect::<Vec<_>>();
-                    let init_iter = range.into_iter().map(|index| self.init_reader_async(index));
-
-                    let batched_readers = polars_io::pl_async::get_runtime()
-                        .block_on_potential_spawn(async {
-                            futures::future::try_join_all(init_iter).await
-                        })?;
-
-                    for r in batched_readers {
-                        self.finish_init_reader(r)?;
+        if self.run_async {
+            #[cfg(not(feature = "async"))]
+            panic!("activate 'async' feature");
+
+            #[cfg(feature = "async")]
+            {
+                // We keep downloading the next files in the background, we can only do that if we
+                // don't have a limit. In the case of a limit we first must update the row count
+                // with the batch results.
+                let max_in_flight = if self.file_options.n_rows.is_none() {
+                    self.prefetch_size
+                } else {
+                    1
+                };
+                self.spawn_prefetches(max_in_flight, true)?;
+
+                // Only block if the compute threads have nothing left to process.
+                if self.batched_readers.is_empty() {
+                    if let Some(handle) = self.pending_readers.pop_front() {
+                        let batched_reader = get_runtime()
+                            .block_on_potential_spawn(handle)
+                            .map_err(to_compute_err)??;
+                        self.finish_init_reader(batched_reader)?;
                     }
                 }
-            } else {
-                for _ in 0..self.prefetch_size - self.batched_readers.len() {
-                    self.init_next_reader()?
-                }
+            }
+        } else if self.batched_readers.len() <= 2 && self.file_options.n_rows.is_none()
+            || self.batched_readers.is_empty()
+        {
+            // It is important we do this for a reasonable batch size, that's why we start this
+            // when we have just 2 readers left.
+            for _ in 0..self.prefetch_size - self.batched_readers.len() {
+                self.init_next_reader()?
             }
         }
         Ok(())
     }
 }
 
+#[cfg(feature = "async")]
+impl Drop for ParquetSource {
+    fn drop(&mut self) {
+        // Stop reading ahead files that will not be used, e.g. after a limit or an error.
+        for handle in &self.pending_readers {
+            handle.abort();
+        }
+    }
+}
+
 impl Source for ParquetSource {
     fn get_batches(&mut self, _context: &PExecutionContext) -> PolarsResult<SourceResult> {
         self.prefetch_files()?;
 
-        let Some(mut reader) = self.batched_readers.pop_front() else {
+        let Some(mut prefetched) = self.batched_readers.pop_front() else {
             // If there was no new reader, we depleted all of them and are finished.
             return Ok(SourceResult::Finished);
         };
 
+        let reader = &mut prefetched.reader;
         let batches =
             get_runtime().block_on_potential_spawn(reader.next_batches(self.n_threads))?;
 
@@ -292,6 +387,7 @@ impl Source for ParquetSource {
                 }
 
                 // reset the reader
+                drop(prefetched);
                 self.init_next_reader()?;
                 return self.get_batches(_context);
             },
@@ -317,7 +413,7 @@ impl Source for ParquetSource {
                 let result = SourceResult::GotMoreData(out);
                 // We are not yet done with this reader.
                 // Ensure it is used in next iteration.
-                self.batched_readers.push_front(reader);
+                self.batched_readers.push_front(prefetched);
 
                 result
             },
@@ -326,4 +422,14 @@ impl Source for ParquetSource {
     fn fmt(&self) -> &str {
         "parquet"
     }
+
+    fn prefetch(&mut self) -> PolarsResult<()> {
+        #[cfg(feature = "async")]
+        {
+            if self.run_async && self.file_options.n_rows.is_none() {
+                self.spawn_prefetches(self.prefetch_size, false)?;
+            }
+        }
+        Ok(())
+    }
 }
@@ -0,0 +1,128 @@
+use std::sync::Arc;
+
+use polars_core::error::to_compute_err;
+use polars_core::prelude::*;
+use polars_core::POOL;
+use polars_plan::prelude::PythonOptions;
+use pyo3::prelude::*;
+use pyo3::types::PyIterator;
+
+use crate::executors::sources::get_source_index;
+use crate::operators::{DataChunk, PExecutionContext, Source, SourceResult};
+
+/// A source that pulls `DataFrame` batches from a python generator.
+///
+/// The python scan function is only called once the first batch is requested.
+/// Every call to `get_batches` then advances the generator at most `n_threads`
+/// times, so the python side never produces more data than the pipeline
+/// can consume.
+pub(crate) struct PythonSource {
+    options: PythonOptions,
+    batches: Option<PyObject>,
+    n_threads: usize,
+    verbose: bool,
+}
+
+impl PythonSource {
+    pub(crate) fn new(options: PythonOptions, verbose: bool) -> Self {
+        Self {
+            options,
+            batches: None,
+            n_threads: POOL.current_num_threads(),
+            verbose,
+        }
+    }
+
+    // Delay calling the scan function
+    // otherwise the python side would start reading during construction of the pipeline
+    fn init_batches(&mut self, py: Python) -> PolarsResult<()> {
+        if self.verbose {
+            eprintln!("run PythonSource")
+        }
+        let with_columns = self
+            .options
+            .with_columns
+            .take()
+            .map(|mut cols| std::mem::take(Arc::make_mut(&mut cols)));
+        let pyarrow_predicate = self.options.predicate.take();
+        let n_rows = self.options.n_rows.take();
+
+        let pl = PyModule::import_bound(py, "polars").map_err(to_compute_err)?;
+        let utils = pl.getattr("_utils").map_err(to_compute_err)?;
+        let callable = utils
+            .getattr("_execute_batches_from_rust")
+            .map_err(to_compute_err)?;
+
+        let python_scan_function = self.options.scan_fn.take().unwrap().0;
+        let batches = callable
+            .call1((
+                python_scan_function,
+                with_columns,
+                pyarrow_predicate,
+                n_rows,
+            ))
+            .map_err(to_compute_err)?;
+        self.batches = Some(batches.unbind());
+        Ok(())
+    }
+}
+
+fn python_df_to_rust(py_df: Bound<PyAny>) -> PolarsResult<DataFrame> {
+    let pydf = py_df.getattr("_df").map_err(to_compute_err)?;
+    let raw_parts = pydf
+        .call_method0("into_raw_parts")
+        .map_err(to_compute_err)?;
+    let (ptr, len, cap) = raw_parts
+        .extract::<(usize, usize, usize)>()
+        .map_err(to_compute_err)?;
+    unsafe {
+        Ok(DataFrame::new_no_checks(Vec::from_raw_parts(
+            ptr as *mut Series,
+            len,
+            cap,
+        )))
+    }
+}
+
+impl Source for PythonSource {
+    fn get_batches(&mut self, context: &PExecutionContext) -> PolarsResult<SourceResult> {
+        let dfs = Python::with_gil(|py| {
+            if self.batches.is_none() {
+                self.init_batches(py)?;
+            }
+            let batches = self.batches.as_ref().unwrap().bind(py);
+            let iter = PyIterator::from_bound_object(batches).map_err(to_compute_err)?;
+            iter.take(self.n_threads)
+                .map(|df| python_df_to_rust(df.map_err(to_compute_err)?))
+                .collect::<PolarsResult<Vec<_>>>()
+        })?;
+
+        if dfs.is_empty() {
+            return Ok(SourceResult::Finished);
+        }
+
+        let idx_offset = get_source_index(0);
+        let chunks = dfs
+            .into_iter()
+            .flat_map(|df| df.split_chunks())
+            .filter(|df| df.height() > 0)
+            .enumerate()
+            .map(|(chunk_index, data)| DataChunk {
+                chunk_index: (chunk_index as u32 + idx_offset) as IdxSize,
+                data,
+            })
+            .collect::<Vec<_>>();
+        get_source_index(chunks.len() as u32);
+
+        if chunks.is_empty() {
+            // Only empty batches were produced, ask the generator again.
+            self.get_batches(context)
+        } else {
+            Ok(SourceResult::GotMoreData(chunks))
+        }
+    }
+
+    fn fmt(&self) -> &str {
+        "python-scan"
+    }
+}
@@ -24,7 +24,13 @@ impl Source for UnionSource {
             let src = &mut self.sources[self.source_index];
             match src.get_batches(context)? {
                 SourceResult::Finished => self.source_index += 1,
-                SourceResult::GotMoreData(chunks) => return Ok(SourceResult::GotMoreData(chunks)),
+                SourceResult::GotMoreData(chunks) => {
+                    // Let the next sources read ahead while these chunks are processed.
+                    for src in &mut self.sources[self.source_index + 1..] {
+                        src.prefetch()?;
+                    }
+                    return Ok(SourceResult::GotMoreData(chunks));
+                },
             }
         }
         Ok(SourceResult::Finished)
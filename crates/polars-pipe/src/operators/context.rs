@@ -2,23 +2,33 @@ use std::any::Any;
 
 use polars_core::prelude::*;
 
+use crate::pipeline::StreamingProfiler;
+
 pub trait SExecutionContext: Send + Sync {
     fn as_any(&self) -> &dyn Any;
 
     fn should_stop(&self) -> PolarsResult<()>;
+
+    /// The profiler that collects the metrics of the pipelines, if the query is profiled.
+    fn profiler(&self) -> Option<Arc<StreamingProfiler>> {
+        None
+    }
 }
 
 pub struct PExecutionContext {
     // injected upstream in polars-lazy
     pub(crate) execution_state: Box<dyn SExecutionContext>,
     pub(crate) verbose: bool,
+    pub(crate) profiler: Option<Arc<StreamingProfiler>>,
 }
 
 impl PExecutionContext {
     pub(crate) fn new(state: Box<dyn SExecutionContext>, verbose: bool) -> Self {
+        let profiler = state.profiler();
         PExecutionContext {
             execution_state: state,
             verbose,
+            profiler,
         }
     }
 }
@@ -9,4 +9,10 @@ pub trait Source: Send + Sync {
     fn get_batches(&mut self, context: &PExecutionContext) -> PolarsResult<SourceResult>;
 
     fn fmt(&self) -> &str;
+
+    /// Start reading ahead in the background, e.g. while a preceding source of a union is still
+    /// being consumed.
+    fn prefetch(&mut self) -> PolarsResult<()> {
+        Ok(())
+    }
 }
@@ -101,12 +101,13 @@ where
                 #[cfg(feature = "csv")]
                 FileScan::Csv {
                     options: csv_options,
+                    cloud_options,
                 } => {
-                    assert_eq!(paths.len(), 1);
                     let src = sources::CsvSource::new(
-                        paths[0].clone(),
-                        file_info.schema,
+                        paths,
+                        file_info,
                         csv_options,
+                        cloud_options,
                         file_options,
                         verbose,
                     )?;
@@ -132,6 +133,9 @@ where
                                 fn evaluate_io(&self, df: &DataFrame) -> PolarsResult<Series> {
                                     self.p.evaluate_io(df)
                                 }
+                                fn live_variables(&self) -> Option<Vec<Arc<str>>> {
+                                    self.p.live_variables()
+                                }
                                 fn as_stats_evaluator(&self) -> Option<&dyn StatsEvaluator> {
                                     self.p.as_stats_evaluator()
                                 }
@@ -152,9 +156,27 @@ where
                     )?;
                     Ok(Box::new(src) as Box<dyn Source>)
                 },
+                #[cfg(feature = "json")]
+                FileScan::NDJson { options } => {
+                    let src = sources::NDJsonSource::new(
+                        paths,
+                        file_info,
+                        options,
+                        file_options,
+                        verbose,
+                    )?;
+                    Ok(Box::new(src) as Box<dyn Source>)
+                },
                 _ => todo!(),
             }
         },
+        #[cfg(feature = "python")]
+        PythonScan { options, .. } => {
+            // The predicate is either pushed down to pyarrow or applied in a
+            // `Filter` node above this scan.
+            let src = sources::PythonSource::new(options, verbose);
+            Ok(Box::new(src) as Box<dyn Source>)
+        },
         _ => unreachable!(),
     }
 }
@@ -185,7 +207,7 @@ where
                     match &file_type {
                         #[cfg(feature = "parquet")]
                         FileType::Parquet(options) => {
-                            Box::new(ParquetSink::new(path, *options, input_schema.as_ref())?)
+                            Box::new(ParquetSink::new(path, options.clone(), input_schema.as_ref())?)
                                 as Box<dyn SinkTrait>
                         },
                         #[cfg(feature = "ipc")]
@@ -221,7 +243,7 @@ where
                         FileType::Parquet(parquet_options) => Box::new(ParquetCloudSink::new(
                             uri.as_ref().as_str(),
                             cloud_options.as_ref(),
-                            *parquet_options,
+                            parquet_options.clone(),
                             lp_arena.get(*input).schema(lp_arena).as_ref(),
                         )?)
                             as Box<dyn SinkTrait>,
@@ -237,6 +259,26 @@ where
                         other_file_type => todo!("Cloud-sinking of the file type {other_file_type:?} is not (yet) supported."),
                     }
                 },
+                #[allow(unused_variables)]
+                SinkType::Partitioned {
+                    path,
+                    file_type,
+                    options,
+                } => {
+                    #[cfg(any(feature = "parquet", feature = "ipc", feature = "csv"))]
+                    {
+                        Box::new(PartitionedSink::new(
+                            path.clone(),
+                            file_type.clone(),
+                            options.clone(),
+                            input_schema.as_ref(),
+                        )?) as Box<dyn SinkTrait>
+                    }
+                    #[cfg(not(any(feature = "parquet", feature = "ipc", feature = "csv")))]
+                    {
+                        polars_bail!(InvalidOperation: "partitioned sink requires the parquet, ipc or csv feature")
+                    }
+                },
             }
         },
         Join {
@@ -302,6 +344,37 @@ where
                                 placeholder,
                             )) as Box<dyn SinkTrait>
                         },
+                        #[cfg(feature = "semi_anti_join")]
+                        join_type @ JoinType::Semi | join_type @ JoinType::Anti => {
+                            let (join_columns_left, join_columns_right) = swap_eval();
+
+                            Box::new(GenericBuild::<()>::new(
+                                Arc::from(options.args.suffix()),
+                                join_type.clone(),
+                                swapped,
+                                join_columns_left,
+                                join_columns_right,
+                                options.args.join_nulls,
+                                node,
+                                // We don't need the key names for these joins.
+                                vec![].into(),
+                                vec![].into(),
+                                placeholder,
+                            )) as Box<dyn SinkTrait>
+                        },
+                        #[cfg(feature = "asof_join")]
+                        JoinType::AsOf(_) => {
+                            // The as-of join is not hash based, the right table is
+                            // always the build side.
+                            debug_assert!(swapped);
+                            Box::new(AsOfJoinBuild::new(
+                                options.args.clone(),
+                                join_columns_left[0].clone(),
+                                join_columns_right[0].clone(),
+                                node,
+                                placeholder,
+                            )) as Box<dyn SinkTrait>
+                        },
                         JoinType::Outer { .. } => {
                             // First get the names before we (potentially) swap.
                             let key_names_left = join_columns_left
@@ -701,6 +774,15 @@ where
                 true,
                 verbose,
             )?,
+            #[cfg(feature = "python")]
+            lp @ PythonScan { .. } => get_source(
+                lp.clone(),
+                &mut operator_objects,
+                expr_arena,
+                &to_physical,
+                true,
+                verbose,
+            )?,
             Union { inputs, .. } => {
                 let sources = inputs
                     .iter()
@@ -766,8 +848,21 @@ where
     ))
 }
 
+/// Joins that filter or extend the rows of the left table always stream the left
+/// table and build the right table. This maintains the order of the left table.
+fn streams_left(how: &JoinType) -> bool {
+    match how {
+        JoinType::Left => true,
+        #[cfg(feature = "semi_anti_join")]
+        JoinType::Semi | JoinType::Anti => true,
+        #[cfg(feature = "asof_join")]
+        JoinType::AsOf(_) => true,
+        _ => false,
+    }
+}
+
 pub fn swap_join_order(options: &JoinOptions) -> bool {
-    matches!(options.args.how, JoinType::Left)
+    streams_left(&options.args.how)
         || match (options.rows_left, options.rows_right) {
             ((Some(left), _), (Some(right), _)) => left > right,
             ((_, left), (_, right)) => left > right,
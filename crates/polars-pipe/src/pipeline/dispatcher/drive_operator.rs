@@ -5,6 +5,7 @@ use crate::pipeline::*;
 /// works thread local.
 /// The caller passes an `operator_start`/`operator_end` to indicate which part of the pipeline
 /// branch should be executed.
+/// Also returns the time the threads waited on the source after they processed the chunks.
 #[allow(clippy::too_many_arguments)]
 pub(super) fn par_process_chunks(
     chunks: Vec<DataChunk>,
@@ -15,8 +16,12 @@ pub(super) fn par_process_chunks(
     operator_end: usize,
     src: &mut Box<dyn Source>,
     must_flush: &AtomicBool,
-) -> PolarsResult<(Option<SinkResult>, SourceResult)> {
+) -> PolarsResult<(Option<SinkResult>, SourceResult, Duration)> {
     debug_assert!(chunks.len() <= sink.len());
+    // Nanoseconds since `start` at which the last chunk and the next batches were done.
+    let start = Instant::now();
+    let chunks_done = AtomicU64::new(0);
+    let source_done = AtomicU64::new(0);
     let sink_results = Arc::new(Mutex::new(None));
     let mut next_batches: Option<PolarsResult<SourceResult>> = None;
     let next_batches_ptr = &mut next_batches as *mut Option<PolarsResult<SourceResult>>;
@@ -40,6 +45,7 @@ pub(super) fn par_process_chunks(
             .zip(operators.iter_mut())
         {
             let sink_results = sink_results.clone();
+            let chunks_done = &chunks_done;
             // Truncate the operators that should run into the current sink.
             let operator_pipe = &mut operator_pipe[operator_start..operator_end];
 
@@ -50,6 +56,8 @@ pub(super) fn par_process_chunks(
                     push_operators_single_thread(chunk, ec, operator_pipe, sink, must_flush)
                 };
 
+                chunks_done.fetch_max(start.elapsed().as_nanos() as u64, Ordering::Relaxed);
+
                 match out {
                     Ok(SinkResult::Finished) | Err(_) => {
                         let mut lock = sink_results.lock().unwrap();
@@ -63,6 +71,7 @@ pub(super) fn par_process_chunks(
         // if one job is finished earlier we can already start that work
         s.spawn(|_| {
             let out = src.get_batches(ec);
+            source_done.store(start.elapsed().as_nanos() as u64, Ordering::Relaxed);
             unsafe {
                 let ptr = next_batches_ptr.get();
                 *ptr = Some(out);
@@ -71,10 +80,15 @@ pub(super) fn par_process_chunks(
     });
 
     let next_batches = next_batches.unwrap()?;
+    let wait = Duration::from_nanos(
+        source_done
+            .into_inner()
+            .saturating_sub(chunks_done.into_inner()),
+    );
     let mut lock = sink_results.lock().unwrap();
     lock.take()
         .transpose()
-        .map(|sink_result| (sink_result, next_batches))
+        .map(|sink_result| (sink_result, next_batches, wait))
 }
 
 /// This thread local logic that pushed a data chunk into the operators + sink
@@ -106,7 +120,10 @@ pub(super) fn push_operators_single_thread(
                 let op = op.get_mut();
                 match op.execute(ec, &chunk)? {
                     OperatorResult::Finished(chunk) => {
-                        must_flush.store(op.must_flush(), Ordering::Relaxed);
+                        // Don't reset the flag if an earlier operator must be flushed.
+                        if op.must_flush() {
+                            must_flush.store(true, Ordering::Relaxed);
+                        }
                         in_process.push((op_i + 1, chunk))
                     },
                     OperatorResult::HaveMoreOutPut(output_chunk) => {
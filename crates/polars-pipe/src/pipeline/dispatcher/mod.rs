@@ -1,8 +1,9 @@
 use std::cell::RefCell;
 use std::fmt::{Debug, Formatter};
 use std::rc::Rc;
-use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::atomic::{AtomicBool, AtomicU64, AtomicUsize, Ordering};
 use std::sync::{Arc, Mutex};
+use std::time::{Duration, Instant};
 
 use polars_core::error::PolarsResult;
 use polars_core::utils::accumulate_dataframes_vertical_unchecked;
@@ -102,6 +103,8 @@ pub struct PipeLine {
     sinks: Vec<ThreadedSink>,
     /// Log runtime info to stderr
     verbose: bool,
+    /// Identifies the pipeline in the metrics of a profiled query.
+    id: usize,
 }
 
 impl PipeLine {
@@ -114,6 +117,7 @@ impl PipeLine {
     ) -> PipeLine {
         // we don't use the power of two partition size here
         // we only do that in the sinks itself.
+        static NEXT_ID: AtomicUsize = AtomicUsize::new(0);
         let n_threads = morsels_per_sink();
 
         // We split so that every thread gets an operator
@@ -132,6 +136,7 @@ impl PipeLine {
             operators,
             sinks,
             verbose,
+            id: NEXT_ID.fetch_add(1, Ordering::Relaxed),
         }
     }
 
@@ -155,14 +160,53 @@ impl PipeLine {
         )
     }
 
+    /// Wrap the sources, operators and sinks, so that their metrics are collected.
+    fn profile(&mut self, profiler: &StreamingProfiler) {
+        self.sources = std::mem::take(&mut self.sources)
+            .into_iter()
+            .enumerate()
+            .map(|(i, src)| profiler.profile_source(self.id, 0, i, src))
+            .collect();
+
+        // The operators are wrapped per position, so that all threads share their metrics.
+        let n_operators = self.operators.first().map_or(0, |ops| ops.len());
+        let mut per_thread = std::mem::take(&mut self.operators)
+            .into_iter()
+            .map(|ops| ops.into_iter())
+            .collect::<Vec<_>>();
+        let mut operators = (0..per_thread.len())
+            .map(|_| Vec::with_capacity(n_operators))
+            .collect::<Vec<ThreadedOperator>>();
+        for _ in 0..n_operators {
+            let ops = per_thread
+                .iter_mut()
+                .map(|ops| ops.next().unwrap().into_inner())
+                .collect();
+            for (thread_ops, op) in operators
+                .iter_mut()
+                .zip(profiler.profile_operators(self.id, ops))
+            {
+                thread_ops.push(op.into());
+            }
+        }
+        self.operators = operators;
+
+        for (i, sink) in self.sinks.iter_mut().enumerate() {
+            sink.sinks = profiler.profile_sinks(self.id, i, std::mem::take(&mut sink.sinks));
+        }
+    }
+
     /// Replace the current sources with a [`DataFrameSource`].
-    fn set_df_as_sources(&mut self, df: DataFrame) {
+    fn set_df_as_sources(&mut self, df: DataFrame, ec: &PExecutionContext, sink_index: usize) {
         let src = Box::new(DataFrameSource::from_df(df)) as Box<dyn Source>;
-        self.set_sources(src)
+        self.set_sources(src, ec, sink_index)
     }
 
-    /// Replace the current sources.
-    fn set_sources(&mut self, src: Box<dyn Source>) {
+    /// Replace the current sources by the source that feeds the sink at `sink_index`.
+    fn set_sources(&mut self, mut src: Box<dyn Source>, ec: &PExecutionContext, sink_index: usize) {
+        if let Some(profiler) = &ec.profiler {
+            src = profiler.profile_source(self.id, sink_index, 0, src);
+        }
         self.sources.clear();
         self.sources.push(src);
     }
@@ -183,7 +227,8 @@ impl PipeLine {
         let mut sink_finished = false;
 
         for (i, mut sink) in std::mem::take(&mut self.sinks).into_iter().enumerate() {
-            for src in &mut std::mem::take(&mut self.sources) {
+            let spilled_at_start = SPILLED_BYTES.load(Ordering::Relaxed);
+            for (j, src) in std::mem::take(&mut self.sources).iter_mut().enumerate() {
                 let mut next_batches = src.get_batches(ec)?;
 
                 let must_flush: AtomicBool = AtomicBool::new(false);
@@ -191,7 +236,7 @@ impl PipeLine {
                     // Every batches iteration we check if we must continue.
                     ec.execution_state.should_stop()?;
 
-                    let (sink_result, next_batches2) = par_process_chunks(
+                    let (sink_result, next_batches2, wait) = par_process_chunks(
                         chunks,
                         &mut sink.sinks,
                         ec,
@@ -202,6 +247,9 @@ impl PipeLine {
                         &must_flush,
                     )?;
                     next_batches = next_batches2;
+                    if let Some(profiler) = &ec.profiler {
+                        profiler.record_wait(self.id, i, j, wait);
+                    }
 
                     if let Some(SinkResult::Finished) = sink_result {
                         sink_finished = true;
@@ -234,6 +282,10 @@ impl PipeLine {
                 })
                 .unwrap();
             operator_start = sink.operator_end;
+            if let Some(profiler) = &ec.profiler {
+                let spilled = SPILLED_BYTES.load(Ordering::Relaxed);
+                profiler.record_spill(self.id, i, spilled.saturating_sub(spilled_at_start));
+            }
 
             let mut shared_sink_count = {
                 let mut shared_sink_count = sink.shared_count.borrow_mut();
@@ -277,8 +329,8 @@ impl PipeLine {
                 let sink_result = reduced_sink.finalize(ec)?;
                 match sink_result {
                     // turn this sink an a new source
-                    FinalizedSink::Finished(df) => self.set_df_as_sources(df),
-                    FinalizedSink::Source(src) => self.set_sources(src),
+                    FinalizedSink::Finished(df) => self.set_df_as_sources(df, ec, i + 1),
+                    FinalizedSink::Source(src) => self.set_sources(src, ec, i + 1),
                     // should not happen
                     FinalizedSink::Operator => {
                         unreachable!()
@@ -315,6 +367,12 @@ pub fn execute_pipeline(
 ) -> PolarsResult<DataFrame> {
     let mut pipeline = pipelines.pop().unwrap();
     let ec = PExecutionContext::new(state, pipeline.verbose);
+    if let Some(profiler) = &ec.profiler {
+        pipeline.profile(profiler);
+        for pipeline in pipelines.iter_mut() {
+            pipeline.profile(profiler);
+        }
+    }
 
     let mut sink_out = pipeline.run_pipeline(&ec, &mut pipelines)?;
     loop {
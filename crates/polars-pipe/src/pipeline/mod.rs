@@ -1,6 +1,10 @@
 mod config;
 mod convert;
 mod dispatcher;
+mod profile;
+
+use std::sync::Mutex;
+use std::time::{Duration, Instant};
 
 pub use convert::{
     create_pipeline, get_dummy_operator, get_operator, get_sink, swap_join_order, CallBacks,
@@ -9,6 +13,9 @@ pub use dispatcher::{execute_pipeline, PipeLine};
 use polars_core::prelude::*;
 use polars_core::POOL;
 use polars_utils::cell::SyncUnsafeCell;
+use polars_utils::sys::MEMINFO;
+pub use profile::StreamingProfiler;
+pub(crate) use profile::SPILLED_BYTES;
 
 pub use crate::executors::sinks::group_by::aggregates::can_convert_to_hash_agg;
 use crate::operators::{Operator, Sink};
@@ -24,17 +31,71 @@ pub(crate) const PARTITION_SIZE: usize = 64;
 // env vars
 pub(crate) static FORCE_OOC: &str = "POLARS_FORCE_OOC";
 
+/// Size in bytes of the chunks we strive to have, 50_000 rows of a single numeric column.
+const IDEAL_CHUNK_BYTES: usize = 50_000 * 8;
+/// Size in bytes we assume for a value of a type without a fixed width, e.g. a string.
+const VARIABLE_WIDTH_VALUE_SIZE: usize = 32;
+/// Number of chunks every thread may hold at once, which must fit in the available memory.
+const CHUNKS_PER_THREAD: usize = 64;
+const MIN_CHUNK_SIZE: usize = 100;
+
+fn estimated_value_size(dtype: &DataType) -> usize {
+    use DataType::*;
+    match dtype.to_physical() {
+        Null => 0,
+        Boolean | UInt8 | Int8 => 1,
+        UInt16 | Int16 => 2,
+        UInt32 | Int32 | Float32 => 4,
+        UInt64 | Int64 | Float64 => 8,
+        #[cfg(feature = "dtype-decimal")]
+        Decimal(_, _) => 16,
+        #[cfg(feature = "dtype-array")]
+        Array(inner, width) => estimated_value_size(&inner) * width,
+        _ => VARIABLE_WIDTH_VALUE_SIZE,
+    }
+}
+
+/// Estimated size in bytes of a row with columns of the given data types.
+pub(crate) fn estimated_row_size<'a>(dtypes: impl IntoIterator<Item = &'a DataType>) -> usize {
+    dtypes.into_iter().map(estimated_value_size).sum()
+}
+
+/// Available memory of the system. This is refreshed at most once a second, as that is
+/// expensive.
+fn available_memory() -> usize {
+    static LATEST: Mutex<Option<(Instant, usize)>> = Mutex::new(None);
+    let mut latest = LATEST.lock().unwrap();
+    match *latest {
+        Some((refreshed, available)) if refreshed.elapsed() < Duration::from_secs(1) => available,
+        _ => {
+            let available = MEMINFO.free() as usize;
+            *latest = Some((Instant::now(), available));
+            available
+        },
+    }
+}
+
 /// ideal chunk size we strive to have
-/// scale the chunk size depending on the number of
-/// columns. With 10 columns we use a chunk size of 40_000
-pub(crate) fn determine_chunk_size(n_cols: usize, n_threads: usize) -> PolarsResult<usize> {
+/// scale the chunk size inversely by the estimated size of a row,
+/// so that string heavy chunks are not larger in memory than numeric ones.
+/// With 10 numeric columns we use a chunk size of 5_000.
+/// Under memory pressure the chunks shrink, so that the chunks of
+/// every thread fit in the available memory.
+pub(crate) fn determine_chunk_size(row_size: usize, n_threads: usize) -> PolarsResult<usize> {
     if let Ok(val) = std::env::var("POLARS_STREAMING_CHUNK_SIZE") {
         val.parse().map_err(
             |_| polars_err!(ComputeError: "could not parse 'POLARS_STREAMING_CHUNK_SIZE' env var"),
         )
     } else {
         let thread_factor = std::cmp::max(12 / n_threads, 1);
-        Ok(std::cmp::max(50_000 / n_cols.max(1) * thread_factor, 1000))
+        let row_size = std::cmp::max(row_size, 1);
+        let chunk_size = std::cmp::max(IDEAL_CHUNK_BYTES / row_size * thread_factor, 1000);
+        let max_chunk_size =
+            available_memory() / (std::cmp::max(n_threads, 1) * CHUNKS_PER_THREAD * row_size);
+        Ok(std::cmp::max(
+            std::cmp::min(chunk_size, max_chunk_size),
+            MIN_CHUNK_SIZE,
+        ))
     }
 }
 
@@ -58,6 +119,10 @@ impl From<Box<dyn Operator>> for PhysOperator {
 }
 
 impl PhysOperator {
+    pub(crate) fn into_inner(self) -> Box<dyn Operator> {
+        self.inner.into_inner()
+    }
+
     pub(crate) fn get_mut(&mut self) -> &mut dyn Operator {
         &mut **self.inner.get_mut()
     }
@@ -0,0 +1,405 @@
+use std::any::Any;
+use std::sync::atomic::{AtomicUsize, Ordering};
+use std::sync::{Arc, Mutex};
+use std::time::{Duration, Instant};
+
+use polars_core::prelude::*;
+use polars_utils::arena::Node;
+
+use crate::operators::{
+    DataChunk, FinalizedSink, Operator, OperatorResult, PExecutionContext, Sink, SinkResult,
+    Source, SourceResult,
+};
+
+/// Estimated size in bytes of the data that out-of-core sinks spilled to disk.
+pub(crate) static SPILLED_BYTES: AtomicUsize = AtomicUsize::new(0);
+
+#[derive(Copy, Clone)]
+enum NodeKind {
+    Source,
+    Operator,
+    Sink,
+}
+
+impl NodeKind {
+    fn as_str(&self) -> &'static str {
+        match self {
+            NodeKind::Source => "source",
+            NodeKind::Operator => "operator",
+            NodeKind::Sink => "sink",
+        }
+    }
+}
+
+#[derive(Default)]
+struct NodeMetrics {
+    rows_in: u64,
+    rows_out: u64,
+    bytes_out: u64,
+    /// Time spent in the node, summed over all threads.
+    busy: Duration,
+    /// Time the compute threads waited on the node.
+    wait: Duration,
+    spilled_bytes: u64,
+    start: Option<Instant>,
+    end: Option<Instant>,
+}
+
+impl NodeMetrics {
+    fn record(&mut self, start: Instant, end: Instant) {
+        self.busy += end - start;
+        self.start = Some(self.start.map_or(start, |s| s.min(start)));
+        self.end = Some(self.end.map_or(end, |e| e.max(end)));
+    }
+
+    fn record_output(&mut self, df: &DataFrame) {
+        self.rows_out += df.height() as u64;
+        self.bytes_out += df.estimated_size() as u64;
+    }
+}
+
+struct ProfiledNode {
+    pipeline: usize,
+    kind: NodeKind,
+    name: String,
+    metrics: Mutex<NodeMetrics>,
+}
+
+type NodeRef = Arc<ProfiledNode>;
+
+/// Collects the metrics of every source, operator and sink of the streaming pipelines of a
+/// query.
+pub struct StreamingProfiler {
+    query_start: Instant,
+    nodes: Mutex<Vec<NodeRef>>,
+    /// The sources and sinks by pipeline and the index of the sink they feed.
+    sources: Mutex<PlHashMap<(usize, usize, usize), NodeRef>>,
+    sinks: Mutex<PlHashMap<(usize, usize), NodeRef>>,
+}
+
+impl StreamingProfiler {
+    /// Create a profiler of which the timings are relative to `query_start`.
+    pub fn new(query_start: Instant) -> Self {
+        Self {
+            query_start,
+            nodes: Default::default(),
+            sources: Default::default(),
+            sinks: Default::default(),
+        }
+    }
+
+    fn register(&self, pipeline: usize, kind: NodeKind, name: &str) -> NodeRef {
+        let node = Arc::new(ProfiledNode {
+            pipeline,
+            kind,
+            name: name.to_string(),
+            metrics: Default::default(),
+        });
+        self.nodes.lock().unwrap().push(node.clone());
+        node
+    }
+
+    /// Wrap the source of `pipeline` at `position` that feeds the sink at `sink_index`.
+    pub(crate) fn profile_source(
+        &self,
+        pipeline: usize,
+        sink_index: usize,
+        position: usize,
+        source: Box<dyn Source>,
+    ) -> Box<dyn Source> {
+        let node = self.register(pipeline, NodeKind::Source, source.fmt());
+        self.sources
+            .lock()
+            .unwrap()
+            .insert((pipeline, sink_index, position), node.clone());
+        Box::new(ProfiledSource {
+            inner: source,
+            node,
+        })
+    }
+
+    /// Wrap the operators of all threads at a single position of `pipeline`.
+    pub(crate) fn profile_operators(
+        &self,
+        pipeline: usize,
+        operators: Vec<Box<dyn Operator>>,
+    ) -> Vec<Box<dyn Operator>> {
+        let node = self.register(pipeline, NodeKind::Operator, operators[0].fmt());
+        operators
+            .into_iter()
+            .map(|op| {
+                Box::new(ProfiledOperator {
+                    inner: op,
+                    node: node.clone(),
+                    has_more_output: false,
+                }) as Box<dyn Operator>
+            })
+            .collect()
+    }
+
+    /// Wrap the sinks of all threads of the sink at `sink_index` of `pipeline`.
+    pub(crate) fn profile_sinks(
+        &self,
+        pipeline: usize,
+        sink_index: usize,
+        sinks: Vec<Box<dyn Sink>>,
+    ) -> Vec<Box<dyn Sink>> {
+        let node = self.register(pipeline, NodeKind::Sink, sinks[0].fmt());
+        self.sinks
+            .lock()
+            .unwrap()
+            .insert((pipeline, sink_index), node.clone());
+        sinks
+            .into_iter()
+            .map(|sink| {
+                Box::new(ProfiledSink {
+                    inner: sink,
+                    node: node.clone(),
+                }) as Box<dyn Sink>
+            })
+            .collect()
+    }
+
+    /// Record that the compute threads waited `wait` on a source.
+    pub(crate) fn record_wait(
+        &self,
+        pipeline: usize,
+        sink_index: usize,
+        position: usize,
+        wait: Duration,
+    ) {
+        if let Some(node) = self
+            .sources
+            .lock()
+            .unwrap()
+            .get(&(pipeline, sink_index, position))
+        {
+            node.metrics.lock().unwrap().wait += wait;
+        }
+    }
+
+    /// Record the bytes that a sink spilled to disk.
+    pub(crate) fn record_spill(&self, pipeline: usize, sink_index: usize, spilled_bytes: usize) {
+        if let Some(node) = self.sinks.lock().unwrap().get(&(pipeline, sink_index)) {
+            node.metrics.lock().unwrap().spilled_bytes += spilled_bytes as u64;
+        }
+    }
+
+    /// The metrics of every node, in the order of the pipelines. The units of the timings are
+    /// microseconds.
+    pub fn finish(&self) -> PolarsResult<DataFrame> {
+        let nodes = self.nodes.lock().unwrap();
+        let micros = |instant: Option<Instant>| {
+            instant.map(|i| i.duration_since(self.query_start).as_micros() as u64)
+        };
+
+        // Number the pipelines in the order in which they were registered.
+        let mut pipeline_ids = PlHashMap::new();
+        let mut pipeline = Vec::with_capacity(nodes.len());
+        let mut name = Vec::with_capacity(nodes.len());
+        let mut kind = Vec::with_capacity(nodes.len());
+        let mut rows_in = Vec::with_capacity(nodes.len());
+        let mut rows_out = Vec::with_capacity(nodes.len());
+        let mut bytes_out = Vec::with_capacity(nodes.len());
+        let mut busy = Vec::with_capacity(nodes.len());
+        let mut wait = Vec::with_capacity(nodes.len());
+        let mut spilled_bytes = Vec::with_capacity(nodes.len());
+        let mut start = Vec::with_capacity(nodes.len());
+        let mut end = Vec::with_capacity(nodes.len());
+        for node in nodes.iter() {
+            let n_pipelines = pipeline_ids.len() as u32;
+            pipeline.push(*pipeline_ids.entry(node.pipeline).or_insert(n_pipelines));
+            name.push(node.name.as_str());
+            kind.push(node.kind.as_str());
+            let metrics = node.metrics.lock().unwrap();
+            rows_in.push(metrics.rows_in);
+            rows_out.push(metrics.rows_out);
+            bytes_out.push(metrics.bytes_out);
+            busy.push(metrics.busy.as_micros() as u64);
+            wait.push(metrics.wait.as_micros() as u64);
+            spilled_bytes.push(metrics.spilled_bytes);
+            start.push(micros(metrics.start));
+            end.push(micros(metrics.end));
+        }
+
+        DataFrame::new(vec![
+            Series::new("pipeline", pipeline),
+            Series::new("node", name),
+            Series::new("kind", kind),
+            Series::new("rows_in", rows_in),
+            Series::new("rows_out", rows_out),
+            Series::new("bytes_out", bytes_out),
+            Series::new("busy", busy),
+            Series::new("wait", wait),
+            Series::new("spilled_bytes", spilled_bytes),
+            Series::new("start", start),
+            Series::new("end", end),
+        ])
+    }
+}
+
+struct ProfiledSource {
+    inner: Box<dyn Source>,
+    node: NodeRef,
+}
+
+impl Source for ProfiledSource {
+    fn get_batches(&mut self, context: &PExecutionContext) -> PolarsResult<SourceResult> {
+        let start = Instant::now();
+        let out = self.inner.get_batches(context);
+        let end = Instant::now();
+
+        let mut metrics = self.node.metrics.lock().unwrap();
+        metrics.record(start, end);
+        if let Ok(SourceResult::GotMoreData(chunks)) = &out {
+            for chunk in chunks {
+                metrics.record_output(&chunk.data);
+            }
+        }
+        out
+    }
+
+    fn fmt(&self) -> &str {
+        self.inner.fmt()
+    }
+
+    fn prefetch(&mut self) -> PolarsResult<()> {
+        self.inner.prefetch()
+    }
+}
+
+struct ProfiledOperator {
+    inner: Box<dyn Operator>,
+    node: NodeRef,
+    /// The operator is called again with the same chunk, which must not be counted twice.
+    has_more_output: bool,
+}
+
+impl ProfiledOperator {
+    fn record(&mut self, start: Instant, rows_in: usize, out: &PolarsResult<OperatorResult>) {
+        let end = Instant::now();
+        let mut metrics = self.node.metrics.lock().unwrap();
+        metrics.record(start, end);
+        metrics.rows_in += rows_in as u64;
+        self.has_more_output = false;
+        match out {
+            Ok(OperatorResult::Finished(chunk)) => metrics.record_output(&chunk.data),
+            Ok(OperatorResult::HaveMoreOutPut(chunk)) => {
+                metrics.record_output(&chunk.data);
+                self.has_more_output = true;
+            },
+            _ => {},
+        }
+    }
+}
+
+impl Operator for ProfiledOperator {
+    fn execute(
+        &mut self,
+        context: &PExecutionContext,
+        chunk: &DataChunk,
+    ) -> PolarsResult<OperatorResult> {
+        let rows_in = if self.has_more_output {
+            0
+        } else {
+            chunk.data.height()
+        };
+        let start = Instant::now();
+        let out = self.inner.execute(context, chunk);
+        self.record(start, rows_in, &out);
+        out
+    }
+
+    fn flush(&mut self) -> PolarsResult<OperatorResult> {
+        let start = Instant::now();
+        let out = self.inner.flush();
+        self.record(start, 0, &out);
+        out
+    }
+
+    fn must_flush(&self) -> bool {
+        self.inner.must_flush()
+    }
+
+    fn split(&self, thread_no: usize) -> Box<dyn Operator> {
+        Box::new(Self {
+            inner: self.inner.split(thread_no),
+            node: self.node.clone(),
+            has_more_output: false,
+        })
+    }
+
+    fn fmt(&self) -> &str {
+        self.inner.fmt()
+    }
+}
+
+struct ProfiledSink {
+    inner: Box<dyn Sink>,
+    node: NodeRef,
+}
+
+impl Sink for ProfiledSink {
+    fn sink(&mut self, context: &PExecutionContext, chunk: DataChunk) -> PolarsResult<SinkResult> {
+        let rows_in = chunk.data.height() as u64;
+        let start = Instant::now();
+        let out = self.inner.sink(context, chunk);
+        let end = Instant::now();
+
+        let mut metrics = self.node.metrics.lock().unwrap();
+        metrics.record(start, end);
+        metrics.rows_in += rows_in;
+        out
+    }
+
+    fn combine(&mut self, other: &mut dyn Sink) {
+        let other = other.as_any().downcast_mut::<Self>().unwrap();
+        let start = Instant::now();
+        self.inner.combine(other.inner.as_mut());
+        self.node
+            .metrics
+            .lock()
+            .unwrap()
+            .record(start, Instant::now());
+    }
+
+    fn split(&self, thread_no: usize) -> Box<dyn Sink> {
+        Box::new(Self {
+            inner: self.inner.split(thread_no),
+            node: self.node.clone(),
+        })
+    }
+
+    fn finalize(&mut self, context: &PExecutionContext) -> PolarsResult<FinalizedSink> {
+        let spilled_at_start = SPILLED_BYTES.load(Ordering::Relaxed);
+        let start = Instant::now();
+        let out = self.inner.finalize(context);
+        let end = Instant::now();
+
+        let mut metrics = self.node.metrics.lock().unwrap();
+        metrics.record(start, end);
+        metrics.spilled_bytes += SPILLED_BYTES
+            .load(Ordering::Relaxed)
+            .saturating_sub(spilled_at_start) as u64;
+        if let Ok(FinalizedSink::Finished(df)) = &out {
+            metrics.record_output(df);
+        }
+        out
+    }
+
+    fn as_any(&mut self) -> &mut dyn Any {
+        self
+    }
+
+    fn fmt(&self) -> &str {
+        self.inner.fmt()
+    }
+
+    fn is_join_build(&self) -> bool {
+        self.inner.is_join_build()
+    }
+
+    fn node(&self) -> Node {
+        self.inner.node()
+    }
+}
@@ -162,6 +162,7 @@ impl DslPlan {
                 input,
                 id: cache_id,
                 cache_hits,
+                ..
             } => {
                 // Always increment cache ids as the `DotNode[0, 0]` will insert a new graph, which we don't want.
                 let cache_id = cache_id.saturating_add(1);
@@ -402,6 +403,7 @@ impl DslPlan {
                         SinkType::File { .. } => "SINK (FILE)",
                         #[cfg(feature = "cloud")]
                         SinkType::Cloud { .. } => "SINK (CLOUD)",
+                        SinkType::Partitioned { .. } => "SINK (PARTITIONED)",
                     },
                 };
                 self.write_dot(acc_str, prev_node, current_node, id_map)?;
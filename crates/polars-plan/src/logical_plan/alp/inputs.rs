@@ -79,10 +79,16 @@ impl IR {
                 slice: *slice,
                 sort_options: sort_options.clone(),
             },
-            Cache { id, cache_hits, .. } => Cache {
+            Cache {
+                id,
+                cache_hits,
+                persist,
+                ..
+            } => Cache {
                 input: inputs[0],
                 id: *id,
                 cache_hits: *cache_hits,
+                persist: *persist,
             },
             Distinct { options, .. } => Distinct {
                 input: inputs[0],
@@ -73,6 +73,8 @@ pub enum IR {
         id: usize,
         /// How many hits the cache must be saved in memory.
         cache_hits: u32,
+        /// Keep the result in the query cache, so that it is reused by later queries.
+        persist: bool,
     },
     GroupBy {
         input: Node,
@@ -38,6 +38,7 @@ impl IR {
                 SinkType::File { .. } => "sink (file)",
                 #[cfg(feature = "cloud")]
                 SinkType::Cloud { .. } => "sink (cloud)",
+                SinkType::Partitioned { .. } => "sink (partitioned)",
             },
             SimpleProjection { .. } => "simple_projection",
             Invalid => "invalid",
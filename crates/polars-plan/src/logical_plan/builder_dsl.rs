@@ -1,10 +1,12 @@
 use polars_core::prelude::*;
-#[cfg(feature = "parquet")]
+#[cfg(any(feature = "parquet", feature = "csv"))]
 use polars_io::cloud::CloudOptions;
 #[cfg(feature = "csv")]
 use polars_io::csv::read::{CommentPrefix, CsvEncoding, CsvParserOptions, NullValues};
 #[cfg(feature = "ipc")]
 use polars_io::ipc::IpcScanOptions;
+#[cfg(feature = "json")]
+use polars_io::ndjson::NDJsonReadOptions;
 #[cfg(feature = "parquet")]
 use polars_io::parquet::read::ParquetOptions;
 use polars_io::HiveOptions;
@@ -12,7 +14,8 @@ use polars_io::HiveOptions;
     feature = "parquet",
     feature = "parquet_async",
     feature = "csv",
-    feature = "ipc"
+    feature = "ipc",
+    feature = "json"
 ))]
 use polars_io::RowIndex;
 
@@ -128,6 +131,7 @@ impl DslBuilder {
     }
 
     #[cfg(feature = "ipc")]
+    #[allow(clippy::too_many_arguments)]
     pub fn scan_ipc<P: Into<Arc<[std::path::PathBuf]>>>(
         paths: P,
         options: IpcScanOptions,
@@ -136,6 +140,7 @@ impl DslBuilder {
         row_index: Option<RowIndex>,
         rechunk: bool,
         cloud_options: Option<CloudOptions>,
+        hive_options: HiveOptions,
     ) -> PolarsResult<Self> {
         let paths = paths.into();
 
@@ -149,11 +154,7 @@ impl DslBuilder {
                 rechunk,
                 row_index,
                 file_counter: Default::default(),
-                // TODO: Support Hive partitioning.
-                hive_options: HiveOptions {
-                    enabled: false,
-                    ..Default::default()
-                },
+                hive_options,
             },
             predicate: None,
             scan_type: FileScan::Ipc {
@@ -167,8 +168,8 @@ impl DslBuilder {
 
     #[allow(clippy::too_many_arguments)]
     #[cfg(feature = "csv")]
-    pub fn scan_csv<P: Into<std::path::PathBuf>>(
-        path: P,
+    pub fn scan_csv<P: Into<Arc<[std::path::PathBuf]>>>(
+        paths: P,
         separator: u8,
         has_header: bool,
         ignore_errors: bool,
@@ -192,10 +193,10 @@ impl DslBuilder {
         truncate_ragged_lines: bool,
         n_threads: Option<usize>,
         decimal_comma: bool,
+        hive_options: HiveOptions,
+        cloud_options: Option<CloudOptions>,
     ) -> PolarsResult<Self> {
-        let path = path.into();
-
-        let paths = Arc::new([path]);
+        let paths = paths.into();
 
         let options = FileScanOptions {
             with_columns: None,
@@ -204,11 +205,7 @@ impl DslBuilder {
             rechunk,
             row_index,
             file_counter: Default::default(),
-            // TODO: Support Hive partitioning.
-            hive_options: HiveOptions {
-                enabled: false,
-                ..Default::default()
-            },
+            hive_options,
         };
         Ok(DslPlan::Scan {
             paths,
@@ -237,18 +234,49 @@ impl DslBuilder {
                     infer_schema_length,
                     decimal_comma,
                 },
+                cloud_options,
             },
         }
         .into())
     }
 
-    pub fn cache(self) -> Self {
+    #[cfg(feature = "json")]
+    pub fn scan_ndjson<P: Into<Arc<[std::path::PathBuf]>>>(
+        paths: P,
+        options: NDJsonReadOptions,
+        n_rows: Option<usize>,
+        row_index: Option<RowIndex>,
+        rechunk: bool,
+        hive_options: HiveOptions,
+    ) -> PolarsResult<Self> {
+        let paths = paths.into();
+
+        Ok(DslPlan::Scan {
+            paths,
+            file_info: None,
+            file_options: FileScanOptions {
+                with_columns: None,
+                cache: false,
+                n_rows,
+                rechunk,
+                row_index,
+                file_counter: Default::default(),
+                hive_options,
+            },
+            predicate: None,
+            scan_type: FileScan::NDJson { options },
+        }
+        .into())
+    }
+
+    pub fn cache(self, persist: bool) -> Self {
         let input = Arc::new(self.0);
         let id = input.as_ref() as *const DslPlan as usize;
         DslPlan::Cache {
             input,
             id,
             cache_hits: UNLIMITED_CACHE,
+            persist,
         }
         .into()
     }
@@ -116,10 +116,18 @@ pub fn to_alp_impl(
                         file_info
                     },
                     #[cfg(feature = "csv")]
-                    FileScan::Csv { options, .. } => {
-                        scans::csv_file_info(&paths, &file_options, options)
+                    FileScan::Csv {
+                        options,
+                        cloud_options,
+                    } => {
+                        scans::csv_file_info(&paths, &file_options, options, cloud_options.as_ref())
                             .map_err(|e| e.context(failed_here!(csv scan)))?
                     },
+                    #[cfg(feature = "json")]
+                    FileScan::NDJson { options } => {
+                        scans::ndjson_file_info(&paths, &file_options, options)
+                            .map_err(|e| e.context(failed_here!(ndjson scan)))?
+                    },
                     // FileInfo should be set.
                     FileScan::Anonymous { .. } => unreachable!(),
                 }
@@ -254,6 +262,7 @@ pub fn to_alp_impl(
             input,
             id,
             cache_hits,
+            persist,
         } => {
             let input = to_alp_impl(owned(input), expr_arena, lp_arena, convert)
                 .map_err(|e| e.context(failed_input!(cache)))?;
@@ -261,6 +270,7 @@ pub fn to_alp_impl(
                 input,
                 id,
                 cache_hits,
+                persist,
             }
         },
         DslPlan::GroupBy {
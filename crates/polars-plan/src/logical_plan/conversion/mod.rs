@@ -149,12 +149,14 @@ impl IR {
                 input,
                 id,
                 cache_hits,
+                persist,
             } => {
                 let input = Arc::new(convert_to_lp(input, lp_arena));
                 DslPlan::Cache {
                     input,
                     id,
                     cache_hits,
+                    persist,
                 }
             },
             IR::GroupBy {
@@ -1,6 +1,8 @@
 use std::io::Read;
 use std::path::PathBuf;
 
+#[cfg(feature = "json")]
+use polars_io::ndjson::NDJsonReadOptions;
 #[cfg(feature = "cloud")]
 use polars_io::pl_async::get_runtime;
 use polars_io::prelude::*;
@@ -16,7 +18,7 @@ fn get_path(paths: &[PathBuf]) -> PolarsResult<&PathBuf> {
         .ok_or_else(|| polars_err!(ComputeError: "expected at least 1 path"))
 }
 
-#[cfg(any(feature = "parquet", feature = "parquet_async",))]
+#[cfg(any(feature = "parquet", feature = "parquet_async", feature = "json"))]
 fn prepare_schema(mut schema: Schema, row_index: Option<&RowIndex>) -> SchemaRef {
     if let Some(rc) = row_index {
         let _ = schema.insert_at_index(0, rc.name.as_str().into(), IDX_DTYPE);
@@ -53,7 +55,7 @@ pub(super) fn parquet_file_info(
         }
     } else {
         let file = polars_utils::open_file(path)?;
-        let mut reader = ParquetReader::new(file);
+        let mut reader = ParquetReader::new(file).with_cached_metadata(path)?;
         let reader_schema = reader.schema()?;
         let schema = prepare_schema((&reader_schema).into(), file_options.row_index.as_ref());
         (
@@ -105,7 +107,7 @@ pub(super) fn ipc_file_info(
             polars_utils::open_file(path)?,
         ))?
     };
-    let file_info = FileInfo::new(
+    let mut file_info = FileInfo::new(
         prepare_schema(
             metadata.schema.as_ref().into(),
             file_options.row_index.as_ref(),
@@ -114,6 +116,10 @@ pub(super) fn ipc_file_info(
         (None, 0),
     );
 
+    if file_options.hive_options.enabled {
+        file_info.init_hive_partitions(path.as_path(), file_options.hive_options.schema.clone())?
+    }
+
     Ok((file_info, metadata))
 }
 
@@ -122,29 +128,58 @@ pub(super) fn csv_file_info(
     paths: &[PathBuf],
     file_options: &FileScanOptions,
     csv_options: &mut CsvParserOptions,
+    cloud_options: Option<&polars_io::cloud::CloudOptions>,
 ) -> PolarsResult<FileInfo> {
     use std::io::Seek;
 
     use polars_io::csv::read::{infer_file_schema, is_compressed};
-    use polars_io::utils::get_reader_bytes;
+    use polars_io::utils::{get_reader_bytes, open_reader};
 
     let path = get_path(paths)?;
-    let mut file = polars_utils::open_file(path)?;
+    let mut file = open_reader(path, cloud_options)?;
 
     let mut magic_nr = [0u8; 4];
     let res_len = file.read(&mut magic_nr)?;
-    if res_len < 2 {
-        if csv_options.raise_if_empty {
-            polars_bail!(NoData: "empty CSV")
+    if res_len < 2 && csv_options.raise_if_empty {
+        polars_bail!(NoData: "empty CSV")
+    }
+    file.rewind()?;
+
+    // Cloud and compressed files are not read in memory to infer their schema, but streamed
+    // until enough rows are read.
+    if is_cloud_url(path) || is_compressed(&magic_nr) {
+        let mut reader = CsvReader::new(file)
+            .has_header(csv_options.has_header)
+            .with_separator(csv_options.separator)
+            .with_skip_rows(csv_options.skip_rows)
+            .with_skip_rows_after_header(csv_options.skip_rows_after_header)
+            ._with_comment_prefix(csv_options.comment_prefix.clone())
+            .with_quote_char(csv_options.quote_char)
+            .with_end_of_line_char(csv_options.eol_char)
+            .with_null_values(csv_options.null_values.clone())
+            .with_try_parse_dates(csv_options.try_parse_dates)
+            .raise_if_empty(csv_options.raise_if_empty)
+            .infer_schema(csv_options.infer_schema_length)
+            .with_dtypes(csv_options.schema_overwrite.clone())
+            .with_schema(csv_options.schema.clone())
+            .with_encoding(csv_options.encoding)
+            .with_decimal_comma(csv_options.decimal_comma)
+            .batched_stream()?;
+        let mut schema = reader.schema()?;
+        if let Some(rc) = &file_options.row_index {
+            let schema = Arc::make_mut(&mut schema);
+            schema.insert_at_index(0, rc.name.as_str().into(), IDX_DTYPE)?;
         }
-    } else {
-        polars_ensure!(
-        !is_compressed(&magic_nr),
-        ComputeError: "cannot scan compressed csv; use `read_csv` for compressed data",
-        );
+        csv_options.skip_rows += csv_options.skip_rows_after_header;
+        // The size of the decompressed file is not known up front.
+        let mut file_info = FileInfo::new(schema, None, (None, usize::MAX));
+        if file_options.hive_options.enabled {
+            file_info
+                .init_hive_partitions(path.as_path(), file_options.hive_options.schema.clone())?
+        }
+        return Ok(file_info);
     }
 
-    file.rewind()?;
     let reader_bytes = get_reader_bytes(&mut file).expect("could not mmap file");
 
     // this needs a way to estimated bytes/rows.
@@ -164,6 +199,7 @@ pub(super) fn csv_file_info(
         csv_options.raise_if_empty,
         &mut csv_options.n_threads,
         csv_options.decimal_comma,
+        csv_options.encoding,
     )?;
 
     let mut schema = csv_options
@@ -180,5 +216,46 @@ pub(super) fn csv_file_info(
     let estimated_n_rows = (rows_read as f64 / bytes_read as f64 * n_bytes as f64) as usize;
 
     csv_options.skip_rows += csv_options.skip_rows_after_header;
-    Ok(FileInfo::new(schema, None, (None, estimated_n_rows)))
+    let mut file_info = FileInfo::new(schema, None, (None, estimated_n_rows));
+
+    if file_options.hive_options.enabled {
+        file_info.init_hive_partitions(path.as_path(), file_options.hive_options.schema.clone())?
+    }
+
+    Ok(file_info)
+}
+
+#[cfg(feature = "json")]
+pub(super) fn ndjson_file_info(
+    paths: &[PathBuf],
+    file_options: &FileScanOptions,
+    ndjson_options: &mut NDJsonReadOptions,
+) -> PolarsResult<FileInfo> {
+    let path = get_path(paths)?;
+
+    let schema = match &ndjson_options.schema {
+        Some(schema) => schema.clone(),
+        None => {
+            let mut reader = std::io::BufReader::new(polars_utils::open_file(path)?);
+            let schema = Arc::new(polars_io::ndjson::infer_schema(
+                &mut reader,
+                ndjson_options.infer_schema_length,
+            )?);
+            // Every file is read with the schema of the first file.
+            ndjson_options.schema = Some(schema.clone());
+            schema
+        },
+    };
+
+    let mut file_info = FileInfo::new(
+        prepare_schema(schema.as_ref().clone(), file_options.row_index.as_ref()),
+        None,
+        (None, usize::MAX),
+    );
+
+    if file_options.hive_options.enabled {
+        file_info.init_hive_partitions(path.as_path(), file_options.hive_options.schema.clone())?
+    }
+
+    Ok(file_info)
 }
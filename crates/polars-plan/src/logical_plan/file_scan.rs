@@ -4,6 +4,8 @@ use std::hash::{Hash, Hasher};
 use polars_io::csv::read::CsvParserOptions;
 #[cfg(feature = "ipc")]
 use polars_io::ipc::IpcScanOptions;
+#[cfg(feature = "json")]
+use polars_io::ndjson::NDJsonReadOptions;
 #[cfg(feature = "parquet")]
 use polars_io::parquet::metadata::FileMetaDataRef;
 #[cfg(feature = "parquet")]
@@ -15,7 +17,10 @@ use super::*;
 #[cfg_attr(feature = "serde", derive(Serialize, Deserialize))]
 pub enum FileScan {
     #[cfg(feature = "csv")]
-    Csv { options: CsvParserOptions },
+    Csv {
+        options: CsvParserOptions,
+        cloud_options: Option<polars_io::cloud::CloudOptions>,
+    },
     #[cfg(feature = "parquet")]
     Parquet {
         options: ParquetOptions,
@@ -30,6 +35,8 @@ pub enum FileScan {
         #[cfg_attr(feature = "serde", serde(skip))]
         metadata: Option<arrow::io::ipc::read::FileMetadata>,
     },
+    #[cfg(feature = "json")]
+    NDJson { options: NDJsonReadOptions },
     #[cfg_attr(feature = "serde", serde(skip))]
     Anonymous {
         options: Arc<AnonymousScanOptions>,
@@ -41,7 +48,16 @@ impl PartialEq for FileScan {
     fn eq(&self, other: &Self) -> bool {
         match (self, other) {
             #[cfg(feature = "csv")]
-            (FileScan::Csv { options: l }, FileScan::Csv { options: r }) => l == r,
+            (
+                FileScan::Csv {
+                    options: l,
+                    cloud_options: c_l,
+                },
+                FileScan::Csv {
+                    options: r,
+                    cloud_options: c_r,
+                },
+            ) => l == r && c_l == c_r,
             #[cfg(feature = "parquet")]
             (
                 FileScan::Parquet {
@@ -68,6 +84,8 @@ impl PartialEq for FileScan {
                     ..
                 },
             ) => l == r && c_l == c_r,
+            #[cfg(feature = "json")]
+            (FileScan::NDJson { options: l }, FileScan::NDJson { options: r }) => l == r,
             _ => false,
         }
     }
@@ -80,7 +98,13 @@ impl Hash for FileScan {
         std::mem::discriminant(self).hash(state);
         match self {
             #[cfg(feature = "csv")]
-            FileScan::Csv { options } => options.hash(state),
+            FileScan::Csv {
+                options,
+                cloud_options,
+            } => {
+                options.hash(state);
+                cloud_options.hash(state)
+            },
             #[cfg(feature = "parquet")]
             FileScan::Parquet {
                 options,
@@ -99,6 +123,8 @@ impl Hash for FileScan {
                 options.hash(state);
                 cloud_options.hash(state);
             },
+            #[cfg(feature = "json")]
+            FileScan::NDJson { options } => options.hash(state),
             FileScan::Anonymous { options, .. } => options.hash(state),
         }
     }
@@ -123,11 +149,24 @@ impl FileScan {
             Self::Ipc { .. } => _file_options.row_index.is_some(),
             #[cfg(feature = "parquet")]
             Self::Parquet { .. } => _file_options.row_index.is_some(),
+            #[cfg(feature = "json")]
+            Self::NDJson { .. } => true,
             #[allow(unreachable_patterns)]
             _ => false,
         }
     }
 
+    /// Whether the rows of the files can be counted without reading them.
+    pub(crate) fn can_count_rows(&self) -> bool {
+        match self {
+            #[cfg(feature = "json")]
+            Self::NDJson { .. } => false,
+            Self::Anonymous { .. } => false,
+            #[allow(unreachable_patterns)]
+            _ => true,
+        }
+    }
+
     pub fn streamable(&self) -> bool {
         match self {
             #[cfg(feature = "csv")]
@@ -136,6 +175,8 @@ impl FileScan {
             Self::Ipc { .. } => false,
             #[cfg(feature = "parquet")]
             Self::Parquet { .. } => true,
+            #[cfg(feature = "json")]
+            Self::NDJson { .. } => true,
             #[allow(unreachable_patterns)]
             _ => false,
         }
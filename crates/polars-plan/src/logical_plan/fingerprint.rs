@@ -0,0 +1,301 @@
+//! Fingerprints of (sub-)plans that identify their result across queries.
+use std::hash::{BuildHasher, Hash, Hasher};
+use std::path::Path;
+use std::time::UNIX_EPOCH;
+
+use polars_core::prelude::*;
+use polars_io::utils::is_cloud_url;
+
+use crate::prelude::*;
+
+/// Identifies the result of a plan across queries.
+pub struct PlanFingerprint {
+    /// 128 bit hash of the plan and the version of its source files.
+    pub key: u128,
+    /// The in-memory sources of the plan. They are identified by their address, so they must be
+    /// kept alive as long as the fingerprint is used.
+    pub sources: Vec<Arc<DataFrame>>,
+}
+
+/// Feeds two hashers with different seeds, which together give a 128 bit hash.
+struct Hasher128(ahash::AHasher, ahash::AHasher);
+
+impl Hasher128 {
+    fn new() -> Self {
+        Self(
+            ahash::RandomState::with_seeds(0, 1, 2, 3).build_hasher(),
+            ahash::RandomState::with_seeds(4, 5, 6, 7).build_hasher(),
+        )
+    }
+
+    fn finish128(&self) -> u128 {
+        ((self.0.finish() as u128) << 64) | self.1.finish() as u128
+    }
+}
+
+impl Hasher for Hasher128 {
+    fn finish(&self) -> u64 {
+        self.0.finish()
+    }
+
+    fn write(&mut self, bytes: &[u8]) {
+        self.0.write(bytes);
+        self.1.write(bytes);
+    }
+}
+
+fn hash_series(s: &Series, state: &mut Hasher128) -> Option<()> {
+    let mut hashes = vec![];
+    s.vec_hash(ahash::RandomState::with_seeds(0, 1, 2, 3), &mut hashes)
+        .ok()?;
+    s.name().hash(state);
+    s.dtype().hash(state);
+    hashes.hash(state);
+    Some(())
+}
+
+fn hash_literal(lv: &LiteralValue, state: &mut Hasher128) -> Option<()> {
+    std::mem::discriminant(lv).hash(state);
+    match lv {
+        LiteralValue::Series(s) => hash_series(s, state)?,
+        LiteralValue::Range {
+            low,
+            high,
+            data_type,
+        } => {
+            low.hash(state);
+            high.hash(state);
+            data_type.hash(state);
+        },
+        lv => {
+            lv.get_datatype().hash(state);
+            lv.to_any_value()?.hash_impl(state, false);
+        },
+    }
+    Some(())
+}
+
+/// Hash every field of a single expression node. The `Hash` implementation of `AExpr` only
+/// hashes what is needed to find common sub-expressions, which are compared for equality
+/// afterwards, so it cannot be used to identify an expression on its own.
+fn hash_aexpr(ae: &AExpr, state: &mut Hasher128) -> Option<()> {
+    use AExpr::*;
+    std::mem::discriminant(ae).hash(state);
+    match ae {
+        Explode(_) | Filter { .. } | Ternary { .. } | Wildcard | Slice { .. } | Len => {},
+        Alias(_, name) | Column(name) => name.hash(state),
+        Nth(n) => n.hash(state),
+        Literal(lv) => hash_literal(lv, state)?,
+        BinaryExpr { op, .. } => op.hash(state),
+        Cast {
+            data_type, strict, ..
+        } => {
+            data_type.hash(state);
+            strict.hash(state);
+        },
+        Sort { options, .. } => options.hash(state),
+        Gather { returns_scalar, .. } => returns_scalar.hash(state),
+        SortBy { sort_options, .. } => sort_options.hash(state),
+        Agg(agg) => {
+            agg.hash(state);
+            if let AAggExpr::Count(_, include_nulls) = agg {
+                include_nulls.hash(state);
+            }
+        },
+        AnonymousFunction { .. } => return None,
+        Function {
+            input,
+            function,
+            options,
+        } => {
+            // The `Hash` implementation of `FunctionExpr` skips some of the arguments of the
+            // functions, its derived `Debug` output contains all of them.
+            format!("{function:?}").hash(state);
+            options.hash(state);
+            for e in input {
+                e.output_name_inner().hash(state);
+            }
+        },
+        Window { options, .. } => options.hash(state),
+    }
+    Some(())
+}
+
+fn hash_expr(e: &ExprIR, expr_arena: &Arena<AExpr>, state: &mut Hasher128) -> Option<()> {
+    e.get_alias().hash(state);
+    let mut inputs: Vec<Node> = vec![];
+    for (_, ae) in expr_arena.iter(e.node()) {
+        hash_aexpr(ae, state)?;
+        // The number of inputs of every node determines the shape of the expression tree.
+        ae.nodes(&mut inputs);
+        inputs.len().hash(state);
+        inputs.clear();
+    }
+    Some(())
+}
+
+fn hash_exprs(exprs: &[ExprIR], expr_arena: &Arena<AExpr>, state: &mut Hasher128) -> Option<()> {
+    exprs.len().hash(state);
+    for e in exprs {
+        hash_expr(e, expr_arena, state)?;
+    }
+    Some(())
+}
+
+/// Hash the size and modification time of a local source file.
+fn hash_file_version(path: &Path, state: &mut Hasher128) -> Option<()> {
+    if is_cloud_url(path) {
+        return None;
+    }
+    let metadata = std::fs::metadata(path).ok()?;
+    let modified = metadata.modified().ok()?.duration_since(UNIX_EPOCH).ok()?;
+    metadata.len().hash(state);
+    modified.hash(state);
+    Some(())
+}
+
+/// Compute the fingerprint of the plan at `root`, or `None` if the result of the plan can not be
+/// identified, e.g. because it contains a user defined function or reads from cloud storage.
+pub fn plan_fingerprint(
+    root: Node,
+    lp_arena: &Arena<IR>,
+    expr_arena: &Arena<AExpr>,
+) -> Option<PlanFingerprint> {
+    let state = &mut Hasher128::new();
+    let mut sources = vec![];
+    let mut stack = vec![root];
+    let mut inputs = vec![];
+
+    while let Some(node) = stack.pop() {
+        let lp = lp_arena.get(node);
+        std::mem::discriminant(lp).hash(state);
+        use IR::*;
+        match lp {
+            #[cfg(feature = "python")]
+            PythonScan { .. } => return None,
+            Slice { offset, len, .. } => {
+                offset.hash(state);
+                len.hash(state);
+            },
+            Filter { predicate, .. } => hash_expr(predicate, expr_arena, state)?,
+            Scan {
+                paths,
+                predicate,
+                scan_type,
+                file_options,
+                ..
+            } => {
+                if matches!(scan_type, FileScan::Anonymous { .. }) {
+                    return None;
+                }
+                scan_type.hash(state);
+                file_options.hash(state);
+                paths.hash(state);
+                for path in paths.iter() {
+                    hash_file_version(path, state)?;
+                }
+                if let Some(predicate) = predicate {
+                    hash_expr(predicate, expr_arena, state)?;
+                }
+            },
+            DataFrameScan {
+                df,
+                projection,
+                selection,
+                ..
+            } => {
+                (Arc::as_ptr(df) as usize).hash(state);
+                sources.push(df.clone());
+                projection.hash(state);
+                if let Some(selection) = selection {
+                    hash_expr(selection, expr_arena, state)?;
+                }
+            },
+            SimpleProjection {
+                columns,
+                duplicate_check,
+                ..
+            } => {
+                for (name, dtype) in columns.iter() {
+                    name.hash(state);
+                    dtype.hash(state);
+                }
+                duplicate_check.hash(state);
+            },
+            Select { expr, options, .. }
+            | HStack {
+                exprs: expr,
+                options,
+                ..
+            } => {
+                hash_exprs(expr.default_exprs(), expr_arena, state)?;
+                hash_exprs(expr.cse_exprs(), expr_arena, state)?;
+                options.hash(state);
+            },
+            Sort {
+                by_column,
+                slice,
+                sort_options,
+                ..
+            } => {
+                hash_exprs(by_column, expr_arena, state)?;
+                slice.hash(state);
+                sort_options.hash(state);
+            },
+            // The id of a cache is derived from an address; it does not identify the input.
+            Cache { .. } => {},
+            GroupBy {
+                keys,
+                aggs,
+                apply,
+                maintain_order,
+                options,
+                ..
+            } => {
+                if apply.is_some() {
+                    return None;
+                }
+                hash_exprs(keys, expr_arena, state)?;
+                hash_exprs(aggs, expr_arena, state)?;
+                maintain_order.hash(state);
+                options.hash(state);
+            },
+            Join {
+                left_on,
+                right_on,
+                options,
+                ..
+            } => {
+                hash_exprs(left_on, expr_arena, state)?;
+                hash_exprs(right_on, expr_arena, state)?;
+                options.hash(state);
+            },
+            Distinct { options, .. } => options.hash(state),
+            MapFunction { function, .. } => match function {
+                #[cfg(feature = "python")]
+                FunctionNode::OpaquePython { .. } => return None,
+                FunctionNode::Opaque { .. } | FunctionNode::Pipeline { .. } => return None,
+                FunctionNode::Count { paths, .. } => {
+                    function.hash(state);
+                    for path in paths.iter() {
+                        hash_file_version(path, state)?;
+                    }
+                },
+                function => function.hash(state),
+            },
+            Union { options, .. } => options.hash(state),
+            HConcat { options, .. } => options.hash(state),
+            ExtContext { .. } => {},
+            Sink { .. } | Invalid => return None,
+        }
+
+        lp.copy_inputs(&mut inputs);
+        inputs.len().hash(state);
+        stack.append(&mut inputs);
+    }
+
+    Some(PlanFingerprint {
+        key: state.finish128(),
+        sources,
+    })
+}
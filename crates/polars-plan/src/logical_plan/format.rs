@@ -114,11 +114,15 @@ impl DslPlan {
                 input,
                 id,
                 cache_hits,
+                persist,
             } => {
                 write!(
                     f,
-                    "{:indent$}CACHE[id: {:x}, cache_hits: {}]",
-                    "", *id, *cache_hits
+                    "{:indent$}CACHE[id: {:x}, cache_hits: {}{}]",
+                    "",
+                    *id,
+                    *cache_hits,
+                    if *persist { ", persist" } else { "" }
                 )?;
                 input._format(f, sub_indent)
             },
@@ -243,6 +247,7 @@ impl DslPlan {
                     SinkType::File { .. } => "SINK (file)",
                     #[cfg(feature = "cloud")]
                     SinkType::Cloud { .. } => "SINK (cloud)",
+                    SinkType::Partitioned { .. } => "SINK (partitioned)",
                 };
                 write!(f, "{:indent$}{name}", "")?;
                 input._format(f, sub_indent)
@@ -1,18 +1,25 @@
+#[cfg(feature = "csv")]
+use std::io::{Read, Seek};
+
 #[cfg(feature = "ipc")]
 use arrow::io::ipc::read::get_row_count as count_rows_ipc_sync;
 #[cfg(feature = "ipc")]
 use polars_core::error::to_compute_err;
-#[cfg(feature = "parquet")]
+#[cfg(feature = "csv")]
+use polars_core::POOL;
+#[cfg(any(feature = "parquet", feature = "csv"))]
 use polars_io::cloud::CloudOptions;
 #[cfg(feature = "csv")]
-use polars_io::csv::read::count_rows as count_rows_csv;
+use polars_io::csv::read::{
+    count_rows as count_rows_csv, is_compressed, CsvParserOptions, CsvReader,
+};
 #[cfg(all(feature = "parquet", feature = "cloud"))]
 use polars_io::parquet::read::ParquetAsyncReader;
 #[cfg(feature = "parquet")]
 use polars_io::parquet::read::ParquetReader;
 #[cfg(all(feature = "parquet", feature = "async"))]
 use polars_io::pl_async::{get_runtime, with_concurrency_budget};
-#[cfg(feature = "parquet")]
+#[cfg(any(feature = "parquet", feature = "csv"))]
 use polars_io::{utils::is_cloud_url, SerReader};
 
 use super::*;
@@ -21,19 +28,13 @@ use super::*;
 pub fn count_rows(paths: &Arc<[PathBuf]>, scan_type: &FileScan) -> PolarsResult<DataFrame> {
     match scan_type {
         #[cfg(feature = "csv")]
-        FileScan::Csv { options } => {
+        FileScan::Csv {
+            options,
+            cloud_options,
+        } => {
             let n_rows: PolarsResult<usize> = paths
                 .iter()
-                .map(|path| {
-                    count_rows_csv(
-                        path,
-                        options.separator,
-                        options.quote_char,
-                        options.comment_prefix.as_ref(),
-                        options.eol_char,
-                        options.has_header,
-                    )
-                })
+                .map(|path| count_rows_csv_file(path, options, cloud_options.as_ref()))
                 .sum();
             Ok(DataFrame::new(vec![Series::new(
                 crate::constants::LEN,
@@ -66,11 +67,55 @@ pub fn count_rows(paths: &Arc<[PathBuf]>, scan_type: &FileScan) -> PolarsResult<
             .map_err(to_compute_err)?;
             Ok(DataFrame::new(vec![Series::new(crate::constants::LEN, [count])]).unwrap())
         },
+        #[cfg(feature = "json")]
+        FileScan::NDJson { .. } => {
+            unreachable!();
+        },
         FileScan::Anonymous { .. } => {
             unreachable!();
         },
     }
 }
+#[cfg(feature = "csv")]
+fn count_rows_csv_file(
+    path: &PathBuf,
+    options: &CsvParserOptions,
+    cloud_options: Option<&CloudOptions>,
+) -> PolarsResult<usize> {
+    let mut file = polars_io::utils::open_reader(path, cloud_options)?;
+    let mut magic_nr = [0u8; 4];
+    let res_len = file.read(&mut magic_nr)?;
+    if !is_cloud_url(path) && !(res_len >= 2 && is_compressed(&magic_nr)) {
+        return count_rows_csv(
+            path,
+            options.separator,
+            options.quote_char,
+            options.comment_prefix.as_ref(),
+            options.eol_char,
+            options.has_header,
+        );
+    }
+
+    // Cloud and compressed files can not be mapped in memory, they are parsed in a stream
+    // instead, projecting only the first column.
+    file.rewind()?;
+    let mut reader = CsvReader::new(file)
+        .has_header(options.has_header)
+        .with_separator(options.separator)
+        ._with_comment_prefix(options.comment_prefix.clone())
+        .with_quote_char(options.quote_char)
+        .with_end_of_line_char(options.eol_char)
+        .with_encoding(options.encoding)
+        .with_projection(Some(vec![0]))
+        .raise_if_empty(options.raise_if_empty)
+        .batched_stream()?;
+    let mut n_rows = 0;
+    while let Some(batches) = reader.next_batches(POOL.current_num_threads())? {
+        n_rows += batches.iter().map(|df| df.height()).sum::<usize>();
+    }
+    Ok(n_rows)
+}
+
 #[cfg(feature = "parquet")]
 pub(super) fn count_rows_parquet(
     paths: &Arc<[PathBuf]>,
@@ -94,7 +139,7 @@ pub(super) fn count_rows_parquet(
             .iter()
             .map(|path| {
                 let file = polars_utils::open_file(path)?;
-                let mut reader = ParquetReader::new(file);
+                let mut reader = ParquetReader::new(file).with_cached_metadata(path)?;
                 reader.num_rows()
             })
             .sum::<PolarsResult<usize>>()
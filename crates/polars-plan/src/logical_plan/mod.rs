@@ -22,6 +22,8 @@ pub(crate) mod debug;
 pub(crate) mod expr_expansion;
 pub mod expr_ir;
 mod file_scan;
+#[cfg(feature = "cse")]
+mod fingerprint;
 mod format;
 mod functions;
 pub(super) mod hive;
@@ -45,6 +47,8 @@ pub use builder_ir::*;
 pub use conversion::*;
 pub(crate) use expr_ir::*;
 pub use file_scan::*;
+#[cfg(feature = "cse")]
+pub use fingerprint::*;
 pub use functions::*;
 pub use iterator::*;
 pub use lit::*;
@@ -81,6 +85,8 @@ pub enum DslPlan {
         input: Arc<DslPlan>,
         id: usize,
         cache_hits: u32,
+        /// Keep the result in the query cache, so that it is reused by later queries.
+        persist: bool,
     },
     Scan {
         paths: Arc<[PathBuf]>,
@@ -185,7 +191,7 @@ impl Clone for DslPlan {
             #[cfg(feature = "python")]
             Self::PythonScan { options } => Self::PythonScan { options: options.clone() },
             Self::Filter { input, predicate } => Self::Filter { input: input.clone(), predicate: predicate.clone() },
-            Self::Cache { input, id, cache_hits } => Self::Cache { input: input.clone(), id: id.clone(), cache_hits: cache_hits.clone() },
+            Self::Cache { input, id, cache_hits, persist } => Self::Cache { input: input.clone(), id: id.clone(), cache_hits: cache_hits.clone(), persist: persist.clone() },
             Self::Scan { paths, file_info, predicate, file_options, scan_type } => Self::Scan { paths: paths.clone(), file_info: file_info.clone(), predicate: predicate.clone(), file_options: file_options.clone(), scan_type: scan_type.clone() },
             Self::DataFrameScan { df, schema, output_schema, projection, selection } => Self::DataFrameScan { df: df.clone(), schema: schema.clone(), output_schema: output_schema.clone(), projection: projection.clone(), selection: selection.clone() },
             Self::Select { expr, input, options } => Self::Select { expr: expr.clone(), input: input.clone(), options: options.clone() },
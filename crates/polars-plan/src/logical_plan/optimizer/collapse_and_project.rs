@@ -106,12 +106,14 @@ impl OptimizationRule for SimpleProjectionAndCollapse {
             Cache {
                 input,
                 cache_hits: outer_cache_hits,
+                persist: outer_persist,
                 ..
             } if !self.eager => {
                 if let Cache {
                     input: prev_input,
                     id,
                     cache_hits,
+                    persist,
                 } = lp_arena.get(*input)
                 {
                     Some(Cache {
@@ -119,6 +121,7 @@ impl OptimizationRule for SimpleProjectionAndCollapse {
                         id: *id,
                         // ensure the counts are updated
                         cache_hits: cache_hits.saturating_add(*outer_cache_hits),
+                        persist: *persist || *outer_persist,
                     })
                 } else {
                     None
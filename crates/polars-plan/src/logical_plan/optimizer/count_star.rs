@@ -97,7 +97,7 @@ fn visit_logical_plan_for_scan_paths(
         },
         IR::Scan {
             scan_type, paths, ..
-        } if !matches!(scan_type, FileScan::Anonymous { .. }) => Some(CountStarExpr {
+        } if scan_type.can_count_rows() => Some(CountStarExpr {
             paths: paths.clone(),
             scan_type: scan_type.clone(),
             node,
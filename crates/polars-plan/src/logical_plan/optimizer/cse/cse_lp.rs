@@ -317,6 +317,7 @@ impl<'a> RewritingVisitor for CommonSubPlanRewriter<'a> {
             input: node.node(),
             id: cache_id,
             cache_hits: cache_count - 1,
+            persist: false,
         };
         node.assign(cache_node, &mut arena.0);
         let (_count, nodes) = self
@@ -385,7 +385,7 @@ impl<'a> PredicatePushDown<'a> {
                                 }
                                 scan_type.remove_metadata();
                             }
-                            if paths.is_empty() {
+                            if new_paths.is_empty() {
                                 let schema = output_schema.as_ref().unwrap_or(&file_info.schema);
                                 let df = DataFrame::from(schema.as_ref());
 
@@ -406,6 +406,8 @@ impl<'a> PredicatePushDown<'a> {
                 let mut do_optimization = match &scan_type {
                     #[cfg(feature = "csv")]
                     FileScan::Csv { .. } => options.n_rows.is_none(),
+                    #[cfg(feature = "json")]
+                    FileScan::NDJson { .. } => options.n_rows.is_none(),
                     FileScan::Anonymous { function, .. } => function.allows_predicate_pushdown(),
                     #[allow(unreachable_patterns)]
                     _ => true,
@@ -172,8 +172,10 @@ impl SlicePushDown {
                 output_schema,
                 file_options: mut options,
                 predicate,
-                scan_type: FileScan::Csv {options: mut csv_options}
-            }, Some(state)) if predicate.is_none() && state.offset >= 0 =>  {
+                scan_type: FileScan::Csv {options: mut csv_options, cloud_options}
+            }, Some(state)) if predicate.is_none() && state.offset >= 0
+                // The rows to skip can only be pushed into a single file.
+                && (state.offset == 0 || paths.len() == 1) =>  {
                 options.n_rows = Some(state.len as usize);
                 csv_options.skip_rows += state.offset as usize;
 
@@ -181,7 +183,7 @@ impl SlicePushDown {
                     paths,
                     file_info,
                     output_schema,
-                    scan_type: FileScan::Csv {options: csv_options},
+                    scan_type: FileScan::Csv {options: csv_options, cloud_options},
                     file_options: options,
                     predicate,
                 };
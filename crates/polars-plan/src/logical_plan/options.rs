@@ -237,6 +237,33 @@ pub enum SinkType {
         file_type: FileType,
         cloud_options: Option<polars_io::cloud::CloudOptions>,
     },
+    /// Write a Hive partitioned dataset into the directory `path`.
+    Partitioned {
+        path: Arc<PathBuf>,
+        file_type: FileType,
+        options: PartitionedSinkOptions,
+    },
+}
+
+#[cfg_attr(feature = "serde", derive(Serialize, Deserialize))]
+#[derive(Clone, Debug, PartialEq, Eq, Hash)]
+pub struct PartitionedSinkOptions {
+    /// The columns to partition by. They are not written to the files.
+    pub by: Vec<String>,
+    /// The maximum number of files that are open at the same time.
+    pub max_open_files: usize,
+    /// Start a new file in a partition once this many rows are written to it.
+    pub max_rows_per_file: Option<usize>,
+}
+
+impl Default for PartitionedSinkOptions {
+    fn default() -> Self {
+        Self {
+            by: vec![],
+            max_open_files: 64,
+            max_rows_per_file: None,
+        }
+    }
 }
 
 #[cfg_attr(feature = "serde", derive(Serialize, Deserialize))]
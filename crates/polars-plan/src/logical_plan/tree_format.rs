@@ -192,11 +192,17 @@ impl<'a> TreeFmtNode<'a> {
                     input,
                     id,
                     cache_hits,
+                    persist,
                 },
             ) => ND(
                 wh(
                     h,
-                    &format!("CACHE[id: {:x}, cache_hits: {}]", *id, *cache_hits),
+                    &format!(
+                        "CACHE[id: {:x}, cache_hits: {}{}]",
+                        *id,
+                        *cache_hits,
+                        if *persist { ", persist" } else { "" }
+                    ),
                 ),
                 vec![NL(None, input)],
             ),
@@ -301,6 +307,7 @@ impl<'a> TreeFmtNode<'a> {
                         SinkType::File { .. } => "SINK (file)",
                         #[cfg(feature = "cloud")]
                         SinkType::Cloud { .. } => "SINK (cloud)",
+                        SinkType::Partitioned { .. } => "SINK (partitioned)",
                     },
                 ),
                 vec![NL(None, input)],
@@ -191,9 +191,11 @@ impl Hash for HashableEqLP<'_> {
                 input: _,
                 id,
                 cache_hits,
+                persist,
             } => {
                 id.hash(state);
                 cache_hits.hash(state);
+                persist.hash(state);
             },
             IR::Invalid => unreachable!(),
         }
@@ -208,6 +208,7 @@ from polars.lazyframe import InProcessQuery, LazyFrame
 from polars.meta import (
     build_info,
     get_index_type,
+    object_store_cache_stats,
     show_versions,
     thread_pool_size,
     threadpool_size,
@@ -429,6 +430,7 @@ __all__ = [
     # polars.utils
     "build_info",
     "get_index_type",
+    "object_store_cache_stats",
     "show_versions",
     "thread_pool_size",
     "threadpool_size",
@@ -15,7 +15,7 @@ from polars._utils.convert import (
     to_py_time,
     to_py_timedelta,
 )
-from polars._utils.scan import _execute_from_rust
+from polars._utils.scan import _execute_batches_from_rust, _execute_from_rust
 from polars._utils.various import NoDefault, _polars_warn, is_column, no_default
 
 __all__ = [
@@ -27,6 +27,7 @@ __all__ = [
     "datetime_to_int",
     "time_to_int",
     "timedelta_to_int",
+    "_execute_batches_from_rust",
     "_execute_from_rust",
     "_polars_warn",
     "to_py_date",
@@ -0,0 +1,173 @@
+"""Run user-defined functions on a persistent pool of worker processes."""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import pickle
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from polars import DataFrame, Series
+    from polars.type_aliases import PolarsDataType
+
+_POOL: ProcessPoolExecutor | None = None
+
+
+def _init_worker() -> None:
+    # The workers together use the threads of the parent; the Polars thread pool is
+    # created lazily, so limiting it here takes effect in the worker.
+    os.environ["POLARS_MAX_THREADS"] = "1"
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        from polars.meta import thread_pool_size
+
+        # Forking a process that runs the Polars thread pool can deadlock the child.
+        _POOL = ProcessPoolExecutor(
+            max_workers=thread_pool_size(),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+    return _POOL
+
+
+def _to_ipc(df: DataFrame) -> bytes:
+    return df.write_ipc(None).getvalue()
+
+
+def _from_ipc(data: bytes) -> DataFrame:
+    import polars as pl
+
+    return pl.read_ipc(BytesIO(data), memory_map=False)
+
+
+def _partition(df: DataFrame, n: int) -> list[DataFrame]:
+    """Split `df` in at most `n` slices of about equal height."""
+    if df.height == 0:
+        return [df]
+    size, remainder = divmod(df.height, n)
+    sizes = [size + 1 if i < remainder else size for i in range(n)]
+    offsets = [sum(sizes[:i]) for i in range(n)]
+    return [df.slice(offset, size) for offset, size in zip(offsets, sizes) if size]
+
+
+def _run_task(task: bytes, data: bytes) -> tuple[str, Any]:
+    """Run a pickled task on a DataFrame in the worker process."""
+    from polars import DataFrame, Series
+
+    out = pickle.loads(task)(_from_ipc(data))
+    if isinstance(out, Series):
+        return "series", _to_ipc(out.to_frame())
+    elif isinstance(out, DataFrame):
+        return "frame", _to_ipc(out)
+    return "object", out
+
+
+def pickle_function(function: Callable[..., Any]) -> bytes:
+    """Pickle a function that is run with the 'process' strategy."""
+    try:
+        return pickle.dumps(function)
+    except (pickle.PicklingError, AttributeError, TypeError) as exc:
+        msg = (
+            "the function must be picklable to run it with the 'process' strategy;"
+            " define it at the top level of a module instead of using a lambda"
+            " or a nested function"
+        )
+        raise TypeError(msg) from exc
+
+
+def run_in_processes(
+    task: Callable[[DataFrame], Any], df: DataFrame, *, split: bool
+) -> list[Any]:
+    """
+    Run `task` on a pool of worker processes.
+
+    The data is sent to and from the workers in the Arrow IPC format.
+
+    Parameters
+    ----------
+    task
+        Function that is called with (a slice of) `df`. It must be picklable.
+    df
+        The data to run the task on.
+    split
+        Split `df` over all workers, otherwise run the task once on the whole frame.
+
+    Returns
+    -------
+    The results of the task on the slices of `df`, in order.
+    """
+    from polars.meta import thread_pool_size
+
+    payload = pickle_function(task)
+    pool = _get_pool()
+    slices = _partition(df, thread_pool_size()) if split else [df]
+    try:
+        futures = [pool.submit(_run_task, payload, _to_ipc(s)) for s in slices]
+        results = [future.result() for future in futures]
+    except BrokenProcessPool:
+        global _POOL
+        _POOL = None
+        raise
+
+    out = []
+    for kind, value in results:
+        if kind == "series":
+            value = _from_ipc(value).to_series()
+        elif kind == "frame":
+            value = _from_ipc(value)
+        out.append(value)
+    return out
+
+
+def _call_with_name(s: Series, *, function: Callable[[Any], Any], name: str) -> Any:
+    return function(s.alias(name))
+
+
+def map_elements_task(
+    df: DataFrame,
+    *,
+    function: Callable[[Any], Any],
+    return_dtype: PolarsDataType | None,
+    skip_nulls: bool,
+    memoize: bool,
+    name: str | None,
+) -> Series:
+    """Map `function` over the elements of the column of `df`."""
+    from polars.exceptions import PolarsInefficientMapWarning
+
+    if name is not None:
+        function = partial(_call_with_name, function=function, name=name)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", PolarsInefficientMapWarning)
+        return df.to_series().map_elements(
+            function,
+            return_dtype=return_dtype,
+            skip_nulls=skip_nulls,
+            memoize=memoize,
+        )
+
+
+def map_batches_task(df: DataFrame, *, function: Callable[[Series], Any]) -> Any:
+    """Call `function` on the column of `df`."""
+    return function(df.to_series())
+
+
+def map_rows_task(
+    df: DataFrame,
+    *,
+    function: Callable[[tuple[Any, ...]], Any],
+    return_dtype: PolarsDataType | None,
+    inference_size: int,
+) -> DataFrame:
+    """Map `function` over the rows of `df`."""
+    return df.map_rows(function, return_dtype, inference_size=inference_size)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import inspect
+from typing import TYPE_CHECKING, Any, Iterator
 
 if TYPE_CHECKING:
     from polars import DataFrame
@@ -25,3 +26,34 @@ def _execute_from_rust(
         Additional function arguments.
     """
     return function(with_columns, *args)
+
+
+def _execute_batches_from_rust(
+    function: Any, with_columns: list[str] | None, *args: Any
+) -> Iterator[DataFrame]:
+    """
+    Execute the given function for the projected columns and iterate its batches.
+
+    Called from the streaming engine in polars-pipe. Functions that accept a
+    `batched` keyword are asked to yield DataFrames one batch at a time; the
+    result of any other function is treated as a single batch.
+
+    Parameters
+    ----------
+    function
+        function object
+    with_columns
+        Columns that are projected
+    *args
+        Additional function arguments.
+    """
+    from polars import DataFrame
+
+    if "batched" in inspect.signature(function).parameters:
+        out = function(with_columns, *args, batched=True)
+    else:
+        out = function(with_columns, *args)
+
+    if isinstance(out, DataFrame):
+        return iter([out])
+    return iter(out)
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import contextlib
 import datetime
 import dis
 import inspect
+import math
+import os
 import re
 import sys
 import warnings
@@ -31,6 +34,8 @@ from polars._utils.various import re_escape
 if TYPE_CHECKING:
     from dis import Instruction
 
+    from polars import Expr
+
     if sys.version_info >= (3, 10):
         from typing import TypeAlias
     else:
@@ -514,8 +519,14 @@ class BytecodeParser:
         *,
         suggestion_override: str | None = None,
         udf_override: str | None = None,
+        rewritten: bool = False,
     ) -> None:
-        """Generate warning that suggests an equivalent native polars expression."""
+        """
+        Generate warning that suggests an equivalent native polars expression.
+
+        If `rewritten` is set, the warning states that the function was replaced by
+        the expression instead.
+        """
         # Import these here so that udfs can be imported without polars installed.
 
         from polars._utils.various import (
@@ -556,13 +567,31 @@ class BytecodeParser:
                     f"  + {suggested_expression}\n{addendum}",
                 )
             )
+            if rewritten:
+                context = (
+                    " in a select or with_columns context; in a group_by or window"
+                    " context the function is still called with every group"
+                    if self._map_target == "expr"
+                    else ""
+                )
+                msg = (
+                    f"\n{clsname}.map_elements was automatically replaced by the native {apitype} API{context}.\n"
+                    "Replaced this expression...\n"
+                    f"{before}"
+                    "with this one:\n"
+                    f"{after}"
+                )
+            else:
+                msg = (
+                    f"\n{clsname}.map_elements is significantly slower than the native {apitype} API.\n"
+                    "Only use if you absolutely CANNOT implement your logic otherwise.\n"
+                    "Replace this expression...\n"
+                    f"{before}"
+                    "with this one instead:\n"
+                    f"{after}"
+                )
             warnings.warn(
-                f"\n{clsname}.map_elements is significantly slower than the native {apitype} API.\n"
-                "Only use if you absolutely CANNOT implement your logic otherwise.\n"
-                "Replace this expression...\n"
-                f"{before}"
-                "with this one instead:\n"
-                f"{after}",
+                msg,
                 PolarsInefficientMapWarning,
                 stacklevel=find_stacklevel(),
             )
@@ -1070,8 +1099,35 @@ def _raw_function_meta(function: Callable[[Any], Any]) -> tuple[str, str]:
     return "", ""
 
 
+def _parse_inefficient_map(
+    function: Callable[[Any], Any], col: str, map_target: MapTarget
+) -> tuple[BytecodeParser, dict[str, str]] | None:
+    """The parser of `function` and the overrides of its suggestion, if any."""
+    # the parser introspects function bytecode to determine if we can
+    # rewrite as a much more optimal native polars expression instead
+    parser = BytecodeParser(function, map_target)
+    if parser.can_attempt_rewrite():
+        return parser, {}
+
+    # handle bare numpy/json functions
+    module, suggestion = _raw_function_meta(function)
+    if module and suggestion:
+        target_name = _get_target_name(col, suggestion, map_target)
+        parser._map_target_name = target_name
+        fn = function.__name__
+        return parser, {
+            "suggestion_override": f"{target_name}.{suggestion}",
+            "udf_override": fn if module == "builtins" else f"{module}.{fn}",
+        }
+    return None
+
+
 def warn_on_inefficient_map(
-    function: Callable[[Any], Any], columns: list[str], map_target: MapTarget
+    function: Callable[[Any], Any],
+    columns: list[str],
+    map_target: MapTarget,
+    *,
+    rewritten: bool = False,
 ) -> None:
     """
     Generate `PolarsInefficientMapWarning` on poor usage of a `map` function.
@@ -1086,6 +1142,8 @@ def warn_on_inefficient_map(
     map_target
         The target of the `map` call. One of `"expr"`, `"frame"`,
         or `"series"`.
+    rewritten
+        The function was replaced by the suggested expression.
     """
     if map_target == "frame":
         msg = "TODO: 'frame' map-function parsing"
@@ -1096,23 +1154,54 @@ def warn_on_inefficient_map(
     if not col and col != "":
         return None
 
-    # the parser introspects function bytecode to determine if we can
-    # rewrite as a much more optimal native polars expression instead
-    parser = BytecodeParser(function, map_target)
-    if parser.can_attempt_rewrite():
-        parser.warn(col)
-    else:
-        # handle bare numpy/json functions
-        module, suggestion = _raw_function_meta(function)
-        if module and suggestion:
-            target_name = _get_target_name(col, suggestion, map_target)
-            parser._map_target_name = target_name
-            fn = function.__name__
-            parser.warn(
-                col,
-                suggestion_override=f"{target_name}.{suggestion}",
-                udf_override=fn if module == "builtins" else f"{module}.{fn}",
-            )
+    if (parsed := _parse_inefficient_map(function, col, map_target)) is not None:
+        parser, overrides = parsed
+        parser.warn(col, rewritten=rewritten, **overrides)
+
+
+def rewrite_inefficient_map(
+    function: Callable[[Any], Any], columns: list[str]
+) -> Expr | None:
+    """
+    Translate a `map` function to a native expression if the setting is enabled.
+
+    See `Config.set_udf_auto_rewrite`. The expression is applied to the column
+    `columns[0]`; None is returned if the function cannot be translated.
+
+    Parameters
+    ----------
+    function
+        The function passed to `map`.
+    columns
+        The column names of the original object; in the case of an `Expr` this
+        will be a list of length 1 containing the expression's root name.
+    """
+    if not int(os.environ.get("POLARS_UDF_AUTO_REWRITE", 0)):
+        return None
+
+    col: str = columns and columns[0]  # type: ignore[assignment]
+    if not col and col != "":
+        return None
+    if (parsed := _parse_inefficient_map(function, col, "expr")) is None:
+        return None
+    parser, overrides = parsed
+    expression = overrides.get("suggestion_override") or parser.to_expression(col)
+    if expression is None:
+        return None
+
+    import polars as pl
+    from polars.dependencies import numpy as np
+
+    # resolve the names that the function refers to, such as constants
+    namespace = dict(getattr(function, "__globals__", {}))
+    with contextlib.suppress(TypeError):
+        namespace.update(inspect.getclosurevars(function).nonlocals)
+    namespace.update({"pl": pl, "np": np, "math": math})
+    try:
+        expr = eval(expression, namespace)
+    except Exception:
+        return None
+    return expr if isinstance(expr, pl.Expr) else None
 
 
-__all__ = ["BytecodeParser", "warn_on_inefficient_map"]
+__all__ = ["BytecodeParser", "rewrite_inefficient_map", "warn_on_inefficient_map"]
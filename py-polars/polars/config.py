@@ -63,8 +63,15 @@ _POLARS_CFG_ENV_VARS = {
     "POLARS_FMT_TABLE_HIDE_DATAFRAME_SHAPE_INFORMATION",
     "POLARS_FMT_TABLE_INLINE_COLUMN_DATA_TYPE",
     "POLARS_FMT_TABLE_ROUNDED_CORNERS",
+    "POLARS_OBJECT_STORE_CACHE_DIR",
+    "POLARS_OBJECT_STORE_CACHE_MAX_SIZE",
+    "POLARS_PREFETCH_MEMORY_BUDGET",
+    "POLARS_PREFETCH_SIZE",
+    "POLARS_QUERY_CACHE_SIZE",
+    "POLARS_QUERY_CACHE_SPILL_DIR",
     "POLARS_STREAMING_CHUNK_SIZE",
     "POLARS_TABLE_WIDTH",
+    "POLARS_UDF_AUTO_REWRITE",
     "POLARS_VERBOSE",
 }
 
@@ -742,15 +749,105 @@ class Config(contextlib.ContextDecorator):
             os.environ["POLARS_FMT_TABLE_CELL_LIST_LEN"] = str(n)
         return cls
 
+    @classmethod
+    def set_object_store_cache(
+        cls, directory: str | Path | None, max_size: int | None = None
+    ) -> type[Config]:
+        """
+        Cache the data that is read from cloud storage on the local disk.
+
+        Repeated scans of the same remote files are then served from the local disk.
+        The cached data is keyed by the object's ETag (or size and modification time),
+        so modified objects are fetched again. The cache can also be configured per
+        scan through the `file_cache_dir` and `file_cache_max_size` keys of the
+        `storage_options`, which take precedence over this setting.
+
+        Parameters
+        ----------
+        directory
+            Directory in which the cached data is stored; `None` disables the cache.
+            The directory can be shared by multiple processes.
+        max_size
+            Maximum size of the cache in bytes (default: 10 GiB). The least recently
+            used data is evicted once the cache grows larger.
+
+        See Also
+        --------
+        object_store_cache_stats : Return the hit/miss statistics of the cache.
+
+        Examples
+        --------
+        >>> pl.Config.set_object_store_cache(
+        ...     "/tmp/polars_cache", max_size=50 * 2**30
+        ... )  # doctest: +SKIP
+        """
+        if directory is None:
+            os.environ.pop("POLARS_OBJECT_STORE_CACHE_DIR", None)
+        else:
+            os.environ["POLARS_OBJECT_STORE_CACHE_DIR"] = normalize_filepath(
+                directory, check_not_directory=False
+            )
+        if max_size is None:
+            os.environ.pop("POLARS_OBJECT_STORE_CACHE_MAX_SIZE", None)
+        else:
+            if max_size < 0:
+                msg = "`max_size` of the object store cache must be >= 0"
+                raise ValueError(msg)
+            os.environ["POLARS_OBJECT_STORE_CACHE_MAX_SIZE"] = str(max_size)
+        return cls
+
+    @classmethod
+    def set_query_cache(
+        cls, max_size: int | None, spill_dir: str | Path | None = None
+    ) -> type[Config]:
+        """
+        Configure the cache of results that are persisted with `cache(persist=True)`.
+
+        Parameters
+        ----------
+        max_size
+            Maximum memory usage of the cached results in bytes (default: 1 GiB);
+            0 disables the cache. The least recently used results are evicted once
+            the cache grows larger.
+        spill_dir
+            Directory to which evicted results are written as IPC files, instead of
+            being dropped. They are read back on their next use.
+
+        See Also
+        --------
+        LazyFrame.cache : Cache the result of a query, optionally across queries.
+
+        Examples
+        --------
+        >>> pl.Config.set_query_cache(
+        ...     4 * 2**30, spill_dir="/tmp/polars_query_cache"
+        ... )  # doctest: +SKIP
+        """
+        if max_size is None:
+            os.environ.pop("POLARS_QUERY_CACHE_SIZE", None)
+        else:
+            if max_size < 0:
+                msg = "`max_size` of the query cache must be >= 0"
+                raise ValueError(msg)
+            os.environ["POLARS_QUERY_CACHE_SIZE"] = str(max_size)
+        if spill_dir is None:
+            os.environ.pop("POLARS_QUERY_CACHE_SPILL_DIR", None)
+        else:
+            os.environ["POLARS_QUERY_CACHE_SPILL_DIR"] = normalize_filepath(
+                spill_dir, check_not_directory=False
+            )
+        return cls
+
     @classmethod
     def set_streaming_chunk_size(cls, size: int | None) -> type[Config]:
         """
         Overwrite chunk size used in `streaming` engine.
 
-        By default, the chunk size is determined by the schema
-        and size of the thread pool. For some datasets (esp.
-        when you have large string elements) this can be too
-        optimistic and lead to Out of Memory errors.
+        By default, the chunk size is determined by the estimated
+        size of a row of the schema, the size of the thread pool and
+        the available memory; the chunks shrink under memory pressure.
+        For some datasets (esp. when you have large string elements)
+        this can be too optimistic and lead to Out of Memory errors.
 
         Parameters
         ----------
@@ -768,6 +865,47 @@ class Config(contextlib.ContextDecorator):
             os.environ["POLARS_STREAMING_CHUNK_SIZE"] = str(size)
         return cls
 
+    @classmethod
+    def set_streaming_prefetch(
+        cls, n_files: int | None, memory_budget: int | None = None
+    ) -> type[Config]:
+        """
+        Configure how far scans of cloud storage read ahead in the `streaming` engine.
+
+        The next files of a scan, and of the scans that are combined with `concat`,
+        are downloaded in the background while the current file is processed.
+
+        Parameters
+        ----------
+        n_files
+            Maximum number of files that a scan reads ahead (default: twice the
+            number of threads, and at least 16).
+        memory_budget
+            Maximum estimated size in bytes of the files that all scans read ahead
+            (default: 1 GiB). A scan always reads at least one file.
+
+        Examples
+        --------
+        >>> pl.Config.set_streaming_prefetch(
+        ...     64, memory_budget=4 * 2**30
+        ... )  # doctest: +SKIP
+        """
+        if n_files is None:
+            os.environ.pop("POLARS_PREFETCH_SIZE", None)
+        else:
+            if n_files < 1:
+                msg = "number of files to prefetch must be >= 1"
+                raise ValueError(msg)
+            os.environ["POLARS_PREFETCH_SIZE"] = str(n_files)
+        if memory_budget is None:
+            os.environ.pop("POLARS_PREFETCH_MEMORY_BUDGET", None)
+        else:
+            if memory_budget < 0:
+                msg = "`memory_budget` of the prefetched files must be >= 0"
+                raise ValueError(msg)
+            os.environ["POLARS_PREFETCH_MEMORY_BUDGET"] = str(memory_budget)
+        return cls
+
     @classmethod
     def set_tbl_cell_alignment(
         cls, format: Literal["LEFT", "CENTER", "RIGHT"] | None
@@ -1281,6 +1419,54 @@ class Config(contextlib.ContextDecorator):
         plr.set_trim_decimal_zeros(active)
         return cls
 
+    @classmethod
+    def set_udf_auto_rewrite(cls, active: bool | None = True) -> type[Config]:
+        """
+        Run user-defined functions as native expressions where they can be translated.
+
+        `map_elements` warns when it is called with a function that can be translated
+        to a native expression. With this setting, `Expr.map_elements` (on a column)
+        and `Series.map_elements` run the translated expression instead, and warn that
+        they did so. Functions that cannot be translated run as before.
+
+        Parameters
+        ----------
+        active : bool
+            Replace the functions by their native equivalent.
+
+        Notes
+        -----
+        The translation assumes that the function is called on single values, and
+        the native expression may differ from the function in edge cases, such as
+        the handling of nulls, overflow or division by zero. Do not enable this
+        setting if a function is used in a group by context, where it is called on
+        the values of every group.
+
+        Examples
+        --------
+        >>> pl.Config.set_udf_auto_rewrite(True)  # doctest: +SKIP
+        >>> s = pl.Series("a", [1, 2, 3])
+        >>> s.map_elements(lambda x: x * 2 + 1)  # doctest: +SKIP
+        PolarsInefficientMapWarning:
+        Series.map_elements was automatically replaced by the native series API.
+        Replaced this expression...
+          - s.map_elements(lambda x: ...)
+        with this one:
+          + s * 2 + 1
+        shape: (3,)
+        Series: 'a' [i64]
+        [
+            3
+            5
+            7
+        ]
+        """
+        if active is None:
+            os.environ.pop("POLARS_UDF_AUTO_REWRITE", None)
+        else:
+            os.environ["POLARS_UDF_AUTO_REWRITE"] = str(int(active))
+        return cls
+
     @classmethod
     def set_verbose(cls, active: bool | None = True) -> type[Config]:
         """
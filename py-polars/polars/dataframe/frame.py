@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import contextlib
 import os
+import pickle
 import random
 from collections import OrderedDict, defaultdict
 from collections.abc import Sized
+from functools import partial
 from io import BytesIO, StringIO, TextIOWrapper
 from operator import itemgetter
 from pathlib import Path
@@ -23,6 +25,7 @@ from typing import (
     Mapping,
     NoReturn,
     Sequence,
+    SupportsIndex,
     TypeVar,
     Union,
     cast,
@@ -78,7 +81,7 @@ from polars.datatypes import (
 )
 from polars.dependencies import (
     _HVPLOT_AVAILABLE,
-    _PANDAS_AVAILABLE,
+    _NUMPY_AVAILABLE,
     _PYARROW_AVAILABLE,
     _check_for_numpy,
     _check_for_pandas,
@@ -111,6 +114,7 @@ from polars.slice import PolarsSlice
 from polars.type_aliases import DbWriteMode
 
 with contextlib.suppress(ImportError):  # Module not available when building docs
+    from polars.polars import PyDataFrame
     from polars.polars import dtype_str_repr as _dtype_str_repr
     from polars.polars import write_clipboard_string as _write_clipboard_string
 
@@ -126,7 +130,6 @@ if TYPE_CHECKING:
 
     from polars import DataType, Expr, LazyFrame, Series
     from polars.interchange.dataframe import PolarsDataFrame
-    from polars.polars import PyDataFrame
     from polars.type_aliases import (
         AsofJoinStrategy,
         AvroCompression,
@@ -148,6 +151,7 @@ if TYPE_CHECKING:
         JoinStrategy,
         JoinValidation,
         Label,
+        MapRowsStrategy,
         NullStrategy,
         OneOrMoreDataTypes,
         Orientation,
@@ -795,6 +799,56 @@ class DataFrame:
 
         return PolarsDataFrame(self, allow_copy=allow_copy)
 
+    def __dlpack__(
+        self,
+        *,
+        stream: Any = None,
+        max_version: tuple[int, int] | None = None,
+        dl_device: tuple[int, int] | None = None,
+        copy: bool | None = None,
+    ) -> Any:
+        """
+        Export the DataFrame as a 2D tensor through the DLPack protocol.
+
+        The columns are the second axis of the tensor. All columns must have the same
+        numeric data type and may not contain nulls. The data is exported without
+        copying if the columns are stored at equal distances in memory, which is the
+        case after :meth:`consolidate`.
+
+        .. warning::
+            The consumer of the tensor must not modify the data, as it is shared with
+            the DataFrame.
+
+        Parameters
+        ----------
+        stream
+            Not supported, as the data is on the CPU.
+        max_version
+            The highest DLPack version that the consumer supports. The tensor is
+            always exported in the format that precedes DLPack 1.0.
+        dl_device
+            The device to export the data to, which must be the CPU.
+        copy
+            Copy the data. If set to `False`, raise if the data cannot be exported
+            without copying. If not set, copy only if necessary.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> df = pl.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]}).consolidate()
+        >>> np.from_dlpack(df)
+        array([[1., 3.],
+               [2., 4.]])
+        """
+        if stream is not None or dl_device not in (None, (1, 0)):
+            msg = "only export to the CPU is supported"
+            raise BufferError(msg)
+        return self._df.to_dlpack(copy)
+
+    def __dlpack_device__(self) -> tuple[int, int]:
+        """The device of the data for the DLPack protocol, which is the CPU."""
+        return (1, 0)
+
     def _comp(self, other: Any, op: ComparisonOperator) -> DataFrame:
         """Compare a DataFrame with another object."""
         if isinstance(other, DataFrame):
@@ -932,6 +986,25 @@ class DataFrame:
     def __setstate__(self, state: list[Series]) -> None:
         self._df = DataFrame(state)._df
 
+    def __reduce_ex__(self, protocol: SupportsIndex) -> str | tuple[Any, ...]:
+        # Pickle protocol 5 supports out-of-band buffers; the data is handed to pickle
+        # as a single buffer without copying it.
+        if int(protocol) >= 5 and _NUMPY_AVAILABLE:
+            buffer = pickle.PickleBuffer(self._df._to_pickle_buffer())
+            return type(self)._from_pickle_buffer, (buffer,)
+        return super().__reduce_ex__(protocol)
+
+    @classmethod
+    def _from_pickle_buffer(cls, buffer: Any) -> Self:
+        if not isinstance(buffer, bytes):
+            # Viewing the buffer as a numpy array does not copy it.
+            buffer = (
+                np.frombuffer(buffer, dtype=np.uint8)
+                if _NUMPY_AVAILABLE
+                else bytes(buffer)
+            )
+        return cls._from_pydf(PyDataFrame._from_pickle_buffer(buffer))
+
     def __mul__(self, other: DataFrame | Series | int | float) -> Self:
         if isinstance(other, DataFrame):
             return self._from_pydf(self._df.mul_df(other._df))
@@ -2854,6 +2927,7 @@ class DataFrame:
         statistics: bool = True,
         row_group_size: int | None = None,
         data_page_size: int | None = None,
+        bloom_filter_columns: Sequence[str] | None = None,
         use_pyarrow: bool = False,
         pyarrow_options: dict[str, Any] | None = None,
     ) -> None:
@@ -2879,10 +2953,16 @@ class DataFrame:
 
         statistics
             Write statistics to the parquet headers. This is the default behavior.
+            The statistics are also written per page in the page index, which
+            allows scans to skip pages that do not match a filter.
         row_group_size
             Size of the row groups in number of rows. Defaults to 512^2 rows.
         data_page_size
             Size of the data page in bytes. Defaults to 1024^2 bytes.
+        bloom_filter_columns
+            Write a bloom filter for these columns in every row group. Readers can
+            use the bloom filters to skip row groups when filtering on equality or
+            `is_in`. Not supported when `use_pyarrow=True`.
         use_pyarrow
             Use C++ parquet implementation vs Rust parquet implementation.
             At the moment C++ supports more features.
@@ -2930,6 +3010,9 @@ class DataFrame:
                 file = normalize_filepath(file)
 
         if use_pyarrow:
+            if bloom_filter_columns is not None:
+                msg = "`bloom_filter_columns` is not supported when `use_pyarrow=True`"
+                raise ValueError(msg)
             tbl = self.to_arrow()
             data = {}
 
@@ -2976,6 +3059,7 @@ class DataFrame:
                 statistics,
                 row_group_size,
                 data_page_size,
+                None if bloom_filter_columns is None else list(bloom_filter_columns),
             )
 
     @deprecate_renamed_parameter("if_exists", "if_table_exists", version="0.20.0")
@@ -2986,6 +3070,7 @@ class DataFrame:
         *,
         if_table_exists: DbWriteMode = "fail",
         engine: DbWriteEngine = "sqlalchemy",
+        batch_size: int = 10_000,
     ) -> int:
         """
         Write a polars frame to a database.
@@ -3009,6 +3094,11 @@ class DataFrame:
             * 'fail' will fail if table already exists.
         engine : {'sqlalchemy', 'adbc'}
             Select the engine to use for writing frame data.
+        batch_size
+            The number of rows that are sent to the database at once when writing
+            with the 'sqlalchemy' engine. Every batch is inserted with a single
+            `executemany` call, which uses the bulk insert path of the dialect
+            where one is available (eg: multi-row VALUES).
 
         Returns
         -------
@@ -3020,6 +3110,9 @@ class DataFrame:
             allowed = ", ".join(repr(m) for m in valid_write_modes)
             msg = f"write_database `if_table_exists` must be one of {{{allowed}}}, got {if_table_exists!r}"
             raise ValueError(msg)
+        if batch_size < 1:
+            msg = f"`batch_size` must be a positive integer, got {batch_size}"
+            raise ValueError(msg)
 
         def unpack_table_name(name: str) -> tuple[str | None, str | None, str]:
             """Unpack optionally qualified table name to catalog/schema/table tuple."""
@@ -3101,37 +3194,30 @@ class DataFrame:
             return n_rows
 
         elif engine == "sqlalchemy":
-            if not _PANDAS_AVAILABLE:
-                msg = "writing with engine 'sqlalchemy' currently requires pandas.\n\nInstall with: pip install pandas"
-                raise ModuleNotFoundError(msg)
-            elif parse_version(pd.__version__) < (1, 5):
-                msg = f"writing with engine 'sqlalchemy' requires pandas 1.5.x or higher, found {pd.__version__!r}"
-                raise ModuleUpgradeRequired(msg)
             try:
-                from sqlalchemy import create_engine
+                import sqlalchemy  # noqa: F401
             except ModuleNotFoundError as exc:
                 msg = "sqlalchemy not found\n\nInstall with: pip install polars[sqlalchemy]"
                 raise ModuleNotFoundError(msg) from exc
 
+            from polars.io.database._write import _write_sqlalchemy
+
             # note: the catalog (database) should be a part of the connection string
-            engine_sa = create_engine(connection)
             catalog, db_schema, unpacked_table_name = unpack_table_name(table_name)
             if catalog:
                 msg = f"Unexpected three-part table name; provide the database/catalog ({catalog!r}) on the connection URI"
                 raise ValueError(msg)
 
-            # ensure conversion to pandas uses the pyarrow extension array option
-            # so that we can make use of the sql/db export *without* copying data
-            res: int | None = self.to_pandas(
-                use_pyarrow_extension_array=True,
-            ).to_sql(
-                name=unpacked_table_name,
-                schema=db_schema,
-                con=engine_sa,
-                if_exists=if_table_exists,
-                index=False,
+            # insert non-copying slices of the frame, so that only a single batch
+            # of rows is materialised as python objects at any time
+            return _write_sqlalchemy(
+                self.iter_slices(batch_size),
+                schema=self.schema,
+                table_name=unpacked_table_name,
+                db_schema=db_schema,
+                connection=connection,
+                if_table_exists=if_table_exists,
             )
-            return -1 if res is None else res
         else:
             msg = f"engine {engine!r} is not supported"
             raise ValueError(msg)
@@ -6174,6 +6260,7 @@ class DataFrame:
         return_dtype: PolarsDataType | None = None,
         *,
         inference_size: int = 256,
+        strategy: MapRowsStrategy = "thread_local",
     ) -> DataFrame:
         """
         Apply a custom/user-defined function (UDF) over the rows of the DataFrame.
@@ -6205,6 +6292,19 @@ class DataFrame:
         inference_size
             Only used in the case when the custom function returns rows.
             This uses the first `n` rows to determine the output schema.
+        strategy : {'thread_local', 'process'}
+            The strategy to run the function with.
+
+            - 'thread_local': run the python function in this process.
+            - 'process': split the rows over a pool of worker processes and run
+              the python function there. This speeds up CPU-bound functions
+              that hold the GIL, if the amount of work per row outweighs
+              copying the data to and from the workers. The function must be
+              picklable, so it cannot be a lambda.
+
+            .. warning::
+                This functionality is considered **unstable**. It may be changed
+                at any point without it being considered a breaking change.
 
         Notes
         -----
@@ -6264,6 +6364,24 @@ class DataFrame:
         # from polars._utils.udfs import warn_on_inefficient_map
         # warn_on_inefficient_map(function, columns=self.columns, map_target="frame)
 
+        if strategy == "process":
+            issue_unstable_warning(
+                "The 'process' strategy for `map_rows` is considered unstable."
+            )
+            from polars._utils.process_pool import map_rows_task, run_in_processes
+
+            task = partial(
+                map_rows_task,
+                function=function,
+                return_dtype=return_dtype,
+                inference_size=inference_size,
+            )
+            frames = run_in_processes(task, self, split=True)
+            return F.concat(frames, how="vertical_relaxed")
+        elif strategy != "thread_local":
+            msg = f"strategy {strategy!r} is not supported"
+            raise ValueError(msg)
+
         out, is_df = self._df.map_rows(function, return_dtype, inference_size)
         if is_df:
             return self._from_pydf(out)
@@ -9006,6 +9124,25 @@ class DataFrame:
         """
         return self._from_pydf(self._df.rechunk())
 
+    def consolidate(self) -> Self:
+        """
+        Store the columns in a single contiguous allocation, one after the other.
+
+        All columns must have the same numeric data type. The data is copied once,
+        after which :meth:`to_numpy` (with the default Fortran-like order) and the
+        DLPack export (`__dlpack__`) of the DataFrame do not copy, as long as it has
+        no nulls. This is useful to pass the same feature matrix to other libraries
+        repeatedly.
+
+        Examples
+        --------
+        >>> df = pl.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]}).consolidate()
+        >>> df.to_numpy(allow_copy=False)
+        array([[1., 3.],
+               [2., 4.]])
+        """
+        return self._from_pydf(self._df.consolidate())
+
     def null_count(self) -> Self:
         """
         Create a new DataFrame that shows the null counts per column.
@@ -5,7 +5,7 @@ import math
 import operator
 import warnings
 from datetime import timedelta
-from functools import reduce
+from functools import partial, reduce
 from io import BytesIO, StringIO
 from pathlib import Path
 from typing import (
@@ -50,12 +50,17 @@ from polars._utils.various import (
 )
 from polars.datatypes import (
     Int64,
+    List,
     is_polars_dtype,
     py_type_to_dtype,
 )
 from polars.dependencies import _check_for_numpy
 from polars.dependencies import numpy as np
-from polars.exceptions import CustomUFuncWarning, PolarsInefficientMapWarning
+from polars.exceptions import (
+    CustomUFuncWarning,
+    PolarsError,
+    PolarsInefficientMapWarning,
+)
 from polars.expr.array import ExprArrayNameSpace
 from polars.expr.binary import ExprBinaryNameSpace
 from polars.expr.categorical import ExprCatNameSpace
@@ -87,6 +92,7 @@ if TYPE_CHECKING:
         InterpolationMethod,
         IntoExpr,
         IntoExprColumn,
+        MapBatchesStrategy,
         MapElementsStrategy,
         NullBehavior,
         NumericLiteral,
@@ -4136,6 +4142,7 @@ class Expr:
         *,
         agg_list: bool = False,
         is_elementwise: bool = False,
+        strategy: MapBatchesStrategy = "thread_local",
     ) -> Self:
         """
         Apply a custom python function to a whole Series or sequence of Series.
@@ -4168,6 +4175,19 @@ class Expr:
             function. This parameter only works in a group-by context.
             The function will be invoked only once on a list of groups, rather than
             once per group.
+        strategy : {'thread_local', 'process'}
+            The strategy to run the function with.
+
+            - 'thread_local': run the python function in this process.
+            - 'process': run the python function on a pool of worker processes,
+              so that it does not hold the GIL of this process. If
+              `is_elementwise` is set, the Series is split over the workers.
+              The function must be picklable, so it cannot be a lambda, and
+              the data is copied to and from the workers.
+
+            .. warning::
+                This functionality is considered **unstable**. It may be changed
+                at any point without it being considered a breaking change.
 
         Warnings
         --------
@@ -4240,15 +4260,162 @@ class Expr:
         if return_dtype is not None:
             return_dtype = py_type_to_dtype(return_dtype)
 
+        wrapper: Callable[[Series], Series | Any] = self._map_batches_wrapper(
+            function, return_dtype
+        )
+        if strategy == "process":
+            issue_unstable_warning(
+                "The 'process' strategy for `map_batches` is considered unstable."
+            )
+            from polars._utils.process_pool import (
+                map_batches_task,
+                pickle_function,
+                run_in_processes,
+            )
+
+            pickle_function(function)
+            task = partial(map_batches_task, function=wrapper)
+
+            def wrap_process(x: Series) -> Series | Any:
+                out = run_in_processes(task, x.to_frame(), split=is_elementwise)
+                return F.concat(out, rechunk=False) if is_elementwise else out[0]
+
+            wrapper = wrap_process
+
+        elif strategy != "thread_local":
+            msg = f"strategy {strategy!r} is not supported"
+            raise ValueError(msg)
+
         return self._from_pyexpr(
             self._pyexpr.map_batches(
-                self._map_batches_wrapper(function, return_dtype),
+                wrapper,
                 return_dtype,
                 agg_list,
                 is_elementwise,
             )
         )
 
+    def map_flat_groups(
+        self,
+        function: Callable[[np.ndarray[Any, Any], np.ndarray[Any, Any]], Any],
+        return_dtype: PolarsDataType | None = None,
+        *,
+        returns_scalar: bool = True,
+    ) -> Self:
+        """
+        Apply a custom python function to the values of all groups at once.
+
+        The function is called once with two NumPy arrays: the values of all groups
+        concatenated, and the offsets of the groups in those values. Group `i`
+        consists of `values[offsets[i]:offsets[i + 1]]`, so `offsets` has one more
+        element than there are groups. This allows NumPy or numba kernels (e.g.
+        `np.add.reduceat` or a `@guvectorize` function) to process every group in
+        a single call, instead of calling a python function per group.
+
+        In a selection context, the whole column is a single group.
+
+        .. warning::
+            This functionality is considered **unstable**. It may be changed
+            at any point without it being considered a breaking change.
+
+        Parameters
+        ----------
+        function
+            Function that receives the values and the offsets and returns an array.
+        return_dtype
+            Dtype of the output values.
+            If not set, the dtype will be inferred from the returned array.
+        returns_scalar
+            The function returns one value per group. Otherwise it returns one
+            value per input value, which are gathered in a list per group; empty
+            groups result in null.
+
+        Notes
+        -----
+        The values are converted with :meth:`Series.to_numpy`, so nulls in numeric
+        columns are passed as NaN.
+
+        See Also
+        --------
+        map_batches
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> df = pl.DataFrame(
+        ...     {
+        ...         "g": ["a", "b", "a", "b", "b"],
+        ...         "v": [1, 2, 3, 4, 5],
+        ...     }
+        ... )
+        >>> df.group_by("g", maintain_order=True).agg(
+        ...     pl.col("v").map_flat_groups(
+        ...         lambda values, offsets: np.add.reduceat(values, offsets[:-1])
+        ...     )
+        ... )
+        shape: (2, 2)
+        ┌─────┬─────┐
+        │ g   ┆ v   │
+        │ --- ┆ --- │
+        │ str ┆ i64 │
+        ╞═════╪═════╡
+        │ a   ┆ 4   │
+        │ b   ┆ 11  │
+        └─────┴─────┘
+        """
+        issue_unstable_warning("`map_flat_groups` is considered unstable.")
+        if return_dtype is not None:
+            return_dtype = py_type_to_dtype(return_dtype)
+
+        def wrap_f(s: Series) -> Series:
+            # The input is wrapped in a struct, so that groups that were aggregated
+            # into lists by `agg_list` can be told apart from a column of lists.
+            if s.dtype == List:
+                lengths = s.list.len().fill_null(0).to_numpy()
+                values = s.explode()
+                if (lengths == 0).any():
+                    # exploding yields a null for every empty group
+                    keep = np.repeat(lengths > 0, np.maximum(lengths, 1))
+                    values = values.filter(pl.Series(keep))
+            else:
+                lengths = np.array([s.len()])
+                values = s
+            values = values.struct.unnest().to_series()
+            offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=offsets[1:])
+
+            result = pl.Series(
+                s.name, function(values.to_numpy(), offsets), dtype=return_dtype
+            )
+            if returns_scalar:
+                return result
+
+            # gather the values of every group in a list
+            groups = np.repeat(np.arange(len(lengths)), lengths)
+            lists = (
+                result.to_frame("value")
+                .with_columns(group=pl.Series(groups))
+                .group_by("group", maintain_order=True)
+                .agg(F.col("value"))
+            )
+            return (
+                pl.Series("group", np.arange(len(lengths)))
+                .to_frame()
+                .join(lists, on="group", how="left")
+                .to_series(1)
+                .alias(s.name)
+            )
+
+        if return_dtype is not None and not returns_scalar:
+            output_dtype: PolarsDataType | None = List(return_dtype)
+        else:
+            output_dtype = return_dtype
+        return self._from_pyexpr(
+            F.struct(self)
+            .map_batches(wrap_f, return_dtype=output_dtype, agg_list=True)
+            ._pyexpr
+        )
+
     def map_elements(
         self,
         function: Callable[[Series], Series] | Callable[[Any], Any],
@@ -4257,6 +4424,7 @@ class Expr:
         skip_nulls: bool = True,
         pass_name: bool = False,
         strategy: MapElementsStrategy = "thread_local",
+        memoize: bool = False,
     ) -> Self:
         """
         Map a custom/user-defined function (UDF) to each element of a column.
@@ -4290,7 +4458,7 @@ class Expr:
             Don't map the function over values that contain nulls (this is faster).
         pass_name
             Pass the Series name to the custom function (this is more expensive).
-        strategy : {'thread_local', 'threading'}
+        strategy : {'thread_local', 'threading', 'process'}
             The threading strategy to use.
 
             - 'thread_local': run the python function on a single thread.
@@ -4299,10 +4467,21 @@ class Expr:
               your code if the amount of work per element is significant
               and the python function releases the GIL (e.g. via calling
               a c function)
+            - 'process': split the column over a pool of worker processes and
+              run the python function there. This speeds up CPU-bound functions
+              that hold the GIL, if the amount of work per element outweighs
+              copying the data to and from the workers. The function must be
+              picklable, so it cannot be a lambda.
 
             .. warning::
                 This functionality is considered **unstable**. It may be changed
                 at any point without it being considered a breaking change.
+        memoize
+            Call the function once per unique value and map every value to the
+            result for its unique value. This is much faster if the column has few
+            unique values, e.g. if it is Categorical, but requires the function to
+            return the same result for the same value. Only applies in a selection
+            context; in a GroupBy context the function is called for every group.
 
         Warnings
         --------
@@ -4434,17 +4613,32 @@ class Expr:
         ...     scaled=(pl.col("val") * pl.col("val").count()).over("key"),
         ... ).sort("key")  # doctest: +IGNORE_RESULT
         """
-        if strategy == "threading":
+        if strategy not in ("thread_local", "threading", "process"):
+            msg = f"strategy {strategy!r} is not supported"
+            raise ValueError(msg)
+        elif strategy != "thread_local":
             issue_unstable_warning(
-                "The 'threading' strategy for `map_elements` is considered unstable."
+                f"The {strategy!r} strategy for `map_elements` is considered unstable."
             )
 
         # input x: Series of type list containing the group values
-        from polars._utils.udfs import warn_on_inefficient_map
+        from polars._utils.udfs import (
+            rewrite_inefficient_map,
+            warn_on_inefficient_map,
+        )
 
+        rewritten: Expr | None = None
         root_names = self.meta.root_names()
         if len(root_names) > 0:
-            warn_on_inefficient_map(function, columns=root_names, map_target="expr")
+            # the 'threading' and 'process' strategies exist to run the function
+            if skip_nulls and strategy == "thread_local" and self.meta.is_column():
+                rewritten = rewrite_inefficient_map(function, root_names)
+            warn_on_inefficient_map(
+                function,
+                columns=root_names,
+                map_target="expr",
+                rewritten=rewritten is not None,
+            )
 
         if pass_name:
 
@@ -4455,7 +4649,10 @@ class Expr:
                 with warnings.catch_warnings():
                     warnings.simplefilter("ignore", PolarsInefficientMapWarning)
                     return x.map_elements(
-                        inner, return_dtype=return_dtype, skip_nulls=skip_nulls
+                        inner,
+                        return_dtype=return_dtype,
+                        skip_nulls=skip_nulls,
+                        memoize=memoize,
                     )
 
         else:
@@ -4464,10 +4661,38 @@ class Expr:
                 with warnings.catch_warnings():
                     warnings.simplefilter("ignore", PolarsInefficientMapWarning)
                     return x.map_elements(
-                        function, return_dtype=return_dtype, skip_nulls=skip_nulls
+                        function,
+                        return_dtype=return_dtype,
+                        skip_nulls=skip_nulls,
+                        memoize=memoize,
                     )
 
-        if strategy == "thread_local":
+        if rewritten is not None:
+            name = root_names[0]
+            if return_dtype is not None:
+                rewritten = rewritten.cast(return_dtype)
+            native = rewritten.alias(name)
+
+            def wrap_rewritten(x: Series) -> Series:
+                # The column is wrapped in a struct, so that the groups of a group_by
+                # or window context (a list of structs) can be told apart from a
+                # column of lists. The function is called with whole groups in those
+                # contexts, so the native expression only replaces it elementwise.
+                if x.dtype == List:
+                    return wrap_f(x.list.eval(F.element().struct.field(name)))
+                x = x.struct.unnest().to_series()
+                if not x.dtype.is_nested():
+                    # fall back to the function if the expression does not apply
+                    with contextlib.suppress(PolarsError):
+                        return x.to_frame().select(native).to_series()
+                return wrap_f(x)
+
+            return self._from_pyexpr(
+                F.struct(self)
+                .map_batches(wrap_rewritten, agg_list=True, return_dtype=return_dtype)
+                ._pyexpr
+            )
+        elif strategy == "thread_local":
             return self.map_batches(wrap_f, agg_list=True, return_dtype=return_dtype)
         elif strategy == "threading":
 
@@ -4512,8 +4737,29 @@ class Expr:
                 wrap_threading, agg_list=True, return_dtype=return_dtype
             )
         else:
-            msg = f"strategy {strategy!r} is not supported"
-            raise ValueError(msg)
+            from polars._utils.process_pool import (
+                map_elements_task,
+                pickle_function,
+                run_in_processes,
+            )
+
+            pickle_function(function)
+
+            def wrap_process(x: Series) -> Series:
+                task = partial(
+                    map_elements_task,
+                    function=function,
+                    return_dtype=return_dtype,
+                    skip_nulls=skip_nulls,
+                    memoize=memoize,
+                    name=x.name if pass_name else None,
+                )
+                out = run_in_processes(task, x.to_frame(), split=True)
+                return F.concat(out, rechunk=False)
+
+            return self.map_batches(
+                wrap_process, agg_list=True, return_dtype=return_dtype
+            )
 
     def flatten(self) -> Self:
         """
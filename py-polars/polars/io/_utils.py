@@ -1,16 +1,20 @@
 from __future__ import annotations
 
+import codecs
 import glob
 import re
 from contextlib import contextmanager
 from io import BytesIO, StringIO
 from pathlib import Path
-from typing import IO, Any, ContextManager, Iterator, Sequence, overload
+from typing import IO, TYPE_CHECKING, Any, ContextManager, Iterator, Sequence, overload
 
 from polars._utils.various import is_int_sequence, is_str_sequence, normalize_filepath
 from polars.dependencies import _FSSPEC_AVAILABLE, fsspec
 from polars.exceptions import NoDataError
 
+if TYPE_CHECKING:
+    from polars.type_aliases import CsvEncoding
+
 
 def parse_columns_arg(
     columns: Sequence[str] | Sequence[int] | str | int | None,
@@ -70,6 +74,35 @@ def parse_row_index_args(
         return (row_index_name, row_index_offset)
 
 
+# Encodings that the CSV reader decodes natively, by their normalized Python codec name.
+_NATIVE_CSV_ENCODINGS: dict[str, CsvEncoding] = {
+    "utf-8": "utf8",
+    "iso8859-1": "latin1",
+    "cp1252": "cp1252",
+    "utf-16": "utf16-le",
+    "utf-16-le": "utf16-le",
+    "utf-16-be": "utf16-be",
+}
+
+
+def native_csv_encoding(encoding: str | None) -> CsvEncoding | None:
+    """
+    Return the name of `encoding` in the native CSV reader.
+
+    Returns `None` if the encoding is not supported natively, in which case the
+    data has to be decoded in Python first.
+    """
+    if not encoding or encoding == "utf8":
+        return "utf8"
+    elif encoding == "utf8-lossy":
+        return "utf8-lossy"
+    try:
+        name = codecs.lookup(encoding).name
+    except LookupError:
+        return None
+    return _NATIVE_CSV_ENCODINGS.get(name)
+
+
 @overload
 def prepare_file_arg(
     file: str | Path | list[str] | IO[bytes] | bytes,
@@ -121,16 +154,15 @@ def prepare_file_arg(
     A local path is returned as a string.
     An http URL is read into a buffer and returned as a `BytesIO`.
 
-    When `encoding` is not `utf8` or `utf8-lossy`, the whole file is
-    first read in Python and decoded using the specified encoding and
-    returned as a `BytesIO` (for usage with `read_csv`).
+    When `encoding` is not decoded natively (see `native_csv_encoding`), the
+    whole file is first read in Python and decoded using the specified encoding
+    and returned as a `BytesIO` (for usage with `read_csv`).
 
     A `bytes` file is returned as a `BytesIO` if `use_pyarrow=True`.
 
     When fsspec is installed, remote file(s) is (are) opened with
     `fsspec.open(file, **kwargs)` or `fsspec.open_files(file, **kwargs)`.
-    If encoding is not `utf8` or `utf8-lossy`, decoding is handled by
-    fsspec too.
+    If encoding is not decoded natively, decoding is handled by fsspec too.
     """
     storage_options = storage_options.copy() if storage_options else {}
     if storage_options and not _FSSPEC_AVAILABLE:
@@ -145,9 +177,7 @@ def prepare_file_arg(
         finally:
             pass
 
-    has_utf8_utf8_lossy_encoding = (
-        encoding in {"utf8", "utf8-lossy"} if encoding else True
-    )
+    decoded_natively = native_csv_encoding(encoding) is not None
     encoding_str = encoding if encoding else "utf8"
 
     # PyArrow allows directories, so we only check that something is not
@@ -155,7 +185,7 @@ def prepare_file_arg(
     check_not_dir = not use_pyarrow
 
     if isinstance(file, bytes):
-        if not has_utf8_utf8_lossy_encoding:
+        if not decoded_natively:
             file = file.decode(encoding_str).encode("utf8")
         return _check_empty(
             BytesIO(file), context="bytes", raise_if_empty=raise_if_empty
@@ -170,7 +200,7 @@ def prepare_file_arg(
         )
 
     if isinstance(file, BytesIO):
-        if not has_utf8_utf8_lossy_encoding:
+        if not decoded_natively:
             return _check_empty(
                 BytesIO(file.read().decode(encoding_str).encode("utf8")),
                 context="BytesIO",
@@ -187,7 +217,7 @@ def prepare_file_arg(
         )
 
     if isinstance(file, Path):
-        if not has_utf8_utf8_lossy_encoding:
+        if not decoded_natively:
             return _check_empty(
                 BytesIO(file.read_bytes().decode(encoding_str).encode("utf8")),
                 context=f"Path ({file!r})",
@@ -207,7 +237,7 @@ def prepare_file_arg(
             # check if it is a local file
             if infer_storage_options(file)["protocol"] == "file":
                 # (lossy) utf8
-                if has_utf8_utf8_lossy_encoding:
+                if decoded_natively:
                     return managed_file(
                         normalize_filepath(file, check_not_directory=check_not_dir)
                     )
@@ -225,7 +255,7 @@ def prepare_file_arg(
         if _FSSPEC_AVAILABLE:
             from fsspec.utils import infer_storage_options
 
-            if has_utf8_utf8_lossy_encoding:
+            if decoded_natively:
                 if all(infer_storage_options(f)["protocol"] == "file" for f in file):
                     return managed_file(
                         [
@@ -238,7 +268,7 @@ def prepare_file_arg(
 
     if isinstance(file, str):
         file = normalize_filepath(file, check_not_directory=check_not_dir)
-        if not has_utf8_utf8_lossy_encoding:
+        if not decoded_natively:
             with Path(file).open(encoding=encoding_str) as f:
                 return _check_empty(
                     BytesIO(f.read().encode("utf8")),
@@ -271,7 +301,7 @@ def process_file_url(path: str, encoding: str | None = None) -> BytesIO:
     from urllib.request import urlopen
 
     with urlopen(path) as f:
-        if not encoding or encoding in {"utf8", "utf8-lossy"}:
+        if native_csv_encoding(encoding) is not None:
             return BytesIO(f.read())
         else:
             return BytesIO(f.read().decode(encoding).encode("utf8"))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import contextlib
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Any, Sequence
 
 from polars._utils.various import (
     _process_null_values,
@@ -56,6 +56,7 @@ class BatchedCsvReader:
         raise_if_empty: bool = True,
         truncate_ragged_lines: bool = False,
         decimal_comma: bool = False,
+        storage_options: dict[str, Any] | None = None,
     ):
         path = normalize_filepath(source)
 
@@ -104,6 +105,7 @@ class BatchedCsvReader:
             raise_if_empty=raise_if_empty,
             truncate_ragged_lines=truncate_ragged_lines,
             decimal_comma=decimal_comma,
+            cloud_options=list(storage_options.items()) if storage_options else None,
         )
         self.new_columns = new_columns
 
@@ -7,6 +7,7 @@ from typing import IO, TYPE_CHECKING, Any, Callable, Mapping, Sequence
 
 import polars._reexport as pl
 from polars._utils.deprecation import deprecate_renamed_parameter
+from polars._utils.unstable import issue_unstable_warning
 from polars._utils.various import (
     _process_null_values,
     is_str_sequence,
@@ -17,6 +18,7 @@ from polars.datatypes import N_INFER_DEFAULT, String
 from polars.datatypes.convert import py_type_to_dtype
 from polars.io._utils import (
     is_glob_pattern,
+    native_csv_encoding,
     parse_columns_arg,
     parse_row_index_args,
     prepare_file_arg,
@@ -147,9 +149,9 @@ def read_csv(
         rows cannot be guaranteed.
     encoding : {'utf8', 'utf8-lossy', ...}
         Lossy means that invalid utf8 values are replaced with `�`
-        characters. When using other encodings than `utf8` or
-        `utf8-lossy`, the input is first decoded in memory with
-        python. Defaults to `utf8`.
+        characters. Latin-1, Windows-1252 (cp1252) and UTF-16 are decoded
+        natively while parsing; other encodings are first decoded in memory
+        with python. Defaults to `utf8`.
     low_memory
         Reduce memory pressure at the expense of performance.
     rechunk
@@ -406,6 +408,11 @@ def read_csv(
                 for column_name, column_dtype in dtypes.items()
             }
 
+    # `prepare_file_arg` decodes the encodings that are not supported natively.
+    native_encoding = native_csv_encoding(encoding) or "utf8"
+    if isinstance(source, StringIO):
+        native_encoding = "utf8"
+
     with prepare_file_arg(
         source,
         encoding=encoding,
@@ -431,7 +438,7 @@ def read_csv(
             infer_schema_length=infer_schema_length,
             batch_size=batch_size,
             n_rows=n_rows,
-            encoding=encoding if encoding == "utf8-lossy" else "utf8",
+            encoding=native_encoding,
             low_memory=low_memory,
             rechunk=rechunk,
             skip_rows_after_header=skip_rows_after_header,
@@ -625,6 +632,7 @@ def read_csv_batched(
     eol_char: str = "\n",
     raise_if_empty: bool = True,
     decimal_comma: bool = False,
+    storage_options: dict[str, Any] | None = None,
 ) -> BatchedCsvReader:
     r"""
     Read a CSV file in batches.
@@ -699,9 +707,9 @@ def read_csv_batched(
         rows cannot be guaranteed.
     encoding : {'utf8', 'utf8-lossy', ...}
         Lossy means that invalid utf8 values are replaced with `�`
-        characters. When using other encodings than `utf8` or
-        `utf8-lossy`, the input is first decoded in memory with
-        python. Defaults to `utf8`.
+        characters. Latin-1, Windows-1252 (cp1252) and UTF-16 are decoded
+        natively while parsing; other encodings are first decoded in memory
+        with python. Defaults to `utf8`.
     low_memory
         Reduce memory pressure at the expense of performance.
     rechunk
@@ -727,6 +735,10 @@ def read_csv_batched(
         is set to False, `None` will be returned from `next_batches(n)` instead.
     decimal_comma
         Parse floats with decimal signs
+    storage_options
+        Options that indicate how to connect to a cloud provider, if `source` is a
+        cloud URL. Files in cloud storage and compressed files are parsed while they
+        are downloaded and decompressed, instead of being read in memory first.
 
     Returns
     -------
@@ -877,7 +889,7 @@ def read_csv_batched(
         infer_schema_length=infer_schema_length,
         batch_size=batch_size,
         n_rows=n_rows,
-        encoding=encoding if encoding == "utf8-lossy" else "utf8",
+        encoding=native_csv_encoding(encoding) or "utf8",
         low_memory=low_memory,
         rechunk=rechunk,
         skip_rows_after_header=skip_rows_after_header,
@@ -888,6 +900,7 @@ def read_csv_batched(
         new_columns=new_columns,
         raise_if_empty=raise_if_empty,
         decimal_comma=decimal_comma,
+        storage_options=storage_options,
     )
 
 
@@ -925,6 +938,10 @@ def scan_csv(
     raise_if_empty: bool = True,
     truncate_ragged_lines: bool = False,
     decimal_comma: bool = False,
+    hive_partitioning: bool = False,
+    hive_schema: SchemaDict | None = None,
+    storage_options: dict[str, Any] | None = None,
+    retries: int = 0,
 ) -> LazyFrame:
     r"""
     Lazily read from a CSV file or multiple files via glob patterns.
@@ -986,7 +1003,7 @@ def scan_csv(
         If set to `None`, the full data may be scanned *(this is slow)*.
     n_rows
         Stop reading from CSV file after reading `n_rows`.
-    encoding : {'utf8', 'utf8-lossy'}
+    encoding : {'utf8', 'utf8-lossy', 'latin1', 'cp1252', 'utf16-le', 'utf16-be'}
         Lossy means that invalid utf8 values are replaced with `�`
         characters. Defaults to "utf8".
     low_memory
@@ -1019,6 +1036,30 @@ def scan_csv(
         Truncate lines that are longer than the schema.
     decimal_comma
         Parse floats with decimal signs
+    hive_partitioning
+        Infer statistics and schema from Hive partitioned paths and use them
+        to prune reads. All files are read with the schema of the first file.
+    hive_schema
+        The column names and data types of the columns by which the data is partitioned.
+        If set to `None` (default), the schema of the Hive partitions is inferred.
+
+        .. warning::
+            This functionality is considered **unstable**. It may be changed
+            at any point without it being considered a breaking change.
+    storage_options
+        Options that indicate how to connect to a cloud provider.
+
+        The cloud providers currently supported are AWS, GCP, and Azure.
+        See supported keys here:
+
+        * `aws <https://docs.rs/object_store/latest/object_store/aws/enum.AmazonS3ConfigKey.html>`_
+        * `gcp <https://docs.rs/object_store/latest/object_store/gcp/enum.GoogleConfigKey.html>`_
+        * `azure <https://docs.rs/object_store/latest/object_store/azure/enum.AzureConfigKey.html>`_
+
+        If `storage_options` is not provided, Polars will try to infer the information
+        from environment variables.
+    retries
+        Number of retries if accessing a cloud instance fails.
 
     Returns
     -------
@@ -1106,6 +1147,10 @@ def scan_csv(
     _check_arg_is_1byte("separator", separator, can_be_empty=False)
     _check_arg_is_1byte("quote_char", quote_char, can_be_empty=True)
 
+    if hive_schema is not None:
+        msg = "The `hive_schema` parameter of `scan_csv` is considered unstable."
+        issue_unstable_warning(msg)
+
     if isinstance(source, (str, Path)):
         source = normalize_filepath(source)
     else:
@@ -1138,6 +1183,10 @@ def scan_csv(
         raise_if_empty=raise_if_empty,
         truncate_ragged_lines=truncate_ragged_lines,
         decimal_comma=decimal_comma,
+        hive_partitioning=hive_partitioning,
+        hive_schema=hive_schema,
+        storage_options=storage_options,
+        retries=retries,
     )
 
 
@@ -1169,6 +1218,10 @@ def _scan_csv_impl(
     raise_if_empty: bool = True,
     truncate_ragged_lines: bool = True,
     decimal_comma: bool = False,
+    hive_partitioning: bool = False,
+    hive_schema: SchemaDict | None = None,
+    storage_options: dict[str, Any] | None = None,
+    retries: int = 0,
 ) -> LazyFrame:
     dtype_list: list[tuple[str, PolarsDataType]] | None = None
     if dtypes is not None:
@@ -1183,6 +1236,12 @@ def _scan_csv_impl(
     else:
         sources = []
 
+    if storage_options:
+        storage_options = list(storage_options.items())  # type: ignore[assignment]
+    else:
+        # Handle empty dict input
+        storage_options = None
+
     pylf = PyLazyFrame.new_from_csv(
         source,
         sources,
@@ -1210,5 +1269,9 @@ def _scan_csv_impl(
         truncate_ragged_lines=truncate_ragged_lines,
         decimal_comma=decimal_comma,
         schema=schema,
+        hive_partitioning=hive_partitioning,
+        hive_schema=hive_schema,
+        cloud_options=storage_options,
+        retries=retries,
     )
     return wrap_ldf(pylf)
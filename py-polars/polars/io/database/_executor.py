@@ -4,7 +4,7 @@ import re
 from collections.abc import Coroutine
 from contextlib import suppress
 from inspect import Parameter, signature
-from typing import TYPE_CHECKING, Any, Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence
 
 from polars import functions as F
 from polars._utils.various import parse_version
@@ -12,7 +12,11 @@ from polars.convert import from_arrow
 from polars.datatypes import (
     N_INFER_DEFAULT,
 )
-from polars.exceptions import ModuleUpgradeRequired, UnsuitableSQLError
+from polars.exceptions import (
+    ModuleUpgradeRequired,
+    PolarsError,
+    UnsuitableSQLError,
+)
 from polars.io.database._arrow_registry import ARROW_DRIVER_REGISTRY
 from polars.io.database._cursor_proxies import ODBCCursorProxy, SurrealDBCursorProxy
 from polars.io.database._inference import _infer_dtype_from_cursor_description
@@ -160,12 +164,7 @@ class ConnectionExecutor:
     @staticmethod
     def _fetchall_rows(result: Cursor) -> Iterable[Sequence[Any]]:
         """Fetch row data in a single call, returning the complete result set."""
-        rows = result.fetchall()
-        return (
-            [tuple(row) for row in rows]
-            if rows and not isinstance(rows[0], (list, tuple, dict))
-            else rows
-        )
+        return result.fetchall()
 
     def _fetchmany_rows(
         self, result: Cursor, batch_size: int | None
@@ -175,10 +174,91 @@ class ConnectionExecutor:
             rows = result.fetchmany(batch_size)
             if not rows:
                 break
-            elif isinstance(rows[0], (list, tuple, dict)):
-                yield rows
+            yield rows
+
+    @staticmethod
+    def _rows_to_frame(
+        rows: Sequence[Any],
+        columns: list[str],
+        schema: SchemaDict,
+        infer_schema_length: int | None,
+    ) -> DataFrame:
+        """
+        Build a frame from row data, one typed column at a time.
+
+        The rows are transposed into columns, so that each column is constructed
+        directly from its values with the dtype given in `schema`; dtypes that are
+        not given are inferred from the first `infer_schema_length` values. If the
+        values do not fit the dtypes, the frame is constructed from the rows.
+        """
+        from polars import DataFrame, Series
+        from polars.datatypes import Null
+
+        if rows and isinstance(rows[0], dict):
+            columns = columns or list(rows[0])
+            values: list[Sequence[Any]] = [
+                [row.get(col) for row in rows] for col in columns
+            ]
+        else:
+            values = list(zip(*rows)) or [() for _ in columns]
+            columns = columns or [f"column_{idx}" for idx in range(len(values))]
+
+        if len(values) == len(columns):
+            dtypes = {}
+            for name, col_values in zip(columns, values):
+                dtype = schema.get(name)
+                if dtype is None and (
+                    infer_schema_length is not None
+                    and len(col_values) > infer_schema_length
+                ):
+                    dtype = Series(col_values[:infer_schema_length]).dtype
+                    if dtype == Null:
+                        break
+                dtypes[name] = dtype
             else:
-                yield [tuple(row) for row in rows]
+                with suppress(TypeError, ValueError, OverflowError, PolarsError):
+                    return DataFrame(
+                        [
+                            Series(name, col_values, dtype=dtypes[name])
+                            for name, col_values in zip(columns, values)
+                        ]
+                    )
+
+        # row-wise construction raises informative errors for unexpected values
+        if rows and not isinstance(rows[0], (list, tuple, dict)):
+            rows = [tuple(row) for row in rows]
+        return DataFrame(
+            data=rows,
+            schema=columns or None,
+            schema_overrides=schema,
+            infer_schema_length=infer_schema_length,
+            orient="row",
+        )
+
+    def _rows_to_frames(
+        self,
+        batches: Iterable[Sequence[Any]],
+        *,
+        columns: list[str],
+        schema_overrides: SchemaDict,
+        infer_schema_length: int | None,
+    ) -> Iterator[DataFrame]:
+        """
+        Yield a frame for every batch of rows.
+
+        The dtypes of the first batch are used for all subsequent batches, so that
+        the frames share a schema and only the first batch requires inference
+        (columns that only contain nulls are inferred again in the next batch).
+        """
+        from polars.datatypes import Null
+
+        schema = dict(schema_overrides)
+        for rows in batches:
+            df = self._rows_to_frame(rows, columns, schema, infer_schema_length)
+            for name, dtype in df.schema.items():
+                if dtype != Null:
+                    schema.setdefault(name, dtype)
+            yield df
 
     def _from_arrow(
         self,
@@ -230,8 +310,6 @@ class ConnectionExecutor:
         infer_schema_length: int | None,
     ) -> DataFrame | Iterable[DataFrame] | None:
         """Return resultset data row-wise for frame init."""
-        from polars import DataFrame
-
         if is_async := isinstance(original_result := self.result, Coroutine):
             self.result = _run_async(self.result)
         try:
@@ -257,21 +335,19 @@ class ConnectionExecutor:
                     schema_overrides=(schema_overrides or {}),
                 )
                 result_columns = list(cursor_desc)
-                frames = (
-                    DataFrame(
-                        data=rows,
-                        schema=result_columns or None,
-                        schema_overrides=schema_overrides,
-                        infer_schema_length=infer_schema_length,
-                        orient="row",
-                    )
-                    for rows in (
+                frames = self._rows_to_frames(
+                    (
                         self._fetchmany_rows(self.result, batch_size)
                         if iter_batches
                         else [self._fetchall_rows(self.result)]  # type: ignore[list-item]
-                    )
+                    ),
+                    columns=result_columns,
+                    schema_overrides=schema_overrides,
+                    infer_schema_length=infer_schema_length,
                 )
-                return frames if iter_batches else next(frames)  # type: ignore[arg-type]
+                if iter_batches:
+                    return frames
+                return next(frames)
             return None
         finally:
             if is_async:
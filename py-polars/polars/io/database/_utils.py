@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 import sys
 from importlib import import_module
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
 from polars.convert import from_arrow
 
@@ -117,3 +117,87 @@ def _open_adbc_connection(connection_uri: str) -> Any:
         connection_uri = re.sub(f"^{driver_name}:/{{,3}}", "", connection_uri)
 
     return adbc_driver.connect(connection_uri)
+
+
+def _partition_queries(
+    query: str,
+    partition_on: str,
+    partition_range: tuple[int, int],
+    partition_num: int,
+) -> list[str]:
+    """
+    Split a query into queries that each return a range of the partition column.
+
+    The ranges are equally sized; the first and last range are unbounded, and nulls
+    are returned by the first query, so that every row is returned exactly once.
+    """
+    lower, upper = partition_range
+    n_values = upper - lower + 1
+    if n_values < 1:
+        msg = f"invalid `partition_range` {partition_range!r}; upper bound must not be smaller than lower bound"
+        raise ValueError(msg)
+
+    n_partitions = min(partition_num, n_values)
+    if n_partitions == 1:
+        return [query]
+
+    size = -(-n_values // n_partitions)
+    subquery = f"SELECT * FROM ({query}) AS _polars_partition WHERE"
+    queries = []
+    for idx in range(n_partitions):
+        start = lower + idx * size
+        end = start + size
+        if idx == 0:
+            cond = f"{partition_on} < {end} OR {partition_on} IS NULL"
+        elif idx == n_partitions - 1:
+            cond = f"{partition_on} >= {start}"
+        else:
+            cond = f"{partition_on} >= {start} AND {partition_on} < {end}"
+        queries.append(f"{subquery} {cond}")
+    return queries
+
+
+def _partition_range_query(query: str, partition_on: str) -> str:
+    """Return a query for the min/max value of the partition column."""
+    return (
+        f"SELECT MIN({partition_on}), MAX({partition_on})"
+        f" FROM ({query}) AS _polars_partition"
+    )
+
+
+def _read_partitioned(
+    read: Callable[[str], DataFrame],
+    query: str | list[str],
+    partition_on: str,
+    partition_range: tuple[int, int] | None,
+    partition_num: int | None,
+) -> DataFrame:
+    """
+    Read the result of a query in range partitions, on concurrent connections.
+
+    `read` executes a query on a connection of its own; it is called from a pool of
+    `partition_num` threads, and the partial results are concatenated without
+    copying the data.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from polars import functions as F
+
+    if not isinstance(query, str):
+        msg = "only a single SQL query string can be partitioned"
+        raise TypeError(msg)
+    if not partition_num or partition_num < 1:
+        msg = "`partition_num` must be a positive integer when setting `partition_on`"
+        raise ValueError(msg)
+
+    if partition_range is None:
+        lower, upper = read(_partition_range_query(query, partition_on)).row(0)
+        if lower is None or upper is None:
+            # empty result; nothing to partition
+            return read(query)
+        partition_range = (int(lower), int(upper))
+
+    queries = _partition_queries(query, partition_on, partition_range, partition_num)
+    with ThreadPoolExecutor(max_workers=len(queries)) as pool:
+        frames = list(pool.map(read, queries))
+    return F.concat(frames, how="vertical_relaxed", rechunk=False)
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterable
+
+from polars.datatypes import (
+    Binary,
+    Boolean,
+    Categorical,
+    Date,
+    Datetime,
+    Decimal,
+    Duration,
+    Enum,
+    Float32,
+    Float64,
+    Int8,
+    Int16,
+    Int32,
+    Int64,
+    Null,
+    String,
+    Time,
+    UInt8,
+    UInt16,
+    UInt32,
+    UInt64,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy import Table
+    from sqlalchemy.engine import Connection
+
+    from polars import DataFrame
+    from polars.type_aliases import DbWriteMode, PolarsDataType, SchemaDict
+
+
+def _sqlalchemy_type(dtype: PolarsDataType) -> Any:
+    """Return the sqlalchemy column type that stores values of the given dtype."""
+    import sqlalchemy as sa
+
+    if dtype in (Int8, Int16, UInt8):
+        return sa.SmallInteger()
+    elif dtype in (Int32, UInt16):
+        return sa.Integer()
+    elif dtype in (Int64, UInt32, UInt64):
+        return sa.BigInteger()
+    elif dtype == Float32:
+        return sa.Float(precision=23)
+    elif dtype == Float64:
+        return sa.Float(precision=53)
+    elif dtype == Boolean:
+        return sa.Boolean()
+    elif dtype in (String, Categorical, Enum, Null):
+        return sa.Text()
+    elif dtype == Binary:
+        return sa.LargeBinary()
+    elif dtype == Date:
+        return sa.Date()
+    elif dtype == Time:
+        return sa.Time()
+    elif dtype == Duration:
+        return sa.Interval()
+    elif dtype == Datetime:
+        return sa.DateTime(timezone=getattr(dtype, "time_zone", None) is not None)
+    elif dtype == Decimal:
+        return sa.Numeric(
+            precision=getattr(dtype, "precision", None),
+            scale=getattr(dtype, "scale", None),
+        )
+    msg = f"writing columns of dtype {dtype} to a database is not supported"
+    raise TypeError(msg)
+
+
+def _create_table(
+    conn: Connection,
+    table_name: str,
+    db_schema: str | None,
+    schema: SchemaDict,
+    if_table_exists: DbWriteMode,
+) -> Table:
+    """Create (or reuse) the target table according to `if_table_exists`."""
+    import sqlalchemy as sa
+
+    table = sa.Table(
+        table_name,
+        sa.MetaData(),
+        *(sa.Column(name, _sqlalchemy_type(tp)) for name, tp in schema.items()),
+        schema=db_schema,
+    )
+    exists = sa.inspect(conn).has_table(table_name, schema=db_schema)
+    if exists:
+        if if_table_exists == "fail":
+            qualified_name = f"{db_schema}.{table_name}" if db_schema else table_name
+            msg = f"table {qualified_name!r} already exists"
+            raise ValueError(msg)
+        elif if_table_exists == "replace":
+            table.drop(conn)
+            table.create(conn)
+    else:
+        table.create(conn)
+    return table
+
+
+def _write_sqlalchemy(
+    batches: Iterable[DataFrame],
+    schema: SchemaDict,
+    table_name: str,
+    db_schema: str | None,
+    connection: str,
+    if_table_exists: DbWriteMode,
+) -> int:
+    """
+    Insert the frame batches into a database table using sqlalchemy.
+
+    Every batch is sent with a single `executemany` call. If the driver uses a
+    positional paramstyle (eg: SQLite), the rows are bound as tuples in column order,
+    passed through the bind processors of the column types; otherwise sqlalchemy
+    dispatches the row dicts to the bulk insert path of the dialect (eg: multi-row
+    VALUES for PostgreSQL). All batches are written in one transaction. Returns the
+    number of inserted rows, or -1 if the driver does not report it.
+    """
+    import sqlalchemy as sa
+
+    engine = sa.create_engine(connection)
+    try:
+        with engine.begin() as conn:
+            table = _create_table(conn, table_name, db_schema, schema, if_table_exists)
+            insert = table.insert()
+            compiled = insert.compile(dialect=conn.dialect)
+            if compiled.positiontup is not None:
+                # compiled without parameters, the statement binds every column
+                columns = [table.c[name] for name in compiled.positiontup]
+                processors = [
+                    col.type.dialect_impl(conn.dialect).bind_processor(conn.dialect)
+                    for col in columns
+                ]
+                sql = str(compiled)
+
+            n_rows = 0
+            for batch in batches:
+                if batch.is_empty():
+                    continue
+                if compiled.positiontup is None:
+                    res = conn.execute(insert, batch.to_dicts())
+                else:
+                    rows = batch.select(col.name for col in columns).iter_rows()
+                    if any(processors):
+                        rows = (
+                            tuple(
+                                value if proc is None else proc(value)
+                                for proc, value in zip(processors, row)
+                            )
+                            for row in rows
+                        )
+                    res = conn.exec_driver_sql(sql, list(rows))
+                if n_rows >= 0:
+                    n_rows = -1 if res.rowcount < 0 else n_rows + res.rowcount
+    finally:
+        engine.dispose()
+    return n_rows
@@ -33,6 +33,9 @@ def read_database(
     *,
     iter_batches: Literal[False] = False,
     batch_size: int | None = ...,
+    partition_on: str | None = ...,
+    partition_range: tuple[int, int] | None = ...,
+    partition_num: int | None = ...,
     schema_overrides: SchemaDict | None = ...,
     infer_schema_length: int | None = ...,
     execute_options: dict[str, Any] | None = ...,
@@ -47,6 +50,9 @@ def read_database(
     *,
     iter_batches: Literal[True],
     batch_size: int | None = ...,
+    partition_on: str | None = ...,
+    partition_range: tuple[int, int] | None = ...,
+    partition_num: int | None = ...,
     schema_overrides: SchemaDict | None = ...,
     infer_schema_length: int | None = ...,
     execute_options: dict[str, Any] | None = ...,
@@ -60,6 +66,9 @@ def read_database(  # noqa: D417
     *,
     iter_batches: bool = False,
     batch_size: int | None = None,
+    partition_on: str | None = None,
+    partition_range: tuple[int, int] | None = None,
+    partition_num: int | None = None,
     schema_overrides: SchemaDict | None = None,
     infer_schema_length: int | None = N_INFER_DEFAULT,
     execute_options: dict[str, Any] | None = None,
@@ -99,6 +108,18 @@ def read_database(  # noqa: D417
         to you. Note that some backends may support batched operation but not allow for
         an explicit size; in this case you will still receive batches, but their exact
         size will be determined by the backend (so may not equal the value set here).
+    partition_on
+        The integer column on which to partition the query. The query is split into
+        `partition_num` queries over ranges of this column, which are executed
+        concurrently on connections of their own; this requires a connection that
+        can open further connections (a SQLAlchemy `Engine`, or an ODBC connection
+        string). The partial results are combined without copying the data.
+    partition_range
+        The value range of the partition column; the first and last partition are
+        unbounded, so no rows are lost if this is smaller than the actual range. If
+        not set, the range is determined with a `MIN`/`MAX` query.
+    partition_num
+        How many partitions (and concurrent queries) to generate.
     schema_overrides
         A dictionary mapping column names to dtypes, used to override the schema
         inferred from the query cursor or given by the incoming Arrow data (depending
@@ -249,6 +270,9 @@ def read_database(  # noqa: D417
             return read_database_uri(
                 query,
                 uri=connection,
+                partition_on=partition_on,
+                partition_range=partition_range,
+                partition_num=partition_num,
                 schema_overrides=schema_overrides,
                 **kwargs,
             )
@@ -259,6 +283,20 @@ def read_database(  # noqa: D417
         msg = f"`read_database` **kwargs only exist for passthrough to `read_database_uri`: found {kwargs!r}"
         raise ValueError(msg)
 
+    if partition_on is not None:
+        return _read_database_partitioned(
+            query,
+            connection,
+            partition_on=partition_on,
+            partition_range=partition_range,
+            partition_num=partition_num,
+            iter_batches=iter_batches,
+            batch_size=batch_size,
+            schema_overrides=schema_overrides,
+            infer_schema_length=infer_schema_length,
+            execute_options=execute_options,
+        )
+
     # return frame from arbitrary connections using the executor abstraction
     with ConnectionExecutor(connection) as cx:
         return cx.execute(
@@ -272,6 +310,68 @@ def read_database(  # noqa: D417
         )
 
 
+def _read_database_partitioned(
+    query: str | Selectable,
+    connection: ConnectionOrCursor,
+    *,
+    partition_on: str,
+    partition_range: tuple[int, int] | None,
+    partition_num: int | None,
+    iter_batches: bool,
+    batch_size: int | None,
+    schema_overrides: SchemaDict | None,
+    infer_schema_length: int | None,
+    execute_options: dict[str, Any] | None,
+) -> DataFrame:
+    """Read a query in range partitions, each on a connection of its own."""
+    from polars.io.database._utils import _read_partitioned
+
+    if iter_batches:
+        msg = "cannot set `iter_batches` when reading with `partition_on`"
+        raise ValueError(msg)
+    conn_type = type(connection)
+    is_sqlalchemy_engine = conn_type.__name__ == "Engine" and (
+        conn_type.__module__.startswith("sqlalchemy")
+    )
+    if isinstance(connection, ODBCCursorProxy):
+        connection_string = connection.connection_string
+
+        def new_connection() -> ConnectionOrCursor:
+            return ODBCCursorProxy(connection_string)
+
+    elif is_sqlalchemy_engine:
+        # the executor checks out a new connection from the engine's pool
+        def new_connection() -> ConnectionOrCursor:
+            return connection
+
+    else:
+        msg = (
+            "reading with `partition_on` requires a connection that can open further"
+            " connections (a SQLAlchemy `Engine`, or an ODBC connection string);"
+            f" found {type(connection).__name__!r}"
+        )
+        raise ValueError(msg)
+
+    def read(partition_query: str) -> DataFrame:
+        with ConnectionExecutor(new_connection()) as cx:
+            return cx.execute(
+                query=partition_query,
+                options=execute_options,
+            ).to_polars(
+                batch_size=batch_size,
+                schema_overrides=schema_overrides,
+                infer_schema_length=infer_schema_length,
+            )  # type: ignore[return-value]
+
+    return _read_partitioned(
+        read,
+        query,  # type: ignore[arg-type]
+        partition_on=partition_on,
+        partition_range=partition_range,
+        partition_num=partition_num,
+    )
+
+
 def read_database_uri(
     query: list[str] | str,
     uri: str,
@@ -302,11 +402,13 @@ def read_database_uri(
         which will be passed "as-is" to the underlying engine (this is most often
         required when coming across special characters in the password).
     partition_on
-        The column on which to partition the result (connectorx).
+        The column on which to partition the result. With the 'adbc' engine, the
+        partitions are read concurrently on connections of their own, and the
+        column must be an integer column.
     partition_range
-        The value range of the partition column (connectorx).
+        The value range of the partition column.
     partition_num
-        How many partitions to generate (connectorx).
+        How many partitions to generate.
     protocol
         Backend-specific transfer protocol directive (connectorx); see connectorx
         documentation for more details.
@@ -393,7 +495,11 @@ def read_database_uri(
     ...     engine="adbc",
     ... )  # doctest: +SKIP
     """
-    from polars.io.database._utils import _read_sql_adbc, _read_sql_connectorx
+    from polars.io.database._utils import (
+        _read_partitioned,
+        _read_sql_adbc,
+        _read_sql_connectorx,
+    )
 
     if not isinstance(uri, str):
         msg = f"expected connection to be a URI string; found {type(uri).__name__!r}"
@@ -418,6 +524,19 @@ def read_database_uri(
         if not isinstance(query, str):
             msg = "only a single SQL query string is accepted for adbc"
             raise ValueError(msg)
+        if partition_on is not None:
+            return _read_partitioned(
+                lambda q: _read_sql_adbc(
+                    q,
+                    connection_uri=uri,
+                    schema_overrides=schema_overrides,
+                    execute_options=execute_options,
+                ),
+                query,
+                partition_on=partition_on,
+                partition_range=partition_range,
+                partition_num=partition_num,
+            )
         return _read_sql_adbc(
             query,
             connection_uri=uri,
@@ -18,7 +18,7 @@ from ast import (
     UnaryOp,
 )
 from functools import partial, singledispatch
-from typing import TYPE_CHECKING, Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
 import polars._reexport as pl
 from polars._utils.convert import to_py_date, to_py_datetime
@@ -27,7 +27,7 @@ from polars.dependencies import pyiceberg
 if TYPE_CHECKING:
     from datetime import date, datetime
 
-    from pyiceberg.table import Table
+    from pyiceberg.table import DataScan, Table
 
     from polars import DataFrame, LazyFrame, Series
 
@@ -145,8 +145,10 @@ def _scan_pyarrow_dataset_impl(
     with_columns: list[str] | None = None,
     predicate: str = "",
     n_rows: int | None = None,
+    *,
+    batched: bool = False,
     **kwargs: Any,
-) -> DataFrame | Series:
+) -> DataFrame | Series | Iterator[DataFrame]:
     """
     Take the projected columns and materialize an arrow table.
 
@@ -162,6 +164,9 @@ def _scan_pyarrow_dataset_impl(
         Materialize only n rows from the arrow dataset.
     batch_size
         The maximum row count for scanned pyarrow record batches.
+    batched
+        Yield a DataFrame per scanned record batch instead of materializing
+        the full table. Used by the streaming engine.
     kwargs:
         For backward compatibility
 
@@ -186,9 +191,26 @@ def _scan_pyarrow_dataset_impl(
 
         scan = scan.filter(pyiceberg_expr)
 
+    if batched:
+        return _iter_iceberg_batches(scan)
+
     return from_arrow(scan.to_arrow())
 
 
+def _iter_iceberg_batches(scan: DataScan) -> Iterator[DataFrame]:
+    """Yield the record batches of the scan as DataFrames."""
+    from polars import from_arrow
+
+    if hasattr(scan, "to_arrow_batch_reader"):
+        batches = scan.to_arrow_batch_reader()
+    else:
+        # older pyiceberg versions can only materialize the full table
+        batches = scan.to_arrow().to_batches()
+
+    for batch in batches:
+        yield from_arrow(batch)  # type: ignore[misc]
+
+
 def _to_ast(expr: str) -> ast.expr:
     """
     Converts a Python string to an AST.
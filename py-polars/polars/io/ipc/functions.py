@@ -6,6 +6,7 @@ from typing import IO, TYPE_CHECKING, Any, Sequence
 
 import polars._reexport as pl
 from polars._utils.deprecation import deprecate_renamed_parameter
+from polars._utils.unstable import issue_unstable_warning
 from polars._utils.various import (
     is_str_sequence,
     normalize_filepath,
@@ -27,6 +28,7 @@ with contextlib.suppress(ImportError):  # Module not available when building doc
 
 if TYPE_CHECKING:
     from polars import DataFrame, DataType, LazyFrame
+    from polars.type_aliases import SchemaDict
 
 
 @deprecate_renamed_parameter("row_count_name", "row_index_name", version="0.20.4")
@@ -314,6 +316,8 @@ def scan_ipc(
     storage_options: dict[str, Any] | None = None,
     memory_map: bool = True,
     retries: int = 0,
+    hive_partitioning: bool = False,
+    hive_schema: SchemaDict | None = None,
 ) -> LazyFrame:
     """
     Lazily read from an Arrow IPC (Feather v2) file or multiple files via glob patterns.
@@ -346,8 +350,22 @@ def scan_ipc(
         Only uncompressed IPC files can be memory mapped.
     retries
         Number of retries if accessing a cloud instance fails.
+    hive_partitioning
+        Infer statistics and schema from Hive partitioned paths and use them
+        to prune reads.
+    hive_schema
+        The column names and data types of the columns by which the data is partitioned.
+        If set to `None` (default), the schema of the Hive partitions is inferred.
+
+        .. warning::
+            This functionality is considered **unstable**. It may be changed
+            at any point without it being considered a breaking change.
 
     """
+    if hive_schema is not None:
+        msg = "The `hive_schema` parameter of `scan_ipc` is considered unstable."
+        issue_unstable_warning(msg)
+
     if isinstance(source, (str, Path)):
         can_use_fsspec = True
         source = normalize_filepath(source)
@@ -375,6 +393,8 @@ def scan_ipc(
         parse_row_index_args(row_index_name, row_index_offset),
         memory_map=memory_map,
         cloud_options=storage_options,
+        hive_partitioning=hive_partitioning,
+        hive_schema=hive_schema,
         retries=retries,
     )
     return wrap_ldf(pylf)
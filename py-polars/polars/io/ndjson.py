@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from polars._utils.deprecation import deprecate_renamed_parameter
+from polars._utils.unstable import issue_unstable_warning
 from polars._utils.various import normalize_filepath
 from polars._utils.wrap import wrap_df, wrap_ldf
 from polars.datatypes import N_INFER_DEFAULT
@@ -18,7 +19,7 @@ if TYPE_CHECKING:
     from io import IOBase
 
     from polars import DataFrame, LazyFrame
-    from polars.type_aliases import SchemaDefinition
+    from polars.type_aliases import SchemaDefinition, SchemaDict
 
 
 def read_ndjson(
@@ -97,6 +98,8 @@ def scan_ndjson(
     row_index_name: str | None = None,
     row_index_offset: int = 0,
     ignore_errors: bool = False,
+    hive_partitioning: bool = False,
+    hive_schema: SchemaDict | None = None,
 ) -> LazyFrame:
     """
     Lazily read from a newline delimited JSON file or multiple files via glob patterns.
@@ -136,7 +139,21 @@ def scan_ndjson(
         Offset to start the row index column (only use if the name is set)
     ignore_errors
         Return `Null` if parsing fails because of schema mismatches.
+    hive_partitioning
+        Infer statistics and schema from Hive partitioned paths and use them
+        to prune reads. All files are read with the schema of the first file.
+    hive_schema
+        The column names and data types of the columns by which the data is partitioned.
+        If set to `None` (default), the schema of the Hive partitions is inferred.
+
+        .. warning::
+            This functionality is considered **unstable**. It may be changed
+            at any point without it being considered a breaking change.
     """
+    if hive_schema is not None:
+        msg = "The `hive_schema` parameter of `scan_ndjson` is considered unstable."
+        issue_unstable_warning(msg)
+
     if isinstance(source, (str, Path)):
         source = normalize_filepath(source)
         sources = []
@@ -155,5 +172,7 @@ def scan_ndjson(
         rechunk,
         parse_row_index_args(row_index_name, row_index_offset),
         ignore_errors,
+        hive_partitioning=hive_partitioning,
+        hive_schema=hive_schema,
     )
     return wrap_ldf(pylf)
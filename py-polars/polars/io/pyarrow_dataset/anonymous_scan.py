@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from functools import partial
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Iterator
 
 import polars._reexport as pl
 from polars.dependencies import pyarrow as pa
@@ -45,7 +45,9 @@ def _scan_pyarrow_dataset_impl(
     predicate: str | None,
     n_rows: int | None,
     batch_size: int | None,
-) -> DataFrame:
+    *,
+    batched: bool = False,
+) -> DataFrame | Iterator[DataFrame]:
     """
     Take the projected columns and materialize an arrow table.
 
@@ -61,10 +63,13 @@ def _scan_pyarrow_dataset_impl(
         Materialize only n rows from the arrow dataset
     batch_size
         The maximum row count for scanned pyarrow record batches.
+    batched
+        Yield a DataFrame per scanned record batch instead of materializing
+        the full table. Used by the streaming engine.
 
     Returns
     -------
-    DataFrame
+    DataFrame or an iterator of DataFrames if `batched`
     """
     from polars import from_arrow
 
@@ -97,7 +102,26 @@ def _scan_pyarrow_dataset_impl(
     if batch_size is not None:
         common_params["batch_size"] = batch_size
 
+    if batched:
+        return _iter_pyarrow_batches(ds, n_rows, common_params)
+
     if n_rows:
         return from_arrow(ds.head(n_rows, **common_params))  # type: ignore[return-value]
 
     return from_arrow(ds.to_table(**common_params))  # type: ignore[return-value]
+
+
+def _iter_pyarrow_batches(
+    ds: pa.dataset.Dataset, n_rows: int | None, params: dict[str, Any]
+) -> Iterator[DataFrame]:
+    """Yield the record batches of the dataset as DataFrames, up to `n_rows`."""
+    from polars import from_arrow
+
+    n_read = 0
+    for batch in ds.to_batches(**params):
+        if n_rows:
+            batch = batch.slice(0, n_rows - n_read)
+        n_read += batch.num_rows
+        yield from_arrow(batch)  # type: ignore[misc]
+        if n_rows and n_read >= n_rows:
+            return
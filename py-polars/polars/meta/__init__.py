@@ -2,12 +2,14 @@
 
 from polars.meta.build import build_info
 from polars.meta.index_type import get_index_type
+from polars.meta.object_store_cache import object_store_cache_stats
 from polars.meta.thread_pool import thread_pool_size, threadpool_size
 from polars.meta.versions import show_versions
 
 __all__ = [
     "build_info",
     "get_index_type",
+    "object_store_cache_stats",
     "show_versions",
     "thread_pool_size",
     "threadpool_size",
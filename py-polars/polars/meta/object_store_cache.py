@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import contextlib
+
+with contextlib.suppress(ImportError):  # Module not available when building docs
+    import polars.polars as plr
+
+
+def object_store_cache_stats() -> dict[str, int]:
+    """
+    Return the statistics of the local disk cache of cloud storage reads.
+
+    The cache is enabled with :meth:`Config.set_object_store_cache` or the
+    `file_cache_dir` key of the `storage_options`. The statistics are aggregated
+    over all cache directories that were used by this process.
+
+    Returns
+    -------
+    dict
+        The number of reads that were served from the cache (`hits`) or fetched
+        from cloud storage (`misses`), the corresponding numbers of bytes
+        (`hit_bytes`, `miss_bytes`), and the number (`entries`) and total size in
+        bytes (`size`) of the cached objects.
+
+    Examples
+    --------
+    >>> pl.object_store_cache_stats()  # doctest: +SKIP
+    {'hits': 12, 'misses': 4, 'hit_bytes': 50331648, 'miss_bytes': 16777216, 'entries': 4, 'size': 16777584}
+    """  # noqa: W505
+    return plr.object_store_cache_stats()
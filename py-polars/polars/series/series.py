@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import contextlib
 import math
+import pickle
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal as PyDecimal
 from typing import (
@@ -16,6 +17,7 @@ from typing import (
     Mapping,
     NoReturn,
     Sequence,
+    SupportsIndex,
     Union,
     overload,
 )
@@ -89,6 +91,7 @@ from polars.datatypes import (
 )
 from polars.dependencies import (
     _HVPLOT_AVAILABLE,
+    _NUMPY_AVAILABLE,
     _PYARROW_AVAILABLE,
     _check_for_numpy,
     _check_for_pandas,
@@ -98,7 +101,7 @@ from polars.dependencies import (
 from polars.dependencies import numpy as np
 from polars.dependencies import pandas as pd
 from polars.dependencies import pyarrow as pa
-from polars.exceptions import ModuleUpgradeRequired, ShapeError
+from polars.exceptions import ModuleUpgradeRequired, PolarsError, ShapeError
 from polars.meta import get_index_type
 from polars.series.array import ArrayNameSpace
 from polars.series.binary import BinaryNameSpace
@@ -623,6 +626,25 @@ class Series:
         self._s = Series()._s  # Initialize with a dummy
         self._s.__setstate__(state)
 
+    def __reduce_ex__(self, protocol: SupportsIndex) -> str | tuple[Any, ...]:
+        # Pickle protocol 5 supports out-of-band buffers; the data is handed to pickle
+        # as a single buffer without copying it.
+        if int(protocol) >= 5 and _NUMPY_AVAILABLE:
+            buffer = pickle.PickleBuffer(self._s._to_pickle_buffer())
+            return type(self)._from_pickle_buffer, (buffer,)
+        return super().__reduce_ex__(protocol)
+
+    @classmethod
+    def _from_pickle_buffer(cls, buffer: Any) -> Self:
+        if not isinstance(buffer, bytes):
+            # Viewing the buffer as a numpy array does not copy it.
+            buffer = (
+                np.frombuffer(buffer, dtype=np.uint8)
+                if _NUMPY_AVAILABLE
+                else bytes(buffer)
+            )
+        return cls._from_pyseries(PySeries._from_pickle_buffer(buffer))
+
     def __str__(self) -> str:
         s_repr: str = self._s.as_str()
         return s_repr.replace("Series", f"{self.__class__.__name__}", 1)
@@ -1381,6 +1403,52 @@ class Series:
         else:
             return self.to_numpy().__array__()
 
+    def __dlpack__(
+        self,
+        *,
+        stream: Any = None,
+        max_version: tuple[int, int] | None = None,
+        dl_device: tuple[int, int] | None = None,
+        copy: bool | None = None,
+    ) -> Any:
+        """
+        Export the Series as a 1D tensor through the DLPack protocol.
+
+        The Series must have a numeric data type and may not contain nulls. The data
+        is exported without copying if it is stored in a single chunk.
+
+        .. warning::
+            The consumer of the tensor must not modify the data, as it is shared with
+            the Series.
+
+        Parameters
+        ----------
+        stream
+            Not supported, as the data is on the CPU.
+        max_version
+            The highest DLPack version that the consumer supports. The tensor is
+            always exported in the format that precedes DLPack 1.0.
+        dl_device
+            The device to export the data to, which must be the CPU.
+        copy
+            Copy the data. If set to `False`, raise if the data cannot be exported
+            without copying. If not set, copy only if necessary.
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> np.from_dlpack(pl.Series([1, 2, 3]))
+        array([1, 2, 3])
+        """
+        if stream is not None or dl_device not in (None, (1, 0)):
+            msg = "only export to the CPU is supported"
+            raise BufferError(msg)
+        return self._s.to_dlpack(copy)
+
+    def __dlpack_device__(self) -> tuple[int, int]:
+        """The device of the data for the DLPack protocol, which is the CPU."""
+        return (1, 0)
+
     def __array_ufunc__(
         self, ufunc: np.ufunc, method: str, *inputs: Any, **kwargs: Any
     ) -> Series:
@@ -5256,6 +5324,7 @@ class Series:
         return_dtype: PolarsDataType | None = None,
         *,
         skip_nulls: bool = True,
+        memoize: bool = False,
     ) -> Self:
         """
         Map a custom/user-defined function (UDF) over elements in this Series.
@@ -5291,6 +5360,12 @@ class Series:
             Nulls will be skipped and not passed to the python function.
             This is faster because python can be skipped and because we call
             more specialized functions.
+        memoize
+            Call the function once per unique value and map every value to the
+            result for its unique value. This is much faster if the Series has few
+            unique values, e.g. if it is Categorical, but requires the function to
+            return the same result for the same value. Ignored for nested and
+            Object data types.
 
         Warnings
         --------
@@ -5319,14 +5394,47 @@ class Series:
         -------
         Series
         """
-        from polars._utils.udfs import warn_on_inefficient_map
+        from polars._utils.udfs import (
+            rewrite_inefficient_map,
+            warn_on_inefficient_map,
+        )
 
         if return_dtype is None:
             pl_return_dtype = None
         else:
             pl_return_dtype = py_type_to_dtype(return_dtype)
 
+        # the function is called with a Series or dict per element of a nested
+        # dtype, which the translated expression does not account for
+        if (
+            skip_nulls
+            and not self.dtype.is_nested()
+            and (expr := rewrite_inefficient_map(function, [self.name])) is not None
+        ):
+            if pl_return_dtype is not None:
+                expr = expr.cast(pl_return_dtype)
+            # fall back to the function if the expression does not apply to the data
+            with contextlib.suppress(PolarsError):
+                out = self.to_frame().select(expr.alias(self.name)).to_series()
+                warn_on_inefficient_map(
+                    function, columns=[self.name], map_target="series", rewritten=True
+                )
+                return self._from_pyseries(out._s)
+
         warn_on_inefficient_map(function, columns=[self.name], map_target="series")
+        if memoize and not (self.dtype.is_nested() or self.dtype == Object):
+            uniques = self.unique()
+            values = uniques._from_pyseries(
+                uniques._s.apply_lambda(function, pl_return_dtype, skip_nulls)
+            )
+            # a left join maintains the order of the values
+            lookup = uniques.to_frame("key").with_columns(values.alias("value"))
+            out = (
+                self.to_frame("key")
+                .join(lookup, on="key", how="left", join_nulls=True)
+                .to_series(1)
+            )
+            return self._from_pyseries(out.alias(self.name)._s)
         return self._from_pyseries(
             self._s.apply_lambda(function, pl_return_dtype, skip_nulls)
         )
@@ -87,7 +87,9 @@ Ambiguous: TypeAlias = Literal["earliest", "latest", "raise", "null"]
 AvroCompression: TypeAlias = Literal["uncompressed", "snappy", "deflate"]
 CsvQuoteStyle: TypeAlias = Literal["necessary", "always", "non_numeric", "never"]
 CategoricalOrdering: TypeAlias = Literal["physical", "lexical"]
-CsvEncoding: TypeAlias = Literal["utf8", "utf8-lossy"]
+CsvEncoding: TypeAlias = Literal[
+    "utf8", "utf8-lossy", "latin1", "cp1252", "utf16-le", "utf16-be"
+]
 FillNullStrategy: TypeAlias = Literal[
     "forward", "backward", "min", "max", "mean", "zero", "one"
 ]
@@ -134,7 +136,9 @@ StartBy: TypeAlias = Literal[
 TimeUnit: TypeAlias = Literal["ns", "us", "ms"]
 UniqueKeepStrategy: TypeAlias = Literal["first", "last", "any", "none"]
 UnstackDirection: TypeAlias = Literal["vertical", "horizontal"]
-MapElementsStrategy: TypeAlias = Literal["thread_local", "threading"]
+MapBatchesStrategy: TypeAlias = Literal["thread_local", "process"]
+MapElementsStrategy: TypeAlias = Literal["thread_local", "threading", "process"]
+MapRowsStrategy: TypeAlias = Literal["thread_local", "process"]
 
 # The following have a Rust enum equivalent with a different name
 AsofJoinStrategy: TypeAlias = Literal["backward", "forward", "nearest"]  # AsofStrategy
@@ -1,18 +1,26 @@
+use std::io::{Read, Seek};
 use std::path::PathBuf;
 use std::sync::Mutex;
 
-use polars::io::csv::read::{OwnedBatchedCsvReader, OwnedBatchedCsvReaderMmap};
+use polars::io::csv::read::{
+    is_compressed, BatchedCsvReaderStream, OwnedBatchedCsvReader, OwnedBatchedCsvReaderMmap,
+};
 use polars::io::mmap::MmapBytesReader;
+use polars::io::utils::{is_cloud_url, open_reader};
 use polars::io::RowIndex;
 use polars::prelude::*;
 use pyo3::prelude::*;
 use pyo3::pybacked::PyBackedStr;
 
+use crate::conversion::parse_cloud_options;
 use crate::{PyDataFrame, PyPolarsErr, Wrap};
 
 enum BatchedReader {
     MMap(OwnedBatchedCsvReaderMmap),
     Read(OwnedBatchedCsvReader),
+    /// Reads cloud and compressed files while they are downloaded and decompressed. The reader
+    /// borrows the dtypes that are stored with it.
+    Stream(BatchedCsvReaderStream<'static>, Option<Vec<DataType>>),
 }
 
 #[pyclass]
@@ -30,7 +38,8 @@ impl PyBatchedCsv {
         projection, separator, rechunk, columns, encoding, n_threads, path, overwrite_dtype,
         overwrite_dtype_slice, low_memory, comment_prefix, quote_char, null_values,
         missing_utf8_is_empty_string, try_parse_dates, skip_rows_after_header, row_index,
-        sample_size, eol_char, raise_if_empty, truncate_ragged_lines, decimal_comma)
+        sample_size, eol_char, raise_if_empty, truncate_ragged_lines, decimal_comma,
+        cloud_options)
     )]
     fn new(
         infer_schema_length: Option<usize>,
@@ -61,6 +70,7 @@ impl PyBatchedCsv {
         raise_if_empty: bool,
         truncate_ragged_lines: bool,
         decimal_comma: bool,
+        cloud_options: Option<Vec<(String, String)>>,
     ) -> PyResult<PyBatchedCsv> {
         let null_values = null_values.map(|w| w.0);
         let eol_char = eol_char.as_bytes()[0];
@@ -92,9 +102,16 @@ impl PyBatchedCsv {
                 .collect::<Vec<_>>()
         });
 
-        let file = std::fs::File::open(path).map_err(PyPolarsErr::from)?;
-        let reader = Box::new(file) as Box<dyn MmapBytesReader>;
-        let reader = CsvReader::new(reader)
+        let cloud_options = cloud_options
+            .map(|kv| parse_cloud_options(&path.to_string_lossy(), kv))
+            .transpose()?;
+        let mut file = open_reader(&path, cloud_options.as_ref()).map_err(PyPolarsErr::from)?;
+        let mut magic_nr = [0u8; 4];
+        let res_len = file.read(&mut magic_nr)?;
+        file.rewind()?;
+        let stream = is_cloud_url(&path) || (res_len >= 2 && is_compressed(&magic_nr));
+
+        let reader = CsvReader::new(file)
             .infer_schema(infer_schema_length)
             .has_header(has_header)
             .with_n_rows(n_rows)
@@ -122,7 +139,20 @@ impl PyBatchedCsv {
             .with_decimal_comma(decimal_comma)
             .raise_if_empty(raise_if_empty);
 
-        let reader = if low_memory {
+        // Files that are transcoded before parsing are held in memory anyway.
+        let reader = if stream {
+            let reader = reader
+                .with_dtypes(overwrite_dtype.map(Arc::new))
+                .batched_stream()
+                .map_err(PyPolarsErr::from)?;
+            // SAFETY: the dtypes are moved along with the reader and dropped after it.
+            let reader = unsafe {
+                std::mem::transmute::<BatchedCsvReaderStream<'_>, BatchedCsvReaderStream<'static>>(
+                    reader,
+                )
+            };
+            BatchedReader::Stream(reader, overwrite_dtype_slice)
+        } else if low_memory && encoding.0.is_ascii_compatible() {
             let reader = reader
                 .batched_read(overwrite_dtype.map(Arc::new))
                 .map_err(PyPolarsErr::from)?;
@@ -148,6 +178,7 @@ impl PyBatchedCsv {
             match reader {
                 BatchedReader::MMap(reader) => reader.next_batches(n),
                 BatchedReader::Read(reader) => reader.next_batches(n),
+                BatchedReader::Stream(reader, _) => reader.next_batches(n),
             }
             .map_err(PyPolarsErr::from)
         })?;
@@ -669,9 +669,14 @@ impl FromPyObject<'_> for Wrap<CsvEncoding> {
         let parsed = match &*ob.extract::<PyBackedStr>()? {
             "utf8" => CsvEncoding::Utf8,
             "utf8-lossy" => CsvEncoding::LossyUtf8,
+            "latin1" => CsvEncoding::Latin1,
+            "cp1252" => CsvEncoding::Windows1252,
+            "utf16-le" => CsvEncoding::Utf16Le,
+            "utf16-be" => CsvEncoding::Utf16Be,
             v => {
                 return Err(PyValueError::new_err(format!(
-                    "csv `encoding` must be one of {{'utf8', 'utf8-lossy'}}, got {v}",
+                    "csv `encoding` must be one of {{'utf8', 'utf8-lossy', 'latin1', 'cp1252', \
+                    'utf16-le', 'utf16-be'}}, got {v}",
                 )))
             },
         };
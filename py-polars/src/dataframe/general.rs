@@ -57,6 +57,20 @@ impl PyDataFrame {
         }
     }
 
+    #[cfg(feature = "ipc")]
+    fn _to_pickle_buffer(&self, py: Python) -> PyResult<PyObject> {
+        // Used in pickle protocol 5
+        crate::pickle::df_to_pickle_buffer(py, self.df.clone())
+    }
+
+    #[cfg(feature = "ipc")]
+    #[staticmethod]
+    fn _from_pickle_buffer(buffer: &Bound<PyAny>) -> PyResult<Self> {
+        // Used in pickle protocol 5
+        let df = crate::pickle::df_from_pickle_buffer(buffer)?;
+        Ok(df.into())
+    }
+
     pub fn estimated_size(&self) -> usize {
         self.df.estimated_size()
     }
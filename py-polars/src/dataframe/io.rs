@@ -395,7 +395,7 @@ impl PyDataFrame {
     }
 
     #[cfg(feature = "parquet")]
-    #[pyo3(signature = (py_f, compression, compression_level, statistics, row_group_size, data_page_size))]
+    #[pyo3(signature = (py_f, compression, compression_level, statistics, row_group_size, data_page_size, bloom_filter_columns))]
     pub fn write_parquet(
         &mut self,
         py: Python,
@@ -405,7 +405,9 @@ impl PyDataFrame {
         statistics: bool,
         row_group_size: Option<usize>,
         data_page_size: Option<usize>,
+        bloom_filter_columns: Option<Vec<String>>,
     ) -> PyResult<()> {
+        let bloom_filter_columns = bloom_filter_columns.unwrap_or_default();
         let compression = parse_parquet_compression(compression, compression_level)?;
 
         if let Ok(s) = py_f.extract::<PyBackedStr>(py) {
@@ -416,6 +418,7 @@ impl PyDataFrame {
                     .with_statistics(statistics)
                     .with_row_group_size(row_group_size)
                     .with_data_page_size(data_page_size)
+                    .with_bloom_filter_columns(bloom_filter_columns)
                     .finish(&mut self.df)
                     .map_err(PyPolarsErr::from)
             })?;
@@ -426,6 +429,7 @@ impl PyDataFrame {
                 .with_statistics(statistics)
                 .with_row_group_size(row_group_size)
                 .with_data_page_size(data_page_size)
+                .with_bloom_filter_columns(bloom_filter_columns)
                 .finish(&mut self.df)
                 .map_err(PyPolarsErr::from)?;
         }
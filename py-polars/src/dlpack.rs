@@ -0,0 +1,254 @@
+//! Export numeric Series and DataFrames as tensors through the DLPack protocol.
+//!
+//! See: https://dmlc.github.io/dlpack/latest/python_spec.html
+use std::ffi::{c_char, c_void};
+
+use polars_core::prelude::*;
+use polars_core::with_match_physical_numeric_polars_type;
+use pyo3::exceptions::PyBufferError;
+use pyo3::ffi;
+use pyo3::prelude::*;
+
+use crate::dataframe::PyDataFrame;
+use crate::series::PySeries;
+use crate::to_numpy::consolidate_columns;
+
+/// The name of a capsule that holds a tensor that was not consumed yet.
+const DLTENSOR: &[u8] = b"dltensor\0";
+const DL_CPU: i32 = 1;
+
+#[repr(C)]
+struct DLDevice {
+    device_type: i32,
+    device_id: i32,
+}
+
+#[repr(C)]
+struct DLDataType {
+    code: u8,
+    bits: u8,
+    lanes: u16,
+}
+
+#[repr(C)]
+struct DLTensor {
+    data: *mut c_void,
+    device: DLDevice,
+    ndim: i32,
+    dtype: DLDataType,
+    shape: *mut i64,
+    strides: *mut i64,
+    byte_offset: u64,
+}
+
+#[repr(C)]
+struct DLManagedTensor {
+    dl_tensor: DLTensor,
+    manager_ctx: *mut c_void,
+    deleter: Option<unsafe extern "C" fn(*mut DLManagedTensor)>,
+}
+
+/// Keeps the exported data alive and owns the shape and strides of the tensor.
+struct ManagerContext {
+    _columns: Vec<Series>,
+    shape: [i64; 2],
+    strides: [i64; 2],
+}
+
+unsafe extern "C" fn delete_tensor(tensor: *mut DLManagedTensor) {
+    let tensor = Box::from_raw(tensor);
+    drop(Box::from_raw(tensor.manager_ctx as *mut ManagerContext));
+}
+
+unsafe extern "C" fn delete_capsule(capsule: *mut ffi::PyObject) {
+    // A consumer renames the capsule and becomes responsible for deleting the tensor.
+    let name = DLTENSOR.as_ptr() as *const c_char;
+    if ffi::PyCapsule_IsValid(capsule, name) == 1 {
+        let tensor = ffi::PyCapsule_GetPointer(capsule, name) as *mut DLManagedTensor;
+        delete_tensor(tensor);
+    }
+}
+
+fn dl_data_type(dtype: &DataType) -> PyResult<DLDataType> {
+    use DataType::*;
+    let (code, bits) = match dtype {
+        Int8 => (0, 8),
+        Int16 => (0, 16),
+        Int32 => (0, 32),
+        Int64 => (0, 64),
+        UInt8 => (1, 8),
+        UInt16 => (1, 16),
+        UInt32 => (1, 32),
+        UInt64 => (1, 64),
+        Float32 => (2, 32),
+        Float64 => (2, 64),
+        dt => {
+            let msg = format!("cannot export data type {dt} through DLPack");
+            return Err(PyBufferError::new_err(msg));
+        },
+    };
+    Ok(DLDataType {
+        code,
+        bits,
+        lanes: 1,
+    })
+}
+
+/// The address of the values of every column, if they are stored in a single chunk.
+fn column_addresses(columns: &[Series]) -> Option<Vec<usize>> {
+    columns
+        .iter()
+        .map(|s| {
+            if s.n_chunks() > 1 {
+                return None;
+            }
+            with_match_physical_numeric_polars_type!(s.dtype(), |$T| {
+                let ca: &ChunkedArray<$T> = s.unpack().unwrap();
+                Some(ca.data_views().next().unwrap().as_ptr() as usize)
+            })
+        })
+        .collect()
+}
+
+/// Wrap the tensor of `columns` in a capsule. The data starts at `address`, and `strides`
+/// are the distances between consecutive values and columns in number of elements.
+fn export_tensor(
+    py: Python,
+    columns: Vec<Series>,
+    address: usize,
+    ndim: i32,
+    dtype: DLDataType,
+    shape: [i64; 2],
+    strides: [i64; 2],
+) -> PyResult<PyObject> {
+    let mut ctx = Box::new(ManagerContext {
+        _columns: columns,
+        shape,
+        strides,
+    });
+    let tensor = Box::new(DLManagedTensor {
+        dl_tensor: DLTensor {
+            data: address as *mut c_void,
+            device: DLDevice {
+                device_type: DL_CPU,
+                device_id: 0,
+            },
+            ndim,
+            dtype,
+            shape: ctx.shape.as_mut_ptr(),
+            strides: ctx.strides.as_mut_ptr(),
+            byte_offset: 0,
+        },
+        manager_ctx: std::ptr::null_mut(),
+        deleter: Some(delete_tensor),
+    });
+    let tensor = Box::into_raw(tensor);
+    unsafe {
+        (*tensor).manager_ctx = Box::into_raw(ctx) as *mut c_void;
+        let capsule = ffi::PyCapsule_New(
+            tensor as *mut c_void,
+            DLTENSOR.as_ptr() as *const c_char,
+            Some(delete_capsule),
+        );
+        if capsule.is_null() {
+            delete_tensor(tensor);
+            return Err(PyErr::fetch(py));
+        }
+        Ok(PyObject::from_owned_ptr(py, capsule))
+    }
+}
+
+fn check_nulls(columns: &[Series]) -> PyResult<()> {
+    if columns.iter().any(|s| s.null_count() > 0) {
+        let msg = "cannot export data that contains nulls through DLPack";
+        return Err(PyBufferError::new_err(msg));
+    }
+    Ok(())
+}
+
+fn copy_not_allowed(msg: &str) -> PyErr {
+    PyBufferError::new_err(format!("copy not allowed: {msg}"))
+}
+
+#[pymethods]
+impl PySeries {
+    /// Export the values as a 1D DLPack tensor.
+    ///
+    /// `copy` follows the DLPack protocol: `True` always copies, `False` never copies and
+    /// `None` copies only if the values are not stored in a single chunk.
+    fn to_dlpack(&self, py: Python, copy: Option<bool>) -> PyResult<PyObject> {
+        let dtype = dl_data_type(self.series.dtype())?;
+        let columns = vec![self.series.clone()];
+        check_nulls(&columns)?;
+
+        let columns = match (copy, column_addresses(&columns)) {
+            (Some(true), _) | (None, None) => consolidate_columns(&columns)?,
+            (_, Some(_)) => columns,
+            (Some(false), None) => {
+                return Err(copy_not_allowed(
+                    "cannot export a Series of multiple chunks without copying",
+                ))
+            },
+        };
+        let address = column_addresses(&columns).unwrap()[0];
+        let len = self.series.len() as i64;
+        export_tensor(py, columns, address, 1, dtype, [len, 0], [1, 0])
+    }
+}
+
+#[pymethods]
+impl PyDataFrame {
+    /// Export the frame as a 2D DLPack tensor of which the columns are the second axis.
+    ///
+    /// The frame is exported without copying if its columns are stored at equal distances
+    /// in memory, e.g. after `consolidate`. `copy` follows the DLPack protocol.
+    fn to_dlpack(&self, py: Python, copy: Option<bool>) -> PyResult<PyObject> {
+        let columns = self.df.get_columns();
+        let Some(first) = columns.first() else {
+            return Err(PyBufferError::new_err(
+                "cannot export a DataFrame without columns through DLPack",
+            ));
+        };
+        let dtype = dl_data_type(first.dtype())?;
+        if columns.iter().any(|s| s.dtype() != first.dtype()) {
+            return Err(PyBufferError::new_err(
+                "all columns must have the same data type to export them through DLPack",
+            ));
+        }
+        check_nulls(columns)?;
+
+        let height = self.df.height();
+        let itemsize = dtype.bits as usize / 8;
+        // The distance between the columns in number of elements, if it is constant.
+        let column_stride = |addresses: &[usize]| -> Option<usize> {
+            if addresses.len() == 1 {
+                return Some(height);
+            }
+            let distance = addresses[1].checked_sub(addresses[0])?;
+            let equally_spaced = addresses
+                .windows(2)
+                .all(|w| w[1].checked_sub(w[0]) == Some(distance));
+            (equally_spaced && distance % itemsize == 0 && distance / itemsize >= height)
+                .then_some(distance / itemsize)
+        };
+
+        let in_place = column_addresses(columns)
+            .and_then(|addresses| Some((addresses[0], column_stride(&addresses)?)));
+        let (columns, address, stride) = match (copy, in_place) {
+            (Some(true), _) | (None, None) => {
+                let columns = consolidate_columns(columns)?;
+                let address = column_addresses(&columns).unwrap()[0];
+                (columns, address, height)
+            },
+            (_, Some((address, stride))) => (columns.to_vec(), address, stride),
+            (Some(false), None) => {
+                return Err(copy_not_allowed(
+                    "only columns that are stored at equal distances in memory can be \
+                     exported without copying; use `consolidate` first",
+                ))
+            },
+        };
+        let shape = [height as i64, columns.len() as i64];
+        export_tensor(py, columns, address, 2, dtype, shape, [1, stride as i64])
+    }
+}
@@ -80,3 +80,17 @@ pub fn write_clipboard_string(s: &str) -> PyResult<()> {
         .map_err(|e| PyPolarsErr::Other(format!("{e}")))?;
     Ok(())
 }
+
+#[cfg(feature = "cloud")]
+#[pyfunction]
+pub fn object_store_cache_stats(py: Python) -> PyResult<PyObject> {
+    let stats = polars::io::cloud::file_cache_stats();
+    let dict = PyDict::new_bound(py);
+    dict.set_item("hits", stats.hits)?;
+    dict.set_item("misses", stats.misses)?;
+    dict.set_item("hit_bytes", stats.hit_bytes)?;
+    dict.set_item("miss_bytes", stats.miss_bytes)?;
+    dict.set_item("entries", stats.entries)?;
+    dict.set_item("size", stats.size)?;
+    Ok(dict.to_object(py))
+}
@@ -100,7 +100,9 @@ impl PyLazyFrame {
     #[staticmethod]
     #[cfg(feature = "json")]
     #[allow(clippy::too_many_arguments)]
-    #[pyo3(signature = (path, paths, infer_schema_length, schema, batch_size, n_rows, low_memory, rechunk, row_index, ignore_errors))]
+    #[pyo3(signature = (path, paths, infer_schema_length, schema, batch_size, n_rows, low_memory, rechunk,
+        row_index, ignore_errors, hive_partitioning, hive_schema)
+    )]
     fn new_from_ndjson(
         path: Option<PathBuf>,
         paths: Vec<PathBuf>,
@@ -112,8 +114,14 @@ impl PyLazyFrame {
         rechunk: bool,
         row_index: Option<(String, IdxSize)>,
         ignore_errors: bool,
+        hive_partitioning: bool,
+        hive_schema: Option<Wrap<Schema>>,
     ) -> PyResult<Self> {
         let row_index = row_index.map(|(name, offset)| RowIndex { name, offset });
+        let hive_options = HiveOptions {
+            enabled: hive_partitioning,
+            schema: hive_schema.map(|s| Arc::new(s.0)),
+        };
 
         let r = if let Some(path) = &path {
             LazyJsonLineReader::new(path)
@@ -130,6 +138,7 @@ impl PyLazyFrame {
             .with_schema(schema.map(|schema| Arc::new(schema.0)))
             .with_row_index(row_index)
             .with_ignore_errors(ignore_errors)
+            .with_hive_options(hive_options)
             .finish()
             .map_err(PyPolarsErr::from)?;
 
@@ -141,7 +150,8 @@ impl PyLazyFrame {
     #[pyo3(signature = (path, paths, separator, has_header, ignore_errors, skip_rows, n_rows, cache, overwrite_dtype,
         low_memory, comment_prefix, quote_char, null_values, missing_utf8_is_empty_string,
         infer_schema_length, with_schema_modify, rechunk, skip_rows_after_header,
-        encoding, row_index, try_parse_dates, eol_char, raise_if_empty, truncate_ragged_lines, decimal_comma, schema
+        encoding, row_index, try_parse_dates, eol_char, raise_if_empty, truncate_ragged_lines, decimal_comma, schema,
+        hive_partitioning, hive_schema, cloud_options, retries
     )
     )]
     fn new_from_csv(
@@ -171,6 +181,10 @@ impl PyLazyFrame {
         truncate_ragged_lines: bool,
         decimal_comma: bool,
         schema: Option<Wrap<Schema>>,
+        hive_partitioning: bool,
+        hive_schema: Option<Wrap<Schema>>,
+        cloud_options: Option<Vec<(String, String)>>,
+        retries: usize,
     ) -> PyResult<Self> {
         let null_values = null_values.map(|w| w.0);
         let quote_char = quote_char.map(|s| s.as_bytes()[0]);
@@ -185,6 +199,28 @@ impl PyLazyFrame {
                 .collect::<Schema>()
         });
 
+        let first_path = if let Some(path) = &path {
+            path
+        } else {
+            paths
+                .first()
+                .ok_or_else(|| PyValueError::new_err("expected a path argument"))?
+        };
+
+        let first_path_url = first_path.to_string_lossy();
+        let mut cloud_options = cloud_options
+            .map(|kv| parse_cloud_options(&first_path_url, kv))
+            .transpose()?;
+        if retries > 0 {
+            cloud_options =
+                cloud_options
+                    .or_else(|| Some(CloudOptions::default()))
+                    .map(|mut options| {
+                        options.max_retries = retries;
+                        options
+                    });
+        }
+
         let r = if let Some(path) = path.as_ref() {
             LazyCsvReader::new(path)
         } else {
@@ -214,7 +250,12 @@ impl PyLazyFrame {
             .with_missing_is_null(!missing_utf8_is_empty_string)
             .truncate_ragged_lines(truncate_ragged_lines)
             .with_decimal_comma(decimal_comma)
-            .raise_if_empty(raise_if_empty);
+            .raise_if_empty(raise_if_empty)
+            .with_hive_options(HiveOptions {
+                enabled: hive_partitioning,
+                schema: hive_schema.map(|s| Arc::new(s.0)),
+            })
+            .with_cloud_options(cloud_options);
 
         if let Some(lambda) = with_schema_modify {
             let f = |schema: Schema| {
@@ -315,7 +356,9 @@ impl PyLazyFrame {
 
     #[cfg(feature = "ipc")]
     #[staticmethod]
-    #[pyo3(signature = (path, paths, n_rows, cache, rechunk, row_index, memory_map, cloud_options, retries))]
+    #[pyo3(signature = (path, paths, n_rows, cache, rechunk, row_index, memory_map, cloud_options,
+        hive_partitioning, hive_schema, retries)
+    )]
     fn new_from_ipc(
         path: Option<PathBuf>,
         paths: Vec<PathBuf>,
@@ -325,9 +368,15 @@ impl PyLazyFrame {
         row_index: Option<(String, IdxSize)>,
         memory_map: bool,
         cloud_options: Option<Vec<(String, String)>>,
+        hive_partitioning: bool,
+        hive_schema: Option<Wrap<Schema>>,
         retries: usize,
     ) -> PyResult<Self> {
         let row_index = row_index.map(|(name, offset)| RowIndex { name, offset });
+        let hive_options = HiveOptions {
+            enabled: hive_partitioning,
+            schema: hive_schema.map(|s| Arc::new(s.0)),
+        };
 
         #[cfg(feature = "cloud")]
         let cloud_options = {
@@ -363,6 +412,7 @@ impl PyLazyFrame {
             memory_map,
             #[cfg(feature = "cloud")]
             cloud_options,
+            hive_options,
         };
 
         let lf = if let Some(path) = &path {
@@ -545,9 +595,13 @@ impl PyLazyFrame {
         .into()
     }
 
-    fn cache(&self) -> Self {
+    fn cache(&self, persist: bool) -> Self {
         let ldf = self.ldf.clone();
-        ldf.cache().into()
+        if persist {
+            ldf.cache_persistent().into()
+        } else {
+            ldf.cache().into()
+        }
     }
 
     fn profile(&self, py: Python) -> PyResult<(PyDataFrame, PyDataFrame)> {
@@ -560,6 +614,17 @@ impl PyLazyFrame {
         Ok((df.into(), time_df.into()))
     }
 
+    #[cfg(feature = "streaming")]
+    fn profile_streaming(&self, py: Python) -> PyResult<(PyDataFrame, PyDataFrame)> {
+        // if we don't allow threads and we have udfs trying to acquire the gil from different
+        // threads we deadlock.
+        let (df, metrics_df) = py.allow_threads(|| {
+            let ldf = self.ldf.clone();
+            ldf.profile_streaming().map_err(PyPolarsErr::from)
+        })?;
+        Ok((df.into(), metrics_df.into()))
+    }
+
     fn collect(&self, py: Python) -> PyResult<PyDataFrame> {
         // if we don't allow threads and we have udfs trying to acquire the gil from different
         // threads we deadlock.
@@ -595,7 +660,7 @@ impl PyLazyFrame {
     }
 
     #[cfg(all(feature = "streaming", feature = "parquet"))]
-    #[pyo3(signature = (path, compression, compression_level, statistics, row_group_size, data_pagesize_limit, maintain_order))]
+    #[pyo3(signature = (path, compression, compression_level, statistics, row_group_size, data_pagesize_limit, maintain_order, bloom_filter_columns, partition_by, max_open_files, max_rows_per_file))]
     fn sink_parquet(
         &self,
         py: Python,
@@ -606,6 +671,10 @@ impl PyLazyFrame {
         row_group_size: Option<usize>,
         data_pagesize_limit: Option<usize>,
         maintain_order: bool,
+        bloom_filter_columns: Option<Vec<String>>,
+        partition_by: Option<Vec<String>>,
+        max_open_files: usize,
+        max_rows_per_file: Option<usize>,
     ) -> PyResult<()> {
         let compression = parse_parquet_compression(compression, compression_level)?;
 
@@ -615,25 +684,37 @@ impl PyLazyFrame {
             row_group_size,
             data_pagesize_limit,
             maintain_order,
+            bloom_filter_columns: bloom_filter_columns.unwrap_or_default(),
         };
 
         // if we don't allow threads and we have udfs trying to acquire the gil from different
         // threads we deadlock.
+        let partition_options =
+            partitioned_sink_options(partition_by, max_open_files, max_rows_per_file);
         py.allow_threads(|| {
             let ldf = self.ldf.clone();
-            ldf.sink_parquet(path, options).map_err(PyPolarsErr::from)
+            match partition_options {
+                Some(partition_options) => {
+                    ldf.sink_partitioned(path, FileType::Parquet(options), partition_options)
+                },
+                None => ldf.sink_parquet(path, options),
+            }
+            .map_err(PyPolarsErr::from)
         })?;
         Ok(())
     }
 
     #[cfg(all(feature = "streaming", feature = "ipc"))]
-    #[pyo3(signature = (path, compression, maintain_order))]
+    #[pyo3(signature = (path, compression, maintain_order, partition_by, max_open_files, max_rows_per_file))]
     fn sink_ipc(
         &self,
         py: Python,
         path: PathBuf,
         compression: Option<Wrap<IpcCompression>>,
         maintain_order: bool,
+        partition_by: Option<Vec<String>>,
+        max_open_files: usize,
+        max_rows_per_file: Option<usize>,
     ) -> PyResult<()> {
         let options = IpcWriterOptions {
             compression: compression.map(|c| c.0),
@@ -642,15 +723,23 @@ impl PyLazyFrame {
 
         // if we don't allow threads and we have udfs trying to acquire the gil from different
         // threads we deadlock.
+        let partition_options =
+            partitioned_sink_options(partition_by, max_open_files, max_rows_per_file);
         py.allow_threads(|| {
             let ldf = self.ldf.clone();
-            ldf.sink_ipc(path, options).map_err(PyPolarsErr::from)
+            match partition_options {
+                Some(partition_options) => {
+                    ldf.sink_partitioned(path, FileType::Ipc(options), partition_options)
+                },
+                None => ldf.sink_ipc(path, options),
+            }
+            .map_err(PyPolarsErr::from)
         })?;
         Ok(())
     }
 
     #[cfg(all(feature = "streaming", feature = "csv"))]
-    #[pyo3(signature = (path, include_bom, include_header, separator, line_terminator, quote_char, batch_size, datetime_format, date_format, time_format, float_precision, null_value, quote_style, maintain_order))]
+    #[pyo3(signature = (path, include_bom, include_header, separator, line_terminator, quote_char, batch_size, datetime_format, date_format, time_format, float_precision, null_value, quote_style, maintain_order, partition_by, max_open_files, max_rows_per_file))]
     fn sink_csv(
         &self,
         py: Python,
@@ -668,6 +757,9 @@ impl PyLazyFrame {
         null_value: Option<String>,
         quote_style: Option<Wrap<QuoteStyle>>,
         maintain_order: bool,
+        partition_by: Option<Vec<String>>,
+        max_open_files: usize,
+        max_rows_per_file: Option<usize>,
     ) -> PyResult<()> {
         let quote_style = quote_style.map_or(QuoteStyle::default(), |wrap| wrap.0);
         let null_value = null_value.unwrap_or(SerializeOptions::default().null);
@@ -694,9 +786,17 @@ impl PyLazyFrame {
 
         // if we don't allow threads and we have udfs trying to acquire the gil from different
         // threads we deadlock.
+        let partition_options =
+            partitioned_sink_options(partition_by, max_open_files, max_rows_per_file);
         py.allow_threads(|| {
             let ldf = self.ldf.clone();
-            ldf.sink_csv(path, options).map_err(PyPolarsErr::from)
+            match partition_options {
+                Some(partition_options) => {
+                    ldf.sink_partitioned(path, FileType::Csv(options), partition_options)
+                },
+                None => ldf.sink_csv(path, options),
+            }
+            .map_err(PyPolarsErr::from)
         })?;
         Ok(())
     }
@@ -1154,3 +1254,19 @@ impl PyLazyFrame {
         Ok(out.into())
     }
 }
+
+#[cfg(all(
+    feature = "streaming",
+    any(feature = "parquet", feature = "ipc", feature = "csv")
+))]
+fn partitioned_sink_options(
+    partition_by: Option<Vec<String>>,
+    max_open_files: usize,
+    max_rows_per_file: Option<usize>,
+) -> Option<PartitionedSinkOptions> {
+    partition_by.map(|by| PartitionedSinkOptions {
+        by,
+        max_open_files,
+        max_rows_per_file,
+    })
+}
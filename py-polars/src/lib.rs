@@ -20,6 +20,7 @@ mod batched_csv;
 mod conversion;
 mod dataframe;
 mod datatypes;
+mod dlpack;
 mod error;
 mod expr;
 mod file;
@@ -34,6 +35,8 @@ mod memory;
 mod object;
 #[cfg(feature = "object")]
 mod on_startup;
+#[cfg(feature = "ipc")]
+mod pickle;
 mod prelude;
 mod py_modules;
 mod series;
@@ -221,6 +224,9 @@ fn polars(py: Python, m: &PyModule) -> PyResult<()> {
     #[cfg(feature = "parquet")]
     m.add_wrapped(wrap_pyfunction!(functions::read_parquet_schema))
         .unwrap();
+    #[cfg(feature = "cloud")]
+    m.add_wrapped(wrap_pyfunction!(functions::object_store_cache_stats))
+        .unwrap();
     #[cfg(feature = "clipboard")]
     m.add_wrapped(wrap_pyfunction!(functions::read_clipboard_string))
         .unwrap();
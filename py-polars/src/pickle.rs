@@ -0,0 +1,74 @@
+//! Pickling with pickle protocol 5.
+//!
+//! The data is written to a single uncompressed IPC file, which is handed to pickle as an
+//! out-of-band buffer without copying it into a `bytes` object. On unpickling, the arrays
+//! point into the received buffer instead of being copied out of it.
+use std::io::Cursor;
+use std::sync::Arc;
+
+use numpy::{IntoPyArray, PyArray1, PyArrayMethods};
+use polars::io::ipc::{read_ipc_file_zero_copy, IpcReader, IpcWriter};
+use polars::prelude::*;
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+
+use crate::error::PyPolarsErr;
+
+/// A pickle buffer and the Python object that owns its memory.
+struct PickleBuffer {
+    _owner: PyObject,
+    ptr: *const u8,
+    len: usize,
+}
+
+// The memory is owned by `_owner` and not mutated while it is referenced.
+unsafe impl Send for PickleBuffer {}
+unsafe impl Sync for PickleBuffer {}
+
+impl AsRef<[u8]> for PickleBuffer {
+    fn as_ref(&self) -> &[u8] {
+        unsafe { std::slice::from_raw_parts(self.ptr, self.len) }
+    }
+}
+
+/// Write `df` to an IPC file that is owned by a numpy array.
+pub(crate) fn df_to_pickle_buffer(py: Python, mut df: DataFrame) -> PyResult<PyObject> {
+    let mut buf: Vec<u8> = vec![];
+    py.allow_threads(|| {
+        IpcWriter::new(&mut buf)
+            .with_compression(None)
+            .with_pl_flavor(true)
+            .finish(&mut df)
+    })
+    .map_err(PyPolarsErr::from)?;
+    // The allocation is handed over to numpy, this does not copy.
+    Ok(buf.into_pyarray_bound(py).into_py(py))
+}
+
+/// Read a `DataFrame` from a pickle buffer written by [`df_to_pickle_buffer`].
+///
+/// `buffer` must be a `bytes` object or a one dimensional `uint8` numpy array.
+pub(crate) fn df_from_pickle_buffer(buffer: &Bound<PyAny>) -> PyResult<DataFrame> {
+    let py = buffer.py();
+    let slice = if let Ok(bytes) = buffer.downcast::<PyBytes>() {
+        bytes.as_bytes()
+    } else {
+        let array = buffer.downcast::<PyArray1<u8>>()?;
+        unsafe { array.as_slice() }
+            .map_err(|_| PyValueError::new_err("pickle buffer must be contiguous"))?
+    };
+    let data = Arc::new(PickleBuffer {
+        _owner: buffer.clone().unbind(),
+        ptr: slice.as_ptr(),
+        len: slice.len(),
+    });
+
+    py.allow_threads(|| {
+        // Buffers that are not aligned, e.g. because they were embedded in the pickle
+        // stream, can not be referenced and are copied instead.
+        unsafe { read_ipc_file_zero_copy(data.clone()) }
+            .or_else(|_| IpcReader::new(Cursor::new(data.as_ref().as_ref())).finish())
+    })
+    .map_err(|e| PyPolarsErr::from(e).into())
+}
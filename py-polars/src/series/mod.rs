@@ -672,6 +672,25 @@ impl PySeries {
         }
     }
 
+    #[cfg(feature = "ipc")]
+    fn _to_pickle_buffer(&self, py: Python) -> PyResult<PyObject> {
+        // Used in pickle protocol 5
+        crate::pickle::df_to_pickle_buffer(py, self.series.clone().into_frame())
+    }
+
+    #[cfg(feature = "ipc")]
+    #[staticmethod]
+    fn _from_pickle_buffer(buffer: &Bound<PyAny>) -> PyResult<Self> {
+        // Used in pickle protocol 5
+        let mut df = crate::pickle::df_from_pickle_buffer(buffer)?;
+        df.pop().map(|s| s.into()).ok_or_else(|| {
+            PyPolarsErr::from(PolarsError::NoData(
+                "No columns found in IPC byte stream".into(),
+            ))
+            .into()
+        })
+    }
+
     fn skew(&self, bias: bool) -> PyResult<Option<f64>> {
         let out = self.series.skew(bias).map_err(PyPolarsErr::from)?;
         Ok(out)
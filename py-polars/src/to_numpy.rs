@@ -3,13 +3,18 @@ use std::ffi::{c_int, c_void};
 use ndarray::{Dim, Dimension, IntoDimension};
 use numpy::npyffi::{flags, PyArrayObject};
 use numpy::{npyffi, Element, IntoPyArray, PyArrayDescrMethods, ToNpyDims, PY_ARRAY_API};
+use polars::export::arrow::array::{Array, PrimitiveArray};
+use polars::export::arrow::buffer::Buffer;
+use polars::export::arrow::types::NativeType;
 use polars_core::prelude::*;
 use polars_core::utils::try_get_supertype;
 use polars_core::with_match_physical_numeric_polars_type;
+use pyo3::exceptions::PyTypeError;
 use pyo3::prelude::*;
 
 use crate::conversion::Wrap;
 use crate::dataframe::PyDataFrame;
+use crate::error::PyPolarsErr;
 use crate::series::PySeries;
 
 pub(crate) unsafe fn create_borrowed_np_array<T: NumericNative + Element, I>(
@@ -47,6 +52,58 @@ where
     any.into_py(py)
 }
 
+/// Copy the values of the columns into a single buffer, one column after the other, of which
+/// the new columns are slices. A frame of these columns can be viewed as a 2D NumPy array
+/// in Fortran order without copying.
+///
+/// All columns must have the same numeric data type and length.
+pub(crate) fn consolidate_columns(columns: &[Series]) -> PyResult<Vec<Series>> {
+    fn consolidate<T: PolarsNumericType>(columns: &[Series]) -> PyResult<Vec<Series>> {
+        let height = columns[0].len();
+        let mut values = Vec::with_capacity(height * columns.len());
+        for s in columns {
+            let ca: &ChunkedArray<T> = s.unpack().unwrap();
+            for arr in ca.downcast_iter() {
+                values.extend_from_slice(arr.values());
+            }
+        }
+        let buffer: Buffer<T::Native> = values.into();
+
+        columns
+            .iter()
+            .enumerate()
+            .map(|(i, s)| {
+                let ca: &ChunkedArray<T> = s.unpack().unwrap();
+                let validity = if ca.null_count() > 0 {
+                    ca.rechunk()
+                        .downcast_iter()
+                        .next()
+                        .unwrap()
+                        .validity()
+                        .cloned()
+                } else {
+                    None
+                };
+                let values = buffer.clone().sliced(i * height, height);
+                let arr = PrimitiveArray::new(T::Native::PRIMITIVE.into(), values, validity);
+                let out =
+                    Series::from_arrow(s.name(), arr.to_boxed()).map_err(PyPolarsErr::from)?;
+                Ok(out)
+            })
+            .collect()
+    }
+
+    let Some(first) = columns.first() else {
+        return Ok(vec![]);
+    };
+    let dtype = first.dtype();
+    if !dtype.is_numeric() || columns.iter().any(|s| s.dtype() != dtype) {
+        let msg = "all columns must have the same numeric data type to consolidate them";
+        return Err(PyTypeError::new_err(msg));
+    }
+    with_match_physical_numeric_polars_type!(dtype, |$T| consolidate::<$T>(columns))
+}
+
 #[pymethods]
 impl PySeries {
     /// Create a view of the data as a NumPy ndarray.
@@ -157,6 +214,12 @@ impl PyDataFrame {
         })
     }
 
+    pub fn consolidate(&self) -> PyResult<Self> {
+        let columns = consolidate_columns(self.df.get_columns())?;
+        // SAFETY: the columns keep their names and lengths.
+        Ok(unsafe { DataFrame::new_no_checks(columns) }.into())
+    }
+
     pub fn to_numpy(&self, py: Python, order: Wrap<IndexOrder>) -> Option<PyObject> {
         let mut st = None;
         for s in self.df.iter() {
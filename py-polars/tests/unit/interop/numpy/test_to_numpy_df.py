@@ -161,3 +161,43 @@ def test_df_to_numpy_not_zero_copy() -> None:
     df = pl.DataFrame({"a": [1, 2, None]})
     with pytest.raises(RuntimeError):
         df.to_numpy(allow_copy=False)
+
+
+def test_df_consolidate_to_numpy_zero_copy() -> None:
+    df = pl.DataFrame({"a": [1.0, 2.0, 3.0], "b": [4.0, 5.0, 6.0]})
+    with pytest.raises(RuntimeError):
+        df.to_numpy(allow_copy=False)
+
+    df = df.consolidate()
+    result = df.to_numpy(allow_copy=False)
+    assert_array_equal(result, np.array([[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]]))
+    assert np.shares_memory(result, df.to_numpy(allow_copy=False))
+
+
+def test_df_consolidate_mixed_dtypes() -> None:
+    df = pl.DataFrame({"a": [1, 2], "b": [1.0, 2.0]})
+    with pytest.raises(TypeError):
+        df.consolidate()
+
+
+def test_df_from_dlpack() -> None:
+    df = pl.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
+    expected = np.array([[1, 4], [2, 5], [3, 6]])
+    assert_array_equal(np.from_dlpack(df), expected)
+
+    df = df.consolidate()
+    result = np.from_dlpack(df)
+    assert_array_equal(result, expected)
+    assert np.shares_memory(result, np.from_dlpack(df))
+
+
+def test_df_dlpack_copy_not_allowed() -> None:
+    df = pl.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]})
+    with pytest.raises(BufferError, match="copy not allowed"):
+        df.__dlpack__(copy=False)
+
+
+def test_df_dlpack_nulls() -> None:
+    df = pl.DataFrame({"a": [1.0, None], "b": [3.0, 4.0]})
+    with pytest.raises(BufferError, match="nulls"):
+        np.from_dlpack(df)
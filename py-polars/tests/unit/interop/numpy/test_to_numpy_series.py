@@ -408,3 +408,22 @@ def test_view_ub() -> None:
     with pytest.deprecated_call():
         result = s.sort().view()
     assert np.sum(result) == 9
+
+
+def test_series_from_dlpack() -> None:
+    s = pl.Series([1.0, 2.0, 3.0])
+    result = np.from_dlpack(s)
+    assert_array_equal(result, np.array([1.0, 2.0, 3.0]))
+    assert np.shares_memory(result, s.to_numpy(allow_copy=False))
+
+    chunked = pl.concat([s, s], rechunk=False)
+    assert_array_equal(np.from_dlpack(chunked), np.array([1.0, 2.0, 3.0] * 2))
+    with pytest.raises(BufferError, match="copy not allowed"):
+        chunked.__dlpack__(copy=False)
+
+
+def test_series_dlpack_unsupported() -> None:
+    with pytest.raises(BufferError, match="nulls"):
+        np.from_dlpack(pl.Series([1, None]))
+    with pytest.raises(BufferError, match="data type"):
+        np.from_dlpack(pl.Series(["a"]))
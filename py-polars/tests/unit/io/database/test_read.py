@@ -589,10 +589,10 @@ def test_read_database_mocked(
                 query="SELECT * FROM test_data",
                 protocol=sqlite3.connect(":memory:"),
                 errclass=ValueError,
-                errmsg=r"`read_database` \*\*kwargs only exist for passthrough to `read_database_uri`",
-                kwargs={"partition_on": "id"},
+                errmsg="reading with `partition_on` requires a connection that can open further connections",
+                kwargs={"partition_on": "id", "partition_num": 2},
             ),
-            id="Invalid kwargs",
+            id="Invalid partitioned connection",
         ),
         pytest.param(
             *ExceptionTestParams(
@@ -613,7 +613,7 @@ def test_read_database_mocked(
                 protocol=sqlite3.connect(":memory:"),
                 errclass=ValueError,
                 errmsg=r"`read_database` \*\*kwargs only exist for passthrough to `read_database_uri`",
-                kwargs={"partition_on": "id"},
+                kwargs={"protocol": "binary"},
             ),
             id="Invalid kwargs",
         ),
@@ -644,6 +644,74 @@ def test_read_database_exceptions(
         read_database(**params)
 
 
+def test_read_database_row_batches_schema() -> None:
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(
+        """
+        CREATE TABLE test_data (id INTEGER, name TEXT, value FLOAT);
+        INSERT INTO test_data VALUES
+          (1, NULL, 0.5), (2, NULL, NULL), (3, 'c', 1.0), (NULL, 'd', -2.5);
+        """
+    )
+    query = "SELECT * FROM test_data"
+    batches = list(pl.read_database(query, conn, iter_batches=True, batch_size=2))
+    assert [df.height for df in batches] == [2, 2]
+    assert batches[1].schema == {"id": pl.Int64, "name": pl.String, "value": pl.Float64}
+    assert batches[0].schema["id"] == pl.Int64
+    assert batches[0].schema["value"] == pl.Float64
+
+    expected = pl.DataFrame(
+        {
+            "id": [1, 2, 3, None],
+            "name": [None, None, "c", "d"],
+            "value": [0.5, None, 1.0, -2.5],
+        }
+    )
+    assert_frame_equal(pl.read_database(query, conn), expected)
+    assert_frame_equal(
+        pl.read_database(query, conn, schema_overrides={"id": pl.Int32}),
+        expected.with_columns(pl.col("id").cast(pl.Int32)),
+    )
+
+
+@pytest.mark.write_disk()
+@pytest.mark.parametrize(
+    ("partition_range", "partition_num"),
+    [(None, 2), ((1, 2), 2), ((5, 6), 3), (None, 1)],
+)
+def test_read_database_partitioned(
+    tmp_sqlite_db: Path,
+    partition_range: tuple[int, int] | None,
+    partition_num: int,
+) -> None:
+    engine = create_engine(f"sqlite:///{tmp_sqlite_db}")
+    query = "SELECT id, name, value FROM test_data"
+    expected = pl.read_database(query, engine)
+
+    df = pl.read_database(
+        query,
+        engine,
+        partition_on="id",
+        partition_range=partition_range,
+        partition_num=partition_num,
+    )
+    assert_frame_equal(df.sort("id"), expected)
+
+
+def test_partition_queries() -> None:
+    from polars.io.database._utils import _partition_queries
+
+    queries = _partition_queries("SELECT * FROM t", "id", (0, 9), 3)
+    assert [q.split(" WHERE ")[1] for q in queries] == [
+        "id < 4 OR id IS NULL",
+        "id >= 4 AND id < 8",
+        "id >= 8",
+    ]
+    assert _partition_queries("SELECT * FROM t", "id", (0, 9), 1) == ["SELECT * FROM t"]
+    with pytest.raises(ValueError, match="invalid `partition_range`"):
+        _partition_queries("SELECT * FROM t", "id", (9, 0), 3)
+
+
 @pytest.mark.skipif(
     sys.version_info > (3, 11),
     reason="connectorx cannot be installed on Python 3.12 yet.",
@@ -182,3 +182,82 @@ class TestWriteDatabase:
                 if_table_exists="do_something",  # type: ignore[arg-type]
                 engine=engine,
             )
+
+
+@pytest.mark.write_disk()
+def test_write_database_sqlalchemy_batches(tmp_path: Path) -> None:
+    df = pl.DataFrame(
+        {
+            "id": range(25),
+            "name": [f"n{i}" if i % 3 else None for i in range(25)],
+            "flag": [i % 2 == 0 for i in range(25)],
+        }
+    )
+    test_db_uri = f"sqlite:///{tmp_path / 'test_batches.db'}"
+
+    assert (
+        df.write_database(
+            table_name="test_batches",
+            connection=test_db_uri,
+            batch_size=4,
+        )
+        == 25
+    )
+    result = pl.read_database(
+        query="SELECT * FROM test_batches",
+        connection=create_engine(test_db_uri),
+        schema_overrides={"flag": pl.Boolean},
+    )
+    assert_frame_equal(result, df)
+
+    with pytest.raises(ValueError, match="already exists"):
+        df.write_database(table_name="test_batches", connection=test_db_uri)
+
+    with pytest.raises(ValueError, match="`batch_size` must be a positive integer"):
+        df.write_database(
+            table_name="test_batches", connection=test_db_uri, batch_size=0
+        )
+
+
+@pytest.mark.write_disk()
+def test_sink_database(tmp_path: Path) -> None:
+    lf = pl.LazyFrame({"a": range(10), "b": [float(i) / 2 for i in range(10)]})
+    test_db_uri = f"sqlite:///{tmp_path / 'test_sink.db'}"
+
+    assert (
+        lf.filter(pl.col("a") > 2).sink_database(
+            table_name="test_sink",
+            connection=test_db_uri,
+            batch_size=3,
+        )
+        == 7
+    )
+    result = pl.read_database(
+        query="SELECT * FROM test_sink",
+        connection=create_engine(test_db_uri),
+    )
+    assert_frame_equal(result, lf.filter(pl.col("a") > 2).collect())
+
+
+@pytest.mark.write_disk()
+@pytest.mark.parametrize("n_rows", [0, 6])
+def test_sink_database_batch_boundaries(n_rows: int, tmp_path: Path) -> None:
+    lf = pl.LazyFrame({"a": range(n_rows)}, schema={"a": pl.Int64})
+    test_db_uri = f"sqlite:///{tmp_path / 'test_sink_batches.db'}"
+
+    lf.sink_database(table_name="test_sink", connection=test_db_uri, batch_size=3)
+    result = pl.read_database(
+        query="SELECT * FROM test_sink",
+        connection=create_engine(test_db_uri),
+        schema_overrides={"a": pl.Int64},
+    )
+    assert_frame_equal(result, lf.collect())
+
+    with pytest.raises(ValueError, match="already exists"):
+        lf.sink_database(table_name="test_sink", connection=test_db_uri)
+
+
+def test_write_database_unsupported_dtype() -> None:
+    df = pl.DataFrame({"a": [[1, 2], [3]]})
+    with pytest.raises(TypeError, match="is not supported"):
+        df.write_database(table_name="test_list", connection="sqlite:///:memory:")
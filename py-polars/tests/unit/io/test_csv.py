@@ -474,6 +474,36 @@ def test_read_csv_encoding(tmp_path: Path) -> None:
             )
 
 
+@pytest.mark.parametrize(
+    ("encoding", "native"),
+    [
+        ("latin-1", "latin1"),
+        ("cp1252", "cp1252"),
+        ("utf-16", "utf16-le"),
+        ("utf-16-be", "utf16-be"),
+    ],
+)
+def test_read_csv_native_encoding(encoding: str, native: str, tmp_path: Path) -> None:
+    tmp_path.mkdir(exist_ok=True)
+
+    # "Œ" is not part of latin-1
+    oeuvre = "Ouvre" if encoding == "latin-1" else "Œuvre"
+    file_path = tmp_path / "encoding.csv"
+    csv = f'name,café\n"Ærø, Søren",1\n{oeuvre},2\n'
+    file_path.write_bytes(csv.encode(encoding))
+    expected = pl.DataFrame({"name": ["Ærø, Søren", oeuvre], "café": [1, 2]})
+
+    assert_frame_equal(pl.read_csv(file_path, encoding=encoding), expected)
+    assert_frame_equal(pl.read_csv(file_path.read_bytes(), encoding=encoding), expected)
+    assert_frame_equal(
+        pl.read_csv(file_path, encoding=encoding, dtypes={"name": pl.Categorical}),
+        expected.with_columns(pl.col("name").cast(pl.Categorical)),
+    )
+    lf = pl.scan_csv(file_path, encoding=native)  # type: ignore[arg-type]
+    assert_frame_equal(lf.collect(), expected)
+    assert_frame_equal(lf.collect(streaming=True), expected)
+
+
 def test_column_rename_and_dtype_overwrite() -> None:
     csv = textwrap.dedent(
         """\
@@ -566,11 +596,8 @@ def test_compressed_csv(io_files_path: Path) -> None:
 
     # zstd compressed file
     csv_file = io_files_path / "zstd_compressed.csv.zst"
-    with pytest.raises(
-        ComputeError,
-        match="cannot scan compressed csv; use `read_csv` for compressed data",
-    ):
-        pl.scan_csv(csv_file).collect()
+    out = pl.scan_csv(csv_file, truncate_ragged_lines=True).collect()
+    assert_frame_equal(out, expected)
     out = pl.read_csv(str(csv_file), truncate_ragged_lines=True)
     assert_frame_equal(out, expected)
 
@@ -1943,6 +1970,30 @@ def test_partial_read_compressed_file(tmp_path: Path) -> None:
     assert df.shape == (30, 3)
 
 
+@pytest.mark.write_disk()
+def test_scan_compressed_csv(tmp_path: Path) -> None:
+    df = pl.DataFrame({"idx": range(100_000), "txt": 'a,"b"\nc'})
+    tmp_path.mkdir(exist_ok=True)
+    file_path = tmp_path / "large.csv.gz"
+    file_path.write_bytes(gzip.compress(df.write_csv().encode()))
+
+    lf = pl.scan_csv(file_path, row_index_name="i")
+    expected = df.with_row_index("i")
+    assert_frame_equal(lf.collect(), expected)
+    assert_frame_equal(lf.collect(streaming=True), expected)
+    assert_frame_equal(
+        lf.filter(pl.col("idx") >= 99_990).collect(streaming=True),
+        expected.slice(99_990),
+    )
+    assert lf.select(pl.len()).collect().item() == 100_000
+
+    reader = pl.read_csv_batched(file_path, batch_size=1_000)
+    batches = []
+    while next_batches := reader.next_batches(5):
+        batches.extend(next_batches)
+    assert_frame_equal(pl.concat(batches), df)
+
+
 def test_read_csv_invalid_dtypes() -> None:
     csv = textwrap.dedent(
         """\
@@ -266,3 +266,56 @@ def test_read_parquet_hive_schema_with_pyarrow() -> None:
         match="cannot use `hive_partitions` with `use_pyarrow=True`",
     ):
         pl.read_parquet("test.parquet", hive_schema={"c": pl.Int32}, use_pyarrow=True)
+
+
+@pytest.mark.parametrize(
+    ("write", "scan", "ext"),
+    [
+        (pl.DataFrame.write_csv, pl.scan_csv, "csv"),
+        (pl.DataFrame.write_ipc, pl.scan_ipc, "ipc"),
+        (pl.DataFrame.write_ndjson, pl.scan_ndjson, "ndjson"),
+    ],
+)
+@pytest.mark.parametrize("streaming", [False, True])
+@pytest.mark.write_disk()
+def test_hive_partitioned_scan_non_parquet(
+    write: Any,
+    scan: Any,
+    ext: str,
+    streaming: bool,
+    tmp_path: Path,
+    monkeypatch: Any,
+    capfd: Any,
+) -> None:
+    monkeypatch.setenv("POLARS_VERBOSE", "1")
+    for a in range(3):
+        for b in ["x", "y"]:
+            path = tmp_path / f"a={a}" / f"b={b}"
+            path.mkdir(parents=True)
+            write(pl.DataFrame({"x": [a, a + 1], "y": [b, b]}), path / f"data.{ext}")
+
+    q = scan(tmp_path / f"**/*.{ext}", hive_partitioning=True)
+    assert q.columns == ["x", "y", "a", "b"]
+
+    expected = pl.DataFrame(
+        {
+            "x": [1, 2, 1, 2],
+            "y": ["x", "x", "y", "y"],
+            "a": [1, 1, 1, 1],
+            "b": ["x", "x", "y", "y"],
+        }
+    )
+    result = q.filter(pl.col("a") == 1).collect(streaming=streaming)
+    assert_frame_equal(result, expected)
+    assert "hive partitioning: skipped 4 files" in capfd.readouterr().err
+
+    result = q.select("b", "a").filter(pl.col("b") == "y").collect(streaming=streaming)
+    assert_frame_equal(result, pl.DataFrame({"b": ["y"] * 6, "a": [0, 0, 1, 1, 2, 2]}))
+
+    result = scan(
+        tmp_path / f"**/*.{ext}", hive_partitioning=True, row_index_name="idx"
+    ).collect(streaming=streaming)
+    assert result.columns == ["idx", "x", "y", "a", "b"]
+    assert result["idx"].to_list() == list(range(12))
+
+    assert scan(tmp_path / f"**/*.{ext}").columns == ["x", "y"]
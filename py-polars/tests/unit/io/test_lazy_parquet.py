@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 from collections import OrderedDict
 from pathlib import Path
 from threading import Thread
@@ -274,6 +275,107 @@ def test_parquet_statistics(monkeypatch: Any, capfd: Any, tmp_path: Path) -> Non
     )
 
 
+@pytest.mark.write_disk()
+def test_parquet_bloom_filter(monkeypatch: Any, capfd: Any, tmp_path: Path) -> None:
+    tmp_path.mkdir(exist_ok=True)
+
+    monkeypatch.setenv("POLARS_VERBOSE", "1")
+
+    # The min/max statistics of both row groups span all ids.
+    df = pl.concat(
+        [
+            pl.DataFrame({"id": range(0, 100, 2), "s": [f"a{i}" for i in range(50)]}),
+            pl.DataFrame({"id": range(1, 101, 2), "s": [f"b{i}" for i in range(50)]}),
+        ],
+        rechunk=False,
+    )
+    file_path = tmp_path / "bloom.parquet"
+    df.write_parquet(file_path, bloom_filter_columns=["id", "s"])
+
+    for pred in [
+        pl.col("id") == 50,
+        pl.col("id").is_in([3, 7]),
+        pl.col("s") == "b10",
+        pl.col("id") == 51,
+    ]:
+        result = pl.scan_parquet(file_path).filter(pred).collect()
+        assert_frame_equal(result, df.filter(pred))
+
+    captured = capfd.readouterr().err
+    assert (
+        "parquet file can be skipped, the statistics were sufficient"
+        " to apply the predicate." in captured
+    )
+
+    sink_path = tmp_path / "bloom_sink.parquet"
+    df.lazy().sink_parquet(sink_path, bloom_filter_columns=["s"])
+    pred = pl.col("s") == "a3"
+    result = pl.scan_parquet(sink_path).filter(pred).collect()
+    assert_frame_equal(result, df.filter(pred))
+
+
+@pytest.mark.write_disk()
+def test_parquet_bloom_filter_float_zeros_and_nan(tmp_path: Path) -> None:
+    tmp_path.mkdir(exist_ok=True)
+
+    df = pl.DataFrame({"x": [-1.0, 0.0, float("nan"), 1.0]})
+    file_path = tmp_path / "bloom_float.parquet"
+    df.write_parquet(file_path, bloom_filter_columns=["x"])
+
+    for pred in [
+        pl.col("x") == -0.0,
+        pl.col("x").is_in([-0.0]),
+        pl.col("x").is_nan(),
+        pl.col("x").is_between(-0.5, 0.5),
+    ]:
+        result = pl.scan_parquet(file_path).filter(pred).collect()
+        assert_frame_equal(result, df.filter(pred))
+
+
+def test_parquet_bloom_filter_unsupported_dtype() -> None:
+    df = pl.DataFrame({"a": [[1], [2]]})
+    with pytest.raises(pl.InvalidOperationError, match="bloom filter"):
+        df.write_parquet(io.BytesIO(), bloom_filter_columns=["a"])
+
+
+@pytest.mark.write_disk()
+def test_parquet_page_index(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capfd: pytest.CaptureFixture[str]
+) -> None:
+    tmp_path.mkdir(exist_ok=True)
+    monkeypatch.setenv("POLARS_VERBOSE", "1")
+
+    n = 10_000
+    df = pl.DataFrame(
+        {
+            "id": range(n),
+            "s": [f"s{i:05}" for i in range(n)],
+            "x": [i % 7 for i in range(n)],
+            "null": [None if i < n // 2 else i for i in range(n)],
+        }
+    )
+    file_path = tmp_path / "page_index.parquet"
+    # A single row group with many small pages.
+    df.write_parquet(file_path, row_group_size=n, data_page_size=1024)
+
+    for pred in [
+        pl.col("id") == 5_000,
+        (pl.col("id") > 1_234) & (pl.col("id") < 1_300),
+        pl.col("id").is_in([10, 9_990]),
+        pl.col("s") == "s04321",
+        (pl.col("id") < 100) & (pl.col("x") == 3),
+        pl.col("null").is_not_null() & (pl.col("id") < 5_010),
+        pl.col("id") > n,
+    ]:
+        capfd.readouterr()
+        result = pl.scan_parquet(file_path).filter(pred).collect()
+        assert "parquet page index: skipping pages" in capfd.readouterr().err
+        assert_frame_equal(result, df.filter(pred))
+
+        result = pl.scan_parquet(file_path).filter(pred).select("x").collect()
+        assert_frame_equal(result, df.filter(pred).select("x"))
+
+
 @pytest.mark.write_disk()
 def test_categorical(tmp_path: Path) -> None:
     tmp_path.mkdir(exist_ok=True)
@@ -432,3 +534,23 @@ def test_scan_deadlock_rayon_spawn_from_async_15172(
     t.join(5)
 
     assert results[0].equals(df)
+
+
+@pytest.mark.write_disk()
+@pytest.mark.parametrize("streaming", [False, True])
+def test_scan_parquet_metadata_cache_invalidation(
+    tmp_path: Path, streaming: bool
+) -> None:
+    path = tmp_path / "data.parquet"
+
+    df = pl.DataFrame({"a": [1, 2, 3]})
+    df.write_parquet(path)
+    for _ in range(2):
+        result = pl.scan_parquet(path).collect(streaming=streaming)
+        assert_frame_equal(result, df)
+
+    # The metadata of the old file must not be reused.
+    df = pl.DataFrame({"a": [1, 2, 3, 4, 5], "b": ["x", "y", "z", "u", "v"]})
+    df.write_parquet(path)
+    result = pl.scan_parquet(path).collect(streaming=streaming)
+    assert_frame_equal(result, df)
@@ -3,6 +3,8 @@ from __future__ import annotations
 import io
 import pickle
 
+import pytest
+
 import polars as pl
 from polars.testing import assert_frame_equal, assert_series_equal
 
@@ -18,6 +20,29 @@ def test_pickle() -> None:
     assert_frame_equal(df, out)
 
 
+@pytest.mark.parametrize("out_of_band", [True, False])
+def test_pickle_protocol_5(out_of_band: bool) -> None:
+    df = pl.DataFrame(
+        {
+            "a": [1, 2, None],
+            "b": ["a", None, "a much longer string that is not inlined"],
+            "c": [[1.5], [], None],
+            "d": pl.Series(["x", "y", "x"], dtype=pl.Categorical),
+        }
+    )
+
+    buffers: list[pickle.PickleBuffer] = []
+    callback = buffers.append if out_of_band else None
+    data = pickle.dumps(df, protocol=5, buffer_callback=callback)
+    assert len(buffers) == (1 if out_of_band else 0)
+    assert_frame_equal(pickle.loads(data, buffers=buffers), df)
+
+    buffers.clear()
+    s = df.to_series(1)
+    data = pickle.dumps(s, protocol=5, buffer_callback=callback)
+    assert_series_equal(pickle.loads(data, buffers=buffers), s)
+
+
 def test_pickle_expr() -> None:
     for e in [pl.all(), pl.len(), pl.duration(weeks=10, days=20, hours=3)]:
         f = io.BytesIO()
@@ -200,3 +200,24 @@ def test_pyarrow_dataset_comm_subplan_elim(tmp_path: Path) -> None:
     assert lf0.join(lf1, on="a", how="inner").collect().to_dict(as_series=False) == {
         "a": [1, 2]
     }
+
+
+@pytest.mark.write_disk()
+def test_pyarrow_dataset_streaming(tmp_path: Path) -> None:
+    df = pl.DataFrame({"a": range(100), "b": [str(i) for i in range(100)]})
+    file_path = tmp_path / "stream.parquet"
+    df.write_parquet(file_path, row_group_size=10)
+
+    dset = ds.dataset(file_path, format="parquet")
+    lf = pl.scan_pyarrow_dataset(dset, batch_size=7)
+
+    assert "STREAMING" in lf.filter(pl.col("a") > 10).explain(streaming=True)
+    assert_frame_equal(
+        lf.filter(pl.col("a") > 10).collect(streaming=True),
+        df.filter(pl.col("a") > 10),
+    )
+    assert_frame_equal(lf.head(15).collect(streaming=True), df.head(15))
+
+    sink_path = tmp_path / "sink.parquet"
+    lf.select("b").sink_parquet(sink_path)
+    assert_frame_equal(pl.read_parquet(sink_path), df.select("b"))
@@ -513,3 +513,68 @@ def test_partial_functions_13523() -> None:
     df = pl.DataFrame(data)
     # should not warn
     _ = df["a"].map_elements(partial(plus, amount=1))
+
+
+def test_udf_auto_rewrite() -> None:
+    df = pl.DataFrame({"a": [1, None, 3], "b": ['{"x": 1}', None, '{"x": 3}']})
+
+    with pl.Config(udf_auto_rewrite=True):
+        with pytest.warns(PolarsInefficientMapWarning, match="automatically replaced"):
+            result = df.select(
+                pl.col("a").map_elements(lambda x: x * MY_CONSTANT + 1),
+                pl.col("b").map_elements(json.loads),
+            )
+        assert_frame_equal(
+            result,
+            df.select(pl.col("a") * 3 + 1, pl.col("b").str.json_decode()),
+        )
+
+        with pytest.warns(PolarsInefficientMapWarning, match="automatically replaced"):
+            s = df["a"].map_elements(lambda x: 1 + x, return_dtype=pl.Float64)
+        assert_series_equal(s, pl.Series("a", [2.0, None, 4.0]))
+
+        # functions that cannot be translated are called as before
+        assert df["a"].map_elements(lambda x: [x]).to_list() == [[1], None, [3]]
+
+
+def test_udf_auto_rewrite_group_context() -> None:
+    df = pl.DataFrame({"g": [1, 1, 2], "a": [1, 2, 3]})
+
+    def query() -> tuple[pl.DataFrame, pl.DataFrame]:
+        # in these contexts the function is called with a Series per group
+        expr = pl.col("a").map_elements(lambda x: str(x), return_dtype=pl.String)
+        return (
+            df.group_by("g", maintain_order=True).agg(expr),
+            df.with_columns(expr.over("g")),
+        )
+
+    with pytest.warns(PolarsInefficientMapWarning):
+        expected = query()
+    with pl.Config(udf_auto_rewrite=True), pytest.warns(
+        PolarsInefficientMapWarning, match="automatically replaced"
+    ):
+        result = query()
+    for left, right in zip(result, expected):
+        assert_frame_equal(left, right)
+    assert result[0]["a"].str.starts_with("shape: (").all()
+
+    # a column of lists is not rewritten either
+    df = pl.DataFrame({"a": [[1, 2], [3]]})
+    with pl.Config(udf_auto_rewrite=True), pytest.warns(PolarsInefficientMapWarning):
+        out = df.select(pl.col("a").map_elements(lambda x: str(x)))
+    assert out["a"].str.starts_with("shape: (").all()
+
+
+def test_udf_auto_rewrite_strategy() -> None:
+    # only the default strategy is rewritten; the others are chosen to run the function
+    df = pl.DataFrame({"a": [1, 2, 3]})
+    with pl.Config(udf_auto_rewrite=True), pytest.warns(
+        PolarsInefficientMapWarning
+    ) as record:
+        result = df.select(
+            pl.col("a").map_elements(
+                lambda x: x + 1, return_dtype=pl.Int64, strategy="threading"
+            )
+        )
+    assert_frame_equal(result, pl.DataFrame({"a": [2, 3, 4]}))
+    assert all("automatically replaced" not in str(w.message) for w in record)
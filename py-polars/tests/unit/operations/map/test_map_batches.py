@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from functools import reduce
+from typing import Any
 
 import numpy as np
 import pytest
@@ -95,3 +96,67 @@ def test_ufunc_args() -> None:
     )
     expected = pl.DataFrame({"z": [3, 4, 5]})
     assert_frame_equal(result, expected)
+
+
+def test_map_batches_process_strategy() -> None:
+    df = pl.DataFrame({"a": [1.0, 4.0, 9.0, 16.0]})
+    assert_frame_equal(
+        df.select(
+            pl.col("a").map_batches(np.sqrt, is_elementwise=True, strategy="process")
+        ),
+        df.select(pl.col("a").sqrt()),
+    )
+    assert df.select(pl.col("a").map_batches(np.argmax, strategy="process")).item() == 3
+
+
+def test_map_flat_groups() -> None:
+    df = pl.DataFrame({"g": [1, 2, 1, 2, 2, 3], "v": [1, 2, 3, 4, 5, 6]})
+    calls = []
+
+    def group_sums(values: Any, offsets: Any) -> Any:
+        calls.append(offsets)
+        return np.add.reduceat(values, offsets[:-1])
+
+    out = df.group_by("g", maintain_order=True).agg(
+        pl.col("v").map_flat_groups(group_sums)
+    )
+    assert out.to_dict(as_series=False) == {"g": [1, 2, 3], "v": [4, 11, 6]}
+    assert len(calls) == 1
+    assert calls[0].tolist() == [0, 2, 5, 6]
+
+    # one value per input value
+    out = df.group_by("g", maintain_order=True).agg(
+        pl.col("v").map_flat_groups(
+            lambda values, offsets: values * 10, returns_scalar=False
+        )
+    )
+    assert out["v"].to_list() == [[10, 30], [20, 40, 50], [60]]
+
+    # the whole column is a single group in a selection context
+    assert df.select(pl.col("v").map_flat_groups(group_sums)).item() == 21
+
+
+def test_map_flat_groups_list_column_and_schema() -> None:
+    # a column of lists is not mistaken for aggregated groups
+    df = pl.DataFrame({"v": [[1, 2], [3]]})
+    out = df.select(
+        pl.col("v").map_flat_groups(lambda values, offsets: np.array([len(values)]))
+    )
+    assert out.item() == 2
+
+    lf = pl.LazyFrame({"g": [1, 2, 1], "v": [1, 2, 3]}).group_by("g")
+    q = lf.agg(
+        pl.col("v").map_flat_groups(
+            lambda values, offsets: np.add.reduceat(values, offsets[:-1]),
+            return_dtype=pl.Float64,
+        )
+    )
+    assert q.schema["v"] == pl.Float64
+    q = lf.agg(
+        pl.col("v").map_flat_groups(
+            lambda values, offsets: values * 10,
+            return_dtype=pl.Int64,
+            returns_scalar=False,
+        )
+    )
+    assert q.schema["v"] == pl.List(pl.Int64)
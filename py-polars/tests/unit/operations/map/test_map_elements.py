@@ -355,3 +355,79 @@ def test_cabbage_strategy_14396() -> None:
         ValueError, match="strategy 'cabbage' is not supported"
     ), pytest.warns(PolarsInefficientMapWarning):
         df.select(pl.col("x").map_elements(lambda x: 2 * x, strategy="cabbage"))  # type: ignore[arg-type]
+
+
+def _collatz_steps(n: int) -> int:
+    steps = 0
+    while n > 1:
+        n = n // 2 if n % 2 == 0 else 3 * n + 1
+        steps += 1
+    return steps
+
+
+def test_map_elements_process_strategy() -> None:
+    df = pl.DataFrame({"a": [*range(1, 100), None], "g": [1, 2] * 50})
+
+    expr = pl.col("a").map_elements(_collatz_steps, return_dtype=pl.Int64)
+    expected = df.select(expr)
+    assert_frame_equal(
+        df.select(
+            pl.col("a").map_elements(
+                _collatz_steps, return_dtype=pl.Int64, strategy="process"
+            )
+        ),
+        expected,
+    )
+
+    # in a group by, the function receives the groups
+    expected = df.group_by("g").agg(pl.col("a").map_elements(len)).sort("g")
+    assert_frame_equal(
+        df.group_by("g")
+        .agg(pl.col("a").map_elements(len, strategy="process"))
+        .sort("g"),
+        expected,
+    )
+
+    with pytest.raises(TypeError, match="must be picklable"), pytest.warns(
+        PolarsInefficientMapWarning
+    ):
+        df.select(pl.col("a").map_elements(lambda x: x + 1, strategy="process"))
+
+
+def test_map_elements_memoize() -> None:
+    calls = []
+
+    def classify(value: str) -> str:
+        calls.append(value)
+        return value.upper()
+
+    s = pl.Series("a", ["x", "y", None, "x", "y", "x"], dtype=pl.Categorical)
+    expected = pl.Series("a", ["X", "Y", None, "X", "Y", "X"])
+    assert_series_equal(s.map_elements(classify, memoize=True), expected)
+    assert sorted(calls) == ["x", "y"]
+
+    calls.clear()
+    df = s.cast(pl.String).to_frame()
+    assert_frame_equal(
+        df.select(pl.col("a").map_elements(classify, memoize=True)),
+        expected.to_frame(),
+    )
+    assert sorted(calls) == ["x", "y"]
+
+
+def test_map_elements_memoize_pass_name() -> None:
+    df = pl.DataFrame({"g": [1, 2, 1, 3], "a": [1, 2, 1, 2]})
+
+    def describe(s: pl.Series) -> str:
+        return f"{s.name}: {s.to_list()}"
+
+    result = df.group_by("g", maintain_order=True).agg(
+        pl.col("a").map_elements(
+            describe, return_dtype=pl.String, pass_name=True, memoize=True
+        )
+    )
+    expected = df.group_by("g", maintain_order=True).agg(
+        pl.col("a").map_elements(describe, return_dtype=pl.String, pass_name=True)
+    )
+    assert_frame_equal(result, expected)
+    assert result["a"].to_list() == ["a: [1, 1]", "a: [2]", "a: [2]"]
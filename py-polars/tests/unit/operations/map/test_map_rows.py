@@ -76,3 +76,15 @@ def test_apply_deprecated() -> None:
 
     expected = pl.DataFrame({"map": [3, 3]})
     assert_frame_equal(result, expected)
+
+
+def _sum_row(row: tuple[Any, ...]) -> int:
+    return sum(row)
+
+
+def test_map_rows_process_strategy() -> None:
+    df = pl.DataFrame({"a": range(100), "b": range(100, 200)})
+    assert_frame_equal(
+        df.map_rows(_sum_row, strategy="process"),
+        df.map_rows(_sum_row),
+    )
@@ -407,3 +407,39 @@ def test_streaming_with_hconcat(tmp_path: Path) -> None:
     )
 
     assert_frame_equal(result, expected)
+
+
+@pytest.mark.write_disk()
+def test_streaming_profile(tmp_path: Path) -> None:
+    import json
+
+    lf = pl.LazyFrame({"a": [1, 2, 1, 3] * 100, "b": range(400)})
+    df, metrics = (
+        lf.group_by("a")
+        .agg(pl.col("b").sum())
+        .profile_streaming(trace_path=tmp_path / "trace.json")
+    )
+    assert df.height == 3
+    assert metrics.columns == [
+        "pipeline",
+        "node",
+        "kind",
+        "rows_in",
+        "rows_out",
+        "bytes_out",
+        "busy",
+        "wait",
+        "spilled_bytes",
+        "start",
+        "end",
+    ]
+    source = metrics.filter(pl.col("kind") == "source")
+    assert source["rows_out"].sum() == 400
+    sink = metrics.filter(pl.col("kind") == "sink")
+    assert sink["rows_in"].sum() == 400
+    assert sink["rows_out"].sum() == 3
+
+    with (tmp_path / "trace.json").open() as f:
+        trace = json.load(f)
+    assert len(trace["traceEvents"]) == metrics.height
+    assert all(event["ph"] == "X" for event in trace["traceEvents"])
@@ -162,6 +162,9 @@ def test_sink_csv_with_options() -> None:
             null_value="BOOM",
             quote_style="always",
             maintain_order=False,
+            partition_by=None,
+            max_open_files=64,
+            max_rows_per_file=None,
         )
 
 
@@ -225,6 +228,66 @@ def test_sink_ndjson_should_write_same_data(
     assert_frame_equal(df, expected)
 
 
+@pytest.mark.write_disk()
+def test_scan_ndjson_streaming(
+    io_files_path: Path, tmp_path: Path, monkeypatch: Any
+) -> None:
+    monkeypatch.setenv("POLARS_STREAMING_CHUNK_SIZE", "7")
+    source = io_files_path / "foods*.ndjson"
+    expected = pl.read_ndjson(io_files_path / "foods1.ndjson")
+    expected = pl.concat([expected, pl.read_ndjson(io_files_path / "foods2.ndjson")])
+
+    lf = pl.scan_ndjson(source)
+    assert "--- STREAMING" in lf.explain(streaming=True)
+    assert_frame_equal(lf.collect(streaming=True), expected)
+
+    # projection, predicate, row index and slice pushdown
+    lf = pl.scan_ndjson(source, row_index_name="idx")
+    q = lf.filter(pl.col("calories") > 100).select("idx", "category").head(5)
+    assert_frame_equal(q.collect(streaming=True), q.collect(no_optimization=True))
+    q = lf.select("idx")
+    assert_frame_equal(q.collect(streaming=True), q.collect())
+
+    file_path = tmp_path / "sink.parquet"
+    pl.scan_ndjson(source).sink_parquet(file_path)
+    assert_frame_equal(pl.read_parquet(file_path), expected)
+
+
+@pytest.mark.write_disk()
+@pytest.mark.parametrize("sink", ["parquet", "ipc", "csv"])
+def test_sink_partitioned(sink: str, tmp_path: Path) -> None:
+    df = pl.DataFrame(
+        {
+            "a": [1, 2, 1, None, 2, 1],
+            "b": ["x", "y/z", "x", "x", "y/z", "x"],
+            "c": list(range(6)),
+        }
+    )
+    getattr(df.lazy(), f"sink_{sink}")(
+        tmp_path, partition_by=["a", "b"], max_rows_per_file=2
+    )
+
+    assert sorted(p.name for p in (tmp_path / "a=1/b=x").iterdir()) == [
+        f"data-0000.{sink}",
+        f"data-0001.{sink}",
+    ]
+    assert (tmp_path / "a=__HIVE_DEFAULT_PARTITION__/b=x").is_dir()
+    assert (tmp_path / "a=2/b=y%2Fz").is_dir()
+
+    scan = getattr(pl, f"scan_{sink}")
+    result = scan(tmp_path / "**/*", hive_partitioning=True).collect()
+    assert_frame_equal(result.select("a", "b", "c").sort("c"), df)
+
+
+@pytest.mark.write_disk()
+def test_sink_partitioned_max_open_files(tmp_path: Path) -> None:
+    df = pl.DataFrame({"a": [1, 2, 3, 1, 2, 3], "b": range(6)})
+    df.lazy().sink_parquet(tmp_path, partition_by="a", max_open_files=1)
+
+    result = pl.scan_parquet(tmp_path / "**/*.parquet", hive_partitioning=True)
+    assert_frame_equal(result.collect().sort("b"), df.select("b", "a"))
+
+
 @pytest.mark.write_disk()
 def test_parquet_eq_statistics(monkeypatch: Any, capfd: Any, tmp_path: Path) -> None:
     tmp_path.mkdir(exist_ok=True)
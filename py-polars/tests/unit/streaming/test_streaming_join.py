@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
 import pandas as pd
@@ -9,6 +9,9 @@ import pytest
 import polars as pl
 from polars.testing import assert_frame_equal
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 pytestmark = pytest.mark.xdist_group("streaming")
 
 
@@ -248,3 +251,88 @@ def test_streaming_join_and_union() -> None:
     out = q.collect(streaming=True)
     assert_frame_equal(out, q.collect(streaming=False))
     assert out.to_series().to_list() == [1, 2, 1, 2, 4, 8, 1, 2]
+
+
+def test_streaming_semi_anti_joins() -> None:
+    n = 100
+    dfa = pl.LazyFrame(
+        {
+            "a": np.random.randint(0, 40, n),
+            "idx": np.arange(0, n),
+        }
+    )
+    dfb = pl.LazyFrame({"a": np.random.randint(0, 40, n)})
+
+    join_strategies: list[Literal["semi", "anti"]] = ["semi", "anti"]
+    for how in join_strategies:
+        q = dfa.join(dfb, on="a", how=how)
+        assert "STREAMING" in q.explain(streaming=True)
+        assert_frame_equal(q.collect(streaming=True), q.collect(streaming=False))
+
+
+@pytest.mark.parametrize("strategy", ["backward", "forward", "nearest"])
+def test_streaming_asof_join(
+    strategy: Literal["backward", "forward", "nearest"],
+) -> None:
+    n = 1000
+    dfa = pl.LazyFrame(
+        {
+            "t": np.sort(np.random.randint(0, 5000, n)),
+            "idx": np.arange(0, n),
+        }
+    )
+    dfb = pl.LazyFrame(
+        {
+            "t": np.sort(np.random.randint(0, 5000, n)),
+            "value": np.arange(0, n),
+        }
+    ).set_sorted("t")
+    dfa = dfa.set_sorted("t")
+
+    q = dfa.join_asof(dfb, on="t", strategy=strategy)
+    assert "STREAMING" in q.explain(streaming=True)
+    assert_frame_equal(q.collect(streaming=True), q.collect(streaming=False))
+
+    q = dfa.join_asof(dfb, on="t", strategy=strategy, tolerance=10)
+    assert_frame_equal(q.collect(streaming=True), q.collect(streaming=False))
+
+
+@pytest.mark.write_disk()
+@pytest.mark.parametrize("how", ["inner", "left", "outer", "outer_coalesce"])
+def test_streaming_join_ooc(
+    how: Literal["inner", "left", "outer", "outer_coalesce"],
+    tmp_path: Path,
+    monkeypatch: Any,
+    capfd: Any,
+) -> None:
+    tmp_path.mkdir(exist_ok=True)
+    monkeypatch.setenv("POLARS_TEMP_DIR", str(tmp_path))
+    monkeypatch.setenv("POLARS_FORCE_OOC", "1")
+    monkeypatch.setenv("POLARS_VERBOSE", "1")
+
+    n = 10_000
+    dfa = pl.LazyFrame(
+        {
+            "a": np.random.randint(0, 2_000, n),
+            "idx": np.arange(0, n),
+        }
+    )
+    dfb = pl.LazyFrame(
+        {
+            "a": np.random.randint(0, 2_000, n),
+            "idx_b": np.arange(0, n),
+        }
+    )
+
+    q = dfa.join(dfb, on="a", how=how)
+    result = q.collect(streaming=True)
+
+    (_, err) = capfd.readouterr()
+    assert "OOC join started" in err
+    assert "OOC join: the probe side is spilled to disk" in err
+    assert "OOC join: joining partition" in err
+
+    assert_frame_equal(
+        result.sort(["idx", "idx_b"], nulls_last=True),
+        q.collect(streaming=False).sort(["idx", "idx_b"], nulls_last=True),
+    )
@@ -750,6 +750,60 @@ def test_set_streaming_chunk_size() -> None:
         cfg.set_streaming_chunk_size(0)
 
 
+def test_set_object_store_cache(tmp_path: Path) -> None:
+    with pl.Config() as cfg:
+        cfg.set_object_store_cache(tmp_path, max_size=1024)
+        assert os.environ["POLARS_OBJECT_STORE_CACHE_DIR"] == str(tmp_path)
+        assert os.environ["POLARS_OBJECT_STORE_CACHE_MAX_SIZE"] == "1024"
+
+        cfg.set_object_store_cache(None)
+        assert "POLARS_OBJECT_STORE_CACHE_DIR" not in os.environ
+        assert "POLARS_OBJECT_STORE_CACHE_MAX_SIZE" not in os.environ
+
+    with pytest.raises(ValueError), pl.Config() as cfg:
+        cfg.set_object_store_cache(tmp_path, max_size=-1)
+
+    stats = pl.object_store_cache_stats()
+    assert set(stats) == {
+        "hits",
+        "misses",
+        "hit_bytes",
+        "miss_bytes",
+        "entries",
+        "size",
+    }
+
+
+def test_set_query_cache(tmp_path: Path) -> None:
+    with pl.Config(set_query_cache=1024):
+        assert os.environ["POLARS_QUERY_CACHE_SIZE"] == "1024"
+        assert "POLARS_QUERY_CACHE_SPILL_DIR" not in os.environ
+    assert "POLARS_QUERY_CACHE_SIZE" not in os.environ
+
+    with pl.Config() as cfg:
+        cfg.set_query_cache(0, spill_dir=tmp_path)
+        assert os.environ["POLARS_QUERY_CACHE_SIZE"] == "0"
+        assert os.environ["POLARS_QUERY_CACHE_SPILL_DIR"] == str(tmp_path)
+
+    with pytest.raises(ValueError), pl.Config() as cfg:
+        cfg.set_query_cache(-1)
+
+
+def test_set_streaming_prefetch() -> None:
+    with pl.Config(set_streaming_prefetch=4):
+        assert os.environ["POLARS_PREFETCH_SIZE"] == "4"
+        assert "POLARS_PREFETCH_MEMORY_BUDGET" not in os.environ
+    assert "POLARS_PREFETCH_SIZE" not in os.environ
+
+    with pl.Config() as cfg:
+        cfg.set_streaming_prefetch(None, memory_budget=1024)
+        assert "POLARS_PREFETCH_SIZE" not in os.environ
+        assert os.environ["POLARS_PREFETCH_MEMORY_BUDGET"] == "1024"
+
+    with pytest.raises(ValueError), pl.Config() as cfg:
+        cfg.set_streaming_prefetch(0)
+
+
 def test_set_fmt_str_lengths_invalid_length() -> None:
     with pl.Config() as cfg:
         with pytest.raises(ValueError):
@@ -833,6 +887,7 @@ def test_warn_unstable(recwarn: pytest.WarningsRecorder) -> None:
         ),
         ("POLARS_STREAMING_CHUNK_SIZE", "set_streaming_chunk_size", 100, "100"),
         ("POLARS_TABLE_WIDTH", "set_tbl_width_chars", 80, "80"),
+        ("POLARS_UDF_AUTO_REWRITE", "set_udf_auto_rewrite", True, "1"),
         ("POLARS_VERBOSE", "set_verbose", True, "1"),
         ("POLARS_WARN_UNSTABLE", "warn_unstable", True, "1"),
     ],
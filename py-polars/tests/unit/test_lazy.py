@@ -18,6 +18,8 @@ from polars.exceptions import ComputeError, PolarsInefficientMapWarning
 from polars.testing import assert_frame_equal, assert_series_equal
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from _pytest.capture import CaptureFixture
 
 
@@ -1237,6 +1239,52 @@ def test_lazy_cache_nested_parallel() -> None:
     assert df_outer_evaluated == 1
 
 
+def test_lazy_cache_persist(tmp_path: Path, monkeypatch: Any, capfd: Any) -> None:
+    monkeypatch.setenv("POLARS_VERBOSE", "1")
+    path = tmp_path / "data.csv"
+    pl.DataFrame({"a": [1, 1, 2], "b": [1, 2, 3]}).write_csv(path)
+
+    def query() -> pl.DataFrame:
+        agg = pl.scan_csv(path).group_by("a").agg(pl.col("b").sum())
+        return agg.cache(persist=True).sort("a").collect()
+
+    expected = pl.DataFrame({"a": [1, 2], "b": [3, 3]})
+    assert_frame_equal(query(), expected)
+    assert "QUERY CACHE HIT" not in capfd.readouterr().err
+    assert_frame_equal(query(), expected)
+    assert "QUERY CACHE HIT" in capfd.readouterr().err
+
+    # modifying the source file invalidates the cached result
+    pl.DataFrame({"a": [1, 1, 2, 3], "b": [1, 2, 3, 40]}).write_csv(path)
+    expected = pl.DataFrame({"a": [1, 2, 3], "b": [3, 3, 40]})
+    assert_frame_equal(query(), expected)
+    assert "QUERY CACHE HIT" not in capfd.readouterr().err
+
+    # results of python functions are not persisted
+    lf = pl.LazyFrame({"a": [1]}).map_batches(lambda df: df).cache(persist=True)
+    lf.collect()
+    lf.collect()
+    assert "QUERY CACHE HIT" not in capfd.readouterr().err
+
+
+def test_lazy_cache_persist_expression_arguments(monkeypatch: Any, capfd: Any) -> None:
+    monkeypatch.setenv("POLARS_VERBOSE", "1")
+    lf = pl.LazyFrame({"a": [2, 3, 1], "b": [1.0, 2.0, 3.0]})
+
+    # expressions that only differ in their options or arguments are not confused
+    for expr, expected in [
+        (pl.col("a").sort(), [1, 2, 3]),
+        (pl.col("a").sort(descending=True), [3, 2, 1]),
+        (pl.col("a").shift(1), [None, 2, 3]),
+        (pl.col("a").shift(2), [None, None, 2]),
+        (pl.col("a").diff(1), [None, 1, -2]),
+        (pl.col("a").diff(2), [None, None, -1]),
+    ]:
+        result = lf.select(expr).cache(persist=True).collect()
+        assert result.to_series().to_list() == expected
+    assert "QUERY CACHE HIT" not in capfd.readouterr().err
+
+
 def test_quadratic_behavior_4736() -> None:
     # no assert; if this function does not stall our tests it has passed!
     ldf = pl.LazyFrame(schema=list(ascii_letters))